@@ -1,9 +1,10 @@
 import struct
 from abc import ABCMeta, abstractmethod
-from typing import Tuple, Optional, List, Set, Union, NamedTuple, Deque
+from typing import Tuple, Optional, List, Set, Union, NamedTuple, Deque, Dict
 
 from bxcommon import constants
 from bxcommon.messages.abstract_block_message import AbstractBlockMessage
+from bxcommon.messages.abstract_message import AbstractMessage
 from bxcommon.messages.bloxroute import compact_block_short_ids_serializer
 
 from bxcommon.messages.bloxroute.tx_message import TxMessage
@@ -21,6 +22,85 @@ class BlockDecompressionResult(NamedTuple):
     unknown_tx_hashes: List[Sha256Hash]
 
 
+class BlockDecompressionState:
+    """
+    Partially decompressed block kept while the block is waiting for recovery.
+
+    Transactions that were resolved during decompression are kept in `tx_pieces`, and the slots of
+    unknown transactions are tracked in `missing_tx_short_ids`, so once the transactions are received
+    only the missing slots have to be filled before the block message is built.
+
+    Attributes
+    ----------
+    bx_block: compressed block bytes
+    block_hash: original block hash
+    short_ids: all short ids of the compressed block
+    block_header: bytes preceding the block transactions
+    block_trailer: bytes following the block transactions
+    tx_pieces: transaction contents in block order, None for unresolved transactions
+    missing_tx_short_ids: map of index in `tx_pieces` to short id of unresolved transaction
+    tx_content_size: total size of resolved transaction contents
+    """
+
+    bx_block: memoryview
+    block_hash: Sha256Hash
+    short_ids: List[int]
+    block_header: Union[bytearray, memoryview]
+    block_trailer: Union[bytearray, memoryview]
+    tx_pieces: List[Optional[Union[bytearray, memoryview]]]
+    missing_tx_short_ids: Dict[int, int]
+    tx_content_size: int
+
+    def __init__(
+        self,
+        bx_block: memoryview,
+        block_hash: Sha256Hash,
+        short_ids: List[int],
+        block_header: Union[bytearray, memoryview],
+        block_trailer: Union[bytearray, memoryview],
+        tx_pieces: List[Optional[Union[bytearray, memoryview]]],
+        missing_tx_short_ids: Dict[int, int],
+        tx_content_size: int
+    ) -> None:
+        self.bx_block = bx_block
+        self.block_hash = block_hash
+        self.short_ids = short_ids
+        self.block_header = block_header
+        self.block_trailer = block_trailer
+        self.tx_pieces = tx_pieces
+        self.missing_tx_short_ids = missing_tx_short_ids
+        self.tx_content_size = tx_content_size
+
+    @property
+    def tx_count(self) -> int:
+        return len(self.tx_pieces)
+
+    def is_complete(self) -> bool:
+        return not self.missing_tx_short_ids
+
+    def fill_missing_transactions(self, tx_service) -> Tuple[List[int], List[Sha256Hash]]:
+        """
+        Looks up contents of unresolved transactions only.
+
+        :param tx_service: Transactions service
+        :return: tuple (short ids still unknown, transaction hashes with contents still unknown)
+        """
+        unknown_tx_sids = []
+        unknown_tx_hashes = []
+        tx_pieces = self.tx_pieces
+        for index, short_id in list(self.missing_tx_short_ids.items()):
+            tx_hash, tx_contents, _ = tx_service.get_transaction(short_id)
+            if tx_hash is None:
+                unknown_tx_sids.append(short_id)
+            elif tx_contents is None:
+                unknown_tx_hashes.append(tx_hash)
+            else:
+                tx_pieces[index] = tx_contents
+                self.tx_content_size += len(tx_contents)
+                del self.missing_tx_short_ids[index]
+        return unknown_tx_sids, unknown_tx_hashes
+
+
 def finalize_block_bytes(
         buf: Deque[Union[bytes, bytearray, memoryview]], size: int, short_ids: List[int]
 ) -> memoryview:
@@ -41,6 +121,52 @@ def finalize_block_bytes(
     return memoryview(block)
 
 
+class BxBlockWriter:
+    """
+    Writes a bx block into a single buffer allocated upfront.
+
+    Block builders compute the size of the block contents before writing, so the block offset, the contents
+    and the serialized short ids are written straight into their final positions instead of being collected
+    as pieces and copied into a new buffer.
+
+    Layout: block contents end offset (8 bytes), block contents (`content_size` bytes), serialized short ids.
+    """
+
+    buffer: bytearray
+    offset: int
+
+    _content_end: int
+
+    def __init__(self, content_size: int, short_ids: List[int]) -> None:
+        serialized_short_ids = compact_block_short_ids_serializer.serialize_short_ids_into_bytes(short_ids)
+        self._content_end = constants.UL_ULL_SIZE_IN_BYTES + content_size
+        self.buffer = bytearray(self._content_end + len(serialized_short_ids))
+        struct.pack_into("<Q", self.buffer, 0, self._content_end)
+        self.buffer[self._content_end:] = serialized_short_ids
+        self.offset = constants.UL_ULL_SIZE_IN_BYTES
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        next_offset = self.offset + len(data)
+        self.buffer[self.offset:next_offset] = data
+        self.offset = next_offset
+
+    def write_byte(self, value: int) -> None:
+        self.buffer[self.offset] = value
+        self.offset += 1
+
+    def write_struct(self, fmt: str, *values) -> None:
+        struct.pack_into(fmt, self.buffer, self.offset, *values)
+        self.offset += struct.calcsize(fmt)
+
+    def finalize(self) -> memoryview:
+        if self.offset != self._content_end:
+            raise ValueError(
+                f"Written {self.offset - constants.UL_ULL_SIZE_IN_BYTES} bytes of bx block contents, "
+                f"expected {self._content_end - constants.UL_ULL_SIZE_IN_BYTES}."
+            )
+        return memoryview(self.buffer)
+
+
 class AbstractMessageConverter(SpecialMemoryProperties, metaclass=ABCMeta):
     """
     Message converter abstract class.
@@ -82,6 +208,16 @@ class AbstractMessageConverter(SpecialMemoryProperties, metaclass=ABCMeta):
 
         pass
 
+    def bx_txs_to_tx_msgs(self, bx_tx_msgs: List[TxMessage]) -> List[AbstractMessage]:
+        """
+        Converts internal transaction messages to blockchain transactions messages, packing
+        as many transactions in a message as the blockchain protocol allows
+
+        :param bx_tx_msgs: internal transaction messages
+        :return: list of blockchain transactions messages
+        """
+        return [self.bx_tx_to_tx(bx_tx_msg) for bx_tx_msg in bx_tx_msgs]
+
     @abstractmethod
     def block_to_bx_block(
         self, block_msg, tx_service, enable_block_compression: bool, min_tx_age_seconds: float
@@ -110,6 +246,56 @@ class AbstractMessageConverter(SpecialMemoryProperties, metaclass=ABCMeta):
         """
         pass
 
+    def bx_block_to_block_resumable(
+        self, bx_block_msg, tx_service
+    ) -> Tuple[BlockDecompressionResult, Optional[BlockDecompressionState]]:
+        """
+        Converts internal broadcast message to blockchain new block message, and returns the partial
+        decompression state if any of the transactions are unknown.
+
+        Converters that do not support resuming decompression return None for the state.
+
+        :param bx_block_msg: internal broadcast message bytes
+        :param tx_service: Transactions service
+        :return: tuple (block decompression result, decompression state)
+        """
+        return self.bx_block_to_block(bx_block_msg, tx_service), None
+
+    def resume_bx_block_to_block(
+        self, decompression_state: BlockDecompressionState, tx_service
+    ) -> Tuple[BlockDecompressionResult, Optional[BlockDecompressionState]]:
+        """
+        Resumes decompression of a block from state returned by `bx_block_to_block_resumable`, looking up
+        only the transactions that were unknown.
+
+        :param decompression_state: partial decompression state
+        :param tx_service: Transactions service
+        :return: tuple (block decompression result, decompression state)
+        """
+        return self.bx_block_to_block_resumable(decompression_state.bx_block, tx_service)
+
+    @abstractmethod
+    def block_message_from_bytes(self, block_bytes: Union[bytearray, memoryview]) -> AbstractBlockMessage:
+        """
+        Creates blockchain block message of the converter protocol from raw message bytes
+
+        :param block_bytes: block message bytes
+        :return: blockchain block message
+        """
+
+        pass
+
+    @abstractmethod
+    def get_block_transaction_hashes(self, block_msg) -> List[Sha256Hash]:
+        """
+        Computes hashes of the block transactions the same way `block_to_bx_block` does for short id lookups
+
+        :param block_msg: blockchain block message
+        :return: transaction hashes in block order
+        """
+
+        pass
+
     @abstractmethod
     def bdn_tx_to_bx_tx(
         self,
@@ -0,0 +1,25 @@
+import sys
+from typing import Dict, Callable, List, Optional
+
+from bxgateway.benchmarks import compression_benchmark, compact_block_benchmark, rlpx_framing_benchmark, \
+    rlpx_cipher_benchmark, block_writer_benchmark, feed_fanout_benchmark
+
+BENCHMARKS: Dict[str, Callable[[Optional[List[str]]], None]] = {
+    "compression": compression_benchmark.main,
+    "compact-block": compact_block_benchmark.main,
+    "rlpx-framing": rlpx_framing_benchmark.main,
+    "rlpx-cipher": rlpx_cipher_benchmark.main,
+    "block-writer": block_writer_benchmark.main,
+    "feed-fanout": feed_fanout_benchmark.main,
+}
+
+
+def main(args: List[str]) -> None:
+    if not args or args[0] not in BENCHMARKS:
+        print("Usage: python -m bxgateway.benchmarks {{{}}} [options]".format(",".join(sorted(BENCHMARKS))))
+        sys.exit(1)
+    BENCHMARKS[args[0]](args[1:])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,186 @@
+import datetime
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class LatencyStats:
+    p50_ms: float
+    p99_ms: float
+    min_ms: float
+    max_ms: float
+    avg_ms: float
+
+    def to_json(self) -> Dict[str, float]:
+        return {
+            "p50_ms": self.p50_ms,
+            "p99_ms": self.p99_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "avg_ms": self.avg_ms,
+        }
+
+
+@dataclass
+class AllocationStats:
+    peak_bytes: int
+    allocations: int
+    allocated_bytes: int
+
+    def to_json(self) -> Dict[str, int]:
+        return {
+            "peak_bytes": self.peak_bytes,
+            "allocations": self.allocations,
+            "allocated_bytes": self.allocated_bytes,
+        }
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of a list of values.
+
+    :param values: measured values
+    :param percent: percentile in range (0, 100]
+    :return: value at the requested percentile, 0 if there are no values
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(int(math.ceil(percent / 100 * len(ordered))), 1)
+    return ordered[rank - 1]
+
+
+def get_latency_stats(durations_s: List[float]) -> LatencyStats:
+    durations_ms = [duration * 1000 for duration in durations_s]
+    if not durations_ms:
+        return LatencyStats(0, 0, 0, 0, 0)
+    return LatencyStats(
+        percentile(durations_ms, 50),
+        percentile(durations_ms, 99),
+        min(durations_ms),
+        max(durations_ms),
+        sum(durations_ms) / len(durations_ms)
+    )
+
+
+def get_throughput(size_bytes: int, durations_s: List[float]) -> float:
+    """
+    :return: average bytes per second processed across all runs
+    """
+    total_duration = sum(durations_s)
+    if total_duration <= 0:
+        return 0
+    return size_bytes * len(durations_s) / total_duration
+
+
+def time_runs(func: Callable[[], T], iterations: int, warmup: int = 1) -> List[float]:
+    """
+    Runs `func` `warmup + iterations` times and returns durations of the measured runs in seconds.
+    """
+    for _ in range(warmup):
+        func()
+
+    durations = []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start_time)
+    return durations
+
+
+def measure_allocations(func: Callable[[], T]) -> AllocationStats:
+    """
+    Traces memory allocations made by a single run of `func`.
+
+    `allocations` and `allocated_bytes` count the memory blocks still alive when `func` returns
+    (including its result), `peak_bytes` is the highest amount of traced memory during the run.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.clear_traces()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func()
+        after = tracemalloc.take_snapshot()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    allocations = 0
+    allocated_bytes = 0
+    for stat in after.compare_to(before, "lineno"):
+        if stat.count_diff > 0:
+            allocations += stat.count_diff
+        if stat.size_diff > 0:
+            allocated_bytes += stat.size_diff
+    del result
+
+    return AllocationStats(peak, allocations, allocated_bytes)
+
+
+def get_environment_info() -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.datetime.utcnow().isoformat(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "argv": sys.argv[1:],
+    }
+
+
+def write_report(report: Dict[str, Any], output_file: Optional[str]) -> None:
+    serialized = json.dumps(report, indent=2, sort_keys=True)
+    if output_file:
+        with open(output_file, "w") as f:
+            f.write(serialized)
+            f.write("\n")
+    else:
+        print(serialized)
+
+
+def load_report(report_file: str) -> Dict[str, Any]:
+    with open(report_file, "r") as f:
+        return json.load(f)
+
+
+def compare_metrics(
+    baseline: Dict[str, Any], current: Dict[str, Any], path: str = ""
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compares all numeric metrics that exist in both reports.
+
+    :return: dictionary of metric path to baseline value, current value and relative change in percent
+    """
+    result = {}
+    for key, current_value in current.items():
+        if key not in baseline:
+            continue
+        baseline_value = baseline[key]
+        metric_path = f"{path}.{key}" if path else key
+        if isinstance(current_value, dict) and isinstance(baseline_value, dict):
+            result.update(compare_metrics(baseline_value, current_value, metric_path))
+        elif (
+            isinstance(current_value, (int, float))
+            and isinstance(baseline_value, (int, float))
+            and not isinstance(current_value, bool)
+        ):
+            if baseline_value:
+                change_percent = (current_value - baseline_value) / baseline_value * 100
+            else:
+                change_percent = 0
+            result[metric_path] = {
+                "baseline": baseline_value,
+                "current": current_value,
+                "change_percent": change_percent,
+            }
+    return result
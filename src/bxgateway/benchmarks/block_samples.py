@@ -0,0 +1,169 @@
+import os
+import struct
+from typing import List, NamedTuple, Union, Callable
+
+from bxcommon.messages.abstract_block_message import AbstractBlockMessage
+from bxcommon.utils import convert
+from bxcommon.utils.blockchain_utils.btc import btc_common_utils
+from bxcommon.utils.blockchain_utils.eth import rlp_utils, eth_common_utils
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway import btc_constants, ont_constants
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.btc_message import BtcMessage
+from bxgateway.messages.eth.eth_abstract_message_converter import parse_block_message
+from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
+from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
+from bxgateway.messages.ont import ont_messages_util
+from bxgateway.messages.ont.block_ont_message import BlockOntMessage
+
+ETH_SAMPLE_BLOCK_FILE = "eth_sample_block.txt"
+BTC_SAMPLE_BLOCK_FILE = "btc_segwit_sample_block.txt"
+ONT_SAMPLE_BLOCK_FILE = "ont_sample_block.txt"
+
+# synthetic transactions are made unique by writing their index into 4 bytes that are part of the hashed contents
+UNIQUE_TX_MARKER_LEN = 4
+ONT_TX_NONCE_OFFSET = 2
+
+# <repo>/src/bxgateway/benchmarks -> <repo>/test/unit/samples
+DEFAULT_SAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "test", "unit", "samples"
+)
+
+
+class SyntheticBlock(NamedTuple):
+    block_msg: AbstractBlockMessage
+    tx_hashes: List[Sha256Hash]
+    tx_contents: List[Union[bytearray, memoryview]]
+    size: int
+
+
+def read_sample_bytes(samples_dir: str, file_name: str) -> bytearray:
+    with open(os.path.join(samples_dir, file_name)) as sample_file:
+        sample_hex = sample_file.read().strip("\n")
+    return bytearray(convert.hex_to_bytes(sample_hex))
+
+
+def tx_count_for_block_size(sample_txs: List[Union[bytearray, memoryview]], block_size: int) -> int:
+    average_tx_size = sum(len(tx) for tx in sample_txs) / len(sample_txs)
+    return max(int(block_size / average_tx_size), 1)
+
+
+def make_unique_txs(
+    sample_txs: List[Union[bytearray, memoryview]],
+    tx_count: int,
+    mark_tx: Callable[[bytearray, int], None]
+) -> List[bytearray]:
+    """
+    Builds `tx_count` distinct transactions by cycling through the sample transactions
+    and marking each copy with its index.
+    """
+    txs = []
+    for index in range(tx_count):
+        tx = bytearray(sample_txs[index % len(sample_txs)])
+        mark_tx(tx, index)
+        txs.append(tx)
+    return txs
+
+
+def _mark_eth_tx(tx: bytearray, index: int) -> None:
+    # last bytes of both legacy and typed transactions belong to the `s` signature value
+    struct.pack_into(">I", tx, len(tx) - UNIQUE_TX_MARKER_LEN, index)
+
+
+def _mark_btc_tx(tx: bytearray, index: int) -> None:
+    # lock time
+    struct.pack_into("<I", tx, len(tx) - UNIQUE_TX_MARKER_LEN, index)
+
+
+def _mark_ont_tx(tx: bytearray, index: int) -> None:
+    struct.pack_into("<I", tx, ONT_TX_NONCE_OFFSET, index)
+
+
+def get_eth_sample_txs(block_msg: InternalEthBlockInfo) -> List[memoryview]:
+    txs_bytes, _, _, _ = parse_block_message(block_msg)
+    txs = []
+    tx_start_index = 0
+    while tx_start_index < len(txs_bytes):
+        _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(txs_bytes, tx_start_index)
+        txs.append(txs_bytes[tx_start_index:tx_item_start + tx_item_length])
+        tx_start_index = tx_item_start + tx_item_length
+    return txs
+
+
+def build_eth_block(samples_dir: str, tx_count: int = 0, block_size: int = 0) -> SyntheticBlock:
+    sample_block = InternalEthBlockInfo.from_new_block_msg(
+        NewBlockEthProtocolMessage(msg_bytes=read_sample_bytes(samples_dir, ETH_SAMPLE_BLOCK_FILE))
+    )
+    sample_txs = get_eth_sample_txs(sample_block)
+    if not tx_count:
+        tx_count = tx_count_for_block_size(sample_txs, block_size) if block_size else len(sample_txs)
+    txs = make_unique_txs(sample_txs, tx_count, _mark_eth_tx)
+
+    _, block_hdr_full_bytes, remaining_bytes, _ = parse_block_message(sample_block)
+    txs_size = sum(len(tx) for tx in txs)
+    txs_prefix = rlp_utils.get_length_prefix_list(txs_size)
+    content_size = len(block_hdr_full_bytes) + len(txs_prefix) + txs_size + len(remaining_bytes)
+    block_prefix = rlp_utils.get_length_prefix_list(content_size)
+
+    block_bytes = bytearray(len(block_prefix) + content_size)
+    offset = 0
+    for piece in [block_prefix, block_hdr_full_bytes, txs_prefix, *txs, remaining_bytes]:
+        block_bytes[offset:offset + len(piece)] = piece
+        offset += len(piece)
+
+    tx_hashes = [Sha256Hash(eth_common_utils.keccak_hash(tx)) for tx in txs]
+    return SyntheticBlock(InternalEthBlockInfo(block_bytes), tx_hashes, txs, len(block_bytes))
+
+
+def build_btc_block(samples_dir: str, tx_count: int = 0, block_size: int = 0) -> SyntheticBlock:
+    payload = read_sample_bytes(samples_dir, BTC_SAMPLE_BLOCK_FILE)
+    buf = bytearray(btc_constants.BTC_HDR_COMMON_OFF + len(payload))
+    buf[btc_constants.BTC_HDR_COMMON_OFF:] = payload
+    msg = BtcMessage(magic="main", command=BlockBtcMessage.MESSAGE_TYPE, payload_len=len(payload), buf=buf)
+    sample_block = BlockBtcMessage(buf=msg.buf)
+
+    sample_txs = sample_block.txns()
+    if not tx_count:
+        tx_count = tx_count_for_block_size(sample_txs, block_size) if block_size else len(sample_txs)
+    txs = make_unique_txs(sample_txs, tx_count, _mark_btc_tx)
+
+    header_size = btc_constants.BTC_HDR_COMMON_OFF + btc_constants.BTC_BLOCK_HDR_SIZE
+    tx_count_size = btc_messages_util.get_sizeof_btc_varint(tx_count)
+    block_bytes = bytearray(header_size + tx_count_size + sum(len(tx) for tx in txs))
+    block_bytes[:header_size] = sample_block.rawbytes()[:header_size]
+    offset = header_size
+    offset += btc_messages_util.pack_int_to_btc_varint(tx_count, block_bytes, offset)
+    for tx in txs:
+        block_bytes[offset:offset + len(tx)] = tx
+        offset += len(tx)
+    struct.pack_into("<L", block_bytes, 16, len(block_bytes) - btc_constants.BTC_HDR_COMMON_OFF)
+
+    tx_hashes = [btc_common_utils.get_txid(tx) for tx in txs]
+    return SyntheticBlock(BlockBtcMessage(buf=block_bytes), tx_hashes, txs, len(block_bytes))
+
+
+def build_ont_block(samples_dir: str, tx_count: int = 0, block_size: int = 0) -> SyntheticBlock:
+    sample_block = BlockOntMessage(buf=read_sample_bytes(samples_dir, ONT_SAMPLE_BLOCK_FILE))
+
+    sample_txs = sample_block.txns()
+    if not tx_count:
+        tx_count = tx_count_for_block_size(sample_txs, block_size) if block_size else len(sample_txs)
+    txs = make_unique_txs(sample_txs, tx_count, _mark_ont_tx)
+
+    txn_header = sample_block.txn_header()
+    merkle_root = sample_block.merkle_root()
+    block_bytes = bytearray(len(txn_header) + sum(len(tx) for tx in txs) + len(merkle_root))
+    block_bytes[:len(txn_header)] = txn_header
+    offset = len(txn_header)
+    for tx in txs:
+        block_bytes[offset:offset + len(tx)] = tx
+        offset += len(tx)
+    block_bytes[offset:offset + len(merkle_root)] = merkle_root
+    struct.pack_into("<L", block_bytes, len(txn_header) - ont_constants.ONT_INT_LEN, tx_count)
+    struct.pack_into("<L", block_bytes, 16, len(block_bytes) - ont_constants.ONT_HDR_COMMON_OFF)
+
+    tx_hashes = [ont_messages_util.get_txid(tx)[0] for tx in txs]
+    return SyntheticBlock(BlockOntMessage(buf=block_bytes), tx_hashes, txs, len(block_bytes))
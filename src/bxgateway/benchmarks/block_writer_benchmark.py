@@ -0,0 +1,235 @@
+"""
+Benchmark of writing compressed blocks (bx blocks) of the Ethereum and Bitcoin message converters.
+
+Compares collecting the block pieces in a deque and copying them into a new buffer once the block size
+is known with computing the block size upfront and writing the pieces straight into a preallocated buffer.
+Both approaches look up short ids the same way, so the difference comes from writing the block only.
+
+Usage:
+    python -m bxgateway.benchmarks block-writer --block-sizes 1000000 5000000 --short-id-hit-ratio 0 1
+"""
+import argparse
+import sys
+from collections import deque
+from typing import List, Dict, Any, Callable, Optional
+
+from bxcommon import constants
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.utils.blockchain_utils.btc import btc_common_utils
+from bxcommon.utils.blockchain_utils.eth import rlp_utils
+
+from bxgateway import btc_constants
+from bxgateway.abstract_message_converter import finalize_block_bytes
+from bxgateway.benchmarks import benchmark_utils, block_samples, compression_benchmark
+from bxgateway.messages.eth.eth_abstract_message_converter import parse_block_message
+from bxgateway.services.gateway_transaction_service import get_short_ids_and_assign_times
+from bxgateway.utils.eth.block_transaction_hashes_memo import block_transaction_hashes_memo
+
+PROTOCOLS = [compression_benchmark.PROTOCOL_ETH, compression_benchmark.PROTOCOL_BTC]
+
+DEFAULT_BLOCK_SIZES = [1000000]
+DEFAULT_SHORT_ID_HIT_RATIOS = [0.0, 1.0]
+DEFAULT_ITERATIONS = 20
+DEFAULT_SEED = 0
+
+
+def write_eth_bx_block_from_pieces(block_msg, tx_service: TransactionService) -> memoryview:
+    """
+    Previous approach: collects the Ethereum bx block pieces in a deque, prepending RLP prefixes once
+    the size of each list is known, and copies the pieces into a new buffer
+    """
+    txs_bytes, block_hdr_full_bytes, remaining_bytes, _ = parse_block_message(block_msg)
+    txs_bytes_list = []
+    tx_start_index = 0
+    while tx_start_index < len(txs_bytes):
+        _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(txs_bytes, tx_start_index)
+        tx_end_index = tx_item_start + tx_item_length
+        txs_bytes_list.append(txs_bytes[tx_start_index:tx_end_index])
+        tx_start_index = tx_end_index
+    tx_hashes = block_transaction_hashes_memo.get_or_hash(block_msg.block_hash(), txs_bytes_list)
+    short_ids, _ = get_short_ids_and_assign_times(tx_service, tx_hashes)
+
+    used_short_ids = []
+    content_size = 0
+    buf = deque()
+    for tx_bytes, short_id in zip(txs_bytes_list, short_ids):
+        if short_id <= constants.NULL_TX_SID:
+            is_full_tx_bytes = rlp_utils.encode_int(1)
+            tx_content_bytes = tx_bytes
+        else:
+            is_full_tx_bytes = rlp_utils.encode_int(0)
+            used_short_ids.append(short_id)
+            tx_content_bytes = bytes()
+        tx_content_prefix = rlp_utils.get_length_prefix_str(len(tx_content_bytes))
+        short_tx_content_size = len(is_full_tx_bytes) + len(tx_content_prefix) + len(tx_content_bytes)
+        short_tx_content_prefix_bytes = rlp_utils.get_length_prefix_list(short_tx_content_size)
+        buf.extend([short_tx_content_prefix_bytes, is_full_tx_bytes, tx_content_prefix, tx_content_bytes])
+        content_size += len(short_tx_content_prefix_bytes) + short_tx_content_size
+
+    list_of_txs_prefix_bytes = rlp_utils.get_length_prefix_list(content_size)
+    buf.appendleft(list_of_txs_prefix_bytes)
+    content_size += len(list_of_txs_prefix_bytes)
+    buf.appendleft(block_hdr_full_bytes)
+    content_size += len(block_hdr_full_bytes)
+    buf.append(remaining_bytes)
+    content_size += len(remaining_bytes)
+    compact_block_msg_prefix = rlp_utils.get_length_prefix_list(content_size)
+    buf.appendleft(compact_block_msg_prefix)
+    content_size += len(compact_block_msg_prefix)
+
+    return finalize_block_bytes(buf, content_size, used_short_ids)
+
+
+def write_btc_bx_block_from_pieces(block_msg, tx_service: TransactionService) -> memoryview:
+    """
+    Previous approach: collects the Bitcoin bx block pieces in a deque and copies them into a new buffer
+    """
+    txns = block_msg.txns()
+    short_ids, _ = get_short_ids_and_assign_times(tx_service, [btc_common_utils.get_txid(tx) for tx in txns])
+
+    used_short_ids = []
+    header = block_msg.header()
+    size = len(header)
+    buf = deque([header])
+    for tx, short_id in zip(txns, short_ids):
+        if short_id == constants.NULL_TX_SID:
+            buf.append(tx)
+            size += len(tx)
+        else:
+            used_short_ids.append(short_id)
+            buf.append(btc_constants.BTC_SHORT_ID_INDICATOR_AS_BYTEARRAY)
+            size += btc_constants.BTC_SHORT_ID_INDICATOR_LENGTH
+
+    return finalize_block_bytes(buf, size, used_short_ids)
+
+
+PIECES_WRITERS: Dict[str, Callable[[Any, TransactionService], memoryview]] = {
+    compression_benchmark.PROTOCOL_ETH: write_eth_bx_block_from_pieces,
+    compression_benchmark.PROTOCOL_BTC: write_btc_bx_block_from_pieces,
+}
+
+
+def run_block_benchmark(
+    protocol: str, block: block_samples.SyntheticBlock, tx_service: TransactionService, opts: argparse.Namespace
+) -> Dict[str, Any]:
+    converter = compression_benchmark.create_message_converter(protocol, block, opts)
+    write_from_pieces = PIECES_WRITERS[protocol]
+
+    def write_preallocated():
+        return converter.block_to_bx_block(block.block_msg, tx_service, True, 0)[0]
+
+    def write_pieces():
+        return write_from_pieces(block.block_msg, tx_service)
+
+    bx_block = write_preallocated()
+    if bytes(bx_block) != bytes(write_pieces()):
+        raise ValueError("Writing the block into a preallocated buffer produced a different bx block.")
+
+    pieces_durations = benchmark_utils.time_runs(write_pieces, opts.iterations)
+    preallocated_durations = benchmark_utils.time_runs(write_preallocated, opts.iterations)
+    return {
+        "bx_block_size": len(bx_block),
+        "pieces": {
+            "latency": benchmark_utils.get_latency_stats(pieces_durations).to_json(),
+            "allocations": benchmark_utils.measure_allocations(write_pieces).to_json(),
+        },
+        "preallocated": {
+            "latency": benchmark_utils.get_latency_stats(preallocated_durations).to_json(),
+            "allocations": benchmark_utils.measure_allocations(write_preallocated).to_json(),
+        },
+    }
+
+
+def run_benchmark(opts: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    tx_service = compression_benchmark.create_transaction_service(False)
+    for protocol in opts.protocols:
+        protocol_results = {}
+        for block_size in opts.block_sizes:
+            block = compression_benchmark.BLOCK_BUILDERS[protocol](opts.samples_dir, block_size=block_size)
+            for short_id_hit_ratio in opts.short_id_hit_ratio:
+                compression_benchmark.populate_transaction_service(tx_service, block, short_id_hit_ratio, opts.seed)
+                protocol_results[f"block_{block_size}_hit_ratio_{short_id_hit_ratio:g}"] = run_block_benchmark(
+                    protocol, block, tx_service, opts
+                )
+        results[protocol] = protocol_results
+        tx_service.clear()
+
+    return {
+        "benchmark": "block-writer",
+        "environment": benchmark_utils.get_environment_info(),
+        "parameters": {
+            "iterations": opts.iterations,
+            "seed": opts.seed,
+        },
+        "results": results,
+    }
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m bxgateway.benchmarks block-writer",
+        description="Measures latency and allocations of writing compressed blocks"
+    )
+    arg_parser.add_argument(
+        "--protocols",
+        nargs="+",
+        choices=PROTOCOLS,
+        default=PROTOCOLS,
+        help="Blockchain protocols to benchmark"
+    )
+    arg_parser.add_argument(
+        "--block-sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_BLOCK_SIZES,
+        help="Approximate sizes of the generated blocks in bytes"
+    )
+    arg_parser.add_argument(
+        "--short-id-hit-ratio",
+        type=float,
+        nargs="+",
+        default=DEFAULT_SHORT_ID_HIT_RATIOS,
+        help="Share of the block transactions with short ids in the transaction service, in range [0, 1]"
+    )
+    arg_parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="Number of measured runs per block"
+    )
+    arg_parser.add_argument(
+        "--samples-dir",
+        default=block_samples.DEFAULT_SAMPLES_DIR,
+        help="Directory with the sample blocks used to build the benchmark blocks"
+    )
+    arg_parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed for selecting known transactions")
+    arg_parser.add_argument("--output", help="File to write the JSON report to (default: stdout)")
+    arg_parser.add_argument("--compare", help="JSON report of a previous run to compare the results with")
+    return arg_parser
+
+
+def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
+    opts = get_argument_parser().parse_args(args)
+    for short_id_hit_ratio in opts.short_id_hit_ratio:
+        if not 0 <= short_id_hit_ratio <= 1:
+            raise ValueError(f"Short id hit ratio must be in range [0, 1], got {short_id_hit_ratio}")
+
+    # options expected by the message converter factories
+    opts.import_extensions = False
+    opts.enable_eth_extensions = False
+    return opts
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    opts = parse_arguments(args)
+    report = run_benchmark(opts)
+    if opts.compare:
+        report["comparison"] = benchmark_utils.compare_metrics(
+            benchmark_utils.load_report(opts.compare)["results"], report["results"]
+        )
+    benchmark_utils.write_report(report, opts.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
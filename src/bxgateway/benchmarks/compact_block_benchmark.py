@@ -0,0 +1,210 @@
+"""
+Benchmark of Bitcoin compact block reconstruction (compact block -> bx_block) depending on the mempool size.
+
+Measures reconstruction with an empty short id index (first compact block for a SipHash key),
+with a warm index (compact blocks sharing the key), and the previous approach of computing
+short ids of the mempool until all block transactions are found.
+
+Usage:
+    python -m bxgateway.benchmarks compact-block --mempool-sizes 10000 100000 300000 --output current.json
+"""
+import argparse
+import random
+import struct
+import sys
+from typing import List, Dict, Any, Optional
+
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.utils.blockchain_utils.btc import btc_common_utils
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway import btc_constants
+from bxgateway.benchmarks import benchmark_utils
+from bxgateway.benchmarks.compression_benchmark import create_transaction_service
+from bxgateway.messages.btc import btc_messages_util
+from bxgateway.messages.btc.btc_message import BtcMessage
+from bxgateway.messages.btc.btc_normal_message_converter import BtcNormalMessageConverter
+from bxgateway.messages.btc.compact_block_btc_message import CompactBlockBtcMessage
+from bxgateway.messages.btc.compact_block_short_id_index import compute_short_id, get_short_id_key
+
+DEFAULT_MEMPOOL_SIZES = [10000, 100000, 300000]
+DEFAULT_BLOCK_TX_COUNT = 2500
+DEFAULT_ITERATIONS = 3
+DEFAULT_SEED = 0
+
+BTC_MAGIC = "main"
+TX_VALUE = 1000
+
+
+def build_transaction(index: int) -> bytearray:
+    """
+    Builds a minimal non-segwit transaction with one input spending output `index` of a null transaction
+    """
+    tx = bytearray()
+    tx += struct.pack("<I", 1)
+    tx += b"\x01"
+    tx += struct.pack("<32sI", index.to_bytes(btc_constants.BTC_SHA_HASH_LEN, "little"), 0)
+    tx += b"\x00"
+    tx += struct.pack("<I", 0xffffffff)
+    tx += b"\x01"
+    tx += struct.pack("<Q", TX_VALUE)
+    tx += b"\x00"
+    tx += struct.pack("<I", 0)
+    return tx
+
+
+def populate_mempool(tx_service: TransactionService, mempool_size: int) -> List[Sha256Hash]:
+    tx_service.clear()
+    tx_hashes = []
+    for index in range(mempool_size):
+        tx = build_transaction(index)
+        tx_hash = btc_common_utils.get_txid(tx)
+        tx_service.set_transaction_contents_by_key(tx_service.get_transaction_key(tx_hash), tx)
+        tx_hashes.append(tx_hash)
+    return tx_hashes
+
+
+def build_compact_block(block_tx_hashes: List[Sha256Hash], rand: random.Random) -> CompactBlockBtcMessage:
+    block_header = bytearray(rand.getrandbits(8) for _ in range(btc_constants.BTC_BLOCK_HDR_SIZE))
+    short_nonce_buf = bytearray(rand.getrandbits(8) for _ in range(btc_constants.BTC_SHORT_NONCE_SIZE))
+    key = get_short_id_key(block_header, short_nonce_buf)
+
+    short_id_count_size = btc_messages_util.get_sizeof_btc_varint(len(block_tx_hashes))
+    payload_len = (
+        btc_constants.BTC_BLOCK_HDR_SIZE
+        + btc_constants.BTC_SHORT_NONCE_SIZE
+        + short_id_count_size
+        + btc_constants.BTC_COMPACT_BLOCK_SHORT_ID_LEN * len(block_tx_hashes)
+        + btc_constants.BTC_VARINT_MIN_SIZE
+    )
+    buf = bytearray(btc_constants.BTC_HDR_COMMON_OFF + payload_len)
+    off = btc_constants.BTC_HDR_COMMON_OFF
+    buf[off:off + btc_constants.BTC_BLOCK_HDR_SIZE] = block_header
+    off += btc_constants.BTC_BLOCK_HDR_SIZE
+    buf[off:off + btc_constants.BTC_SHORT_NONCE_SIZE] = short_nonce_buf
+    off += btc_constants.BTC_SHORT_NONCE_SIZE
+    off += btc_messages_util.pack_int_to_btc_varint(len(block_tx_hashes), buf, off)
+    for tx_hash in block_tx_hashes:
+        buf[off:off + btc_constants.BTC_COMPACT_BLOCK_SHORT_ID_LEN] = compute_short_id(key, tx_hash.binary[::-1])
+        off += btc_constants.BTC_COMPACT_BLOCK_SHORT_ID_LEN
+    # no pre-filled transactions
+    off += btc_messages_util.pack_int_to_btc_varint(0, buf, off)
+
+    msg = BtcMessage(magic=BTC_MAGIC, command=CompactBlockBtcMessage.MESSAGE_TYPE, payload_len=payload_len, buf=buf)
+    return CompactBlockBtcMessage(buf=msg.buf)
+
+
+def full_scan(compact_block: CompactBlockBtcMessage, tx_service: TransactionService) -> int:
+    """
+    Previous reconstruction approach: short ids of mempool transactions are computed for each compact block
+    """
+    key = get_short_id_key(compact_block.block_header(), compact_block.short_nonce_buf())
+    short_ids = compact_block.short_ids()
+    found_short_ids = set()
+    for tx_hash in tx_service.iter_transaction_hashes():
+        tx_short_id = compute_short_id(key, tx_hash.binary[::-1])
+        if tx_short_id in short_ids:
+            found_short_ids.add(tx_short_id)
+            if len(found_short_ids) == len(short_ids):
+                break
+    return len(found_short_ids)
+
+
+def run_mempool_benchmark(
+    tx_service: TransactionService, mempool_size: int, block_tx_count: int, iterations: int, seed: int
+) -> Dict[str, Any]:
+    rand = random.Random(seed)
+    mempool_tx_hashes = populate_mempool(tx_service, mempool_size)
+    compact_block = build_compact_block(
+        rand.sample(mempool_tx_hashes, min(block_tx_count, mempool_size)), rand
+    )
+    magic = compact_block.magic()
+
+    def reconstruct_cold():
+        return BtcNormalMessageConverter(magic).compact_block_to_bx_block(compact_block, tx_service)
+
+    warm_converter = BtcNormalMessageConverter(magic)
+
+    def reconstruct_warm():
+        return warm_converter.compact_block_to_bx_block(compact_block, tx_service)
+
+    result = reconstruct_cold()
+    if result.missing_indices:
+        raise ValueError(f"Could not reconstruct benchmark compact block, {len(result.missing_indices)} "
+                         f"transactions are missing.")
+
+    cold_durations = benchmark_utils.time_runs(reconstruct_cold, iterations, warmup=0)
+    warm_durations = benchmark_utils.time_runs(reconstruct_warm, iterations)
+    full_scan_durations = benchmark_utils.time_runs(lambda: full_scan(compact_block, tx_service), iterations, 0)
+
+    return {
+        "mempool_size": mempool_size,
+        "block_tx_count": len(compact_block.short_ids()),
+        "reconstruction_cold_index": benchmark_utils.get_latency_stats(cold_durations).to_json(),
+        "reconstruction_warm_index": benchmark_utils.get_latency_stats(warm_durations).to_json(),
+        "full_mempool_scan": benchmark_utils.get_latency_stats(full_scan_durations).to_json(),
+    }
+
+
+def run_benchmark(opts: argparse.Namespace) -> Dict[str, Any]:
+    tx_service = create_transaction_service(False)
+    results = {}
+    for mempool_size in opts.mempool_sizes:
+        results[f"mempool_{mempool_size}"] = run_mempool_benchmark(
+            tx_service, mempool_size, opts.block_tx_count, opts.iterations, opts.seed
+        )
+    tx_service.clear()
+
+    return {
+        "benchmark": "compact-block",
+        "environment": benchmark_utils.get_environment_info(),
+        "parameters": {
+            "iterations": opts.iterations,
+            "seed": opts.seed,
+        },
+        "results": results,
+    }
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m bxgateway.benchmarks compact-block",
+        description="Measures Bitcoin compact block reconstruction time depending on the mempool size"
+    )
+    arg_parser.add_argument(
+        "--mempool-sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_MEMPOOL_SIZES,
+        help="Numbers of transactions in the transaction service"
+    )
+    arg_parser.add_argument(
+        "--block-tx-count",
+        type=int,
+        default=DEFAULT_BLOCK_TX_COUNT,
+        help="Number of transactions in the compact block"
+    )
+    arg_parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="Number of measured reconstructions per mempool size"
+    )
+    arg_parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed for generating the compact block")
+    arg_parser.add_argument("--output", help="File to write the JSON report to (default: stdout)")
+    arg_parser.add_argument("--compare", help="JSON report of a previous run to compare the results with")
+    return arg_parser
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    opts = get_argument_parser().parse_args(args)
+    report = run_benchmark(opts)
+    if opts.compare:
+        report["comparison"] = benchmark_utils.compare_metrics(
+            benchmark_utils.load_report(opts.compare)["results"], report["results"]
+        )
+    benchmark_utils.write_report(report, opts.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,232 @@
+"""
+Benchmark of block compression (block -> bx_block) and decompression (bx_block -> block)
+for the Ethereum, Bitcoin and Ontology message converters.
+
+Synthetic blocks are built from the sample blocks used by the unit tests, so the benchmark
+must be run from a source checkout or pointed to a samples directory with `--samples-dir`.
+
+Usage:
+    python -m bxgateway.benchmarks compression --tx-count 200 --short-id-hit-ratio 0 0.5 1 \
+        --output current.json --compare baseline.json
+"""
+import argparse
+import random
+import sys
+from typing import List, Dict, Any, Callable, Optional
+
+from bxcommon.services.transaction_service import TransactionService
+
+from bxgateway.abstract_message_converter import AbstractMessageConverter
+from bxgateway.benchmarks import benchmark_utils, block_samples
+from bxgateway.benchmarks.block_samples import SyntheticBlock
+from bxgateway.messages.btc.btc_message_converter_factory import create_btc_message_converter
+from bxgateway.messages.eth.eth_message_converter_factory import create_eth_message_converter
+from bxgateway.messages.ont.ont_message_converter_factory import create_ont_message_converter
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+
+PROTOCOL_ETH = "eth"
+PROTOCOL_BTC = "btc"
+PROTOCOL_ONT = "ont"
+PROTOCOLS = [PROTOCOL_ETH, PROTOCOL_BTC, PROTOCOL_ONT]
+
+BLOCK_BUILDERS: Dict[str, Callable[..., SyntheticBlock]] = {
+    PROTOCOL_ETH: block_samples.build_eth_block,
+    PROTOCOL_BTC: block_samples.build_btc_block,
+    PROTOCOL_ONT: block_samples.build_ont_block,
+}
+
+DEFAULT_ITERATIONS = 20
+DEFAULT_SHORT_ID_HIT_RATIOS = [0.0, 0.5, 1.0]
+DEFAULT_SEED = 0
+
+
+def create_message_converter(
+    protocol: str, block: SyntheticBlock, opts: argparse.Namespace
+) -> AbstractMessageConverter:
+    if protocol == PROTOCOL_ETH:
+        return create_eth_message_converter(opts)
+    elif protocol == PROTOCOL_BTC:
+        return create_btc_message_converter(block.block_msg.magic(), opts)
+    elif protocol == PROTOCOL_ONT:
+        return create_ont_message_converter(block.block_msg.magic(), opts)
+    else:
+        raise ValueError(f"Unsupported protocol: {protocol}")
+
+
+def create_transaction_service(use_extensions: bool) -> TransactionService:
+    node = MockGatewayNode(
+        gateway_helpers.get_gateway_opts(8000, include_default_eth_args=True, use_extensions=use_extensions)
+    )
+    return node.get_tx_service()
+
+
+def populate_transaction_service(
+    tx_service: TransactionService, block: SyntheticBlock, short_id_hit_ratio: float, seed: int
+) -> int:
+    """
+    Assigns short ids and contents for a random `short_id_hit_ratio` share of the block transactions.
+
+    :return: number of transactions known to the transaction service
+    """
+    tx_service.clear()
+    rand = random.Random(seed)
+    tx_count = len(block.tx_hashes)
+    known_indices = rand.sample(range(tx_count), int(round(tx_count * short_id_hit_ratio)))
+    for short_id, index in enumerate(sorted(known_indices), 1):
+        tx_key = tx_service.get_transaction_key(block.tx_hashes[index])
+        tx_service.assign_short_id_by_key(tx_key, short_id)
+        tx_service.set_transaction_contents_by_key(tx_key, block.tx_contents[index])
+    return len(known_indices)
+
+
+def run_block_benchmark(
+    converter: AbstractMessageConverter,
+    tx_service: TransactionService,
+    block: SyntheticBlock,
+    iterations: int,
+) -> Dict[str, Any]:
+    def compress():
+        return converter.block_to_bx_block(block.block_msg, tx_service, True, 0)
+
+    bx_block, block_info = compress()
+
+    def decompress():
+        return converter.bx_block_to_block(bx_block, tx_service)
+
+    decompression_result = decompress()
+    if decompression_result.block_msg is None:
+        raise ValueError(
+            f"Could not decompress benchmark block. Unknown short ids: {decompression_result.unknown_short_ids}, "
+            f"unknown transactions: {decompression_result.unknown_tx_hashes}"
+        )
+
+    compress_durations = benchmark_utils.time_runs(compress, iterations)
+    decompress_durations = benchmark_utils.time_runs(decompress, iterations)
+
+    return {
+        "block_size": block.size,
+        "bx_block_size": len(bx_block),
+        "short_ids": len(block_info.short_ids),
+        "compression": {
+            "latency": benchmark_utils.get_latency_stats(compress_durations).to_json(),
+            "bytes_per_second": benchmark_utils.get_throughput(block.size, compress_durations),
+            "allocations": benchmark_utils.measure_allocations(compress).to_json(),
+        },
+        "decompression": {
+            "latency": benchmark_utils.get_latency_stats(decompress_durations).to_json(),
+            "bytes_per_second": benchmark_utils.get_throughput(len(bx_block), decompress_durations),
+            "allocations": benchmark_utils.measure_allocations(decompress).to_json(),
+        },
+    }
+
+
+def run_benchmark(opts: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    tx_service = create_transaction_service(opts.use_extensions)
+    for protocol in opts.protocols:
+        block = BLOCK_BUILDERS[protocol](opts.samples_dir, opts.tx_count, opts.block_size)
+        converter = create_message_converter(protocol, block, opts)
+        protocol_results = {}
+        for short_id_hit_ratio in opts.short_id_hit_ratio:
+            populate_transaction_service(tx_service, block, short_id_hit_ratio, opts.seed)
+            protocol_results[f"hit_ratio_{short_id_hit_ratio:g}"] = run_block_benchmark(
+                converter, tx_service, block, opts.iterations
+            )
+        results[protocol] = {
+            "tx_count": len(block.tx_hashes),
+            "converter": type(converter).__name__,
+            "results": protocol_results,
+        }
+        tx_service.clear()
+
+    return {
+        "benchmark": "compression",
+        "environment": benchmark_utils.get_environment_info(),
+        "parameters": {
+            "iterations": opts.iterations,
+            "use_extensions": opts.use_extensions,
+            "seed": opts.seed,
+        },
+        "protocols": results,
+    }
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m bxgateway.benchmarks compression",
+        description="Measures block compression and decompression latency, throughput and allocations"
+    )
+    arg_parser.add_argument(
+        "--protocols",
+        nargs="+",
+        choices=PROTOCOLS,
+        default=PROTOCOLS,
+        help="Blockchain protocols to benchmark"
+    )
+    block_size_group = arg_parser.add_mutually_exclusive_group()
+    block_size_group.add_argument(
+        "--tx-count",
+        type=int,
+        default=0,
+        help="Number of transactions in the benchmark block (default: same as the sample block)"
+    )
+    block_size_group.add_argument(
+        "--block-size",
+        type=int,
+        default=0,
+        help="Approximate size of the benchmark block in bytes"
+    )
+    arg_parser.add_argument(
+        "--short-id-hit-ratio",
+        type=float,
+        nargs="+",
+        default=DEFAULT_SHORT_ID_HIT_RATIOS,
+        help="Share of the block transactions with short ids in the transaction service, in range [0, 1]"
+    )
+    arg_parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="Number of measured compression and decompression runs per block"
+    )
+    arg_parser.add_argument(
+        "--use-extensions",
+        action="store_true",
+        help="Benchmark the C++ extension converters and transaction service"
+    )
+    arg_parser.add_argument(
+        "--samples-dir",
+        default=block_samples.DEFAULT_SAMPLES_DIR,
+        help="Directory with the sample blocks used to build the benchmark blocks"
+    )
+    arg_parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed for selecting known transactions")
+    arg_parser.add_argument("--output", help="File to write the JSON report to (default: stdout)")
+    arg_parser.add_argument("--compare", help="JSON report of a previous run to compare the results with")
+    return arg_parser
+
+
+def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
+    opts = get_argument_parser().parse_args(args)
+    for short_id_hit_ratio in opts.short_id_hit_ratio:
+        if not 0 <= short_id_hit_ratio <= 1:
+            raise ValueError(f"Short id hit ratio must be in range [0, 1], got {short_id_hit_ratio}")
+
+    # options expected by the message converter factories
+    opts.import_extensions = opts.use_extensions
+    opts.enable_eth_extensions = opts.use_extensions
+    return opts
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    opts = parse_arguments(args)
+    report = run_benchmark(opts)
+    if opts.compare:
+        report["comparison"] = benchmark_utils.compare_metrics(
+            benchmark_utils.load_report(opts.compare)["protocols"], report["protocols"]
+        )
+    benchmark_utils.write_report(report, opts.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
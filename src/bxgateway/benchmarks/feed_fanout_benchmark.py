@@ -0,0 +1,178 @@
+"""
+Benchmark of publishing a feed notification to many websocket subscribers.
+
+Compares serializing the whole JSON-RPC notification for each subscriber with serializing the notification
+result once and splicing the subscription id of each subscriber into the shared serialized result.
+Subscribers either receive the same result object, or, as for subscribers with include fields, an equal
+result filtered for each subscriber.
+
+Usage:
+    python -m bxgateway.benchmarks feed-fanout --subscriber-counts 1 10 50 200 --tx-sizes 200 5000
+"""
+import argparse
+import sys
+import uuid
+from typing import List, Dict, Any, Optional
+
+from bxcommon.feed.feed import FeedKey
+from bxcommon.rpc.bx_json_rpc_request import BxJsonRpcRequest
+from bxcommon.rpc.rpc_request_type import RpcRequestType
+from bxgateway.benchmarks import benchmark_utils
+from bxgateway.rpc.serialized_notification_cache import SerializedNotificationCache
+from bxutils.encoding.json_encoder import Case
+
+DEFAULT_SUBSCRIBER_COUNTS = [1, 10, 50, 200]
+DEFAULT_TX_SIZES = [200, 5000]
+DEFAULT_ITERATIONS = 200
+
+FEED_KEY = FeedKey("newTxs")
+INCLUDE_FIELDS = ("tx_hash", "tx_contents")
+
+
+def build_notification_result(tx_size: int, nonce: int) -> Dict[str, Any]:
+    """
+    Builds a newTxs notification of an Ethereum transaction with `tx_size` bytes of input data
+    """
+    return {
+        "tx_hash": f"0x{nonce:064x}",
+        "tx_contents": {
+            "from": f"0x{'ab' * 20}",
+            "gas": hex(21000 + tx_size * 16),
+            "gas_price": hex(50000000000),
+            "hash": f"0x{nonce:064x}",
+            "input": f"0x{'cd' * tx_size}",
+            "nonce": hex(nonce),
+            "value": hex(10 ** 18),
+            "v": "0x25",
+            "r": f"0x{'ef' * 32}",
+            "s": f"0x{'12' * 32}",
+            "to": f"0x{'34' * 20}",
+        },
+    }
+
+
+def publish_per_subscriber(result: Dict[str, Any], subscription_ids: List[str], filtered: bool) -> int:
+    """
+    Previous approach: the notification of each subscriber is serialized as a whole
+    """
+    sent_bytes = 0
+    for subscription_id in subscription_ids:
+        notification = BxJsonRpcRequest(
+            None,
+            RpcRequestType.SUBSCRIBE,
+            {"subscription": subscription_id, "result": dict(result) if filtered else result}
+        )
+        sent_bytes += len(notification.to_jsons(Case.SNAKE).encode())
+    return sent_bytes
+
+
+def publish_shared(
+    result: Dict[str, Any], subscription_ids: List[str], filtered: bool, cache: SerializedNotificationCache
+) -> int:
+    include = INCLUDE_FIELDS if filtered else ()
+    sent_bytes = 0
+    for subscription_id in subscription_ids:
+        notification = BxJsonRpcRequest(
+            None,
+            RpcRequestType.SUBSCRIBE,
+            {"subscription": subscription_id, "result": dict(result) if filtered else result}
+        )
+        sent_bytes += len(cache.serialize(notification, FEED_KEY, include, Case.SNAKE))
+    return sent_bytes
+
+
+def run_fanout_benchmark(
+    tx_size: int, subscriber_counts: List[int], iterations: int, filtered: bool
+) -> Dict[str, Any]:
+    results = {}
+    for subscriber_count in subscriber_counts:
+        subscription_ids = [str(uuid.uuid4()) for _ in range(subscriber_count)]
+        cache = SerializedNotificationCache()
+        # each run publishes a new notification, as a feed does for each transaction
+        per_subscriber_results = [build_notification_result(tx_size, nonce) for nonce in range(iterations + 1)]
+        shared_results = [build_notification_result(tx_size, nonce) for nonce in range(iterations + 1)]
+
+        sent_bytes = publish_shared(shared_results[0], subscription_ids, filtered, cache)
+        if sent_bytes != publish_per_subscriber(per_subscriber_results[0], subscription_ids, filtered):
+            raise ValueError("Spliced notifications have a different size than serialized notifications.")
+
+        per_subscriber_iter = iter(per_subscriber_results[1:])
+        shared_iter = iter(shared_results[1:])
+        per_subscriber_durations = benchmark_utils.time_runs(
+            lambda: publish_per_subscriber(next(per_subscriber_iter), subscription_ids, filtered), iterations, 0
+        )
+        shared_durations = benchmark_utils.time_runs(
+            lambda: publish_shared(next(shared_iter), subscription_ids, filtered, cache), iterations, 0
+        )
+        per_subscriber_stats = benchmark_utils.get_latency_stats(per_subscriber_durations)
+        shared_stats = benchmark_utils.get_latency_stats(shared_durations)
+        results[f"subscribers_{subscriber_count}"] = {
+            "sent_bytes": sent_bytes,
+            "serialized_per_subscriber": per_subscriber_stats.to_json(),
+            "serialized_per_subscriber_avg_ms_per_subscriber": per_subscriber_stats.avg_ms / subscriber_count,
+            "serialized_once": shared_stats.to_json(),
+            "serialized_once_avg_ms_per_subscriber": shared_stats.avg_ms / subscriber_count,
+        }
+    return results
+
+
+def run_benchmark(opts: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    for tx_size in opts.tx_sizes:
+        results[f"tx_{tx_size}"] = {
+            "shared_result": run_fanout_benchmark(tx_size, opts.subscriber_counts, opts.iterations, False),
+            "filtered_result": run_fanout_benchmark(tx_size, opts.subscriber_counts, opts.iterations, True),
+        }
+
+    return {
+        "benchmark": "feed-fanout",
+        "environment": benchmark_utils.get_environment_info(),
+        "parameters": {
+            "iterations": opts.iterations,
+        },
+        "results": results,
+    }
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m bxgateway.benchmarks feed-fanout",
+        description="Measures serialization time of a feed notification published to multiple subscribers"
+    )
+    arg_parser.add_argument(
+        "--subscriber-counts",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SUBSCRIBER_COUNTS,
+        help="Numbers of subscribers the notification is published to"
+    )
+    arg_parser.add_argument(
+        "--tx-sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_TX_SIZES,
+        help="Sizes of the input data of the notification transactions in bytes"
+    )
+    arg_parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="Number of published notifications per transaction size and subscriber count"
+    )
+    arg_parser.add_argument("--output", help="File to write the JSON report to (default: stdout)")
+    arg_parser.add_argument("--compare", help="JSON report of a previous run to compare the results with")
+    return arg_parser
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    opts = get_argument_parser().parse_args(args)
+    report = run_benchmark(opts)
+    if opts.compare:
+        report["comparison"] = benchmark_utils.compare_metrics(
+            benchmark_utils.load_report(opts.compare)["results"], report["results"]
+        )
+    benchmark_utils.write_report(report, opts.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
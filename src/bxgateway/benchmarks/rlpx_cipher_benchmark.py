@@ -0,0 +1,158 @@
+"""
+Benchmark of RLPx frame encryption and decryption throughput on a single core.
+
+Compares encryption and decryption that allocate a new buffer for each frame with encrypting all frames of
+a message into a single preallocated buffer and decrypting frames in place.
+
+Usage:
+    python -m bxgateway.benchmarks rlpx-cipher --message-sizes 100000 1000000 5000000
+"""
+import argparse
+import sys
+import time
+from typing import List, Dict, Any, Optional, Callable
+
+from bxcommon.utils.blockchain_utils.eth import crypto_utils, eth_common_constants
+
+from bxgateway.benchmarks import benchmark_utils
+from bxgateway.benchmarks.rlpx_framing_benchmark import create_cipher_pair
+from bxgateway.utils.eth import frame_utils
+from bxgateway.utils.eth.framed_message_cache import FramedMessage
+from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
+
+DEFAULT_MESSAGE_SIZES = [100000, 1000000, 5000000]
+DEFAULT_ITERATIONS = 10
+
+MSG_TYPE = 0x07
+
+
+def encrypt_per_frame(framed_message: FramedMessage, cipher: RLPxCipher) -> bytearray:
+    output = bytearray()
+    for frame_header, frame_body in framed_message.frames:
+        output.extend(cipher.encrypt_frame_bytes(frame_header, frame_body))
+    return output
+
+
+def encrypt_into(framed_message: FramedMessage, cipher: RLPxCipher) -> bytearray:
+    output = bytearray(sum(cipher.get_encrypted_frame_size(len(frame_body)) for _, frame_body in framed_message.frames))
+    output_view = memoryview(output)
+    offset = 0
+    for frame_header, frame_body in framed_message.frames:
+        offset += cipher.encrypt_frame_bytes_into(frame_header, frame_body, output_view[offset:])
+    return output
+
+
+def decrypt_frames(encrypted_bytes: bytearray, cipher: RLPxCipher, in_place: bool) -> int:
+    encrypted_view = memoryview(encrypted_bytes)
+    offset = 0
+    payload_size = 0
+    while offset < len(encrypted_view):
+        header = cipher.decrypt_frame_header(
+            bytes(encrypted_view[offset:offset + eth_common_constants.FRAME_HDR_TOTAL_LEN])
+        )
+        body_size, _, _, _ = frame_utils.parse_frame_header(header)
+        offset += eth_common_constants.FRAME_HDR_TOTAL_LEN
+        enc_body_size = crypto_utils.get_padded_len_16(body_size) + eth_common_constants.FRAME_MAC_LEN
+        enc_body = encrypted_view[offset:offset + enc_body_size]
+        if in_place:
+            payload_size += len(cipher.decrypt_frame_body_into(enc_body, body_size, enc_body))
+        else:
+            payload_size += len(cipher.decrypt_frame_body(enc_body, body_size))
+        offset += enc_body_size
+    return payload_size
+
+
+def measure_round_trips(
+    framed_message: FramedMessage,
+    encrypt: Callable[[FramedMessage, RLPxCipher], bytearray],
+    decrypt_in_place: bool,
+    iterations: int
+) -> Dict[str, Any]:
+    """
+    Encrypts and decrypts the message `iterations` times with a single connection's ciphers,
+    timing encryption and decryption separately.
+    """
+    sender, receiver = create_cipher_pair()
+    encryption_durations = []
+    decryption_durations = []
+    encrypted_size = 0
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        encrypted_bytes = encrypt(framed_message, sender)
+        encryption_durations.append(time.perf_counter() - start_time)
+        encrypted_size = len(encrypted_bytes)
+
+        start_time = time.perf_counter()
+        decrypt_frames(encrypted_bytes, receiver, decrypt_in_place)
+        decryption_durations.append(time.perf_counter() - start_time)
+
+    return {
+        "encryption": benchmark_utils.get_latency_stats(encryption_durations).to_json(),
+        "encryption_mb_per_s": benchmark_utils.get_throughput(encrypted_size, encryption_durations) / 1000000,
+        "decryption": benchmark_utils.get_latency_stats(decryption_durations).to_json(),
+        "decryption_mb_per_s": benchmark_utils.get_throughput(encrypted_size, decryption_durations) / 1000000,
+    }
+
+
+def run_message_benchmark(message_size: int, iterations: int) -> Dict[str, Any]:
+    payload = bytearray(i % 256 for i in range(message_size))
+    frames = frame_utils.get_frames(MSG_TYPE, payload)
+    framed_message = FramedMessage([(frame.get_header(), frame.get_body()) for frame in frames])
+
+    return {
+        "frame_count": len(frames),
+        "copying": measure_round_trips(framed_message, encrypt_per_frame, False, iterations),
+        "zero_copy": measure_round_trips(framed_message, encrypt_into, True, iterations),
+    }
+
+
+def run_benchmark(opts: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    for message_size in opts.message_sizes:
+        results[f"message_{message_size}"] = run_message_benchmark(message_size, opts.iterations)
+
+    return {
+        "benchmark": "rlpx-cipher",
+        "environment": benchmark_utils.get_environment_info(),
+        "parameters": {
+            "iterations": opts.iterations,
+        },
+        "results": results,
+    }
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m bxgateway.benchmarks rlpx-cipher",
+        description="Measures single core RLPx frame encryption and decryption throughput"
+    )
+    arg_parser.add_argument(
+        "--message-sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_MESSAGE_SIZES,
+        help="Sizes of the encrypted message payloads in bytes"
+    )
+    arg_parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="Number of measured encryptions and decryptions per message size"
+    )
+    arg_parser.add_argument("--output", help="File to write the JSON report to (default: stdout)")
+    arg_parser.add_argument("--compare", help="JSON report of a previous run to compare the results with")
+    return arg_parser
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    opts = get_argument_parser().parse_args(args)
+    report = run_benchmark(opts)
+    if opts.compare:
+        report["comparison"] = benchmark_utils.compare_metrics(
+            benchmark_utils.load_report(opts.compare)["results"], report["results"]
+        )
+    benchmark_utils.write_report(report, opts.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,150 @@
+"""
+Benchmark of sending a large Ethereum block to multiple peers over RLPx.
+
+Compares splitting the message into frames and encoding frame headers and bodies separately for each peer
+with framing the message once and only encrypting the shared frames for each peer.
+
+Usage:
+    python -m bxgateway.benchmarks rlpx-framing --block-sizes 1000000 5000000 --peer-counts 1 4 16
+"""
+import argparse
+import sys
+from typing import List, Dict, Any, Optional, Tuple
+
+from bxcommon.utils.blockchain_utils.eth import crypto_utils
+
+from bxgateway.benchmarks import benchmark_utils, block_samples
+from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
+from bxgateway.utils.eth import frame_utils
+from bxgateway.utils.eth.framed_message_cache import frame_message
+from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
+
+DEFAULT_BLOCK_SIZES = [1000000, 5000000]
+DEFAULT_PEER_COUNTS = [1, 4, 16]
+DEFAULT_ITERATIONS = 5
+
+
+def create_cipher_pair() -> Tuple[RLPxCipher, RLPxCipher]:
+    """
+    Creates initiator and responder ciphers of a connection that completed the RLPx handshake
+    """
+    private_key_1 = crypto_utils.make_private_key(b"initiator")
+    private_key_2 = crypto_utils.make_private_key(b"responder")
+    initiator = RLPxCipher(True, private_key_1, crypto_utils.private_to_public_key(private_key_2))
+    responder = RLPxCipher(False, private_key_2, crypto_utils.private_to_public_key(private_key_1))
+
+    auth_msg, _ = responder.decrypt_auth_message(initiator.encrypt_auth_message(initiator.create_auth_message()))
+    responder.parse_auth_message(auth_msg)
+    initiator.decrypt_auth_ack_message(responder.encrypt_auth_ack_message(responder.create_auth_ack_message()))
+
+    initiator.setup_cipher()
+    responder.setup_cipher()
+    return initiator, responder
+
+
+def send_framed_per_peer(msg: EthProtocolMessage, ciphers: List[RLPxCipher]) -> int:
+    """
+    Previous approach: each connection splits the message into frames and encodes them
+    """
+    sent_bytes = 0
+    for cipher in ciphers:
+        for frame in frame_utils.get_frames(msg.msg_type, msg.rawbytes()):
+            sent_bytes += len(cipher.encrypt_frame(frame))
+    return sent_bytes
+
+
+def send_framed_once(msg: EthProtocolMessage, ciphers: List[RLPxCipher]) -> int:
+    framed_message = frame_message(msg)
+    sent_bytes = 0
+    for cipher in ciphers:
+        for frame_header, frame_body in framed_message.frames:
+            sent_bytes += len(cipher.encrypt_frame_bytes(frame_header, frame_body))
+    return sent_bytes
+
+
+def run_block_benchmark(
+    msg: EthProtocolMessage, peer_counts: List[int], iterations: int
+) -> Dict[str, Any]:
+    results = {}
+    for peer_count in peer_counts:
+        ciphers = [create_cipher_pair()[0] for _ in range(peer_count)]
+        sent_bytes = send_framed_once(msg, ciphers)
+        if sent_bytes != send_framed_per_peer(msg, ciphers):
+            raise ValueError("Framing the message once produced a different number of bytes.")
+
+        per_peer_durations = benchmark_utils.time_runs(lambda: send_framed_per_peer(msg, ciphers), iterations)
+        once_durations = benchmark_utils.time_runs(lambda: send_framed_once(msg, ciphers), iterations)
+        results[f"peers_{peer_count}"] = {
+            "sent_bytes": sent_bytes,
+            "framed_per_peer": benchmark_utils.get_latency_stats(per_peer_durations).to_json(),
+            "framed_per_peer_bytes_per_s": benchmark_utils.get_throughput(sent_bytes, per_peer_durations),
+            "framed_once": benchmark_utils.get_latency_stats(once_durations).to_json(),
+            "framed_once_bytes_per_s": benchmark_utils.get_throughput(sent_bytes, once_durations),
+        }
+    return results
+
+
+def run_benchmark(opts: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    for block_size in opts.block_sizes:
+        block = block_samples.build_eth_block(opts.samples_dir, block_size=block_size)
+        msg = block.block_msg.to_new_block_msg()
+        results[f"block_{block_size}"] = run_block_benchmark(msg, opts.peer_counts, opts.iterations)
+
+    return {
+        "benchmark": "rlpx-framing",
+        "environment": benchmark_utils.get_environment_info(),
+        "parameters": {
+            "iterations": opts.iterations,
+        },
+        "results": results,
+    }
+
+
+def get_argument_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m bxgateway.benchmarks rlpx-framing",
+        description="Measures RLPx framing and encryption time of a large Ethereum block sent to multiple peers"
+    )
+    arg_parser.add_argument(
+        "--block-sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_BLOCK_SIZES,
+        help="Approximate sizes of the generated blocks in bytes"
+    )
+    arg_parser.add_argument(
+        "--peer-counts",
+        type=int,
+        nargs="+",
+        default=DEFAULT_PEER_COUNTS,
+        help="Numbers of peers the block is sent to"
+    )
+    arg_parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="Number of measured runs per block size and peer count"
+    )
+    arg_parser.add_argument(
+        "--samples-dir",
+        default=block_samples.DEFAULT_SAMPLES_DIR,
+        help="Directory with the sample blocks used to build the benchmark blocks"
+    )
+    arg_parser.add_argument("--output", help="File to write the JSON report to (default: stdout)")
+    arg_parser.add_argument("--compare", help="JSON report of a previous run to compare the results with")
+    return arg_parser
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    opts = get_argument_parser().parse_args(args)
+    report = run_benchmark(opts)
+    if opts.compare:
+        report["comparison"] = benchmark_utils.compare_metrics(
+            benchmark_utils.load_report(opts.compare)["results"], report["results"]
+        )
+    benchmark_utils.write_report(report, opts.output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -53,6 +53,8 @@ BTC_VARINT_LONG_INDICATOR_AS_BYTEARRAY = bytearray([BTC_VARINT_LONG_INDICATOR])
 
 BTC_COMPACT_BLOCK_RECOVERY_TIMEOUT_S = 10
 BTC_COMPACT_BLOCK_DECOMPRESS_MIN_TX_COUNT = 10000
+# the same block may be announced by several blockchain nodes, each with its own short id nonce
+BTC_COMPACT_BLOCK_SHORT_ID_INDEX_CACHE_SIZE = 2
 
 BTC_DEFAULT_BLOCK_SIZE = 621000
 BTC_MINIMAL_SUB_TASK_TX_COUNT = 2500
@@ -46,6 +46,7 @@ class AbstractBlockchainConnectionProtocol:
         start_time = time.time()
         txn_count = 0
         broadcast_txs_count = 0
+        forwarded_tx_results = []
 
         process_tx_msg_result = self.tx_service.process_transactions_message_from_node(
             msg,
@@ -152,11 +153,7 @@ class AbstractBlockchainConnectionProtocol:
                 self.connection,
                 connection_types=(ConnectionType.RELAY_TRANSACTION,)
             )
-            self.node.broadcast(
-                msg,
-                self.connection,
-                connection_types=(ConnectionType.BLOCKCHAIN_NODE,)
-            )
+            forwarded_tx_results.append(tx_result)
             gateway_bdn_performance_stats_service.log_tx_sent_to_nodes(broadcasting_endpoint=self.connection.endpoint)
 
             if self.node.opts.ws:
@@ -177,6 +174,9 @@ class AbstractBlockchainConnectionProtocol:
                     tx_result.transaction_hash
                 )
 
+        if forwarded_tx_results:
+            self.forward_transactions_to_nodes(msg, forwarded_tx_results, txn_count)
+
         set_content_start_time = time.time()
         end_time = time.time()
 
@@ -206,6 +206,47 @@ class AbstractBlockchainConnectionProtocol:
             duration_set_content_ms=duration_set_content_ms
         )
 
+    def forward_transactions_to_nodes(
+        self,
+        msg: AbstractMessage,
+        tx_results: List[ProcessTransactionMessageFromNodeResult],
+        total_txs_count: int
+    ) -> None:
+        """
+        Sends new valid transactions received from the blockchain node to other blockchain nodes
+        in a single message, dropping transactions that failed validation or were already seen.
+        """
+        if len(tx_results) == total_txs_count:
+            forwarded_msg = msg
+        else:
+            forwarded_msg = self.build_transactions_message(msg, tx_results)
+
+        broadcast_peers = self.node.broadcast(
+            forwarded_msg,
+            self.connection,
+            connection_types=(ConnectionType.BLOCKCHAIN_NODE,)
+        )
+
+        if broadcast_peers:
+            forwarded_bytes = len(forwarded_msg.rawbytes())
+            # previously the whole message was forwarded once per each new transaction
+            saved_bytes = len(msg.rawbytes()) * len(tx_results) - forwarded_bytes
+            gateway_transaction_stats_service.log_transactions_forwarded_to_nodes(
+                forwarded_bytes * len(broadcast_peers),
+                saved_bytes * len(broadcast_peers)
+            )
+
+    def build_transactions_message(
+        self, msg: AbstractMessage, tx_results: List[ProcessTransactionMessageFromNodeResult]
+    ) -> AbstractMessage:
+        """
+        Builds a blockchain message containing only transactions from `tx_results`.
+
+        Transaction messages of most protocols contain a single transaction, so by default the message is
+        forwarded as is.
+        """
+        return msg
+
     def msg_tx_after_tx_service_process_complete(self, process_result: List[ProcessTransactionMessageFromNodeResult]):
         pass
 
@@ -43,7 +43,7 @@ from bxcommon.network.peer_info import ConnectionPeerInfo
 from bxcommon.services import sdn_http_service
 from bxcommon.services.broadcast_service import BroadcastService
 from bxcommon.storage.block_encrypted_cache import BlockEncryptedCache
-from bxcommon.utils import network_latency, memory_utils, convert, node_cache
+from bxcommon.utils import network_latency, memory_utils, convert, node_cache, config
 from bxcommon.utils.alarm_queue import AlarmId
 from bxcommon.utils.expiring_dict import ExpiringDict
 from bxcommon.utils.expiring_set import ExpiringSet
@@ -65,13 +65,17 @@ from bxgateway.gateway_opts import GatewayOpts
 from bxgateway.rpc.https.gateway_http_rpc_server import GatewayHttpRpcServer
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
 from bxgateway.services.abstract_block_queuing_service import AbstractBlockQueuingService
+from bxgateway.services.block_conversion_pool import BlockConversionPool
 from bxgateway.services.block_processing_service import BlockProcessingService
 from bxgateway.services.block_recovery_service import BlockRecoveryService, RecoveredTxsSource
 from bxgateway.services.gateway_broadcast_service import GatewayBroadcastService
 from bxgateway.services.gateway_transaction_service import GatewayTransactionService
+from bxgateway.services.memory_governor import MemoryGovernor
 from bxgateway.services.neutrality_service import NeutralityService
+from bxgateway.services import tx_service_snapshot_file
 from bxgateway.utils import configuration_utils
 from bxgateway.utils.blockchain_message_queue import BlockchainMessageQueue
+from bxgateway.utils.event_loop_profiler import event_loop_profiler
 from bxgateway.utils.logging.status import status_log
 from bxgateway.utils.stats.gateway_bdn_performance_stats_service import gateway_bdn_performance_stats_service
 from bxgateway.utils.stats.gateway_transaction_stats_service import gateway_transaction_stats_service
@@ -144,6 +148,7 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
         super(AbstractGatewayNode, self).__init__(
             opts, node_ssl_service
         )
+        event_loop_profiler.profile_alarm_queue(self.alarm_queue)
         self.opts: GatewayOpts = opts
         if opts.split_relays:
             opts.peer_transaction_relays = {
@@ -209,6 +214,7 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
             self.block_storage,
             self.blockchain_peer_to_block_queuing_service
         )
+        self.memory_governor = MemoryGovernor(self, opts.memory_budget_mb * 1024 * 1024)
 
         self.send_request_for_relay_peers_num_of_calls = 0
         self.check_relay_alarm_id: Optional[AlarmId] = None
@@ -277,6 +283,10 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
         )
 
         self.message_converter: Optional[AbstractMessageConverter] = None
+        self.block_conversion_pool: Optional[BlockConversionPool] = None
+        self._event_loop_lag_task: Optional[asyncio.Future] = None
+        self._tx_service_snapshot_loaded = False
+        self._tx_service_snapshot_write: Optional[asyncio.Future] = None
         self.account_id: Optional[str] = extensions_factory.get_account_id(
             node_ssl_service.get_certificate(SSLCertificateType.PRIVATE)
         )
@@ -331,10 +341,10 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
             self.quota_level
         )
 
-        if self.opts.should_restart_on_high_memory:
+        if self.opts.memory_budget_mb > 0 or self.opts.should_restart_on_high_memory:
             self.alarm_queue.register_alarm(
-                gateway_constants.CHECK_MEMORY_THRESHOLD_INTERVAL_S,
-                self._check_memory_threshold,
+                self.memory_governor.check_interval_s,
+                self.memory_governor.check_memory,
                 alarm_name="check_memory_threshold"
             )
 
@@ -520,6 +530,11 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
 
     async def init(self) -> None:
         await super(AbstractGatewayNode, self).init()
+        self.init_block_conversion_pool()
+        self.init_tx_service_snapshot()
+        self._event_loop_lag_task = asyncio.ensure_future(
+            event_loop_profiler.sample_event_loop_lag(gateway_constants.EVENT_LOOP_LAG_SAMPLE_INTERVAL_S)
+        )
         if self.opts.rpc:
             try:
                 await asyncio.wait_for(
@@ -545,6 +560,16 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
                 logger.error(log_messages.IPC_INITIALIZATION_FAIL, e, exc_info=True)
 
     async def close(self) -> None:
+        self.close_block_conversion_pool()
+        if self.opts.tx_service_snapshot_interval_s > 0:
+            self._write_tx_service_snapshot_file(
+                self._get_tx_service_snapshot_path(),
+                tx_service_snapshot_file.serialize_tx_service(self._tx_service, self.network_num)
+            )
+        event_loop_lag_task = self._event_loop_lag_task
+        if event_loop_lag_task is not None:
+            self._event_loop_lag_task = None
+            event_loop_lag_task.cancel()
         try:
             await asyncio.wait_for(self._rpc_server.stop(), rpc_constants.RPC_SERVER_STOP_TIMEOUT_S)
         except (Exception, CancelledError) as e:
@@ -560,6 +585,67 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
 
         await super(AbstractGatewayNode, self).close()
 
+    def init_block_conversion_pool(self) -> None:
+        """
+        Starts worker processes for block compression and decompression if enabled. C++ extension converters
+        already run conversions in the task pool, so worker processes are used with pure Python converters only.
+        """
+        processes = self.opts.block_conversion_processes
+        if processes <= 0:
+            return
+        if self.opts.use_extensions:
+            logger.info("--block-conversion-processes is ignored, blocks are converted by the C++ extensions.")
+            return
+
+        message_converter = self.message_converter
+        assert message_converter is not None
+        self.block_conversion_pool = BlockConversionPool(message_converter, processes)
+        logger.info("Started {} worker processes for block conversion.", processes)
+
+    def close_block_conversion_pool(self) -> None:
+        block_conversion_pool = self.block_conversion_pool
+        if block_conversion_pool is not None:
+            self.block_conversion_pool = None
+            block_conversion_pool.close()
+
+    def init_tx_service_snapshot(self) -> None:
+        """
+        Loads the transaction service snapshot written before the last restart, if it is recent enough, and schedules
+        writing new snapshots. A loaded snapshot is kept during the first sync with the BDN instead of clearing the
+        transaction service, and transactions from the BDN are merged into it. The transaction service is still
+        reported as not synced until that sync completes.
+        """
+        interval_s = self.opts.tx_service_snapshot_interval_s
+        if interval_s <= 0:
+            return
+
+        path = self._get_tx_service_snapshot_path()
+        try:
+            result = tx_service_snapshot_file.load_snapshot_file(
+                self._tx_service,
+                path,
+                self.network_num,
+                gateway_constants.TX_SERVICE_SNAPSHOT_MAX_AGE_S,
+                self.opts.sid_expire_time
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(log_messages.TX_SERVICE_SNAPSHOT_LOAD_FAIL, path, e)
+            self._clear_transaction_service()
+            result = None
+
+        if result is not None:
+            logger.info(
+                "Loaded {} transactions and {} short ids from transaction service snapshot taken {:.0f} seconds ago, "
+                "skipped {} expired short ids.",
+                result.transactions_count,
+                result.short_ids_count,
+                time.time() - result.snapshot_time,
+                result.expired_short_ids_count
+            )
+            self._tx_service_snapshot_loaded = True
+
+        self.alarm_queue.register_alarm(interval_s, self._write_tx_service_snapshot)
+
     def send_request_for_remote_blockchain_peer(self):
         """
         Requests a bloxroute owned blockchain node from the SDN.
@@ -1103,7 +1189,7 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
                         # the sync with relay_tx must be the last one. since each call erase the previous call alarm
                         relay_block_connection.tx_sync_service.send_tx_service_sync_req(self.network_num)
                         relay_tx_connection.tx_sync_service.send_tx_service_sync_req(self.network_num)
-                        self._clear_transaction_service()
+                        self._clear_transaction_service_for_sync()
                         retry = False
                 else:
                     relay_connection: Optional[AbstractRelayConnection] = next(
@@ -1120,7 +1206,7 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
                             constants.TX_SERVICE_CHECK_NETWORKS_SYNCED_S, self._transaction_sync_timeout
                         )
                         relay_connection.tx_sync_service.send_tx_service_sync_req(self.network_num)
-                        self._clear_transaction_service()
+                        self._clear_transaction_service_for_sync()
                         retry = False
 
             if retry:
@@ -1512,13 +1598,32 @@ class AbstractGatewayNode(AbstractNode, metaclass=ABCMeta):
         logger.debug("Clearing all data in transaction service.")
         self._tx_service.clear()
 
-    def _check_memory_threshold(self):
-        if self.opts.should_restart_on_high_memory and \
-                memory_utils.get_app_memory_usage() > gateway_constants.CHECK_MEMORY_THRESHOLD_LIMIT:
-            logger.warning(log_messages.NODE_EXCEEDS_MEMORY)
-            self.should_force_exit = True
-            self.should_restart_on_high_memory = True
-        return gateway_constants.CHECK_MEMORY_THRESHOLD_INTERVAL_S
+    def _clear_transaction_service_for_sync(self) -> None:
+        if self._tx_service_snapshot_loaded:
+            # transactions from the BDN are merged into the snapshot on the first sync
+            self._tx_service_snapshot_loaded = False
+        else:
+            self._clear_transaction_service()
+
+    def _get_tx_service_snapshot_path(self) -> str:
+        return config.get_data_file(gateway_constants.TX_SERVICE_SNAPSHOT_FILE_NAME)
+
+    def _write_tx_service_snapshot(self) -> int:
+        previous_write = self._tx_service_snapshot_write
+        if previous_write is None or previous_write.done():
+            # collect snapshot pieces on the event loop, since the transaction service is not thread safe.
+            # pieces reference transaction contents, which are only copied when written to the file.
+            snapshot = tx_service_snapshot_file.serialize_tx_service(self._tx_service, self.network_num)
+            self._tx_service_snapshot_write = asyncio.get_event_loop().run_in_executor(
+                None, self._write_tx_service_snapshot_file, self._get_tx_service_snapshot_path(), snapshot
+            )
+        return self.opts.tx_service_snapshot_interval_s
+
+    def _write_tx_service_snapshot_file(self, path: str, snapshot: List[Union[bytes, bytearray, memoryview]]) -> None:
+        try:
+            tx_service_snapshot_file.write_snapshot_file(path, snapshot)
+        except OSError as e:
+            logger.warning(log_messages.TX_SERVICE_SNAPSHOT_WRITE_FAIL, path, e)
 
     def _get_account_record(self) -> int:
         if self.account_model:
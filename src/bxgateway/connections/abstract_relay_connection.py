@@ -36,6 +36,7 @@ from bxgateway import log_messages, gateway_constants
 from bxcommon.feed.new_transaction_feed import NewTransactionFeed, RawTransactionFeedEntry
 from bxgateway.services.block_recovery_service import RecoveredTxsSource
 from bxgateway.services.gateway_transaction_service import MissingTransactions
+from bxgateway.utils.event_loop_profiler import event_loop_profiler
 from bxgateway.utils.logging.status import status_log
 from bxgateway.utils.stats.gateway_bdn_performance_stats_service import gateway_bdn_performance_stats_service, \
     GatewayBdnPerformanceStatInterval
@@ -68,7 +69,7 @@ class AbstractRelayConnection(InternalNodeConnection["AbstractGatewayNode"]):
 
         self.hello_messages = constants.BLOXROUTE_HELLO_MESSAGES
         self.header_size = constants.STARTING_SEQUENCE_BYTES_LEN + constants.BX_HDR_COMMON_OFF
-        self.message_handlers = {
+        self.message_handlers = event_loop_profiler.profile_message_handlers(self, {
             BloxrouteMessageType.HELLO: self.msg_hello,
             BloxrouteMessageType.PING: self.msg_ping,
             BloxrouteMessageType.PONG: self.msg_pong,
@@ -86,7 +87,7 @@ class AbstractRelayConnection(InternalNodeConnection["AbstractGatewayNode"]):
             BloxrouteMessageType.TRANSACTION_CLEANUP: self.msg_cleanup,
             BloxrouteMessageType.NOTIFICATION: self.msg_notify,
             BloxrouteMessageType.REFRESH_BLOCKCHAIN_NETWORK: self.msg_refresh_blockchain_network
-        }
+        })
 
         msg_size_validation_settings = MessageSizeValidationSettings(self.node.network.max_block_size_bytes,
                                                                      self.node.network.max_tx_size_bytes)
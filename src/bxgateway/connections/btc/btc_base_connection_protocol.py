@@ -13,6 +13,7 @@ from bxgateway.messages.btc.btc_message_type import BtcMessageType
 from bxgateway.messages.btc.inventory_btc_message import InvBtcMessage, InventoryType
 from bxgateway.messages.btc.pong_btc_message import PongBtcMessage
 from bxgateway.messages.btc.version_btc_message import VersionBtcMessage
+from bxgateway.utils.event_loop_profiler import event_loop_profiler
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
@@ -27,11 +28,11 @@ class BtcBaseConnectionProtocol(AbstractBlockchainConnectionProtocol):
 
         connection.hello_messages = btc_constants.BTC_HELLO_MESSAGES
         connection.header_size = btc_constants.BTC_HDR_COMMON_OFF
-        connection.message_handlers = {
+        connection.message_handlers = event_loop_profiler.profile_message_handlers(connection, {
             BtcMessageType.PING: self.msg_ping,
             BtcMessageType.PONG: self.msg_pong,
             BtcMessageType.GET_ADDRESS: self.msg_getaddr
-        }
+        })
 
         # Establish connection with blockchain node
         version_msg = VersionBtcMessage(self.magic, self.version, connection.peer_ip, connection.peer_port,
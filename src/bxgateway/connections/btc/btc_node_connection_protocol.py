@@ -23,6 +23,7 @@ from bxgateway.messages.btc.send_compact_btc_message import SendCompactBtcMessag
 from bxgateway.messages.btc.ver_ack_btc_message import VerAckBtcMessage
 from bxgateway.messages.btc.version_btc_message import VersionBtcMessage
 from bxgateway.utils.errors.message_conversion_error import MessageConversionError
+from bxgateway.utils.stats.gateway_transaction_stats_service import gateway_transaction_stats_service
 
 if TYPE_CHECKING:
     from bxgateway.connections.btc.btc_node_connection import BtcNodeConnection
@@ -90,11 +91,16 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
         Handle an inventory message.
 
         Requests all transactions and blocks that haven't been previously seen.
+        Transactions that the transaction service has contents of, or that were already removed, are not requested.
         :param msg: INV message
         """
         contains_block = False
         inventory_requests = []
         block_hashes = []
+        tx_service = self.node.get_tx_service()
+        requested_tx_count = 0
+        skipped_tx_count = 0
+        skipped_tx_bytes = 0
         for inventory_type, item_hash in msg:
             if InventoryType.is_block(inventory_type):
                 if not self.node.should_process_block_hash(item_hash):
@@ -104,7 +110,20 @@ class BtcNodeConnectionProtocol(BtcBaseConnectionProtocol):
                     contains_block = True
                     inventory_requests.append((inventory_type, item_hash))
             else:
-                inventory_requests.append((inventory_type, item_hash))
+                transaction_key = tx_service.get_transaction_key(item_hash)
+                if tx_service.has_transaction_contents_by_key(transaction_key):
+                    skipped_tx_count += 1
+                    skipped_tx_bytes += len(tx_service.get_transaction_by_key(transaction_key))
+                elif tx_service.removed_transaction_by_key(transaction_key):
+                    skipped_tx_count += 1
+                else:
+                    requested_tx_count += 1
+                    inventory_requests.append((inventory_type, item_hash))
+
+        if requested_tx_count or skipped_tx_count:
+            gateway_transaction_stats_service.log_inv_transactions(
+                requested_tx_count, skipped_tx_count, skipped_tx_bytes
+            )
 
         self.node.block_cleanup_service.mark_blocks_and_request_cleanup(block_hashes)
 
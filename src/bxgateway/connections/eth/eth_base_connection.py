@@ -56,8 +56,12 @@ class EthBaseConnection(AbstractGatewayBlockchainConnection["EthGatewayNode"], A
 
         self._log_message(msg.log_level(), "Enqueued message: {}", msg)
 
-        full_message_bytes = bytearray()
-        for message_bytes in self.connection_protocol.get_message_bytes(msg):
-            full_message_bytes.extend(message_bytes)
+        message_bytes_pieces = list(self.connection_protocol.get_message_bytes(msg))
+        if len(message_bytes_pieces) == 1 and isinstance(message_bytes_pieces[0], bytearray):
+            full_message_bytes = message_bytes_pieces[0]
+        else:
+            full_message_bytes = bytearray()
+            for message_bytes in message_bytes_pieces:
+                full_message_bytes.extend(message_bytes)
 
         self.enqueue_msg_bytes(full_message_bytes, prepend)
@@ -16,8 +16,9 @@ from bxgateway.messages.eth.protocol.pong_eth_protocol_message import PongEthPro
 from bxgateway.messages.eth.protocol.raw_eth_protocol_message import RawEthProtocolMessage
 from bxgateway.messages.eth.protocol.status_eth_protocol_message import StatusEthProtocolMessage
 from bxgateway.messages.eth.protocol.status_eth_protocol_message_v63 import StatusEthProtocolMessageV63
-from bxgateway.utils.eth import frame_utils
+from bxgateway.utils.eth.framed_message_cache import framed_message_cache
 from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
+from bxgateway.utils.event_loop_profiler import event_loop_profiler
 from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
 from bxutils import logging
 
@@ -68,7 +69,7 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
             EthProtocolMessageType.DISCONNECT
         ]
 
-        connection.message_handlers = {
+        connection.message_handlers = event_loop_profiler.profile_message_handlers(connection, {
             EthProtocolMessageType.AUTH: self.msg_auth,
             EthProtocolMessageType.AUTH_ACK: self.msg_auth_ack,
             EthProtocolMessageType.HELLO: self.msg_hello,
@@ -77,7 +78,7 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
             EthProtocolMessageType.PING: self.msg_ping,
             EthProtocolMessageType.PONG: self.msg_pong,
             EthProtocolMessageType.GET_BLOCK_HEADERS: self.msg_get_block_headers
-        }
+        })
         connection.pong_message = PongEthProtocolMessage(None)
 
         self._waiting_checkpoint_headers_request = True
@@ -170,20 +171,28 @@ class EthBaseConnectionProtocol(AbstractBlockchainConnectionProtocol, metaclass=
         if isinstance(msg, RawEthProtocolMessage):
             yield msg.rawbytes()
         else:
+            # frames are shared by all connections the message is sent to, only encryption is per connection
             serialization_start_time = time.time()
-            frames = frame_utils.get_frames(msg.msg_type,
-                                            msg.rawbytes(),
-                                            eth_common_constants.DEFAULT_FRAME_PROTOCOL_ID,
-                                            eth_common_constants.DEFAULT_FRAME_SIZE)
-            eth_gateway_stats_service.log_serialized_message(time.time() - serialization_start_time)
+            framed_message, is_cached = framed_message_cache.get_or_frame(msg)
+            if is_cached:
+                eth_gateway_stats_service.log_framed_message_cache_hit()
+            else:
+                eth_gateway_stats_service.log_serialized_message(time.time() - serialization_start_time)
 
-            assert frames
-            self.connection.log_trace("Broke message into {} frames", len(frames))
+            self.connection.log_trace("Broke message into {} frames", len(framed_message.frames))
 
+            # all frames are encrypted directly into a single preallocated buffer
             encryption_start_time = time.time()
-            for frame in frames:
-                yield self.rlpx_cipher.encrypt_frame(frame)
+            rlpx_cipher = self.rlpx_cipher
+            message_bytes = bytearray(sum(
+                rlpx_cipher.get_encrypted_frame_size(len(frame_body)) for _, frame_body in framed_message.frames
+            ))
+            message_view = memoryview(message_bytes)
+            offset = 0
+            for frame_header, frame_body in framed_message.frames:
+                offset += rlpx_cipher.encrypt_frame_bytes_into(frame_header, frame_body, message_view[offset:])
             eth_gateway_stats_service.log_encrypted_message(time.time() - encryption_start_time)
+            yield message_bytes
 
     def _enqueue_auth_message(self):
         auth_msg_bytes = self._get_auth_msg_bytes()
@@ -48,11 +48,15 @@ from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import \
     TransactionsEthProtocolMessage
 from bxgateway.rpc.external.eth_ws_proxy_publisher import EthWsProxyPublisher
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
+from bxgateway.services.eth.eth_block_fetch_coordinator import EthBlockFetchCoordinator
 from bxgateway.services.eth.eth_block_processing_service import EthBlockProcessingService
 from bxgateway.services.eth.eth_block_queuing_service import EthBlockQueuingService
+from bxgateway.services.eth.eth_header_chain_index import EthHeaderChainIndex
 from bxgateway.services.eth.eth_normal_block_cleanup_service import EthNormalBlockCleanupService
+from bxgateway.services.eth.eth_transaction_batching_service import EthTransactionBatchingService
 from bxgateway.testing.eth_lossy_relay_connection import EthLossyRelayConnection
 from bxgateway.testing.test_modes import TestModes
+from bxgateway.utils.eth import eth_utils
 from bxgateway.utils.interval_minimum import IntervalMinimum
 from bxgateway.utils.running_average import RunningAverage
 from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
@@ -114,6 +118,7 @@ class EthGatewayNode(AbstractGatewayNode):
             gateway_constants.MAX_BLOCK_CACHE_TIME_S,
             "eth_block_queue_parts",
         )
+        self.header_chain_index = EthHeaderChainIndex()
 
         # List of know total difficulties, tuples of values (block hash, total difficulty)
         self._last_known_difficulties = deque(maxlen=eth_common_constants.LAST_KNOWN_TOTAL_DIFFICULTIES_MAX_COUNT)
@@ -135,6 +140,16 @@ class EthGatewayNode(AbstractGatewayNode):
         self.average_block_gas_price = RunningAverage(gateway_constants.ETH_GAS_RUNNING_AVERAGE_SIZE)
         self.min_tx_from_node_gas_price = IntervalMinimum(gateway_constants.ETH_MIN_GAS_INTERVAL_S, self.alarm_queue)
 
+        self.transaction_batching_service: Optional[EthTransactionBatchingService] = None
+        if self.opts.eth_tx_batch_interval_ms > 0:
+            self.transaction_batching_service = EthTransactionBatchingService(
+                self, self.opts.eth_tx_batch_interval_ms / 1000, self.opts.eth_tx_batch_max_size
+            )
+
+        self.block_fetch_coordinator = EthBlockFetchCoordinator(
+            self, self.opts.eth_block_fetch_hedge_delay_ms / 1000
+        )
+
         logger.info("Gateway enode url: {}", self.get_enode())
 
     def build_blockchain_connection(
@@ -472,29 +487,42 @@ class EthGatewayNode(AbstractGatewayNode):
         gas_price_filter = max(average_block_gas_filter, min_gas_price_from_node)
 
         if gas_price_filter > 0:
-            assert len(msg.get_transactions()) == 1
-            transaction = msg.get_transactions()[0]
-
-            gas_price = float(transaction.gas_price)
-
-            if gas_price < gas_price_filter:
-                logger.trace(
-                    "Skipping sending transaction {} with gas price: {}. Average was {}. Minimum from node was {}.",
-                    transaction.hash(),
-                    float(transaction.gas_price),
-                    average_block_gas_filter,
-                    min_gas_price_from_node
-                )
-                tx_stats.add_tx_by_hash_event(
-                    transaction.hash(),
-                    TransactionStatEventType.TX_FROM_BDN_IGNORE_LOW_GAS_PRICE,
-                    self.network_num,
-                    peers=[broadcasting_conn],
-                    more_info="Tx gas price {}. Average block gas price: {}. Node min gas price {}."
-                        .format(gas_price, average_block_gas_filter, min_gas_price_from_node)
-                )
+            transactions = msg.get_transactions()
+            accepted_transactions = []
+
+            for transaction in transactions:
+                gas_price = float(transaction.gas_price)
+
+                if gas_price < gas_price_filter:
+                    logger.trace(
+                        "Skipping sending transaction {} with gas price: {}. Average was {}. Minimum from node was {}.",
+                        transaction.hash(),
+                        float(transaction.gas_price),
+                        average_block_gas_filter,
+                        min_gas_price_from_node
+                    )
+                    tx_stats.add_tx_by_hash_event(
+                        transaction.hash(),
+                        TransactionStatEventType.TX_FROM_BDN_IGNORE_LOW_GAS_PRICE,
+                        self.network_num,
+                        peers=[broadcasting_conn],
+                        more_info="Tx gas price {}. Average block gas price: {}. Node min gas price {}."
+                            .format(gas_price, average_block_gas_filter, min_gas_price_from_node)
+                    )
+                else:
+                    accepted_transactions.append(transaction)
+
+            if not accepted_transactions:
                 return False
 
+            if len(accepted_transactions) < len(transactions):
+                msg = TransactionsEthProtocolMessage(None, accepted_transactions)
+
+        transaction_batching_service = self.transaction_batching_service
+        if transaction_batching_service is not None:
+            transaction_batching_service.add_transactions(eth_utils.get_transactions_bytes(msg))
+            return True
+
         return super().broadcast_transactions_to_nodes(msg, broadcasting_conn)
 
     def get_enode(self) -> str:
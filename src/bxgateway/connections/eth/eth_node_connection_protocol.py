@@ -1,3 +1,4 @@
+import asyncio
 import time
 from collections import deque
 from typing import List, Deque, cast, Union
@@ -11,7 +12,7 @@ from bxcommon.utils.object_hash import Sha256Hash, NULL_SHA256_HASH
 from bxcommon.utils.stats.block_stat_event_type import BlockStatEventType
 from bxcommon.utils.stats.block_statistics_service import block_stats
 from bxcommon.feed.feed_source import FeedSource
-from bxgateway import log_messages
+from bxgateway import log_messages, gateway_constants
 from bxgateway.connections.eth.eth_base_connection_protocol import EthBaseConnectionProtocol
 from bxgateway.eth_exceptions import CipherNotInitializedError
 from bxcommon.feed.eth.eth_new_transaction_feed import EthNewTransactionFeed
@@ -33,6 +34,8 @@ from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import \
     TransactionsEthProtocolMessage
 from bxgateway.services.eth.eth_block_queuing_service import EthBlockQueuingService
 from bxgateway.services.gateway_transaction_service import ProcessTransactionMessageFromNodeResult
+from bxgateway.utils.eth import eth_utils
+from bxgateway.utils.eth.block_transaction_hashes_memo import block_transaction_hashes_memo
 from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
 from bxgateway.utils.stats.gateway_bdn_performance_stats_service import \
     gateway_bdn_performance_stats_service
@@ -110,12 +113,43 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
 
     def msg_tx(self, msg: TransactionsEthProtocolMessage) -> None:
         if len(msg.rawbytes()) >= eth_common_constants.ETH_SKIP_TRANSACTIONS_SIZE:
-            bytes_skipped_count = len(msg.rawbytes())
-            self.connection.log_debug("Skipping {} bytes of transactions message.", bytes_skipped_count)
-            gateway_transaction_stats_service.log_skipped_transaction_bytes(bytes_skipped_count)
+            self.connection.log_debug("Processing {} bytes of transactions message in slices.", len(msg.rawbytes()))
+            asyncio.create_task(self.process_transactions_message_in_slices(msg))
         else:
             super().msg_tx(msg)
 
+    async def process_transactions_message_in_slices(self, msg: TransactionsEthProtocolMessage) -> None:
+        """
+        Processes a large transactions message in slices of `ETH_TRANSACTIONS_SLICE_SIZE` bytes,
+        yielding to the event loop between slices.
+        """
+        msg_size = len(msg.rawbytes())
+        processed_bytes = 0
+        slices_count = 0
+        try:
+            for txs in eth_utils.iter_transactions_bytes_slices(msg, gateway_constants.ETH_TRANSACTIONS_SLICE_SIZE):
+                if not self.connection.is_alive():
+                    break
+                super().msg_tx(eth_utils.build_transactions_message(txs))
+                processed_bytes += sum(len(tx) for tx in txs)
+                slices_count += 1
+                await asyncio.sleep(0)
+        except Exception as e:  # pylint: disable=broad-except
+            self.connection.log_warning(
+                "Failed to process transactions message of {} bytes after {} bytes: {}.",
+                msg_size, processed_bytes, e
+            )
+            gateway_transaction_stats_service.log_skipped_transaction_bytes(msg_size - processed_bytes)
+
+        gateway_transaction_stats_service.log_sliced_transactions_message(processed_bytes, slices_count)
+
+    def build_transactions_message(
+        self, msg: AbstractMessage, tx_results: List[ProcessTransactionMessageFromNodeResult]
+    ) -> AbstractMessage:
+        return eth_utils.build_transactions_message(
+            [tx_result.transaction_contents for tx_result in tx_results]
+        )
+
     def msg_tx_after_tx_service_process_complete(self, process_result: List[ProcessTransactionMessageFromNodeResult]):
         # calculate minimal tx gas price only if transaction validation is enabled
         if not self.node.opts.transaction_validation:
@@ -177,6 +211,10 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
 
             self.node.on_block_seen_by_blockchain_node(block_hash, self.connection, block_number=block_number)
 
+            if not self.node.block_fetch_coordinator.on_block_announced(block_hash, block_number, self.connection):
+                logger.debug("Block {} is already being fetched from another blockchain node.", block_hash)
+                continue
+
             self.node.track_block_from_node_handling_started(block_hash)
             block_hash_number_pairs.append((block_hash, block_number))
 
@@ -195,6 +233,16 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
 
         self.request_block_body([block_hash for block_hash, _ in block_hash_number_pairs])
 
+    def request_new_block(self, block_hash: Sha256Hash, block_number: int) -> None:
+        """
+        Requests header and body of a block announced by another blockchain node that is slow to provide it.
+        """
+        self.connection.log_info("Fetching block {} from local Ethereum node.", block_hash)
+        # pyre-fixme[6]: Expected `memoryview` for 1st param but got `None`.
+        self.pending_new_block_parts.add(block_hash, NewBlockParts(None, None, block_number))
+        self.connection.enqueue_msg(GetBlockHeadersEthProtocolMessage(None, block_hash.binary, 1, 0, 0))
+        self.request_block_body([block_hash])
+
     def request_block_body(self, block_hashes: List[Sha256Hash]):
         block_request_message = GetBlockBodiesEthProtocolMessage(
             None,
@@ -288,15 +336,21 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             logger.debug("Processing expected block bodies messages for blocks [{}]",
                          ", ".join([convert.bytes_to_hex(block_hash.binary) for block_hash in requested_hashes]))
 
+            block_fetch_coordinator = self.node.block_fetch_coordinator
             for block_hash, block_body_bytes in zip(requested_hashes, bodies_bytes):
-                if block_hash in self.pending_new_block_parts.contents:
+                is_pending_new_block = block_hash in self.pending_new_block_parts.contents
+                if is_pending_new_block and not block_fetch_coordinator.has_fetched(block_hash):
                     logger.debug("Received block body for pending new block {}",
                                  convert.bytes_to_hex(block_hash.binary))
                     self.pending_new_block_parts.contents[block_hash].block_body_bytes = block_body_bytes
                     self._check_pending_new_block(block_hash)
                 elif self.node.block_cleanup_service.is_marked_for_cleanup(block_hash):
-                    transactions_hashes = \
-                        BlockBodiesEthProtocolMessage.from_body_bytes(block_body_bytes).get_block_transaction_hashes(0)
+                    transactions_hashes = block_transaction_hashes_memo.get(block_hash)
+                    if transactions_hashes is None:
+                        transactions_hashes = block_transaction_hashes_memo.get_or_hash(
+                            block_hash,
+                            BlockBodiesEthProtocolMessage.from_body_bytes(block_body_bytes).get_block_transaction_bytes(0)
+                        )
                     # pyre-fixme[16]: `AbstractBlockCleanupService` has no attribute
                     #  `clean_block_transactions_by_block_components`.
                     self.node.block_cleanup_service.clean_block_transactions_by_block_components(
@@ -304,6 +358,14 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
                         block_hash=block_hash,
                         transactions_list=transactions_hashes
                     )
+                    if is_pending_new_block:
+                        self.pending_new_block_parts.remove_item(block_hash)
+                elif is_pending_new_block and block_fetch_coordinator.is_fetched(block_hash, self.connection):
+                    # only bodies requested for announced blocks are duplicates, since block cleanup
+                    # requests bodies of blocks that were already fetched as well
+                    logger.debug("Dropping block body for block {} already fetched from another blockchain node.",
+                                 convert.bytes_to_hex(block_hash.binary))
+                    self.pending_new_block_parts.remove_item(block_hash)
                 else:
                     logger.warning(log_messages.REDUNDANT_BLOCK_BODY,
                                    convert.bytes_to_hex(block_hash.binary))
@@ -330,6 +392,12 @@ class EthNodeConnectionProtocol(EthBaseConnectionProtocol):
             pending_new_block = self.pending_new_block_parts.contents[ready_block_hash]
             self.pending_new_block_parts.remove_item(ready_block_hash)
 
+            if not self.node.block_fetch_coordinator.on_block_fetched(ready_block_hash, self.connection):
+                self.connection.log_debug(
+                    "Discarding block {} already fetched from another blockchain node.", ready_block_hash
+                )
+                continue
+
             if ready_block_hash in self.node.blocks_seen.contents:
                 self.node.on_block_seen_by_blockchain_node(
                     ready_block_hash, self.connection, block_number=pending_new_block.block_number
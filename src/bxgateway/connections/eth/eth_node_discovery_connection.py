@@ -9,6 +9,7 @@ from bxgateway.connections.abstract_gateway_blockchain_connection import Abstrac
 from bxgateway.messages.eth.discovery.eth_discovery_message_factory import eth_discovery_message_factory
 from bxgateway.messages.eth.discovery.eth_discovery_message_type import EthDiscoveryMessageType
 from bxgateway.messages.eth.discovery.ping_eth_discovery_message import PingEthDiscoveryMessage
+from bxgateway.utils.event_loop_profiler import event_loop_profiler
 from bxutils import logging
 from bxgateway import log_messages
 from bxcommon.utils.blockchain_utils.eth import eth_common_constants
@@ -28,10 +29,10 @@ class EthNodeDiscoveryConnection(AbstractGatewayBlockchainConnection["EthGateway
     def __init__(self, sock: AbstractSocketConnectionProtocol, node: "EthGatewayNode"):
         super(EthNodeDiscoveryConnection, self).__init__(sock, node)
 
-        self.message_handlers = {
+        self.message_handlers = event_loop_profiler.profile_message_handlers(self, {
             EthDiscoveryMessageType.PING: self.msg_ping,
             EthDiscoveryMessageType.PONG: self.msg_pong
-        }
+        })
 
         self.can_send_pings = True
         self.pong_message = None
@@ -24,6 +24,7 @@ from bxgateway.messages.gateway.gateway_message_factory import gateway_message_f
 from bxgateway.messages.gateway.gateway_message_type import GatewayMessageType
 from bxgateway.messages.gateway.gateway_version_manager import gateway_version_manager
 from bxgateway.messages.gateway.request_tx_stream_message import RequestTxStreamMessage
+from bxgateway.utils.event_loop_profiler import event_loop_profiler
 from bxgateway.utils.stats.transaction_feed_stats_service import transaction_feed_stats_service
 
 if TYPE_CHECKING:
@@ -45,7 +46,7 @@ class GatewayConnection(InternalNodeConnection["AbstractGatewayNode"]):
 
         self.hello_messages = gateway_constants.GATEWAY_HELLO_MESSAGES
         self.header_size = constants.STARTING_SEQUENCE_BYTES_LEN + constants.BX_HDR_COMMON_OFF
-        self.message_handlers = {
+        self.message_handlers = event_loop_profiler.profile_message_handlers(self, {
             GatewayMessageType.HELLO: self.msg_hello,
             BloxrouteMessageType.ACK: self.msg_ack,
             GatewayMessageType.BLOCK_RECEIVED: self.msg_block_received,
@@ -54,7 +55,7 @@ class GatewayConnection(InternalNodeConnection["AbstractGatewayNode"]):
             BloxrouteMessageType.KEY: self.msg_key,
             GatewayMessageType.CONFIRMED_TX: self.msg_confirmed_tx,
             GatewayMessageType.REQUEST_TX_STREAM: self.msg_request_tx_stream,
-        }
+        })
         self.version_manager = gateway_version_manager
         self.protocol_version = self.version_manager.CURRENT_PROTOCOL_VERSION
 
@@ -1,18 +1,46 @@
+from typing import Type, TYPE_CHECKING
+
 from bxcommon.models.blockchain_protocol import BlockchainProtocol
-from bxgateway.connections.btc.btc_gateway_node import BtcGatewayNode
-from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
+from bxgateway.utils.import_profiler import ImportProfiler
 from bxutils import logging
 
+if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+
 logger = logging.get_logger(__name__)
 
 
-def get_gateway_node_type(blockchain_protocol):
+def get_gateway_node_type(blockchain_protocol, import_profile: bool = False) -> Type["AbstractGatewayNode"]:
+    """
+    Returns gateway node class of the blockchain protocol.
+
+    Only the protocol stack of the requested blockchain protocol is imported, so that a gateway
+    does not load messages, converters and connections of other protocols.
+
+    :param blockchain_protocol: blockchain protocol name
+    :param import_profile: if time and memory spent on importing the protocol stack should be logged
+    """
+    if not import_profile:
+        return _import_gateway_node_type(blockchain_protocol)
+
+    with ImportProfiler() as profiler:
+        node_type = _import_gateway_node_type(blockchain_protocol)
+    logger.info("Loaded {} protocol stack.", blockchain_protocol)
+    profiler.log_report()
+    return node_type
+
+
+def _import_gateway_node_type(blockchain_protocol) -> Type["AbstractGatewayNode"]:
+    # pylint: disable=import-outside-toplevel
     # TODO: This is temporary logic that will be replaced with list of valid protocols and networks from SDN
     if blockchain_protocol == BlockchainProtocol.ETHEREUM.value:
+        from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
         return EthGatewayNode
 
     if blockchain_protocol == BlockchainProtocol.ONTOLOGY.value:
         from bxgateway.connections.ont.ont_gateway_node import OntGatewayNode
         return OntGatewayNode
 
+    from bxgateway.connections.btc.btc_gateway_node import BtcGatewayNode
     return BtcGatewayNode
@@ -19,6 +19,7 @@ from bxgateway.messages.ont.ont_message_type import OntMessageType
 from bxgateway.messages.ont.ping_ont_message import PingOntMessage
 from bxgateway.messages.ont.pong_ont_message import PongOntMessage
 from bxgateway.messages.ont.version_ont_message import VersionOntMessage
+from bxgateway.utils.event_loop_profiler import event_loop_profiler
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
@@ -37,11 +38,11 @@ class OntBaseConnectionProtocol(AbstractBlockchainConnectionProtocol):
 
         connection.hello_messages = ont_constants.ONT_HELLO_MESSAGES
         connection.header_size = ont_constants.ONT_HDR_COMMON_OFF
-        connection.message_handlers = {
+        connection.message_handlers = event_loop_profiler.profile_message_handlers(connection, {
             OntMessageType.PING: self.msg_ping,
             OntMessageType.PONG: self.msg_pong,
             OntMessageType.GET_ADDRESS: self.msg_getaddr
-        }
+        })
 
         version_msg = VersionOntMessage(self.magic, self.version, self.node.opts.blockchain_port,
                                         self.node.opts.http_info_port, self.node.opts.consensus_port,
@@ -3,3 +3,6 @@ ETH_GATEWAY_STATS_LOOKBACK = 1
 
 ETH_ON_BLOCK_FEED_STATS_INTERVAL_S = 5 * 60
 ETH_ON_BLOCK_FEED_STATS_LOOKBACK = 1
+
+ETH_FRAMED_MESSAGE_CACHE_SIZE = 10
+ETH_BLOCK_TX_HASHES_MEMO_SIZE = 50
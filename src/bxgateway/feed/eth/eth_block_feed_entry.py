@@ -1,35 +1,67 @@
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Union, Optional, Collection
+
+import blxr_rlp as rlp
 
 from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway import log_messages
 from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
 from bxcommon.messages.eth.serializers.block import Block
+from bxcommon.messages.eth.serializers.block_header import BlockHeader
+from bxcommon.messages.eth.serializers.transaction import Transaction
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
 
+BLOCK_FIELDS = ("header", "transactions", "uncles")
+
+_transactions_serializer = rlp.sedes.CountableList(Transaction)
+_uncles_serializer = rlp.sedes.CountableList(BlockHeader)
+
 
 class EthBlockFeedEntry:
+    """
+    newBlocks feed notification.
+
+    Only block fields in `fields` are decoded, so that transactions, whose JSON representation is expensive
+    to build, are skipped if no subscriber includes them. Block messages are decoded field by field from
+    their RLP items, without building the intermediate `Block` object.
+    """
     hash: str
     header: Dict[str, Any]
     transactions: List[Any]
     uncles: List[Any]
 
     def __init__(
-        self, hash: Sha256Hash, block: Union[Block, InternalEthBlockInfo, memoryview]
+        self,
+        hash: Sha256Hash,
+        block: Union[Block, InternalEthBlockInfo, memoryview],
+        fields: Optional[Collection[str]] = None
     ) -> None:
         self.hash = f"0x{str(hash)}"
+        if fields is None:
+            fields = BLOCK_FIELDS
         try:
             if isinstance(block, Block):
-                block_info = block
-            elif isinstance(block, InternalEthBlockInfo):
-                block_info = block.to_new_block_msg().get_block()
+                if "header" in fields:
+                    self.header = block.header.to_json()
+                if "transactions" in fields:
+                    self.transactions = [tx.to_json() for tx in block.transactions]
+                if "uncles" in fields:
+                    self.uncles = [uncle.to_json() for uncle in block.uncles]
             else:
-                block_info = InternalEthBlockInfo(block).to_new_block_msg().get_block()
-            block_json = block_info.to_json()
-            self.header = block_json["header"]
-            self.transactions = block_json["transactions"]
-            self.uncles = block_json["uncles"]
+                if not isinstance(block, InternalEthBlockInfo):
+                    block = InternalEthBlockInfo(block)
+                header_bytes, transactions_bytes, uncles_bytes = block.block_items_bytes()
+                if "header" in fields:
+                    self.header = rlp.decode(header_bytes.tobytes(), BlockHeader).to_json()
+                if "transactions" in fields:
+                    self.transactions = [
+                        tx.to_json() for tx in rlp.decode(transactions_bytes.tobytes(), _transactions_serializer)
+                    ]
+                if "uncles" in fields:
+                    self.uncles = [
+                        uncle.to_json() for uncle in rlp.decode(uncles_bytes.tobytes(), _uncles_serializer)
+                    ]
         except Exception as e:
             block_str = block
             if isinstance(block, memoryview):
@@ -46,8 +78,5 @@ class EthBlockFeedEntry:
     def __eq__(self, other) -> bool:
         return (
             isinstance(other, EthBlockFeedEntry)
-            and other.hash == self.hash
-            and other.header == self.header
-            and other.transactions == self.transactions
-            and other.uncles == self.uncles
+            and other.__dict__ == self.__dict__
         )
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable
+
+from bxcommon.rpc import rpc_constants
+from bxcommon.rpc.json_rpc_response import JsonRpcResponse
+from bxcommon.rpc.rpc_errors import RpcError
+from bxgateway import gateway_constants
+from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
+from bxutils import logging, utils
+
+if TYPE_CHECKING:
+    # noinspection PyUnresolvedReferences
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
+
+logger = logging.get_logger(__name__)
+
+ETH_GET_BLOCK_RECEIPTS_RPC_METHOD = "eth_getBlockReceipts"
+RETRIES_MAX_ATTEMPTS = 8
+# JSON-RPC error code of nodes that do not implement a method
+METHOD_NOT_FOUND_ERROR_CODE = -32601
+
+
+class EthBlockReceiptsFetcher:
+    """
+    Fetches transaction receipts of a whole block from the Ethereum node.
+
+    Receipts are requested with a single `eth_getBlockReceipts` call per block. If the call fails, receipts of
+    the block are requested with `eth_getTransactionReceipt` in chunks of at most `ETH_RECEIPTS_FETCH_CHUNK_SIZE`
+    concurrent calls instead. `eth_getBlockReceipts` is only abandoned once the node reports that it does not
+    implement the method. Receipts that are not available yet are retried together, with a single backoff for
+    the block.
+    """
+
+    def __init__(
+        self,
+        node: "EthGatewayNode",
+        chunk_size: int = gateway_constants.ETH_RECEIPTS_FETCH_CHUNK_SIZE,
+        max_retries: int = RETRIES_MAX_ATTEMPTS
+    ) -> None:
+        self.node = node
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.block_receipts_supported = True
+
+    async def fetch_receipts(
+        self,
+        block_hash: str,
+        transaction_hashes: List[str],
+        on_receipts_fetched: Optional[Callable[[List[Optional[Dict[str, Any]]]], None]] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetches receipts of all block transactions.
+
+        :param block_hash: 0x prefixed block hash
+        :param transaction_hashes: 0x prefixed hashes of the block transactions, in transaction index order
+        :param on_receipts_fetched: called with the receipts fetched so far whenever more receipts are fetched,
+        so that receipts can be published before receipts of the whole block are fetched
+        :return: receipt of each transaction in transaction index order, None for receipts that could not be fetched
+        """
+        start_time = time.time()
+        receipts: List[Optional[Dict[str, Any]]] = [None] * len(transaction_hashes)
+        missing_indices = list(range(len(transaction_hashes)))
+
+        retry_count = 0
+        while True:
+            missing_indices = await self._fetch_missing_receipts(
+                block_hash, transaction_hashes, receipts, missing_indices, on_receipts_fetched
+            )
+            if not missing_indices or retry_count >= self.max_retries:
+                break
+            if retry_count == 0:
+                logger.debug(
+                    "Failed to fetch {} of {} transaction receipts in block {}: not found. Retrying.",
+                    len(missing_indices), len(transaction_hashes), block_hash
+                )
+            retry_count += 1
+            await asyncio.sleep(utils.fibonacci(retry_count) * 0.1)
+
+        duration = time.time() - start_time
+        eth_gateway_stats_service.log_receipts_fetch(len(transaction_hashes), duration)
+        if missing_indices:
+            logger.debug(
+                "Failed to fetch {} of {} transaction receipts in block {} after {} attempts. Ceasing attempts.",
+                len(missing_indices), len(transaction_hashes), block_hash, retry_count + 1
+            )
+        else:
+            logger.debug(
+                "Fetched {} transaction receipts in block {} in {:.2f}ms after {} attempts.",
+                len(transaction_hashes), block_hash, duration * 1000, retry_count + 1
+            )
+        return receipts
+
+    async def _fetch_missing_receipts(
+        self,
+        block_hash: str,
+        transaction_hashes: List[str],
+        receipts: List[Optional[Dict[str, Any]]],
+        missing_indices: List[int],
+        on_receipts_fetched: Optional[Callable[[List[Optional[Dict[str, Any]]]], None]]
+    ) -> List[int]:
+        if self.block_receipts_supported:
+            response = await self._fetch_block_receipts(block_hash)
+            if response is not None:
+                result = response.result
+                if result is None:
+                    # block is not known to the node yet
+                    return missing_indices
+                if isinstance(result, list) and len(result) == len(transaction_hashes):
+                    for index in missing_indices:
+                        receipts[index] = result[index]
+                    if on_receipts_fetched is not None:
+                        on_receipts_fetched(receipts)
+                    return []
+                logger.debug(
+                    "Unexpected {} response for block {}. Fetching receipts of each transaction instead.",
+                    ETH_GET_BLOCK_RECEIPTS_RPC_METHOD, block_hash
+                )
+
+        still_missing_indices = []
+        for chunk_start in range(0, len(missing_indices), self.chunk_size):
+            chunk = missing_indices[chunk_start:chunk_start + self.chunk_size]
+            responses = await asyncio.gather(
+                *[self._fetch_transaction_receipt(transaction_hashes[index]) for index in chunk]
+            )
+            for index, response in zip(chunk, responses):
+                if response is None or response.result is None:
+                    still_missing_indices.append(index)
+                else:
+                    receipts[index] = response.result
+            if on_receipts_fetched is not None:
+                on_receipts_fetched(receipts)
+        return still_missing_indices
+
+    async def _fetch_block_receipts(self, block_hash: str) -> Optional[JsonRpcResponse]:
+        try:
+            return await self.node.eth_ws_proxy_publisher.call_rpc(
+                ETH_GET_BLOCK_RECEIPTS_RPC_METHOD, [block_hash]
+            )
+        except RpcError as e:
+            if getattr(e.code, "value", e.code) == METHOD_NOT_FOUND_ERROR_CODE:
+                logger.info(
+                    "Ethereum node does not support {}: {}. Fetching receipts of each transaction instead.",
+                    ETH_GET_BLOCK_RECEIPTS_RPC_METHOD, e.to_json()
+                )
+                self.block_receipts_supported = False
+            else:
+                logger.debug(
+                    "Failed to fetch receipts of block {}: {}. Fetching receipts of each transaction instead.",
+                    block_hash, e.to_json()
+                )
+            return None
+
+    async def _fetch_transaction_receipt(self, transaction_hash: str) -> Optional[JsonRpcResponse]:
+        try:
+            return await self.node.eth_ws_proxy_publisher.call_rpc(
+                rpc_constants.ETH_GET_TRANSACTION_RECEIPT_RPC_METHOD, [transaction_hash],
+            )
+        except RpcError as e:
+            logger.warning(
+                "Failed to fetch transaction receipt for {}: {}.",
+                transaction_hash, e.to_json()
+            )
+            return None
@@ -47,19 +47,25 @@ class EthNewBlockFeed(Feed[EthBlockFeedEntry, EthRawBlock]):
     def serialize(self, raw_message: EthRawBlock) -> EthBlockFeedEntry:
         block_message = raw_message.block
         assert block_message is not None
-        return EthBlockFeedEntry(raw_message.block_hash, block_message)
+        return EthBlockFeedEntry(raw_message.block_hash, block_message, self.get_included_fields())
+
+    def get_included_fields(self) -> Set[str]:
+        """
+        :return: top level fields included by at least one subscriber, e.g. "header" for "header.number"
+        """
+        included_fields = set()
+        for subscriber in self.subscribers.values():
+            include = subscriber.options.get("include")
+            if not include:
+                return set(self.FIELDS)
+            included_fields.update(field.split(".", 1)[0] for field in include)
+        return included_fields
 
     def publish_blocks_from_queue(self, start_block_height, end_block_height) -> Set[int]:
         missing_blocks = set()
-        block_queuing_service = cast(
-            EthBlockQueuingService,
-            self.node.block_queuing_service_manager.get_designated_block_queuing_service()
-        )
-        if block_queuing_service is None:
-            return missing_blocks
-
+        header_chain_index = self.node.header_chain_index
         for block_number in range(start_block_height, end_block_height):
-            block_hash = block_queuing_service.accepted_block_hash_at_height.contents.get(block_number)
+            block_hash = header_chain_index.get_canonical_block_hash(block_number)
             if block_hash:
                 self.publish(
                     EthRawBlock(
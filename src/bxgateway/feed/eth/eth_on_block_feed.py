@@ -1,7 +1,8 @@
 import asyncio
+import json
 import time
 
-from typing import Dict, Any, TYPE_CHECKING, Union, List, Optional
+from typing import Dict, Any, TYPE_CHECKING, Union, List, Optional, Tuple
 from asyncio import QueueFull, Task
 from dataclasses import dataclass, asdict
 
@@ -13,7 +14,7 @@ from bxcommon.rpc import rpc_constants
 from bxcommon.feed.feed import Feed
 from bxcommon.feed.subscriber import Subscriber
 
-from bxgateway import log_messages
+from bxgateway import log_messages, gateway_constants
 
 from bxgateway.utils.stats.eth_on_block_feed_stats_service import (
     eth_on_block_feed_stats_service,
@@ -101,6 +102,25 @@ class EthCallOption:
             self.validate_item_in_payload("pos")
 
 
+class PlannedEthCall:
+    """
+    Call executed once for a block on behalf of all subscribers with an identical call.
+    """
+
+    call: EthCallOption
+    tag: TAG_TYPE
+    subscriber_calls: List[Tuple[Subscriber[OnBlockFeedEntry], EthCallOption]]
+
+    def __init__(self, call: EthCallOption, tag: TAG_TYPE) -> None:
+        self.call = call
+        self.tag = tag
+        self.subscriber_calls = []
+
+
+def get_call_key(call: EthCallOption, tag: TAG_TYPE) -> Tuple[str, TAG_TYPE, str]:
+    return str(call.command_method), tag, json.dumps(call.call_payload, sort_keys=True)
+
+
 class EventNotification:
     block_height: int
 
@@ -169,10 +189,16 @@ class EthOnBlockFeed(Feed[OnBlockFeedEntry, EventNotification]):
     VALID_SOURCES = {FeedSource.BLOCKCHAIN_RPC, FeedSource.BLOCKCHAIN_SOCKET}
     last_block_height: int
 
-    def __init__(self, node: "EthGatewayNode", network_num: int = constants.ALL_NETWORK_NUM,) -> None:
+    def __init__(
+        self,
+        node: "EthGatewayNode",
+        network_num: int = constants.ALL_NETWORK_NUM,
+        max_concurrent_calls: int = gateway_constants.ETH_ON_BLOCK_FEED_MAX_CONCURRENT_CALLS,
+    ) -> None:
         self.node = node
         self.bad_subscribers = set()
         self.last_block_height = 0
+        self.max_concurrent_calls = max_concurrent_calls
         super().__init__(self.NAME, network_num)
 
     def subscribe(self, options: Dict[str, Any]) -> Subscriber[OnBlockFeedEntry]:
@@ -209,63 +235,131 @@ class EthOnBlockFeed(Feed[OnBlockFeedEntry, EventNotification]):
         while self.bad_subscribers:
             self.unsubscribe(self.bad_subscribers.pop())
 
-        # process subscriptions
+        # plan subscriptions, identical calls of all subscribers are executed once
+        planned_calls: Dict[Tuple[str, TAG_TYPE, str], PlannedEthCall] = {}
         for subscriber in self.subscribers.values():
-            subscriber_tasks = []
             for call in subscriber.options["calls"].values():
                 if call.active:
-                    task = asyncio.create_task(
-                        self._publish(subscriber, call, block_height)
-                    )
-                    subscriber_tasks.append(task)
-            asyncio.create_task(
+                    tag = block_height + call.block_offset
+                    call_key = get_call_key(call, tag)
+                    planned_call = planned_calls.get(call_key)
+                    if planned_call is None:
+                        planned_call = PlannedEthCall(call, tag)
+                        planned_calls[call_key] = planned_call
+                    planned_call.subscriber_calls.append((subscriber, call))
+
+        asyncio.create_task(
+            self.execute_planned_calls(
+                list(self.subscribers.values()), list(planned_calls.values()), block_height, event_init_time
+            )
+        )
+
+    async def execute_planned_calls(
+        self,
+        subscribers: List[Subscriber[OnBlockFeedEntry]],
+        planned_calls: List[PlannedEthCall],
+        block_height: int,
+        event_init_time: float,
+    ) -> None:
+        """
+        Executes calls planned for a block, with at most `max_concurrent_calls` calls in flight,
+        and notifies each subscriber once all of its calls are completed.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_calls)
+        subscriber_tasks: Dict[str, List[Task]] = {
+            subscriber.subscription_id: [] for subscriber in subscribers
+        }
+        subscriber_calls_count: Dict[str, int] = {
+            subscriber.subscription_id: 0 for subscriber in subscribers
+        }
+        total_calls = 0
+        for planned_call in planned_calls:
+            task = asyncio.create_task(self._execute_planned_call(semaphore, planned_call, block_height))
+            total_calls += len(planned_call.subscriber_calls)
+            for subscriber, _call in planned_call.subscriber_calls:
+                subscriber_calls_count[subscriber.subscription_id] += 1
+                tasks = subscriber_tasks[subscriber.subscription_id]
+                # a subscriber may have several identical calls planned as one
+                if not tasks or tasks[-1] is not task:
+                    tasks.append(task)
+
+        await asyncio.gather(
+            *(
                 self.wait_for_all_subscriber_tasks(
-                    subscriber, subscriber_tasks, block_height, event_init_time
+                    subscriber,
+                    subscriber_tasks[subscriber.subscription_id],
+                    subscriber_calls_count[subscriber.subscription_id],
+                    block_height,
+                    event_init_time,
                 )
+                for subscriber in subscribers
             )
+        )
+
+        duration = time.time() - event_init_time
+        logger.trace(
+            "Executed {} calls ({} unique) for block height {} in {:.2f}ms",
+            total_calls, len(planned_calls), block_height, duration * 1000
+        )
+        eth_on_block_feed_stats_service.log_block_calls(total_calls, len(planned_calls), duration)
 
     async def wait_for_all_subscriber_tasks(
         self,
         subscriber: Subscriber[OnBlockFeedEntry],
         subscriber_tasks: List[Task],
+        calls_count: int,
         block_height: int,
         event_init_time: float,
     ) -> None:
+        if subscriber_tasks:
+            await asyncio.wait(subscriber_tasks, return_when=asyncio.ALL_COMPLETED)
         logger.trace(
             "Execution Completed for block height {} duration {} s",
             block_height,
             time.time() - event_init_time,
         )
         eth_on_block_feed_stats_service.log_subscriber_tasks(
-            len(subscriber_tasks), time.time() - event_init_time
+            calls_count, time.time() - event_init_time
         )
-        if subscriber_tasks:
-            await asyncio.wait(subscriber_tasks, return_when=asyncio.ALL_COMPLETED)
         subscriber.queue(
             self.serialize_response(
                 str(EventType.TASK_COMPLETED_EVENT), {}, block_height, block_height
             )
         )
 
-    async def _publish(
-        self,
-        subscriber: Subscriber[OnBlockFeedEntry],
-        call: EthCallOption,
-        block_height: int,
-        retry_count: int = 0
+    async def _execute_planned_call(
+        self, semaphore: asyncio.Semaphore, planned_call: PlannedEthCall, block_height: int
     ) -> None:
-        tag = block_height + call.block_offset
-        try:
-            response = await self.execute_eth_call(call, tag)
-        except RpcError as e:
-            response = e.to_json()
-            if e.message == "header not found" and retry_count <= RETRIES_MAX_ATTEMPTS:
+        tag = planned_call.tag
+        disabled = False
+        retry_count = 0
+        while True:
+            try:
+                async with semaphore:
+                    response = await self.execute_eth_call(planned_call.call, tag)
+                break
+            except RpcError as e:
+                response = e.to_json()
+                retry = e.message == "header not found" and retry_count <= RETRIES_MAX_ATTEMPTS
+                logger.info(
+                    "{}, Error response from node {}, call details {} retry: {}",
+                    self,
+                    response,
+                    planned_call.call,
+                    retry,
+                )
+                if not retry:
+                    disabled = True
+                    break
+                retry_count += 1
                 await asyncio.sleep(RETRIES_SLEEP_INTERVAL)
-                await self._publish(subscriber, call, block_height, retry_count + 1)
-                retry = True
-            else:
+
+        # fan out the response to all subscribers of the call
+        for subscriber, call in planned_call.subscriber_calls:
+            if disabled:
                 call.active = False
-                subscriber.queue(
+                self._queue(
+                    subscriber,
                     self.serialize_response(
                         str(EventType.TASK_DISABLED_EVENT),
                         asdict(call),
@@ -273,20 +367,11 @@ class EthOnBlockFeed(Feed[OnBlockFeedEntry, EventNotification]):
                         block_height,
                     )
                 )
-                retry = False
-            logger.info(
-                "{}, Error response from node {}, call details {} retry: {}",
-                self,
-                response,
-                call,
-                retry,
-            )
+            self._queue(subscriber, self.serialize_response(call.call_name, response, block_height, tag))
 
-        serialized_message = self.serialize_response(
-            call.call_name, response, block_height, tag
-        )
+    def _queue(self, subscriber: Subscriber[OnBlockFeedEntry], message: OnBlockFeedEntry) -> None:
         try:
-            subscriber.queue(serialized_message)
+            subscriber.queue(message)
         except QueueFull:
             logger.error(
                 log_messages.GATEWAY_BAD_FEED_SUBSCRIBER, subscriber.subscription_id, self.name
@@ -1,5 +1,5 @@
 import asyncio
-from typing import TYPE_CHECKING, Dict, cast, Set, Union
+from typing import TYPE_CHECKING, Dict, cast, Set, Union, List, Optional
 
 import humps
 
@@ -7,13 +7,15 @@ from bxcommon import constants
 from bxcommon.feed.feed import Feed
 from bxcommon.feed.feed_source import FeedSource
 from bxcommon.rpc import rpc_constants
-from bxcommon.rpc.rpc_errors import RpcError
 from bxcommon.utils.expiring_set import ExpiringSet
+from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway import gateway_constants
+from bxgateway.feed.eth.eth_block_receipts_fetcher import EthBlockReceiptsFetcher
 from bxgateway.feed.eth.eth_raw_block import EthRawBlock
 from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
-from bxgateway.services.eth.eth_block_queuing_service import EthBlockQueuingService
-from bxutils import logging, utils
+from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
+from bxgateway.utils.eth.block_transaction_hashes_memo import block_transaction_hashes_memo
+from bxutils import logging
 
 if TYPE_CHECKING:
     # noinspection PyUnresolvedReferences
@@ -22,8 +24,6 @@ if TYPE_CHECKING:
 
 logger = logging.get_logger(__name__)
 
-RETRIES_MAX_ATTEMPTS = 8
-
 
 class TransactionReceiptsFeedEntry:
     receipt: Dict[str, str]
@@ -73,6 +73,7 @@ class EthTransactionReceiptsFeed(Feed[TransactionReceiptsFeedEntry, Union[EthRaw
         self.blocks_confirmed_by_new_heads_notification = ExpiringSet(
             node.alarm_queue, gateway_constants.MAX_BLOCK_CACHE_TIME_S, name="receipts_feed_newHeads_confirmed_blocks"
         )
+        self.receipts_fetcher = EthBlockReceiptsFetcher(node)
 
     def serialize(self, raw_message: Union[EthRawBlock, Dict]) -> TransactionReceiptsFeedEntry:
         # only receipts are serialized for publishing
@@ -132,9 +133,7 @@ class EthTransactionReceiptsFeed(Feed[TransactionReceiptsFeedEntry, Union[EthRaw
                 )
 
         logger.debug("{} Attempting to fetch transaction receipts for block {}", self.name, block_hash)
-        block_hash_str = block_hash.to_string(True)
-        for tx in block.txns():
-            asyncio.create_task(self._publish(tx.hash().to_string(True), block_hash_str))
+        self._fetch_and_publish_block(block_hash, block)
 
         if block_number in self.published_blocks_height and block_number <= self.last_block_number:
             # possible fork, try to republish all later blocks
@@ -143,68 +142,46 @@ class EthTransactionReceiptsFeed(Feed[TransactionReceiptsFeedEntry, Union[EthRaw
         if block_number > self.last_block_number:
             self.last_block_number = block_number
 
-    async def _publish(
-        self,
-        transaction_hash: str,
-        block_hash: str,
-        retry_count: int = 0
-    ) -> None:
-        response = None
-        try:
-            response = await self.node.eth_ws_proxy_publisher.call_rpc(
-                rpc_constants.ETH_GET_TRANSACTION_RECEIPT_RPC_METHOD, [transaction_hash],
-            )
-        except RpcError as e:
-            error_response = e.to_json()
-            logger.warning(
-                "Failed to fetch transaction receipt for {} in block {}: {}. Ceasing attempts.",
-                transaction_hash, block_hash, error_response
-            )
-
-        assert response is not None
-
-        if response.result is None:
-            if retry_count == 0 or retry_count == RETRIES_MAX_ATTEMPTS:
-                logger.debug(
-                    "Failed to fetch transaction receipt for tx {} in block {}: not found. "
-                    "Attempt: {}. Max attempts: {}.",
-                    transaction_hash, block_hash, retry_count + 1, RETRIES_MAX_ATTEMPTS + 1
-                )
-            if retry_count < RETRIES_MAX_ATTEMPTS:
-                sleep_time = utils.fibonacci(retry_count + 1) * 0.1
-                await asyncio.sleep(sleep_time)
-                asyncio.create_task(self._publish(transaction_hash, block_hash, retry_count + 1))
-            return
+    async def _publish_block(self, block_hash: str, transaction_hashes: List[str]) -> None:
+        published_count = 0
 
-        response.result = humps.decamelize(response.result)
-        json_response = response.to_json()
-        if json_response["result"]["block_hash"] != block_hash:
-            return
-        super().publish(json_response)
+        def publish_ready_receipts(receipts: List[Optional[Dict]]) -> None:
+            # receipts are published in transaction index order as soon as all previous receipts are fetched
+            nonlocal published_count
+            while published_count < len(receipts) and receipts[published_count] is not None:
+                self._publish_receipt(block_hash, receipts[published_count])
+                published_count += 1
 
-        if retry_count > 0:
-            logger.debug(
-                "Succeeded in fetching receipt for tx {} in block {} after {} attempts.",
-                transaction_hash, block_hash, retry_count
-            )
+        receipts = await self.receipts_fetcher.fetch_receipts(block_hash, transaction_hashes, publish_ready_receipts)
+        for receipt in receipts[published_count:]:
+            if receipt is not None:
+                self._publish_receipt(block_hash, receipt)
+
+    def _publish_receipt(self, block_hash: str, receipt: Dict) -> None:
+        receipt = humps.decamelize(receipt)
+        if receipt["block_hash"] != block_hash:
+            return
+        super().publish({"result": receipt})
 
     def _publish_blocks_from_queue(self, start_block_height, end_block_height) -> Set[int]:
         missing_blocks = set()
-        block_queuing_service = cast(
-            EthBlockQueuingService,
-            self.node.block_queuing_service_manager.get_designated_block_queuing_service()
-        )
-        if block_queuing_service is None:
-            return missing_blocks
-
+        header_chain_index = self.node.header_chain_index
         for block_number in range(start_block_height, end_block_height):
-            block_hash = block_queuing_service.accepted_block_hash_at_height.contents.get(block_number)
+            block_hash = header_chain_index.get_canonical_block_hash(block_number)
             if block_hash:
                 block = self.node.block_queuing_service_manager.get_block_data(block_hash)
                 if block is not None:
-                    block_hash_str = block_hash.to_string(True)
-                    for tx in block.txns():
-                        asyncio.create_task(self._publish(tx.hash().to_string(True), block_hash_str))
+                    self._fetch_and_publish_block(block_hash, block)
             else:
                 missing_blocks.add(block_number)
         return missing_blocks
+
+    def _fetch_and_publish_block(
+        self, block_hash: Sha256Hash, block: Union[InternalEthBlockInfo, NewBlockEthProtocolMessage]
+    ) -> None:
+        # receipts of all transactions are fetched together and published in transaction index order
+        tx_hashes = block_transaction_hashes_memo.get(block_hash)
+        if tx_hashes is None:
+            tx_hashes = [tx.hash() for tx in block.txns()]
+        transaction_hashes = [tx_hash.to_string(True) for tx_hash in tx_hashes]
+        asyncio.create_task(self._publish_block(block_hash.to_string(True), transaction_hashes))
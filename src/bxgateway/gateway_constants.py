@@ -18,6 +18,13 @@ BLOCK_RECOVERY_MAX_RETRY_ATTEMPTS = 1  # for now, since longer retries aren't re
 BLOCK_RECOVERY_MAX_QUEUE_TIME = 15  # slightly more than sum(BLOCK_RECOVERY_RECOVERY_INTERVAL_S)
 CHECK_MEMORY_THRESHOLD_INTERVAL_S = 60 * 60
 CHECK_MEMORY_THRESHOLD_LIMIT = 4 * 1024 * 1024 * 1024
+MEMORY_BUDGET_CHECK_INTERVAL_S = 60
+# cached data is evicted once its tracked size is above this share of the memory budget, down to the target share
+MEMORY_EVICTION_THRESHOLD = 0.9
+MEMORY_EVICTION_TARGET = 0.8
+# with a memory budget, consecutive memory checks above the memory limit, despite evictions, before the gateway
+# restarts
+MEMORY_MAX_OVER_LIMIT_CHECKS = 3
 
 # enum for setting Gateway neutrality assertion policy for releasing encryption keys
 class NeutralityPolicy:
@@ -43,6 +50,13 @@ MAX_INTERVAL_BETWEEN_BLOCKS_S = 0.6
 NODE_READINESS_FOR_BLOCKS_CHECK_INTERVAL_S = 5
 MAX_BLOCK_CACHE_TIME_S = 20 * 60
 MAX_BLOCK_BACKLOG_TO_PUBLISH = 10
+# worker processes converting blocks without C++ extensions, 0 converts blocks on the event loop
+BLOCK_CONVERSION_PROCESSES = 0
+# 0 disables writing the transaction service snapshot used for warm restarts
+TX_SERVICE_SNAPSHOT_INTERVAL_S = 0
+# older snapshots are ignored on startup and the transaction service is synced from scratch
+TX_SERVICE_SNAPSHOT_MAX_AGE_S = 30 * 60
+TX_SERVICE_SNAPSHOT_FILE_NAME = "tx_service_snapshot.bin"
 
 GATEWAY_TRANSACTION_STATS_INTERVAL_S = 1 * 60
 GATEWAY_TRANSACTION_STATS_LOOKBACK = 1
@@ -103,15 +117,37 @@ TRACKED_BLOCK_MAX_HASH_LOOKUP = 100
 
 BDN_TX_PROCESSING_TIME_WARNING_THRESHOLD_S = 0.05
 BLOCKCHAIN_TX_PROCESSING_TIME_WARNING_THRESHOLD_S = 0.05
+# buckets of the message handler, alarm callback and event loop lag histograms
+EVENT_LOOP_PROFILER_BUCKETS_S = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+EVENT_LOOP_LAG_SAMPLE_INTERVAL_S = 0.5
+PROFILE_RPC_DEFAULT_TOP = 20
 
 WS_DEFAULT_PORT = 28333
 WS_DEFAULT_HOST = LOCALHOST
 RPC_SUBSCRIBER_MAX_QUEUE_SIZE = 1000
+# serialized notifications kept per feed, include fields and case for subscribers lagging behind
+FEED_SERIALIZED_NOTIFICATION_CACHE_SIZE = 16
+BLXR_BATCH_TX_MAX_SIZE = 1000
+# 1 handles websocket and IPC requests one by one in the order they were received
+WS_MAX_IN_FLIGHT_REQUESTS = 1
 
 ETH_GAS_RUNNING_AVERAGE_SIZE = 10000
 ADDITIONAL_BLOCKCHAIN_RECONNECT_TIMEOUT_S = 3
 CHECK_RELAY_CONNECTIONS_DELAY_S = 5
 ETH_MIN_GAS_INTERVAL_S = 5 * 60
+# 0 disables batching of transactions sent to Ethereum nodes
+ETH_TX_BATCH_INTERVAL_MS = 0
+ETH_TX_BATCH_MAX_SIZE = 100
+
+ETH_RECEIPTS_FETCH_CHUNK_SIZE = 50
+# identical onBlock feed calls of all subscribers are executed once per block, with at most this many in flight
+ETH_ON_BLOCK_FEED_MAX_CONCURRENT_CALLS = 80
+# Transactions messages above eth_common_constants.ETH_SKIP_TRANSACTIONS_SIZE are processed in slices of this size
+ETH_TRANSACTIONS_SLICE_SIZE = 128 * 1024
+# number of most recent block heights kept in the shared Ethereum header chain index
+ETH_HEADER_CHAIN_INDEX_LENGTH = 1024
+# 0 disables requesting announced blocks from another Ethereum node when the first one is slow
+ETH_BLOCK_FETCH_HEDGE_DELAY_MS = 250
 
 ETH_PROTOCOL_VERSION_63 = 63
 ONE_DAY_INTERVAL_S = 60 * 60 * 24
@@ -84,6 +84,13 @@ class GatewayOpts(CommonOpts):
     request_recovery: bool
     enable_block_compression: bool
     filter_txs_factor: float
+    eth_tx_batch_interval_ms: float
+    eth_tx_batch_max_size: int
+    eth_block_fetch_hedge_delay_ms: float
+    import_profile: bool
+    block_conversion_processes: int
+    tx_service_snapshot_interval_s: int
+    memory_budget_mb: int
     min_peer_relays_count: int
     should_restart_on_high_memory: bool
 
@@ -101,6 +108,7 @@ class GatewayOpts(CommonOpts):
     ws: bool
     ws_host: str
     ws_port: int
+    ws_max_in_flight_requests: int
     eth_ws_uri: Optional[str]
     request_remote_transaction_streaming: bool
 
@@ -179,6 +187,27 @@ class GatewayOpts(CommonOpts):
         if self.filter_txs_factor < 0:
             logger.fatal("--filter_txs_factor cannot be below 0.")
             sys.exit(1)
+        if self.eth_tx_batch_interval_ms < 0:
+            logger.fatal("--eth-tx-batch-interval-ms cannot be below 0.")
+            sys.exit(1)
+        if self.eth_tx_batch_max_size < 1:
+            logger.fatal("--eth-tx-batch-max-size cannot be below 1.")
+            sys.exit(1)
+        if self.eth_block_fetch_hedge_delay_ms < 0:
+            logger.fatal("--eth-block-fetch-hedge-delay-ms cannot be below 0.")
+            sys.exit(1)
+        if self.block_conversion_processes < 0:
+            logger.fatal("--block-conversion-processes cannot be below 0.")
+            sys.exit(1)
+        if self.tx_service_snapshot_interval_s < 0:
+            logger.fatal("--tx-service-snapshot-interval-s cannot be below 0.")
+            sys.exit(1)
+        if self.memory_budget_mb < 0:
+            logger.fatal("--memory-budget-mb cannot be below 0.")
+            sys.exit(1)
+        if self.ws_max_in_flight_requests < 1:
+            logger.fatal("--ws-max-in-flight-requests cannot be below 1.")
+            sys.exit(1)
 
     def validate_eth_opts(self) -> None:
         if not self.blockchain_ip and not self.blockchain_peers:
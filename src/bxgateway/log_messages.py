@@ -497,3 +497,23 @@ ATTEMPTED_FETCH_FOR_NONEXISTENT_QUEUING_SERVICE = LogMessage(
     GENERAL_CATEGORY,
     "Attmepted to fetch queuing service for blockchain node {}, but it was not found."
 )
+BLOCK_CONVERSION_POOL_FAIL = LogMessage(
+    "G-000093",
+    PROCESSING_FAILED_CATEGORY,
+    "Failed to convert block {} in a worker process, converting blocks on the event loop from now on - {}"
+)
+TX_SERVICE_SNAPSHOT_LOAD_FAIL = LogMessage(
+    "G-000094",
+    GENERAL_CATEGORY,
+    "Failed to load transaction service snapshot from {}, syncing transaction service from scratch - {}"
+)
+TX_SERVICE_SNAPSHOT_WRITE_FAIL = LogMessage(
+    "G-000095",
+    GENERAL_CATEGORY,
+    "Failed to write transaction service snapshot to {} - {}"
+)
+MEMORY_BUDGET_EVICTION = LogMessage(
+    "G-000096",
+    MEMORY_CATEGORY,
+    "Size of data cached by the gateway {} is close to the memory budget of {}, evicted {}"
+)
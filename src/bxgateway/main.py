@@ -173,7 +173,8 @@ def get_argument_parser() -> argparse.ArgumentParser:
                             type=str,
                             default="bxgateway.ipc")
     arg_parser.add_argument("--should-restart-on-high-memory",
-                            help="Should a gateway restart itself if memory exceeds 2GB",
+                            help="Should a gateway restart itself if memory stays above --memory-budget-mb "
+                                 "after evicting cached data",
                             type=convert.str_to_bool,
                             default=True)
     # Ontology specific
@@ -291,6 +292,14 @@ def get_argument_parser() -> argparse.ArgumentParser:
         type=int,
         default=gateway_constants.WS_DEFAULT_PORT,
     )
+    arg_parser.add_argument(
+        "--ws-max-in-flight-requests",
+        help="Maximum number of requests handled concurrently on a single websockets or IPC connection. "
+             "Responses are sent as requests complete, and are matched to requests by JSON-RPC id. "
+             f"(default: {gateway_constants.WS_MAX_IN_FLIGHT_REQUESTS})",
+        type=int,
+        default=gateway_constants.WS_MAX_IN_FLIGHT_REQUESTS,
+    )
     arg_parser.add_argument(
         "--eth-ws-uri",
         help="Ethereum websockets endpoint for syncing transaction content",
@@ -329,6 +338,62 @@ def get_argument_parser() -> argparse.ArgumentParser:
         type=float,
         default=0
     )
+    arg_parser.add_argument(
+        "--eth-tx-batch-interval-ms",
+        help="Ethereum only. Maximum time in milliseconds to hold transactions from BDN to send them to the "
+             "blockchain node in a single message. 0 disables batching. "
+             f"(default: {gateway_constants.ETH_TX_BATCH_INTERVAL_MS})",
+        type=float,
+        default=gateway_constants.ETH_TX_BATCH_INTERVAL_MS
+    )
+    arg_parser.add_argument(
+        "--eth-tx-batch-max-size",
+        help="Ethereum only. Maximum number of transactions sent to the blockchain node in a single batched "
+             f"message (default: {gateway_constants.ETH_TX_BATCH_MAX_SIZE})",
+        type=int,
+        default=gateway_constants.ETH_TX_BATCH_MAX_SIZE
+    )
+    arg_parser.add_argument(
+        "--eth-block-fetch-hedge-delay-ms",
+        help="Ethereum only. Time in milliseconds to wait for a block announced by a blockchain node before "
+             "requesting it from another blockchain node that announced it. 0 disables the second request. "
+             f"(default: {gateway_constants.ETH_BLOCK_FETCH_HEDGE_DELAY_MS})",
+        type=float,
+        default=gateway_constants.ETH_BLOCK_FETCH_HEDGE_DELAY_MS
+    )
+    arg_parser.add_argument(
+        "--block-conversion-processes",
+        help="Number of worker processes compressing and decompressing blocks when the gateway runs without "
+             "C++ extensions, so that block conversion does not block the event loop. 0 converts blocks on the "
+             f"event loop. (default: {gateway_constants.BLOCK_CONVERSION_PROCESSES})",
+        type=int,
+        default=gateway_constants.BLOCK_CONVERSION_PROCESSES
+    )
+    arg_parser.add_argument(
+        "--tx-service-snapshot-interval-s",
+        help="Interval in seconds of writing a snapshot of the transaction service to disk. The snapshot is "
+             "written on shutdown as well, and loaded on startup if it is not older than "
+             f"{gateway_constants.TX_SERVICE_SNAPSHOT_MAX_AGE_S} seconds, so the gateway does not start with an "
+             f"empty transaction service. 0 disables snapshots. "
+             f"(default: {gateway_constants.TX_SERVICE_SNAPSHOT_INTERVAL_S})",
+        type=int,
+        default=gateway_constants.TX_SERVICE_SNAPSHOT_INTERVAL_S
+    )
+    arg_parser.add_argument(
+        "--memory-budget-mb",
+        help="Memory budget in megabytes for the data the gateway caches. Once cached data comes close to the "
+             "budget, the gateway evicts transactions without short ids, block bodies blockchain nodes already "
+             "have and blocks awaiting recovery. 0 disables eviction. (default: 0)",
+        type=int,
+        default=0
+    )
+    arg_parser.add_argument(
+        "--import-profile",
+        help="If true, logs time and memory spent on importing each module of the blockchain protocol "
+             "stack at startup",
+        default=False,
+        type=convert.str_to_bool,
+    )
 
     return arg_parser
 
@@ -349,7 +414,7 @@ def main() -> None:
     logger_names.append("bxgateway")
     logging_messages_utils.logger_names = set(logger_names)
     opts = get_opts()
-    get_node_class = functools.partial(get_gateway_node_type, opts.blockchain_protocol)
+    get_node_class = functools.partial(get_gateway_node_type, opts.blockchain_protocol, opts.import_profile)
 
     node_runner.run_node(
         config.get_data_file(PID_FILE_NAME),
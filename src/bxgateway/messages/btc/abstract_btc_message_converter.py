@@ -8,6 +8,7 @@ from bxcommon.services.transaction_service import TransactionService
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.utils import crypto, convert
 from bxcommon.utils.blockchain_utils.bdn_tx_to_bx_tx import bdn_tx_to_bx_tx
+from bxcommon.utils.blockchain_utils.btc import btc_common_utils
 from bxcommon.utils.object_hash import Sha256Hash
 from bxcommon.utils.proxy.vector_proxy import VectorProxy
 from bxcommon import constants as common_constants
@@ -122,6 +123,12 @@ class AbstractBtcMessageConverter(AbstractMessageConverter):
     ) -> CompactBlockCompressionResult:
         pass
 
+    def block_message_from_bytes(self, block_bytes: Union[bytearray, memoryview]) -> BlockBtcMessage:
+        return BlockBtcMessage(buf=block_bytes)
+
+    def get_block_transaction_hashes(self, block_msg: BlockBtcMessage) -> List[Sha256Hash]:
+        return [btc_common_utils.get_txid(tx) for tx in block_msg.txns()]
+
     def bx_tx_to_tx(self, tx_msg):
         if not isinstance(tx_msg, TxMessage):
             raise TypeError("tx_msg is expected to be of type TxMessage")
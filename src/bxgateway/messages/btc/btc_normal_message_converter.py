@@ -1,11 +1,9 @@
 import struct
 import time
-import hashlib
 from datetime import datetime
 
-from csiphash import siphash24
 from collections import deque
-from typing import Tuple, Optional, List, Deque, Union, NamedTuple
+from typing import Tuple, Optional, List, Deque, Union, NamedTuple, Dict
 
 from bxutils import logging
 
@@ -20,16 +18,18 @@ from bxcommon.utils.object_hash import Sha256Hash
 
 from bxgateway import btc_constants
 from bxgateway.utils.errors import message_conversion_error
-from bxgateway.abstract_message_converter import finalize_block_bytes
+from bxgateway.abstract_message_converter import BxBlockWriter
 from bxgateway.messages.btc.abstract_btc_message_converter import AbstractBtcMessageConverter, get_block_info, \
     CompactBlockCompressionResult
 from bxgateway.messages.btc.btc_message_type import BtcMessageType
 from bxgateway.messages.btc.compact_block_btc_message import CompactBlockBtcMessage
+from bxgateway.messages.btc.compact_block_short_id_index import CompactBlockShortIdIndexCache, get_short_id_key
 from bxgateway.utils.block_info import BlockInfo
 from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 from bxgateway.utils.block_header_info import BlockHeaderInfo
 from bxgateway.messages.btc import btc_messages_util
-from bxgateway.abstract_message_converter import BlockDecompressionResult
+from bxgateway.services.gateway_transaction_service import get_short_ids_and_assign_times
+from bxgateway.abstract_message_converter import BlockDecompressionResult, BlockDecompressionState
 
 
 logger = logging.get_logger(__name__)
@@ -81,14 +81,19 @@ def parse_bx_block_transactions(
         short_ids: List[int],
         block_offsets: BlockOffsets,
         tx_service: TransactionService,
-        block_pieces: Deque[Union[bytearray, memoryview]]
+        tx_pieces: List[Optional[Union[bytearray, memoryview]]],
+        missing_tx_short_ids: Dict[int, int]
 ) -> Tuple[List[int], List[Sha256Hash], int]:
-    has_missing, unknown_tx_sids, unknown_tx_hashes = \
-        tx_service.get_missing_transactions(short_ids)
-    if has_missing:
-        return unknown_tx_sids, unknown_tx_hashes, offset
+    """
+    Collects block transaction contents into `tx_pieces`. Slots of transactions that are not known
+    by the transaction service are left empty and tracked in `missing_tx_short_ids`.
+
+    :return: tuple (unknown short ids, unknown transaction hashes, size of known transaction contents)
+    """
+    unknown_tx_sids = []
+    unknown_tx_hashes = []
     short_tx_index = 0
-    output_offset = offset
+    tx_content_size = 0
     while offset < block_offsets.short_id_offset:
         if bx_block[offset] == btc_constants.BTC_SHORT_ID_INDICATOR:
             try:
@@ -100,6 +105,12 @@ def parse_bx_block_transactions(
                     f"exceeded its array bounds (size: {len(short_ids)})"
                 )
             tx_hash, tx, _ = tx_service.get_transaction(sid)
+            if tx_hash is None:
+                unknown_tx_sids.append(sid)
+            elif tx is None:
+                unknown_tx_hashes.append(tx_hash)
+            if tx is None:
+                missing_tx_short_ids[len(tx_pieces)] = sid
             offset += btc_constants.BTC_SHORT_ID_INDICATOR_LENGTH
             short_tx_index += 1
         else:
@@ -107,14 +118,11 @@ def parse_bx_block_transactions(
             tx = bx_block[offset:offset + tx_size]
             offset += tx_size
 
-        # pyre-fixme[6]: Expected `Union[bytearray, memoryview]` for 1st param but
-        #  got `Optional[Union[bytearray, memoryview]]`.
-        block_pieces.append(tx)
-        # pyre-fixme[6]: Expected `Sized` for 1st param but got
-        #  `Optional[Union[bytearray, memoryview]]`.
-        output_offset += len(tx)
+        tx_pieces.append(tx)
+        if tx is not None:
+            tx_content_size += len(tx)
 
-    return unknown_tx_sids, unknown_tx_hashes, output_offset
+    return unknown_tx_sids, unknown_tx_hashes, tx_content_size
 
 
 def build_btc_block(
@@ -129,12 +137,12 @@ def build_btc_block(
     return BlockBtcMessage(buf=btc_block), offset
 
 
-def compute_short_id(key: bytes, tx_hash_binary: Union[bytearray, memoryview]) -> bytes:
-    return siphash24(key, bytes(tx_hash_binary))[0:6]
-
-
 class BtcNormalMessageConverter(AbstractBtcMessageConverter):
 
+    def __init__(self, btc_magic):
+        super(BtcNormalMessageConverter, self).__init__(btc_magic)
+        self._short_id_indices = CompactBlockShortIdIndexCache()
+
     def block_to_bx_block(
         self, block_msg, tx_service, enable_block_compression: bool, min_tx_age_seconds: float
     ) -> Tuple[memoryview, BlockInfo]:
@@ -143,40 +151,42 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
         """
         compress_start_datetime = datetime.utcnow()
         compress_start_timestamp = time.time()
-        size = 0
-        buf = deque()
         short_ids = []
         original_size = len(block_msg.rawbytes())
         ignored_sids = []
 
         header = block_msg.header()
-        size += len(header)
-        buf.append(header)
+        size = len(header)
 
         max_timestamp_for_compression = time.time() - min_tx_age_seconds
 
-        for tx in block_msg.txns():
-            tx_hash = btc_common_utils.get_txid(tx)
-            transaction_key = tx_service.get_transaction_key(tx_hash)
-            short_id = tx_service.get_short_id_by_key(transaction_key)
-
-            short_id_assign_time = 0
-            if short_id != constants.NULL_TX_SID:
-                short_id_assign_time = tx_service.get_short_id_assign_time(short_id)
+        txns = block_msg.txns()
+        short_ids_by_tx, short_id_assign_times = get_short_ids_and_assign_times(
+            tx_service, self.get_block_transaction_hashes(block_msg)
+        )
 
+        is_full_txs = []
+        for tx, short_id, short_id_assign_time in zip(txns, short_ids_by_tx, short_id_assign_times):
             if short_id == constants.NULL_TX_SID or \
                     not enable_block_compression or \
                     short_id_assign_time > max_timestamp_for_compression:
-                if short_id != constants.NULL_TX_SIDS:
+                if short_id != constants.NULL_TX_SID:
                     ignored_sids.append(short_id)
-                buf.append(tx)
+                is_full_txs.append(True)
                 size += len(tx)
             else:
                 short_ids.append(short_id)
-                buf.append(btc_constants.BTC_SHORT_ID_INDICATOR_AS_BYTEARRAY)
-                size += 1
-
-        block = finalize_block_bytes(buf, size, short_ids)
+                is_full_txs.append(False)
+                size += btc_constants.BTC_SHORT_ID_INDICATOR_LENGTH
+
+        writer = BxBlockWriter(size, short_ids)
+        writer.write(header)
+        for tx, is_full_tx in zip(txns, is_full_txs):
+            if is_full_tx:
+                writer.write(tx)
+            else:
+                writer.write(btc_constants.BTC_SHORT_ID_INDICATOR_AS_BYTEARRAY)
+        block = writer.finalize()
 
         prev_block_hash = convert.bytes_to_hex(block_msg.prev_block_hash().binary)
         bx_block_hash = convert.bytes_to_hex(crypto.double_sha256(block))
@@ -196,7 +206,7 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
             ignored_sids
         )
 
-        return memoryview(block), block_info
+        return block, block_info
 
     def bx_block_to_block(self, bx_block_msg, tx_service) -> BlockDecompressionResult:
         """
@@ -205,6 +215,15 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
         bx_block must be a memoryview, since memoryview[offset] returns a bytearray, while bytearray[offset] returns
         a byte.
         """
+        decompression_result, _ = self.bx_block_to_block_resumable(bx_block_msg, tx_service)
+        return decompression_result
+
+    def bx_block_to_block_resumable(
+        self, bx_block_msg, tx_service
+    ) -> Tuple[BlockDecompressionResult, Optional[BlockDecompressionState]]:
+        """
+        Uncompresses a bx_block, keeping resolved transactions in the decompression state if block recovery is needed.
+        """
         if not isinstance(bx_block_msg, memoryview):
             bx_block_msg = memoryview(bx_block_msg)
 
@@ -212,47 +231,99 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
         decompress_start_timestamp = time.time()
 
         # Initialize tracking of transaction and SID mapping
-        block_pieces = deque()
-        header_info = parse_bx_block_header(bx_block_msg, block_pieces)
-        unknown_tx_sids, unknown_tx_hashes, offset = parse_bx_block_transactions(
+        header_pieces = deque()
+        header_info = parse_bx_block_header(bx_block_msg, header_pieces)
+        tx_pieces = []
+        missing_tx_short_ids = {}
+        unknown_tx_sids, unknown_tx_hashes, tx_content_size = parse_bx_block_transactions(
             header_info.block_hash,
             bx_block_msg,
             header_info.offset,
             header_info.short_ids,
             header_info.block_offsets,
             tx_service,
-            block_pieces
+            tx_pieces,
+            missing_tx_short_ids
+        )
+        decompression_state = BlockDecompressionState(
+            bx_block_msg,
+            header_info.block_hash,
+            header_info.short_ids,
+            header_pieces[0],
+            memoryview(bytearray(0)),
+            tx_pieces,
+            missing_tx_short_ids,
+            tx_content_size
+        )
+        return self._finalize_decompression(
+            decompression_state,
+            unknown_tx_sids,
+            unknown_tx_hashes,
+            decompress_start_datetime,
+            decompress_start_timestamp
+        )
+
+    def resume_bx_block_to_block(
+        self, decompression_state: BlockDecompressionState, tx_service
+    ) -> Tuple[BlockDecompressionResult, Optional[BlockDecompressionState]]:
+        decompress_start_datetime = datetime.utcnow()
+        decompress_start_timestamp = time.time()
+
+        unknown_tx_sids, unknown_tx_hashes = decompression_state.fill_missing_transactions(tx_service)
+        return self._finalize_decompression(
+            decompression_state,
+            unknown_tx_sids,
+            unknown_tx_hashes,
+            decompress_start_datetime,
+            decompress_start_timestamp
         )
-        total_tx_count = header_info.txn_count
 
-        if not unknown_tx_sids and not unknown_tx_hashes:
-            btc_block_msg, offset = build_btc_block(block_pieces, offset)
+    def _finalize_decompression(
+        self,
+        decompression_state: BlockDecompressionState,
+        unknown_tx_sids: List[int],
+        unknown_tx_hashes: List[Sha256Hash],
+        decompress_start_datetime: datetime,
+        decompress_start_timestamp: float
+    ) -> Tuple[BlockDecompressionResult, Optional[BlockDecompressionState]]:
+        total_tx_count = decompression_state.tx_count
+
+        if decompression_state.is_complete():
+            block_pieces = deque(decompression_state.tx_pieces)
+            block_pieces.appendleft(decompression_state.block_header)
+            btc_block_msg, _ = build_btc_block(
+                block_pieces, len(decompression_state.block_header) + decompression_state.tx_content_size
+            )
             logger.debug(
                 "Successfully parsed block broadcast message. {} transactions "
                 "in block {}",
                 total_tx_count,
-                header_info.block_hash
+                decompression_state.block_hash
             )
         else:
             btc_block_msg = None
             logger.debug(
                 "Block recovery needed for {}. Missing {} sids, {} tx hashes. "
                 "Total txs in block: {}",
-                header_info.block_hash,
+                decompression_state.block_hash,
                 len(unknown_tx_sids),
                 len(unknown_tx_hashes),
                 total_tx_count
             )
         block_info = get_block_info(
-            bx_block_msg,
-            header_info.block_hash,
-            header_info.short_ids,
+            decompression_state.bx_block,
+            decompression_state.block_hash,
+            decompression_state.short_ids,
             decompress_start_datetime,
             decompress_start_timestamp,
             total_tx_count,
             btc_block_msg
         )
-        return BlockDecompressionResult(btc_block_msg, block_info, unknown_tx_sids, unknown_tx_hashes)
+        decompression_result = BlockDecompressionResult(btc_block_msg, block_info, unknown_tx_sids, unknown_tx_hashes)
+        if btc_block_msg is None:
+            return decompression_result, decompression_state
+        else:
+            return decompression_result, None
 
     def compact_block_to_bx_block(
         self,
@@ -265,28 +336,24 @@ class BtcNormalMessageConverter(AbstractBtcMessageConverter):
          """
         compress_start_datetime = datetime.utcnow()
         block_header = compact_block.block_header()
-        sha256_hash = hashlib.sha256()
-        sha256_hash.update(block_header)
-        sha256_hash.update(compact_block.short_nonce_buf())
-        hex_digest = sha256_hash.digest()
-        key = hex_digest[0:16]
+        key = get_short_id_key(block_header, compact_block.short_nonce_buf())
 
         short_ids = compact_block.short_ids()
 
+        short_id_index = self._short_id_indices.get_index(key)
+        short_id_index.update(transaction_service.iter_transaction_hashes())
+
         short_id_to_tx_contents = {}
 
-        for tx_hash in transaction_service.iter_transaction_hashes():
-            transaction_key = transaction_service.get_transaction_key(tx_hash)
-            tx_hash_binary = tx_hash.binary[::-1]
-            tx_short_id = compute_short_id(key, tx_hash_binary)
-            if tx_short_id in short_ids:
-                tx_content = transaction_service.get_transaction_by_key(transaction_key)
-                if tx_content is None:
-                    logger.debug("Hash {} is known by transactions service but content is missing.", tx_hash)
-                else:
-                    short_id_to_tx_contents[tx_short_id] = tx_content
-            if len(short_id_to_tx_contents) == len(short_ids):
-                break
+        for short_id in short_ids:
+            tx_hash = short_id_index.get_tx_hash(short_id)
+            if tx_hash is None:
+                continue
+            tx_content = transaction_service.get_transaction_by_key(transaction_service.get_transaction_key(tx_hash))
+            if tx_content is None:
+                logger.debug("Hash {} is known by transactions service but content is missing.", tx_hash)
+            else:
+                short_id_to_tx_contents[short_id] = tx_content
 
         block_transactions = []
         missing_transactions_indices = []
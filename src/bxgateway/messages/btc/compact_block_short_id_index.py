@@ -0,0 +1,109 @@
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Union
+
+from csiphash import siphash24
+
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import btc_constants
+
+
+def get_short_id_key(
+    block_header: Union[bytearray, memoryview], short_nonce_buf: Union[bytearray, memoryview]
+) -> bytes:
+    """
+    SipHash key of compact block short ids as defined in BIP-152
+    """
+    sha256_hash = hashlib.sha256()
+    sha256_hash.update(block_header)
+    sha256_hash.update(short_nonce_buf)
+    return sha256_hash.digest()[0:16]
+
+
+def compute_short_id(key: bytes, tx_hash_binary: Union[bytearray, memoryview]) -> bytes:
+    return siphash24(key, bytes(tx_hash_binary))[0:btc_constants.BTC_COMPACT_BLOCK_SHORT_ID_LEN]
+
+
+class CompactBlockShortIdIndex:
+    """
+    Mapping of compact block short ids to transaction hashes for a single (block header, nonce) SipHash key.
+
+    The index is kept in sync with the transaction service incrementally: short ids are only computed for
+    transactions added since the last update, and transactions removed since then are dropped from the index.
+    """
+
+    key: bytes
+    _short_id_to_tx_hash: Dict[bytes, Sha256Hash]
+    _tx_hash_to_short_id: Dict[Sha256Hash, bytes]
+
+    def __init__(self, key: bytes) -> None:
+        self.key = key
+        self._short_id_to_tx_hash = {}
+        self._tx_hash_to_short_id = {}
+
+    def __len__(self) -> int:
+        return len(self._tx_hash_to_short_id)
+
+    def update(self, tx_hashes: Iterable[Sha256Hash]) -> int:
+        """
+        Indexes transactions that are not in the index yet, and drops indexed transactions that are not
+        in `tx_hashes` anymore.
+
+        :param tx_hashes: all transaction hashes known to the transaction service
+        :return: number of newly indexed transactions
+        """
+        key = self.key
+        short_id_to_tx_hash = self._short_id_to_tx_hash
+        tx_hash_to_short_id = self._tx_hash_to_short_id
+
+        current_tx_hashes = set()
+        indexed_count = 0
+        for tx_hash in tx_hashes:
+            current_tx_hashes.add(tx_hash)
+            if tx_hash in tx_hash_to_short_id:
+                continue
+            # short ids are computed over hashes in internal byte order
+            short_id = compute_short_id(key, tx_hash.binary[::-1])
+            short_id_to_tx_hash[short_id] = tx_hash
+            tx_hash_to_short_id[tx_hash] = short_id
+            indexed_count += 1
+
+        if len(tx_hash_to_short_id) > len(current_tx_hashes):
+            for tx_hash in tx_hash_to_short_id.keys() - current_tx_hashes:
+                short_id = tx_hash_to_short_id.pop(tx_hash)
+                # another transaction with a colliding short id may have replaced the entry
+                if short_id_to_tx_hash.get(short_id) == tx_hash:
+                    del short_id_to_tx_hash[short_id]
+        return indexed_count
+
+    def get_tx_hash(self, short_id: bytes) -> Optional[Sha256Hash]:
+        return self._short_id_to_tx_hash.get(short_id)
+
+
+class CompactBlockShortIdIndexCache:
+    """
+    Keeps short id indices of the most recent compact block keys.
+    """
+
+    _indices: "OrderedDict[bytes, CompactBlockShortIdIndex]"
+
+    def __init__(self, max_size: int = btc_constants.BTC_COMPACT_BLOCK_SHORT_ID_INDEX_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._indices = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def get_index(self, key: bytes) -> CompactBlockShortIdIndex:
+        index = self._indices.get(key)
+        if index is None:
+            index = CompactBlockShortIdIndex(key)
+            self._indices[key] = index
+            while len(self._indices) > self.max_size:
+                self._indices.popitem(last=False)
+        else:
+            self._indices.move_to_end(key)
+        return index
+
+    def clear(self) -> None:
+        self._indices.clear()
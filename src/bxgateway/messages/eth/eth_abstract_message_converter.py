@@ -13,7 +13,8 @@ from bxgateway.abstract_message_converter import AbstractMessageConverter, Block
 from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
 from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
 from bxgateway.utils.block_info import BlockInfo
-from bxgateway.utils.eth.eth_utils import parse_transaction_bytes
+from bxgateway.utils.eth.block_transaction_hashes_memo import block_transaction_hashes_memo
+from bxgateway.utils.eth.eth_utils import parse_transaction_bytes, build_transactions_message
 
 from bxutils import logging
 
@@ -45,6 +46,20 @@ def parse_block_message(block_msg: InternalEthBlockInfo):
     return txs_bytes, block_hdr_full_bytes, remaining_bytes, prev_block_bytes
 
 
+def split_transactions_bytes(txs_bytes: memoryview) -> List[memoryview]:
+    """
+    Splits RLP encoded block transactions list contents into encoded transactions
+    """
+    txs_bytes_list = []
+    tx_start_index = 0
+    while tx_start_index < len(txs_bytes):
+        _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(txs_bytes, tx_start_index)
+        tx_end_index = tx_item_start + tx_item_length
+        txs_bytes_list.append(txs_bytes[tx_start_index:tx_end_index])
+        tx_start_index = tx_end_index
+    return txs_bytes_list
+
+
 class EthAbstractMessageConverter(AbstractMessageConverter):
 
     def __init__(self):
@@ -125,6 +140,14 @@ class EthAbstractMessageConverter(AbstractMessageConverter):
 
         return parse_transaction_bytes(bx_tx_msg.tx_val())
 
+    def bx_txs_to_tx_msgs(self, bx_tx_msgs: List[TxMessage]) -> List[TransactionsEthProtocolMessage]:
+        """
+        Converts internal transaction messages to a single Ethereum transactions message
+        """
+        if not bx_tx_msgs:
+            return []
+        return [build_transactions_message([bx_tx_msg.tx_val() for bx_tx_msg in bx_tx_msgs])]
+
     def block_to_bx_block(
         self, block_msg: InternalEthBlockInfo, tx_service, enable_block_compression: bool, min_tx_age_seconds: float
     ) -> Tuple[memoryview, BlockInfo]:
@@ -153,6 +176,13 @@ class EthAbstractMessageConverter(AbstractMessageConverter):
         """
         raise NotImplementedError
 
+    def block_message_from_bytes(self, block_bytes: Union[bytearray, memoryview]) -> InternalEthBlockInfo:
+        return InternalEthBlockInfo(block_bytes)
+
+    def get_block_transaction_hashes(self, block_msg: InternalEthBlockInfo) -> List[Sha256Hash]:
+        txs_bytes, _, _, _ = parse_block_message(block_msg)
+        return block_transaction_hashes_memo.get_or_hash(block_msg.block_hash(), split_transactions_bytes(txs_bytes))
+
     def encode_raw_msg(self, raw_msg: str) -> bytes:
         msg_bytes = convert.hex_to_bytes(raw_msg)
 
@@ -1,23 +1,58 @@
 import datetime
 import time
 from collections import deque
-from typing import Tuple
+from typing import Tuple, Optional, List
 
 from bxcommon import constants
 from bxutils import logging
 from bxcommon.messages.bloxroute import compact_block_short_ids_serializer
 from bxcommon.services.transaction_service import TransactionService
-from bxgateway.abstract_message_converter import finalize_block_bytes
 from bxcommon.utils import convert, crypto
 from bxcommon.utils.object_hash import Sha256Hash
-from bxgateway.abstract_message_converter import BlockDecompressionResult
-from bxgateway.messages.eth.eth_abstract_message_converter import EthAbstractMessageConverter, parse_block_message
+from bxgateway.abstract_message_converter import BlockDecompressionResult, BlockDecompressionState, BxBlockWriter
+from bxgateway.messages.eth.eth_abstract_message_converter import EthAbstractMessageConverter, parse_block_message, \
+    split_transactions_bytes
 from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
+from bxgateway.services.gateway_transaction_service import get_short_ids_and_assign_times
 from bxgateway.utils.block_info import BlockInfo
+from bxgateway.utils.eth.block_transaction_hashes_memo import block_transaction_hashes_memo
 from bxcommon.utils.blockchain_utils.eth import rlp_utils, eth_common_utils
 
 logger = logging.get_logger(__name__)
 
+RLP_STR_PREFIX = 0x80
+RLP_LIST_PREFIX = 0xc0
+RLP_SHORT_LENGTH_LIMIT = 56
+
+# compressed transaction is a list of a full transaction flag and the full transaction or empty contents
+FULL_TX_FLAG = rlp_utils.encode_int(1)
+FULL_TX_FLAG_LEN = len(FULL_TX_FLAG)
+SHORT_TX_CONTENT = (
+    rlp_utils.get_length_prefix_list(len(rlp_utils.encode_int(0)) + len(rlp_utils.get_length_prefix_str(0)))
+    + rlp_utils.encode_int(0)
+    + rlp_utils.get_length_prefix_str(0)
+)
+SHORT_TX_CONTENT_SIZE = len(SHORT_TX_CONTENT) - 1
+
+
+def _get_length_prefix_size(length: int) -> int:
+    if length < RLP_SHORT_LENGTH_LIMIT:
+        return 1
+    return 1 + (length.bit_length() + 7) // 8
+
+
+def _write_length_prefix(writer: BxBlockWriter, length: int, prefix: int) -> None:
+    """
+    Writes RLP length prefix of a string or list of the length, same as `rlp_utils.get_length_prefix_str`
+    and `rlp_utils.get_length_prefix_list`
+    """
+    if length < RLP_SHORT_LENGTH_LIMIT:
+        writer.write_byte(prefix + length)
+    else:
+        length_bytes_len = (length.bit_length() + 7) // 8
+        writer.write_byte(prefix + RLP_SHORT_LENGTH_LIMIT - 1 + length_bytes_len)
+        writer.write(length.to_bytes(length_bytes_len, "big"))
+
 
 class EthNormalMessageConverter(EthAbstractMessageConverter):
 
@@ -46,79 +81,68 @@ class EthNormalMessageConverter(EthAbstractMessageConverter):
         txs_bytes, block_hdr_full_bytes, remaining_bytes, prev_block_bytes = parse_block_message(block_msg)
 
         used_short_ids = []
-
-        # creating transactions content
-        content_size = 0
-        buf = deque()
         ignored_sids = []
 
-        tx_start_index = 0
-        tx_count = 0
         original_size = len(block_msg.rawbytes())
         max_timestamp_for_compression = time.time() - min_tx_age_seconds
 
-        while True:
-            if tx_start_index >= len(txs_bytes):
-                break
-
-            _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(txs_bytes, tx_start_index)
-            tx_bytes = txs_bytes[tx_start_index:tx_item_start + tx_item_length]
-            tx_hash_bytes = eth_common_utils.keccak_hash(tx_bytes)
-            tx_hash = Sha256Hash(tx_hash_bytes)
-            tx_key = tx_service.get_transaction_key(tx_hash)
-            short_id = tx_service.get_short_id_by_key(tx_key)
-            short_id_assign_time = 0
+        txs_bytes_list = split_transactions_bytes(txs_bytes)
+        tx_count = len(txs_bytes_list)
 
-            if short_id != constants.NULL_TX_SID:
-                short_id_assign_time = tx_service.get_short_id_assign_time(short_id)
+        block_hash = block_msg.block_hash()
+        tx_hashes = block_transaction_hashes_memo.get_or_hash(block_hash, txs_bytes_list)
+        short_ids, short_id_assign_times = get_short_ids_and_assign_times(tx_service, tx_hashes)
 
+        # first pass: choose full or short form of each transaction and compute the block size
+        is_full_txs = []
+        txs_content_size = 0
+        for tx_bytes, short_id, short_id_assign_time in zip(txs_bytes_list, short_ids, short_id_assign_times):
             if short_id <= constants.NULL_TX_SID or \
                     not enable_block_compression or short_id_assign_time > max_timestamp_for_compression:
                 if short_id > constants.NULL_TX_SID:
                     ignored_sids.append(short_id)
-                is_full_tx_bytes = rlp_utils.encode_int(1)
-                tx_content_bytes = tx_bytes
+                is_full_txs.append(True)
+                tx_content_size = len(tx_bytes)
+                short_tx_content_size = FULL_TX_FLAG_LEN + _get_length_prefix_size(tx_content_size) + tx_content_size
             else:
-                is_full_tx_bytes = rlp_utils.encode_int(0)
                 used_short_ids.append(short_id)
-                tx_content_bytes = bytes()
-
-            tx_content_prefix = rlp_utils.get_length_prefix_str(len(tx_content_bytes))
-
-            short_tx_content_size = len(is_full_tx_bytes) + len(tx_content_prefix) + len(tx_content_bytes)
-
-            short_tx_content_prefix_bytes = rlp_utils.get_length_prefix_list(short_tx_content_size)
-
-            buf.append(short_tx_content_prefix_bytes)
-            buf.append(is_full_tx_bytes)
-            buf.append(tx_content_prefix)
-            buf.append(tx_content_bytes)
-
-            content_size += len(short_tx_content_prefix_bytes) + short_tx_content_size
-
-            tx_start_index = tx_item_start + tx_item_length
-
-            tx_count += 1
-
-        list_of_txs_prefix_bytes = rlp_utils.get_length_prefix_list(content_size)
-        buf.appendleft(list_of_txs_prefix_bytes)
-        content_size += len(list_of_txs_prefix_bytes)
-
-        buf.appendleft(block_hdr_full_bytes)
-        content_size += len(block_hdr_full_bytes)
-
-        buf.append(remaining_bytes)
-        content_size += len(remaining_bytes)
-
-        compact_block_msg_prefix = rlp_utils.get_length_prefix_list(content_size)
-        buf.appendleft(compact_block_msg_prefix)
-        content_size += len(compact_block_msg_prefix)
+                is_full_txs.append(False)
+                short_tx_content_size = SHORT_TX_CONTENT_SIZE
+            txs_content_size += _get_length_prefix_size(short_tx_content_size) + short_tx_content_size
+
+        block_content_size = (
+            len(block_hdr_full_bytes)
+            + _get_length_prefix_size(txs_content_size)
+            + txs_content_size
+            + len(remaining_bytes)
+        )
+        content_size = _get_length_prefix_size(block_content_size) + block_content_size
+
+        # second pass: write the block into a buffer of the final size
+        writer = BxBlockWriter(content_size, used_short_ids)
+        _write_length_prefix(writer, block_content_size, RLP_LIST_PREFIX)
+        writer.write(block_hdr_full_bytes)
+        _write_length_prefix(writer, txs_content_size, RLP_LIST_PREFIX)
+        for tx_bytes, is_full_tx in zip(txs_bytes_list, is_full_txs):
+            if is_full_tx:
+                tx_content_size = len(tx_bytes)
+                _write_length_prefix(
+                    writer,
+                    FULL_TX_FLAG_LEN + _get_length_prefix_size(tx_content_size) + tx_content_size,
+                    RLP_LIST_PREFIX
+                )
+                writer.write(FULL_TX_FLAG)
+                _write_length_prefix(writer, tx_content_size, RLP_STR_PREFIX)
+                writer.write(tx_bytes)
+            else:
+                writer.write(SHORT_TX_CONTENT)
+        writer.write(remaining_bytes)
 
-        block = finalize_block_bytes(buf, content_size, used_short_ids)
+        block = writer.finalize()
         bx_block_hash = convert.bytes_to_hex(crypto.double_sha256(block))
 
         block_info = BlockInfo(
-            block_msg.block_hash(),
+            block_hash,
             used_short_ids,
             compress_start_datetime,
             datetime.datetime.utcnow(),
@@ -132,7 +156,7 @@ class EthNormalMessageConverter(EthAbstractMessageConverter):
             ignored_sids
         )
 
-        return memoryview(block), block_info
+        return block, block_info
     
     def bx_block_to_block(self, bx_block_msg, tx_service) -> BlockDecompressionResult:
         """
@@ -144,6 +168,20 @@ class EthNormalMessageConverter(EthAbstractMessageConverter):
         :param tx_service: Transactions service
         :return: tuple (new block message, block hash, unknown transaction short id, unknown transaction hashes)
         """
+        decompression_result, _ = self.bx_block_to_block_resumable(bx_block_msg, tx_service)
+        return decompression_result
+
+    def bx_block_to_block_resumable(
+        self, bx_block_msg, tx_service
+    ) -> Tuple[BlockDecompressionResult, Optional[BlockDecompressionState]]:
+        """
+        Converts internal broadcast message to Ethereum new block message, keeping resolved transactions
+        in the decompression state if block recovery is needed
+
+        :param bx_block_msg: internal broadcast message bytes
+        :param tx_service: Transactions service
+        :return: tuple (block decompression result, decompression state)
+        """
 
         if not isinstance(bx_block_msg, (bytearray, memoryview)):
             raise TypeError("Type bytearray is expected for arg block_bytes but was {0}"
@@ -186,8 +224,8 @@ class EthNormalMessageConverter(EthAbstractMessageConverter):
 
         # creating transactions content
         content_size = 0
-        buf = deque()
-        tx_count = 0
+        tx_pieces = []
+        missing_tx_short_ids = {}
 
         tx_start_index = 0
 
@@ -215,25 +253,75 @@ class EthNormalMessageConverter(EthAbstractMessageConverter):
                 elif tx_bytes is None:
                     unknown_tx_hashes.append(tx_hash)
 
+                if tx_bytes is None:
+                    missing_tx_short_ids[len(tx_pieces)] = short_id
+
                 short_tx_index += 1
 
-            if tx_bytes is not None and not unknown_tx_sids and not unknown_tx_hashes:
-                buf.append(tx_bytes)
+            tx_pieces.append(tx_bytes)
+            if tx_bytes is not None:
                 content_size += len(tx_bytes)
 
-            tx_count += 1
-
             tx_start_index = tx_itm_start + tx_itm_len
 
-        if not unknown_tx_sids and not unknown_tx_hashes:
+        decompression_state = BlockDecompressionState(
+            block_msg_bytes,
+            block_hash,
+            short_ids,
+            full_hdr_bytes,
+            remaining_bytes,
+            tx_pieces,
+            missing_tx_short_ids,
+            content_size
+        )
+        return self._finalize_decompression(
+            decompression_state,
+            unknown_tx_sids,
+            unknown_tx_hashes,
+            decompress_start_datetime,
+            decompress_start_timestamp
+        )
+
+    def resume_bx_block_to_block(
+        self, decompression_state: BlockDecompressionState, tx_service
+    ) -> Tuple[BlockDecompressionResult, Optional[BlockDecompressionState]]:
+        decompress_start_datetime = datetime.datetime.utcnow()
+        decompress_start_timestamp = time.time()
+
+        unknown_tx_sids, unknown_tx_hashes = decompression_state.fill_missing_transactions(tx_service)
+        return self._finalize_decompression(
+            decompression_state,
+            unknown_tx_sids,
+            unknown_tx_hashes,
+            decompress_start_datetime,
+            decompress_start_timestamp
+        )
+
+    def _finalize_decompression(
+        self,
+        decompression_state: BlockDecompressionState,
+        unknown_tx_sids: List[int],
+        unknown_tx_hashes: List[Sha256Hash],
+        decompress_start_datetime: datetime.datetime,
+        decompress_start_timestamp: float
+    ) -> Tuple[BlockDecompressionResult, Optional[BlockDecompressionState]]:
+        block_hash = decompression_state.block_hash
+        short_ids = decompression_state.short_ids
+        tx_count = decompression_state.tx_count
+
+        if decompression_state.is_complete():
+            content_size = decompression_state.tx_content_size
+            buf = deque(decompression_state.tx_pieces)
 
             txs_prefix = rlp_utils.get_length_prefix_list(content_size)
             buf.appendleft(txs_prefix)
             content_size += len(txs_prefix)
 
+            full_hdr_bytes = decompression_state.block_header
             buf.appendleft(full_hdr_bytes)
             content_size += len(full_hdr_bytes)
 
+            remaining_bytes = decompression_state.block_trailer
             buf.append(remaining_bytes)
             content_size += len(remaining_bytes)
 
@@ -251,6 +339,7 @@ class EthNormalMessageConverter(EthAbstractMessageConverter):
             logger.debug("Successfully parsed block broadcast message. {} "
                          "transactions in block {}", tx_count, block_hash)
 
+            bx_block_msg = decompression_state.bx_block
             bx_block_hash = convert.bytes_to_hex(crypto.double_sha256(bx_block_msg))
             compressed_size = len(bx_block_msg)
 
@@ -269,7 +358,7 @@ class EthNormalMessageConverter(EthAbstractMessageConverter):
                 []
             )
 
-            return BlockDecompressionResult(block_msg, block_info, unknown_tx_sids, unknown_tx_hashes)
+            return BlockDecompressionResult(block_msg, block_info, unknown_tx_sids, unknown_tx_hashes), None
         else:
             logger.debug(
                 "Block recovery needed for {}. Missing {} sids, {} tx hashes. "
@@ -297,4 +386,4 @@ class EthNormalMessageConverter(EthAbstractMessageConverter):
                 ),
                 unknown_tx_sids,
                 unknown_tx_hashes
-            )
+            ), decompression_state
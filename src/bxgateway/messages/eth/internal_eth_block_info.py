@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 import blxr_rlp as rlp
 from bxcommon.messages.abstract_block_message import AbstractBlockMessage
@@ -335,6 +335,28 @@ class InternalEthBlockInfo(AbstractEthMessage, AbstractBlockMessage, ABC):
 
         return NewBlockEthProtocolMessage(result_msg_bytes)
 
+    def block_items_bytes(self) -> Tuple[memoryview, memoryview, memoryview]:
+        """
+        :return: RLP encoded block header, list of transactions and list of uncles, without decoding them
+        """
+        _, msg_itm_len, msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
+        msg_itm_bytes = self._memory_view[msg_itm_start:]
+
+        offset = 0
+
+        _, header_len, header_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
+        header_bytes = msg_itm_bytes[offset:header_start + header_len]
+        offset = header_start + header_len
+
+        _, txs_len, txs_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
+        txs_bytes = msg_itm_bytes[offset:txs_start + txs_len]
+        offset = txs_start + txs_len
+
+        _, uncles_len, uncles_start = rlp_utils.consume_length_prefix(msg_itm_bytes, offset)
+        uncles_bytes = msg_itm_bytes[offset:uncles_start + uncles_len]
+
+        return header_bytes, txs_bytes, uncles_bytes
+
     def to_new_block_parts(self) -> NewBlockParts:
         _, msg_itm_len, msg_itm_start = rlp_utils.consume_length_prefix(self._memory_view, 0)
         msg_itm_bytes = self._memory_view[msg_itm_start:]
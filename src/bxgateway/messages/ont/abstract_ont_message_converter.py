@@ -12,6 +12,7 @@ from bxcommon import constants as common_constants
 
 from bxgateway import ont_constants
 from bxgateway.abstract_message_converter import AbstractMessageConverter, BlockDecompressionResult
+from bxgateway.messages.ont import ont_messages_util
 from bxgateway.messages.ont.block_ont_message import BlockOntMessage
 from bxgateway.messages.ont.consensus_ont_message import OntConsensusMessage
 from bxgateway.messages.ont.ont_message import OntMessage
@@ -80,6 +81,12 @@ class AbstractOntMessageConverter(AbstractMessageConverter):
         """
         pass
 
+    def block_message_from_bytes(self, block_bytes: Union[bytearray, memoryview]) -> BlockOntMessage:
+        return BlockOntMessage(buf=block_bytes)
+
+    def get_block_transaction_hashes(self, block_msg) -> List[Sha256Hash]:
+        return [ont_messages_util.get_txid(tx)[0] for tx in block_msg.txns()]
+
     # pyre-fixme[14]: `bx_tx_to_tx` overrides method defined in
     #  `AbstractMessageConverter` inconsistently.
     def bx_tx_to_tx(self, tx_msg: TxMessage):
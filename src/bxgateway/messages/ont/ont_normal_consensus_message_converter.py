@@ -18,10 +18,11 @@ from bxcommon.utils.blockchain_utils.ont.ont_object_hash import OntObjectHash
 from bxcommon.utils.object_hash import Sha256Hash
 
 from bxgateway import ont_constants, log_messages
-from bxgateway.abstract_message_converter import BlockDecompressionResult, finalize_block_bytes
+from bxgateway.abstract_message_converter import BlockDecompressionResult, BxBlockWriter
 from bxgateway.messages.ont import ont_messages_util
 from bxgateway.messages.ont.abstract_ont_message_converter import AbstractOntMessageConverter, get_block_info
 from bxgateway.messages.ont.consensus_ont_message import OntConsensusMessage, ConsensusMsgPayload
+from bxgateway.services.gateway_transaction_service import get_short_ids_and_assign_times
 from bxgateway.utils.block_header_info import BlockHeaderInfo
 from bxgateway.utils.block_info import BlockInfo
 from bxgateway.utils.errors import message_conversion_error
@@ -129,6 +130,9 @@ def build_ont_block(block_pieces: Deque[Union[bytearray, memoryview]]) -> OntCon
 
 class OntNormalConsensusMessageConverter(AbstractOntMessageConverter):
 
+    def block_message_from_bytes(self, block_bytes: Union[bytearray, memoryview]) -> OntConsensusMessage:
+        return OntConsensusMessage(buf=block_bytes)
+
     def block_to_bx_block(
         self,
         block_msg: OntConsensusMessage,
@@ -142,88 +146,65 @@ class OntNormalConsensusMessageConverter(AbstractOntMessageConverter):
         consensus_msg = block_msg
         compress_start_datetime = datetime.utcnow()
         compress_start_timestamp = time.time()
-        size = 0
-        buf = deque()
         short_ids = []
         ignored_sids = []
         original_size = len(consensus_msg.rawbytes())
 
+        owner_and_signature = consensus_msg.owner_and_signature()
+        payload_tail = consensus_msg.payload_tail()
         consensus_payload_header = consensus_msg.consensus_payload_header()
-        consensus_payload_header_len = bytearray(ont_constants.ONT_INT_LEN)
-        struct.pack_into("<L", consensus_payload_header_len, 0, len(consensus_payload_header))
-        size += ont_constants.ONT_INT_LEN
-        buf.append(consensus_payload_header_len)
-        size += len(consensus_payload_header)
-        buf.append(consensus_payload_header)
-        consensus_data_type = bytearray(ont_constants.ONT_CHAR_LEN)
-        struct.pack_into("<B", consensus_data_type, 0, consensus_msg.consensus_data_type())
-        size += ont_constants.ONT_CHAR_LEN
-        buf.append(consensus_data_type)
-        consensus_data_len = bytearray(ont_constants.ONT_INT_LEN)
-        struct.pack_into("<L", consensus_data_len, 0, consensus_msg.consensus_data_len())
-        size += ont_constants.ONT_INT_LEN
-        buf.append(consensus_data_len)
         block_start_len = consensus_msg.block_start_len_memoryview()
         txn_header = consensus_msg.txn_header()
-        block_start_len_and_txn_header_total_len = bytearray(ont_constants.ONT_INT_LEN)
-        struct.pack_into("<L", block_start_len_and_txn_header_total_len, 0, len(block_start_len) + len(txn_header))
-        size += ont_constants.ONT_INT_LEN
-        buf.append(block_start_len_and_txn_header_total_len)
-        size += len(block_start_len)
-        buf.append(block_start_len)
-        size += len(txn_header)
-        buf.append(txn_header)
         max_timestamp_for_compression = time.time() - min_tx_age_seconds
 
-        for tx in consensus_msg.txns():
-            tx_hash, _ = ont_messages_util.get_txid(tx)
-            transaction_key = tx_service.get_transaction_key(tx_hash)
-            short_id = tx_service.get_short_id_by_key(transaction_key)
-            short_id_assign_time = 0
-
-            if short_id != constants.NULL_TX_SID:
-                short_id_assign_time = tx_service.get_short_id_assign_time(short_id)
+        txns = consensus_msg.txns()
+        short_ids_by_tx, short_id_assign_times = get_short_ids_and_assign_times(
+            tx_service, self.get_block_transaction_hashes(consensus_msg)
+        )
 
+        # is consensus message flag, block hash, tx count, consensus payload tail, owner and signature,
+        # consensus payload header, consensus data type and length, block start length and transactions header
+        size = 1 + ont_constants.ONT_HASH_LEN + ont_constants.ONT_INT_LEN + \
+            ont_constants.ONT_INT_LEN + len(payload_tail) + \
+            ont_constants.ONT_INT_LEN + len(owner_and_signature) + \
+            ont_constants.ONT_INT_LEN + len(consensus_payload_header) + \
+            ont_constants.ONT_CHAR_LEN + ont_constants.ONT_INT_LEN + \
+            ont_constants.ONT_INT_LEN + len(block_start_len) + len(txn_header)
+        is_full_txs = []
+        for tx, short_id, short_id_assign_time in zip(txns, short_ids_by_tx, short_id_assign_times):
             if short_id == constants.NULL_TX_SID or \
                     not enable_block_compression or \
                     short_id_assign_time > max_timestamp_for_compression:
-                if short_id != constants.NULL_TX_SIDS:
+                if short_id != constants.NULL_TX_SID:
                     ignored_sids.append(short_id)
-                buf.append(tx)
+                is_full_txs.append(True)
                 size += len(tx)
             else:
                 short_ids.append(short_id)
-                buf.append(ont_constants.ONT_SHORT_ID_INDICATOR_AS_BYTEARRAY)
-                size += 1
-
-        # Prepend owner and signature, consensus payload tail, tx count and block hash to bx_block
-        owner_and_signature = consensus_msg.owner_and_signature()
-        owner_and_signature_len = bytearray(ont_constants.ONT_INT_LEN)
-        struct.pack_into("<L", owner_and_signature_len, 0, len(owner_and_signature))
-        size += len(owner_and_signature)
-        buf.appendleft(owner_and_signature)
-        size += ont_constants.ONT_INT_LEN
-        buf.appendleft(owner_and_signature_len)
-        payload_tail = consensus_msg.payload_tail()
-        payload_tail_len = bytearray(ont_constants.ONT_INT_LEN)
-        struct.pack_into("<L", payload_tail_len, 0, len(payload_tail))
-        size += len(payload_tail)
-        buf.appendleft(payload_tail)
-        size += ont_constants.ONT_INT_LEN
-        buf.appendleft(payload_tail_len)
-        txn_count = bytearray(ont_constants.ONT_INT_LEN)
-        struct.pack_into("<L", txn_count, 0, consensus_msg.txn_count())
-        size += ont_constants.ONT_INT_LEN
-        buf.appendleft(txn_count)
-        block_hash = consensus_msg.block_hash().binary
-        size += ont_constants.ONT_HASH_LEN
-        buf.appendleft(block_hash)
-
-        is_consensus_msg_buf = struct.pack("?", True)
-        buf.appendleft(is_consensus_msg_buf)
-        size += 1
-
-        block = finalize_block_bytes(buf, size, short_ids)
+                is_full_txs.append(False)
+                size += ont_constants.ONT_SHORT_ID_INDICATOR_LENGTH
+
+        writer = BxBlockWriter(size, short_ids)
+        writer.write_struct("?", True)
+        writer.write(consensus_msg.block_hash().binary)
+        writer.write_struct("<L", consensus_msg.txn_count())
+        writer.write_struct("<L", len(payload_tail))
+        writer.write(payload_tail)
+        writer.write_struct("<L", len(owner_and_signature))
+        writer.write(owner_and_signature)
+        writer.write_struct("<L", len(consensus_payload_header))
+        writer.write(consensus_payload_header)
+        writer.write_struct("<B", consensus_msg.consensus_data_type())
+        writer.write_struct("<L", consensus_msg.consensus_data_len())
+        writer.write_struct("<L", len(block_start_len) + len(txn_header))
+        writer.write(block_start_len)
+        writer.write(txn_header)
+        for tx, is_full_tx in zip(txns, is_full_txs):
+            if is_full_tx:
+                writer.write(tx)
+            else:
+                writer.write(ont_constants.ONT_SHORT_ID_INDICATOR_AS_BYTEARRAY)
+        block = writer.finalize()
 
         prev_block_hash = convert.bytes_to_hex(consensus_msg.prev_block_hash().binary)
         bx_block_hash = convert.bytes_to_hex(crypto.double_sha256(block))
@@ -243,7 +224,7 @@ class OntNormalConsensusMessageConverter(AbstractOntMessageConverter):
             ignored_sids
         )
 
-        return memoryview(block), block_info
+        return block, block_info
 
     def bx_block_to_block(self, bx_block_msg: memoryview, tx_service: TransactionService) -> BlockDecompressionResult:
         """
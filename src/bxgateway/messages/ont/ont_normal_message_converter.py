@@ -1,4 +1,3 @@
-import struct
 import time
 from collections import deque
 from datetime import datetime
@@ -12,10 +11,11 @@ from bxcommon.utils import convert, crypto
 from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway import log_messages
 from bxgateway import ont_constants
-from bxgateway.abstract_message_converter import BlockDecompressionResult
+from bxgateway.abstract_message_converter import BlockDecompressionResult, BxBlockWriter
 from bxgateway.messages.ont import ont_messages_util
 from bxgateway.messages.ont.abstract_ont_message_converter import AbstractOntMessageConverter, get_block_info
 from bxgateway.messages.ont.block_ont_message import BlockOntMessage
+from bxgateway.services.gateway_transaction_service import get_short_ids_and_assign_times
 from bxgateway.utils.block_header_info import BlockHeaderInfo
 from bxgateway.utils.block_info import BlockInfo
 from bxgateway.utils.errors import message_conversion_error
@@ -104,60 +104,45 @@ class OntNormalMessageConverter(AbstractOntMessageConverter):
         """
         compress_start_datetime = datetime.utcnow()
         compress_start_timestamp = time.time()
-        size = 0
-        buf = deque()
         short_ids = []
         original_size = len(block_msg.rawbytes())
 
         header = block_msg.txn_header()
-        size += len(header)
-        buf.append(header)
         max_timestamp_for_compression = time.time() - min_tx_age_seconds
         ignored_sids = []
 
-        for tx in block_msg.txns():
-            tx_hash, _ = ont_messages_util.get_txid(tx)
-            transaction_key = tx_service.get_transaction_key(tx_hash)
-            short_id = tx_service.get_short_id_by_key(transaction_key)
-            short_id_assign_time = 0
-
-            if short_id != constants.NULL_TX_SID:
-                short_id_assign_time = tx_service.get_short_id_assign_time(short_id)
+        txns = block_msg.txns()
+        short_ids_by_tx, short_id_assign_times = get_short_ids_and_assign_times(
+            tx_service, self.get_block_transaction_hashes(block_msg)
+        )
 
+        # is consensus message flag and merkle root precede the transactions header
+        content_size = 1 + ont_constants.ONT_HASH_LEN + len(header)
+        is_full_txs = []
+        for tx, short_id, short_id_assign_time in zip(txns, short_ids_by_tx, short_id_assign_times):
             if short_id == constants.NULL_TX_SID or \
                     not enable_block_compression or \
                     short_id_assign_time > max_timestamp_for_compression:
-                if short_id != constants.NULL_TX_SIDS:
-                    ignored_sids.append(ignored_sids)
-                buf.append(tx)
-                size += len(tx)
+                if short_id != constants.NULL_TX_SID:
+                    ignored_sids.append(short_id)
+                is_full_txs.append(True)
+                content_size += len(tx)
             else:
                 short_ids.append(short_id)
-                buf.append(ont_constants.ONT_SHORT_ID_INDICATOR_AS_BYTEARRAY)
-                size += 1
-
-        serialized_short_ids = compact_block_short_ids_serializer.serialize_short_ids_into_bytes(short_ids)
-        buf.append(serialized_short_ids)
-        size += constants.UL_ULL_SIZE_IN_BYTES
-
-        merkle_root = block_msg.merkle_root()
-        buf.appendleft(merkle_root)
-        size += ont_constants.ONT_HASH_LEN
-
-        is_consensus_msg_buf = struct.pack("?", False)
-        buf.appendleft(is_consensus_msg_buf)
-        size += 1
-
-        offset_buf = struct.pack("<Q", size)
-        buf.appendleft(offset_buf)
-        size += len(serialized_short_ids)
-
-        block = bytearray(size)
-        off = 0
-        for blob in buf:
-            next_off = off + len(blob)
-            block[off:next_off] = blob
-            off = next_off
+                is_full_txs.append(False)
+                content_size += ont_constants.ONT_SHORT_ID_INDICATOR_LENGTH
+
+        writer = BxBlockWriter(content_size, short_ids)
+        writer.write_struct("?", False)
+        writer.write(block_msg.merkle_root())
+        writer.write(header)
+        for tx, is_full_tx in zip(txns, is_full_txs):
+            if is_full_tx:
+                writer.write(tx)
+            else:
+                writer.write(ont_constants.ONT_SHORT_ID_INDICATOR_AS_BYTEARRAY)
+        block = writer.finalize()
+        size = len(block)
 
         prev_block_hash = convert.bytes_to_hex(block_msg.prev_block_hash().binary)
         bx_block_hash = convert.bytes_to_hex(crypto.double_sha256(block))
@@ -177,7 +162,7 @@ class OntNormalMessageConverter(AbstractOntMessageConverter):
             ignored_sids
         )
 
-        return memoryview(block), block_info
+        return block, block_info
 
     def bx_block_to_block(self, bx_block_msg: memoryview, tx_service: TransactionService) -> BlockDecompressionResult:
         """
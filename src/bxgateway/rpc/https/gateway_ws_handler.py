@@ -1,17 +1,21 @@
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, cast, Union
 
 from bxcommon.feed.feed_manager import FeedManager
 from bxcommon.rpc.abstract_ws_rpc_handler import AbstractWsRpcHandler
 from bxcommon.rpc.requests.transaction_status_rpc_request import TransactionStatusRpcRequest
 from bxcommon.rpc.rpc_request_type import RpcRequestType
+from bxgateway.rpc import rpc_request_types
 from bxgateway.rpc.requests.add_blockchain_peer_rpc_request import AddBlockchainPeerRpcRequest
 from bxgateway.rpc.requests.bdn_performance_rpc_request import BdnPerformanceRpcRequest
+from bxgateway.rpc.requests.gateway_blxr_batch_transaction_rpc_request import \
+    GatewayBlxrBatchTransactionRpcRequest
 from bxgateway.rpc.requests.gateway_blxr_transaction_rpc_request import GatewayBlxrTransactionRpcRequest
 from bxgateway.rpc.requests.gateway_memory_usage_report_rpc_request import GatewayMemoryUsageRpcRequest
 from bxgateway.rpc.requests.gateway_status_rpc_request import GatewayStatusRpcRequest
 from bxgateway.rpc.requests.gateway_stop_rpc_request import GatewayStopRpcRequest
 from bxgateway.rpc.requests.gateway_memory_rpc_request import GatewayMemoryRpcRequest
 from bxgateway.rpc.requests.gateway_peers_rpc_request import GatewayPeersRpcRequest
+from bxgateway.rpc.requests.gateway_profile_rpc_request import GatewayProfileRpcRequest
 from bxgateway.rpc.requests.gateway_transaction_service_rpc_request import GatewayTransactionServiceRpcRequest
 from bxgateway.rpc.requests.quota_usage_rpc_request import QuotaUsageRpcRequest
 from bxgateway.rpc.requests.gateway_blxr_call_rpc_request import GatewayBlxrCallRpcRequest
@@ -52,3 +56,13 @@ class GatewayWsHandler(AbstractWsRpcHandler):
             RpcRequestType.SUBSCRIBE: SubscribeRpcRequest,
             RpcRequestType.UNSUBSCRIBE: UnsubscribeRpcRequest,
         }
+        self.gateway_request_handlers = {
+            rpc_request_types.BLXR_BATCH_TX: GatewayBlxrBatchTransactionRpcRequest,
+            rpc_request_types.PROFILE: GatewayProfileRpcRequest,
+        }
+
+    async def handle_request(self, request: Union[bytes, str]) -> Union[bytes, str]:
+        response = await rpc_request_types.handle_gateway_request(self, self.gateway_request_handlers, request)
+        if response is not None:
+            return response
+        return await super().handle_request(request)
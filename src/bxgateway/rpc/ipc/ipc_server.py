@@ -62,7 +62,9 @@ class IpcServer:
         connection = WsConnection(
             websocket,
             path,
-            SubscriptionRpcHandler(self.node, self.feed_manager, self.case)
+            SubscriptionRpcHandler(self.node, self.feed_manager, self.case),
+            self.node.opts.ws_max_in_flight_requests,
+            "ipc"
         )
         self._connections.append(connection)
         await connection.handle()
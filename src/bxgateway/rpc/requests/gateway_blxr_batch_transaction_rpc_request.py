@@ -0,0 +1,214 @@
+import asyncio
+from typing import TYPE_CHECKING, List, Dict, Any, Tuple, Set
+
+from bxcommon import constants
+from bxcommon.connections.connection_type import ConnectionType
+from bxcommon.exceptions import ParseError
+from bxcommon.messages.bloxroute.tx_message import TxMessage
+from bxcommon.models.transaction_flag import TransactionFlag
+from bxcommon.rpc import rpc_constants
+from bxcommon.rpc.json_rpc_response import JsonRpcResponse
+from bxcommon.rpc.requests.abstract_rpc_request import AbstractRpcRequest
+from bxcommon.rpc.rpc_errors import RpcInvalidParams, RpcAccountIdError, RpcBlocked
+from bxcommon.utils import convert
+from bxcommon.utils.object_hash import Sha256Hash
+from bxcommon.utils.stats.transaction_stat_event_type import TransactionStatEventType
+from bxcommon.utils.stats.transaction_statistics_service import tx_stats
+from bxgateway import gateway_constants
+
+from bxutils import logging, log_messages as common_log_messages
+
+if TYPE_CHECKING:
+    # noinspection PyUnresolvedReferences
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+
+logger = logging.get_logger(__name__)
+
+TRANSACTIONS_PARAMS_KEY = "transactions"
+UNSUPPORTED_TRACK_PARAMS_KEYS = (rpc_constants.STATUS_TRACK_PARAMS_KEY, rpc_constants.NONCE_MONITORING_PARAMS_KEY)
+
+
+class GatewayBlxrBatchTransactionRpcRequest(AbstractRpcRequest["AbstractGatewayNode"]):
+    SYNCHRONOUS = rpc_constants.SYNCHRONOUS_PARAMS_KEY
+    synchronous: bool = True
+    help = {
+        "params": f"{TRANSACTIONS_PARAMS_KEY}: list of raw signed transaction hex strings "
+                  f"(at most {gateway_constants.BLXR_BATCH_TX_MAX_SIZE}), "
+                  f"[Optional - {SYNCHRONOUS}: True (default) or False]",
+        "description": "send multiple transactions to the BDN and blockchain nodes in a single request. "
+                       "Result contains transaction hash or error for each transaction, in the request order"
+    }
+
+    def validate_params(self) -> None:
+        super().validate_params()
+        params = self.params
+        if params is None or not isinstance(params, dict):
+            raise RpcInvalidParams(
+                self.request_id,
+                "Params request field is either missing or not a dictionary type."
+            )
+        transactions = params.get(TRANSACTIONS_PARAMS_KEY)
+        if not transactions or not isinstance(transactions, list):
+            raise RpcInvalidParams(
+                self.request_id,
+                f"Missing param: {TRANSACTIONS_PARAMS_KEY} should be a non-empty list of transactions."
+            )
+        if len(transactions) > gateway_constants.BLXR_BATCH_TX_MAX_SIZE:
+            raise RpcInvalidParams(
+                self.request_id,
+                f"Too many transactions: {len(transactions)}. "
+                f"At most {gateway_constants.BLXR_BATCH_TX_MAX_SIZE} transactions can be sent in a single request."
+            )
+        if not all(isinstance(transaction, str) for transaction in transactions):
+            raise RpcInvalidParams(
+                self.request_id,
+                f"Invalid param: {TRANSACTIONS_PARAMS_KEY} should contain raw transaction hex strings."
+            )
+        for track_params_key in UNSUPPORTED_TRACK_PARAMS_KEYS:
+            if convert.str_to_bool(str(params.get(track_params_key, False)).lower(), default=False):
+                raise RpcInvalidParams(
+                    self.request_id,
+                    f"Invalid param: {track_params_key} is not supported for batches of transactions. "
+                    f"Transactions that should be tracked have to be sent with blxr_tx."
+                )
+
+        if self.SYNCHRONOUS in params:
+            synchronous = params[self.SYNCHRONOUS]
+            self.synchronous = convert.str_to_bool(str(synchronous).lower(), default=True)
+        else:
+            self.synchronous = GatewayBlxrBatchTransactionRpcRequest.synchronous
+
+    async def process_request(self) -> JsonRpcResponse:
+        params = self.params
+        assert isinstance(params, dict)
+
+        account_id = self.node.account_id
+        if not account_id:
+            raise RpcAccountIdError(
+                self.request_id,
+                "Gateway does not have an associated account. Please register the gateway with an account to submit "
+                "transactions through RPC."
+            )
+
+        transaction_strs: List[str] = params[TRANSACTIONS_PARAMS_KEY]
+        if self.synchronous:
+            return await self.post_process_transactions(account_id, transaction_strs)
+
+        asyncio.create_task(self.post_process_transactions(account_id, transaction_strs))
+        return JsonRpcResponse(
+            self.request_id,
+            {
+                TRANSACTIONS_PARAMS_KEY: "not available with async",
+            }
+        )
+
+    async def post_process_transactions(self, account_id: str, transaction_strs: List[str]) -> JsonRpcResponse:
+        results, new_transactions = self.parse_transactions(self.node.network_num, account_id, transaction_strs)
+        if new_transactions:
+            self.broadcast_transactions(self.node.network_num, new_transactions)
+
+        if not self.node.account_model.is_account_valid():
+            raise RpcAccountIdError(
+                self.request_id,
+                "The account associated with this gateway has expired. "
+                "Please visit https://portal.bloxroute.com to renew your subscription."
+            )
+        if self.node.quota_level == constants.FULL_QUOTA_PERCENTAGE:
+            raise RpcBlocked(
+                self.request_id,
+                "The account associated with this gateway has exceeded its daily transaction quota."
+            )
+        return self.ok({TRANSACTIONS_PARAMS_KEY: results})
+
+    def parse_transactions(
+        self, network_num: int, account_id: str, transaction_strs: List[str]
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[TxMessage, Any]]]:
+        """
+        Converts all transactions of the request, skipping invalid transactions and transactions
+        that were already seen.
+
+        :return: tuple (result of each transaction, list of (new transaction message, transaction key))
+        """
+        message_converter = self.node.message_converter
+        assert message_converter is not None, "Invalid server state!"
+        tx_service = self.node.get_tx_service()
+
+        results = []
+        new_transactions = []
+        new_tx_hashes: Set[Sha256Hash] = set()
+        for transaction_str in transaction_strs:
+            try:
+                transaction = message_converter.encode_raw_msg(transaction_str)
+                bx_tx = message_converter.bdn_tx_to_bx_tx(
+                    transaction, network_num, TransactionFlag.PAID_TX, account_id
+                )
+            except (ValueError, ParseError) as e:
+                logger.error(common_log_messages.RPC_COULD_NOT_PARSE_TRANSACTION, e)
+                results.append({"error": f"Invalid transaction param: {transaction_str}"})
+                continue
+
+            tx_hash = bx_tx.tx_hash()
+            results.append({"tx_hash": str(tx_hash)})
+            if tx_hash in new_tx_hashes:
+                continue
+
+            transaction_key = tx_service.get_transaction_key(tx_hash)
+            if (
+                tx_service.has_transaction_contents_by_key(transaction_key) or
+                tx_service.removed_transaction_by_key(transaction_key)
+            ):
+                tx_stats.add_tx_by_hash_event(
+                    tx_hash,
+                    TransactionStatEventType.TX_RECEIVED_FROM_RPC_REQUEST_IGNORE_SEEN,
+                    network_num,
+                    account_id=account_id, short_id=tx_service.get_short_id_by_key(transaction_key)
+                )
+                continue
+
+            tx_stats.add_tx_by_hash_event(
+                tx_hash,
+                TransactionStatEventType.TX_RECEIVED_FROM_RPC_REQUEST,
+                network_num,
+                account_id=account_id
+            )
+            new_tx_hashes.add(tx_hash)
+            new_transactions.append((bx_tx, transaction_key))
+        return results, new_transactions
+
+    def broadcast_transactions(self, network_num: int, new_transactions: List[Tuple[TxMessage, Any]]) -> None:
+        """
+        Sends new transactions to blockchain nodes in as few messages as the blockchain protocol allows,
+        and to relays.
+        """
+        message_converter = self.node.message_converter
+        assert message_converter is not None, "Invalid server state!"
+        tx_service = self.node.get_tx_service()
+
+        if self.node.has_active_blockchain_peer():
+            for blockchain_tx_message in message_converter.bx_txs_to_tx_msgs(
+                [bx_tx for bx_tx, _ in new_transactions]
+            ):
+                self.node.broadcast(
+                    blockchain_tx_message,
+                    connection_types=(ConnectionType.BLOCKCHAIN_NODE,)
+                )
+
+        for bx_tx, transaction_key in new_transactions:
+            tx_hash = bx_tx.tx_hash()
+            broadcast_peers = self.node.broadcast(
+                bx_tx,
+                connection_types=(ConnectionType.RELAY_TRANSACTION,)
+            )
+            tx_stats.add_tx_by_hash_event(
+                tx_hash,
+                TransactionStatEventType.TX_SENT_FROM_GATEWAY_TO_PEERS,
+                network_num,
+                peers=broadcast_peers
+            )
+            tx_stats.add_tx_by_hash_event(
+                tx_hash,
+                TransactionStatEventType.TX_GATEWAY_RPC_RESPONSE_SENT,
+                network_num
+            )
+            tx_service.set_transaction_contents_by_key(transaction_key, bx_tx.tx_val())
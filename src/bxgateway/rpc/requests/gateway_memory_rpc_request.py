@@ -13,6 +13,7 @@ if TYPE_CHECKING:
 TOTAL_MEM_USAGE = "total_mem_usage"
 TOTAL_CACHED_TX = "total_cached_transactions"
 TOTAL_CACHED_TX_SIZE = "total_cached_transactions_size"
+MEMORY_GOVERNOR = "memory_governor"
 
 
 class GatewayMemoryRpcRequest(AbstractRpcRequest["AbstractGatewayNode"]):
@@ -31,6 +32,7 @@ class GatewayMemoryRpcRequest(AbstractRpcRequest["AbstractGatewayNode"]):
         return self.ok({
             TOTAL_MEM_USAGE: stats_format.byte_count(memory_utils.get_app_memory_usage()),
             TOTAL_CACHED_TX: cache_state["tx_hash_to_contents_len"],
-            TOTAL_CACHED_TX_SIZE: stats_format.byte_count(cache_state["total_tx_contents_size"])
+            TOTAL_CACHED_TX_SIZE: stats_format.byte_count(cache_state["total_tx_contents_size"]),
+            MEMORY_GOVERNOR: self.node.memory_governor.get_info()
         })
 
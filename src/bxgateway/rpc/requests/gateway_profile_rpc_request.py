@@ -0,0 +1,50 @@
+from typing import TYPE_CHECKING
+
+from bxcommon.rpc.json_rpc_response import JsonRpcResponse
+from bxcommon.rpc.requests.abstract_rpc_request import AbstractRpcRequest
+from bxcommon.rpc.rpc_errors import RpcInvalidParams
+from bxgateway import gateway_constants
+from bxgateway.utils.event_loop_profiler import event_loop_profiler
+
+if TYPE_CHECKING:
+    # noinspection PyUnresolvedReferences
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+
+TOP_PARAMS_KEY = "top"
+RESET_PARAMS_KEY = "reset"
+
+
+class GatewayProfileRpcRequest(AbstractRpcRequest["AbstractGatewayNode"]):
+    help = {
+        "params": f"Optional - {TOP_PARAMS_KEY}: number of message handlers and alarms to return "
+                  f"(default {gateway_constants.PROFILE_RPC_DEFAULT_TOP}), "
+                  f"{RESET_PARAMS_KEY}: true to start a new profiling interval after the response",
+        "description": "return event loop lag, and message handlers and alarm callbacks that spent the most time "
+                       "on the event loop since gateway start or the last reset"
+    }
+
+    def validate_params(self) -> None:
+        params = self.params
+        if params is None:
+            self.params = {}
+            return
+        if not isinstance(params, dict):
+            raise RpcInvalidParams(self.request_id, "Params request field is not a dictionary type.")
+
+        top = params.get(TOP_PARAMS_KEY, gateway_constants.PROFILE_RPC_DEFAULT_TOP)
+        if not isinstance(top, int) or isinstance(top, bool) or top <= 0:
+            raise RpcInvalidParams(
+                self.request_id, f"Invalid param: {TOP_PARAMS_KEY} should be a positive integer."
+            )
+        if not isinstance(params.get(RESET_PARAMS_KEY, False), bool):
+            raise RpcInvalidParams(self.request_id, f"Invalid param: {RESET_PARAMS_KEY} should be a boolean.")
+
+    async def process_request(self) -> JsonRpcResponse:
+        params = self.params
+        assert isinstance(params, dict)
+
+        report = event_loop_profiler.get_report(params.get(TOP_PARAMS_KEY, gateway_constants.PROFILE_RPC_DEFAULT_TOP))
+        if params.get(RESET_PARAMS_KEY, False):
+            event_loop_profiler.reset()
+        return self.ok(report)
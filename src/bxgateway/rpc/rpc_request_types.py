@@ -0,0 +1,65 @@
+import json
+from typing import Dict, Type, Any, Optional, Union
+
+from bxcommon.rpc.abstract_rpc_handler import AbstractRpcHandler
+from bxcommon.rpc.bx_json_rpc_request import BxJsonRpcRequest
+from bxcommon.rpc.json_rpc_response import JsonRpcResponse
+from bxcommon.rpc.requests.abstract_rpc_request import AbstractRpcRequest
+from bxcommon.rpc.rpc_errors import RpcError
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+# RPC methods implemented only by the gateway, without an RpcRequestType member in bxcommon
+BLXR_BATCH_TX = "blxr_batch_tx"
+PROFILE = "profile"
+
+
+async def handle_gateway_request(
+    rpc_handler: AbstractRpcHandler,
+    gateway_request_handlers: Dict[str, Type[AbstractRpcRequest]],
+    request: Any
+) -> Optional[Any]:
+    """
+    Handles requests of RPC methods implemented only by the gateway. bxcommon parses request methods into
+    RpcRequestType members, so these methods are dispatched by their method name before the request
+    reaches bxcommon parsing.
+
+    :param rpc_handler: RPC handler that received the request
+    :param gateway_request_handlers: request handler of each gateway method, by method name
+    :param request: request as received by the RPC handler
+    :return: serialized response, None if the request is not a request of a gateway method
+    """
+    if isinstance(request, (str, bytes)) and not _may_contain_method(request, gateway_request_handlers):
+        return None
+
+    parsed_request = await rpc_handler.parse_request(request)
+    if not isinstance(parsed_request, dict):
+        return None
+    method = parsed_request.get("method")
+    request_handler_type = gateway_request_handlers.get(method) if isinstance(method, str) else None
+    if request_handler_type is None:
+        return None
+
+    # the method name stands in for an RpcRequestType member, gateway request handlers don't read it
+    rpc_request = BxJsonRpcRequest(parsed_request.get("id"), method, parsed_request.get("params"))
+    try:
+        response = await request_handler_type(rpc_request, rpc_handler.node).process_request()
+    except RpcError as e:
+        logger.debug("Failed to handle {} request: {}", method, e)
+        response = JsonRpcResponse(e.id, error=e)
+    return rpc_handler.serialize_response(response)
+
+
+def _may_contain_method(
+    request: Union[str, bytes], gateway_request_handlers: Dict[str, Type[AbstractRpcRequest]]
+) -> bool:
+    # avoids parsing requests of other methods twice
+    for method in gateway_request_handlers:
+        quoted_method = json.dumps(method)
+        if isinstance(request, bytes):
+            if quoted_method.encode() in request:
+                return True
+        elif quoted_method in request:
+            return True
+    return False
@@ -0,0 +1,169 @@
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from bxcommon.feed.feed import FeedKey
+from bxcommon.rpc.bx_json_rpc_request import BxJsonRpcRequest
+from bxcommon.rpc.rpc_request_type import RpcRequestType
+from bxgateway import gateway_constants
+from bxutils.encoding.json_encoder import Case
+
+SUBSCRIPTION_ID_PLACEHOLDER = "bxsubscriptionidplaceholder"
+RESULT_PLACEHOLDER = "bxresultplaceholder"
+
+NotificationKey = Tuple[FeedKey, Tuple[str, ...], Case]
+
+
+class NotificationEnvelope:
+    """
+    Serialized JSON-RPC envelope of subscription notifications, split around the subscription id and the result.
+
+    The envelope is built by serializing a notification with placeholder values, so spliced notifications
+    are byte for byte identical to notifications serialized as a whole.
+    """
+
+    subscription_id_first: bool
+    head: bytes
+    middle: bytes
+    tail: bytes
+
+    def __init__(self, case: Case) -> None:
+        serialized = BxJsonRpcRequest(
+            None,
+            RpcRequestType.SUBSCRIBE,
+            {"subscription": SUBSCRIPTION_ID_PLACEHOLDER, "result": RESULT_PLACEHOLDER}
+        ).to_jsons(case).encode()
+        subscription_id = json.dumps(SUBSCRIPTION_ID_PLACEHOLDER).encode()
+        result = json.dumps(RESULT_PLACEHOLDER).encode()
+        subscription_id_start = serialized.index(subscription_id)
+        result_start = serialized.index(result)
+
+        self.subscription_id_first = subscription_id_start < result_start
+        if self.subscription_id_first:
+            first_start, first_end = subscription_id_start, subscription_id_start + len(subscription_id)
+            second_start, second_end = result_start, result_start + len(result)
+        else:
+            first_start, first_end = result_start, result_start + len(result)
+            second_start, second_end = subscription_id_start, subscription_id_start + len(subscription_id)
+        self.head = serialized[:first_start]
+        self.middle = serialized[first_end:second_start]
+        self.tail = serialized[second_end:]
+
+    def build(self, subscription_id: bytes, result: bytes) -> bytes:
+        if self.subscription_id_first:
+            return b"".join((self.head, subscription_id, self.middle, result, self.tail))
+        return b"".join((self.head, result, self.middle, subscription_id, self.tail))
+
+    def extract_result(self, serialized: bytes, subscription_id: bytes) -> Optional[bytes]:
+        """
+        :return: serialized result of a serialized notification, None if the notification does not fit the envelope
+        """
+        if not serialized.startswith(self.head) or not serialized.endswith(self.tail):
+            return None
+        tail_start = len(serialized) - len(self.tail)
+        if self.subscription_id_first:
+            result_start = len(self.head) + len(subscription_id) + len(self.middle)
+            if serialized[len(self.head):result_start] != subscription_id + self.middle:
+                return None
+            return serialized[result_start:tail_start]
+
+        result_end = tail_start - len(self.middle) - len(subscription_id)
+        if serialized[result_end:tail_start] != self.middle + subscription_id:
+            return None
+        return serialized[len(self.head):result_end]
+
+
+class SerializedNotificationCache:
+    """
+    Keeps serialized results of the most recent notifications of each feed, so a notification published
+    to many subscribers with the same include fields is serialized only once. Per subscriber, only the
+    subscription id is spliced into the shared serialized result and envelope.
+
+    Results are matched by identity, and results filtered for each subscriber separately by type-strict equality.
+    Cache entries hold a reference to the result, so the identity of a cached result cannot be reused
+    by another object.
+    """
+
+    _envelopes: Dict[Case, NotificationEnvelope]
+    _serialized_results: Dict[NotificationKey, "OrderedDict[int, Tuple[Any, bytes]]"]
+
+    def __init__(self, max_size: int = gateway_constants.FEED_SERIALIZED_NOTIFICATION_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._envelopes = {}
+        self._serialized_results = {}
+
+    def serialize(
+        self, message: BxJsonRpcRequest, feed_key: FeedKey, include: Tuple[str, ...], case: Case
+    ) -> bytes:
+        """
+        Serializes a subscription notification, reusing the serialized result of an identical notification
+        of the same feed, include fields and case.
+        """
+        subscription_id = json.dumps(message.params["subscription"]).encode()
+        result = message.params["result"]
+        envelope = self._envelopes.get(case)
+        if envelope is None:
+            envelope = NotificationEnvelope(case)
+            self._envelopes[case] = envelope
+
+        key = (feed_key, include, case)
+        serialized_results = self._serialized_results.get(key)
+        if serialized_results is None:
+            serialized_results = OrderedDict()
+            self._serialized_results[key] = serialized_results
+
+        serialized_result = self._get_serialized_result(serialized_results, result)
+        if serialized_result is not None:
+            return envelope.build(subscription_id, serialized_result)
+
+        serialized = message.to_jsons(case).encode()
+        serialized_result = envelope.extract_result(serialized, subscription_id)
+        if serialized_result is not None:
+            serialized_results[id(result)] = (result, serialized_result)
+            while len(serialized_results) > self.max_size:
+                serialized_results.popitem(last=False)
+        return serialized
+
+    def clear(self) -> None:
+        self._serialized_results.clear()
+
+    def _get_serialized_result(
+        self, serialized_results: "OrderedDict[int, Tuple[Any, bytes]]", result: Any
+    ) -> Optional[bytes]:
+        entry = serialized_results.get(id(result))
+        if entry is not None and entry[0] is result:
+            return entry[1]
+
+        # results filtered by include fields are new dictionaries for each subscriber
+        if isinstance(result, dict):
+            for cached_result, serialized_result in reversed(serialized_results.values()):
+                if isinstance(cached_result, dict) and _is_identical(cached_result, result):
+                    return serialized_result
+        return None
+
+
+def _is_identical(first: Any, second: Any) -> bool:
+    """
+    Equality of values that serialize the same way: unlike `==`, values of different types (e.g. 1, 1.0 and True)
+    and dictionaries with different key order are not identical.
+    """
+    if first is second:
+        return True
+    if type(first) is not type(second):
+        return False
+    if isinstance(first, dict):
+        return (
+            len(first) == len(second)
+            and all(
+                first_key == second_key and _is_identical(first_value, second_value)
+                for (first_key, first_value), (second_key, second_value) in zip(first.items(), second.items())
+            )
+        )
+    if isinstance(first, (list, tuple)):
+        return len(first) == len(second) and all(
+            _is_identical(first_item, second_item) for first_item, second_item in zip(first, second)
+        )
+    return first == second
+
+
+serialized_notification_cache = SerializedNotificationCache()
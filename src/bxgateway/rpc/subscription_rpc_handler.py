@@ -1,6 +1,6 @@
 import asyncio
 import json
-from typing import TYPE_CHECKING, Dict, Any, Optional, Union, cast, Type
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union, cast, Type, Tuple
 
 from bxcommon.feed.feed import FeedKey
 from bxcommon.rpc.abstract_rpc_handler import AbstractRpcHandler
@@ -14,13 +14,17 @@ from bxcommon.feed.subscriber import Subscriber
 from bxcommon.rpc.abstract_ws_rpc_handler import Subscription
 
 from bxgateway import gateway_constants, log_messages
+from bxgateway.rpc import rpc_request_types
 from bxgateway.rpc.requests.add_blockchain_peer_rpc_request import AddBlockchainPeerRpcRequest
 from bxgateway.rpc.requests.bdn_performance_rpc_request import BdnPerformanceRpcRequest
+from bxgateway.rpc.requests.gateway_blxr_batch_transaction_rpc_request import \
+    GatewayBlxrBatchTransactionRpcRequest
 from bxgateway.rpc.requests.gateway_blxr_transaction_rpc_request import \
     GatewayBlxrTransactionRpcRequest
 from bxgateway.rpc.requests.gateway_memory_rpc_request import GatewayMemoryRpcRequest
 from bxgateway.rpc.requests.gateway_memory_usage_report_rpc_request import GatewayMemoryUsageRpcRequest
 from bxgateway.rpc.requests.gateway_peers_rpc_request import GatewayPeersRpcRequest
+from bxgateway.rpc.requests.gateway_profile_rpc_request import GatewayProfileRpcRequest
 from bxgateway.rpc.requests.gateway_status_rpc_request import GatewayStatusRpcRequest
 from bxgateway.rpc.requests.gateway_stop_rpc_request import GatewayStopRpcRequest
 from bxgateway.rpc.requests.gateway_subscribe_rpc_request import GatewaySubscribeRpcRequest
@@ -30,6 +34,7 @@ from bxgateway.rpc.requests.remove_blockchain_peer_rpc_request import RemoveBloc
 from bxcommon.rpc.requests.subscribe_rpc_request import SubscribeRpcRequest
 from bxcommon.rpc.requests.unsubscribe_rpc_request import UnsubscribeRpcRequest
 from bxgateway.rpc.requests.gateway_blxr_call_rpc_request import GatewayBlxrCallRpcRequest
+from bxgateway.rpc.serialized_notification_cache import serialized_notification_cache
 from bxutils import logging
 from bxutils.encoding.json_encoder import Case
 
@@ -46,6 +51,7 @@ class SubscriptionRpcHandler(AbstractRpcHandler["AbstractGatewayNode", Union[byt
     feed_manager: FeedManager
     subscriptions: Dict[str, Subscription]
     subscribed_messages: 'asyncio.Queue[BxJsonRpcRequest]'
+    gateway_request_handlers: Dict[str, Type[AbstractRpcRequest]]
 
     def __init__(self, node: "AbstractGatewayNode", feed_manager: FeedManager, case: Case) -> None:
         super().__init__(node, case)
@@ -66,6 +72,10 @@ class SubscriptionRpcHandler(AbstractRpcHandler["AbstractGatewayNode", Union[byt
             RpcRequestType.ADD_BLOCKCHAIN_PEER: AddBlockchainPeerRpcRequest,
             RpcRequestType.REMOVE_BLOCKCHAIN_PEER: RemoveBlockchainPeerRpcRequest,
         }
+        self.gateway_request_handlers = {
+            rpc_request_types.BLXR_BATCH_TX: GatewayBlxrBatchTransactionRpcRequest,
+            rpc_request_types.PROFILE: GatewayProfileRpcRequest,
+        }
 
         self.feed_manager = feed_manager
         self.subscriptions = {}
@@ -74,6 +84,12 @@ class SubscriptionRpcHandler(AbstractRpcHandler["AbstractGatewayNode", Union[byt
         )
         self.disconnect_event = asyncio.Event()
 
+    async def handle_request(self, request: Union[bytes, str]) -> Union[bytes, str]:
+        response = await rpc_request_types.handle_gateway_request(self, self.gateway_request_handlers, request)
+        if response is not None:
+            return response
+        return await super().handle_request(request)
+
     async def parse_request(self, request: Union[bytes, str]) -> Dict[str, Any]:
         return json.loads(request)
 
@@ -90,7 +106,13 @@ class SubscriptionRpcHandler(AbstractRpcHandler["AbstractGatewayNode", Union[byt
         return response.to_jsons(self.case)
 
     def serialize_cached_subscription_message(self, message: BxJsonRpcRequest) -> bytes:
-        return self.node.serialized_message_cache.serialize_from_cache(message, self.case)
+        subscription = self.subscriptions.get(message.params["subscription"])
+        if subscription is None:
+            return self.node.serialized_message_cache.serialize_from_cache(message, self.case)
+        subscriber, feed_key, _task = subscription
+        return serialized_notification_cache.serialize(
+            message, feed_key, self._get_include_fields(subscriber), self.case
+        )
 
     async def get_next_subscribed_message(self) -> BxJsonRpcRequest:
         return await self.subscribed_messages.get()
@@ -148,6 +170,12 @@ class SubscriptionRpcHandler(AbstractRpcHandler["AbstractGatewayNode", Union[byt
             return feed_key
         return None
 
+    def _get_include_fields(self, subscriber: Subscriber) -> Tuple[str, ...]:
+        include = subscriber.options.get("include")
+        if not include:
+            return ()
+        return tuple(include)
+
     def _subscribe_request_factory(
         self, request: BxJsonRpcRequest
     ) -> AbstractRpcRequest:
@@ -1,24 +1,59 @@
 import asyncio
+import time
 from asyncio import Future
-from typing import Optional
+from typing import Optional, Set
 
+from prometheus_client import Counter, Gauge
 from websockets import WebSocketServerProtocol
 
+from bxgateway import gateway_constants
 from bxgateway.rpc.subscription_rpc_handler import SubscriptionRpcHandler
 from bxcommon.rpc.rpc_errors import RpcError
 from bxcommon.rpc.json_rpc_response import JsonRpcResponse
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+in_flight_requests = Gauge(
+    "ws_in_flight_requests", "Number of websocket requests being handled concurrently", ["server"]
+)
+throttled_requests = Counter(
+    "ws_throttled_requests",
+    "Number of websocket requests that waited for the in-flight request limit before being handled",
+    ["server"]
+)
+throttled_requests_wait_time = Counter(
+    "ws_throttled_requests_wait_time_s",
+    "Total time websocket requests waited for the in-flight request limit",
+    ["server"]
+)
 
 
 class WsConnection:
+    """
+    Websocket connection of a RPC client.
+
+    With `max_in_flight_requests` above 1 requests are pipelined: each request is handled in its own task
+    and its response is sent as soon as it is ready, so responses can arrive out of order and clients
+    match them to requests by JSON-RPC id. Reading of new requests is paused while the limit is reached.
+    """
+
     def __init__(
         self,
         websocket: WebSocketServerProtocol,
         path: str,
         rpc_handler: SubscriptionRpcHandler,
+        max_in_flight_requests: int = gateway_constants.WS_MAX_IN_FLIGHT_REQUESTS,
+        server_name: str = "ws",
     ) -> None:
         self.ws = websocket
         self.path = path  # currently unused
         self.rpc_handler = rpc_handler
+        self.max_in_flight_requests = max_in_flight_requests
+        self.server_name = server_name
+
+        self._in_flight_requests: Set[Future] = set()
+        self._in_flight_requests_semaphore: Optional[asyncio.Semaphore] = None
 
         self.request_handler: Optional[Future] = None
         self.publish_handler: Optional[Future] = None
@@ -42,12 +77,51 @@ class WsConnection:
         await self.close()
 
     async def handle_request(self, websocket: WebSocketServerProtocol, _path: str) -> None:
+        if self.max_in_flight_requests > 1:
+            await self.handle_pipelined_requests(websocket)
+            return
+
         async for message in websocket:
-            try:
-                response = await self.rpc_handler.handle_request(message)
-            except RpcError as err:
-                response = JsonRpcResponse(err.id, error=err).to_jsons()
-            await websocket.send(response)
+            await self._respond(websocket, message)
+
+    async def handle_pipelined_requests(self, websocket: WebSocketServerProtocol) -> None:
+        semaphore = asyncio.Semaphore(self.max_in_flight_requests)
+        self._in_flight_requests_semaphore = semaphore
+        in_flight_requests_gauge = in_flight_requests.labels(self.server_name)
+
+        async for message in websocket:
+            if semaphore.locked():
+                wait_start_time = time.time()
+                await semaphore.acquire()
+                throttled_requests.labels(self.server_name).inc()
+                throttled_requests_wait_time.labels(self.server_name).inc(time.time() - wait_start_time)
+            else:
+                await semaphore.acquire()
+
+            in_flight_requests_gauge.inc()
+            request = asyncio.ensure_future(self._respond(websocket, message))
+            self._in_flight_requests.add(request)
+            request.add_done_callback(self._on_pipelined_request_done)
+
+    async def _respond(self, websocket: WebSocketServerProtocol, message) -> None:
+        try:
+            response = await self.rpc_handler.handle_request(message)
+        except RpcError as err:
+            response = JsonRpcResponse(err.id, error=err).to_jsons()
+        await websocket.send(response)
+
+    def _on_pipelined_request_done(self, request: Future) -> None:
+        self._in_flight_requests.discard(request)
+        in_flight_requests.labels(self.server_name).dec()
+
+        if not request.cancelled():
+            exception = request.exception()
+            if exception is not None:
+                logger.debug("Failed to handle websocket request: {}", exception)
+
+        semaphore = self._in_flight_requests_semaphore
+        if semaphore is not None:
+            semaphore.release()
 
     async def handle_publications(self, websocket: WebSocketServerProtocol, _path: str) -> None:
         while True:
@@ -71,10 +145,14 @@ class WsConnection:
         if alive_handler is not None:
             alive_handler.cancel()
 
+        for request in list(self._in_flight_requests):
+            request.cancel()
+
         # cleanup to avoid circular reference and allow immediate GC.
         self.request_handler = None
         self.publish_handler = None
         self.alive_handler = None
+        self._in_flight_requests_semaphore = None
 
         await self.ws.close()
 
@@ -60,7 +60,9 @@ class WsServer:
         connection = WsConnection(
             websocket,
             path,
-            SubscriptionRpcHandler(self.node, self.feed_manager, self.case)
+            SubscriptionRpcHandler(self.node, self.feed_manager, self.case),
+            self.node.opts.ws_max_in_flight_requests,
+            "ws"
         )
         self._connections.append(connection)
         await connection.handle()
@@ -14,6 +14,7 @@ from typing import (
 
 from bxcommon.messages.abstract_block_message import AbstractBlockMessage
 from bxcommon.messages.abstract_message import AbstractMessage
+from bxcommon.utils import crypto
 from bxcommon.utils.expiring_set import ExpiringSet
 from bxcommon.utils.object_hash import Sha256Hash
 from bxcommon.utils.stats import stats_format
@@ -261,12 +262,33 @@ class AbstractBlockQueuingService(
             self._blocks.remove(block_hash)
         return index
 
+    def on_block_removed_from_storage(self, block_hash: Sha256Hash) -> None:
+        """
+        Called once the block is removed from the block storage shared by all queuing services,
+        to clean up state shared with other queuing services
+        """
+        pass
+
     def iterate_recent_block_hashes(
         self,
         max_count: int = gateway_constants.TRACKED_BLOCK_MAX_HASH_LOOKUP
     ) -> Iterator[Sha256Hash]:
         raise NotImplementedError
 
+    def is_block_seen_by_blockchain_node(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._blocks_seen_by_blockchain_node
+
+    def get_estimated_memory_size(self) -> int:
+        """
+        Estimated size of block hashes tracked by the service. Blocks themselves are kept in common block storage.
+        """
+        return crypto.SHA256_HASH_LEN * (
+            len(self._blocks)
+            + len(self._block_queue)
+            + len(self._blocks_waiting_for_recovery)
+            + len(self._blocks_seen_by_blockchain_node)
+        )
+
     def log_memory_stats(self):
         pass
 
@@ -0,0 +1,299 @@
+import asyncio
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union, Iterable, Callable, TypeVar
+
+from bxcommon import constants
+from bxcommon.messages.bloxroute import compact_block_short_ids_serializer
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway.abstract_message_converter import AbstractMessageConverter, BlockDecompressionResult
+from bxgateway.services.gateway_transaction_service import get_short_ids_and_assign_times
+from bxgateway.utils.block_info import BlockInfo
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+T = TypeVar("T")
+
+# worker processes are forked from a clean server process, not from the gateway process running the event loop
+WORKER_START_METHOD = "forkserver"
+
+
+class SnapshotTransactionInfo(NamedTuple):
+    hash: Optional[Sha256Hash]
+    contents: Optional[Union[bytearray, memoryview]]
+    short_id: int
+
+
+class TransactionServiceSnapshot:
+    """
+    Read-only copy of the transaction service entries needed to convert a single block in a worker process.
+
+    Implements the part of the transaction service interface used by the pure Python message converters.
+    Transactions are keyed by transaction hash.
+    """
+
+    _short_ids_by_tx_hash: Dict[Sha256Hash, int]
+    _short_id_assign_times: Dict[int, float]
+    _transactions: Dict[int, SnapshotTransactionInfo]
+
+    def __init__(
+        self,
+        short_ids_by_tx_hash: Optional[Dict[Sha256Hash, int]] = None,
+        short_id_assign_times: Optional[Dict[int, float]] = None,
+        transactions: Optional[Dict[int, SnapshotTransactionInfo]] = None
+    ) -> None:
+        self._short_ids_by_tx_hash = short_ids_by_tx_hash or {}
+        self._short_id_assign_times = short_id_assign_times or {}
+        self._transactions = transactions or {}
+
+    def get_transaction_key(self, transaction_hash: Sha256Hash) -> Sha256Hash:
+        return transaction_hash
+
+    def get_short_id_by_key(self, transaction_key: Sha256Hash) -> int:
+        return self._short_ids_by_tx_hash.get(transaction_key, constants.NULL_TX_SID)
+
+    def get_short_id_assign_time(self, short_id: int) -> float:
+        return self._short_id_assign_times.get(short_id, 0)
+
+    def get_transaction(self, short_id: int) -> SnapshotTransactionInfo:
+        transaction = self._transactions.get(short_id)
+        if transaction is None:
+            return SnapshotTransactionInfo(None, None, short_id)
+        return transaction
+
+    def get_missing_transactions(self, short_ids: Iterable[int]) -> Tuple[bool, List[int], List[Sha256Hash]]:
+        unknown_short_ids = []
+        unknown_tx_hashes = []
+        for short_id in short_ids:
+            tx_hash, tx_contents, _ = self.get_transaction(short_id)
+            if tx_hash is None:
+                unknown_short_ids.append(short_id)
+            elif tx_contents is None:
+                unknown_tx_hashes.append(tx_hash)
+        return bool(unknown_short_ids or unknown_tx_hashes), unknown_short_ids, unknown_tx_hashes
+
+
+class BlockConversionPool:
+    """
+    Pool of worker processes converting blocks with a pure Python message converter, so that block compression
+    and decompression do not block the event loop while the gateway runs without C++ extensions.
+
+    Blocks are passed to workers through shared memory. Workers do not have access to the transaction service,
+    so each conversion is given a snapshot of the entries of the transactions in the block:
+    - decompression: short ids are read from the compressed block and the transactions are looked up before the
+      block is sent to a worker. Transaction contents are passed through shared memory as well.
+    - compression: a worker computes hashes of the block transactions first, then short ids are looked up on the
+      event loop thread, and a worker compresses the block with the looked up short ids.
+
+    Decompression of blocks with unknown transactions is not resumable, since the partially decompressed block
+    stays in the worker process. Such blocks are fully decompressed again once recovered.
+    """
+
+    message_converter: AbstractMessageConverter
+    processes: int
+
+    _executor: ProcessPoolExecutor
+
+    def __init__(self, message_converter: AbstractMessageConverter, processes: int) -> None:
+        self.message_converter = message_converter
+        self.processes = processes
+        # converter is pickled now, before it accumulates state that is not needed (or not picklable) in workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=get_context(WORKER_START_METHOD),
+            initializer=_init_worker,
+            initargs=(pickle.dumps(message_converter),)
+        )
+
+    async def block_to_bx_block(
+        self,
+        block_msg,
+        tx_service: TransactionService,
+        enable_block_compression: bool,
+        min_tx_age_seconds: float
+    ) -> Tuple[memoryview, BlockInfo]:
+        """
+        Same as `AbstractMessageConverter.block_to_bx_block`, but runs in a worker process
+        """
+        block_bytes = block_msg.rawbytes()
+        with _SharedBuffer(block_bytes) as block_buffer:
+            tx_hashes = await self._run(_get_block_transaction_hashes, block_buffer.name, len(block_bytes))
+            short_ids, short_id_assign_times = get_short_ids_and_assign_times(tx_service, tx_hashes)
+            short_ids_by_tx_hash = {}
+            assign_times = {}
+            for tx_hash, short_id, short_id_assign_time in zip(tx_hashes, short_ids, short_id_assign_times):
+                if short_id != constants.NULL_TX_SID:
+                    short_ids_by_tx_hash[tx_hash] = short_id
+                    assign_times[short_id] = short_id_assign_time
+
+            bx_block, block_info = await self._run(
+                _block_to_bx_block,
+                block_buffer.name,
+                len(block_bytes),
+                TransactionServiceSnapshot(short_ids_by_tx_hash, assign_times),
+                enable_block_compression,
+                min_tx_age_seconds
+            )
+        return memoryview(bx_block), block_info
+
+    async def bx_block_to_block(
+        self, bx_block: Union[bytearray, memoryview], tx_service: TransactionService
+    ) -> BlockDecompressionResult:
+        """
+        Same as `AbstractMessageConverter.bx_block_to_block`, but runs in a worker process
+        """
+        block_offsets = compact_block_short_ids_serializer.get_bx_block_offsets(bx_block)
+        short_ids, _ = compact_block_short_ids_serializer.deserialize_short_ids_from_buffer(
+            bx_block, block_offsets.short_id_offset
+        )
+
+        transactions = []
+        tx_contents_pieces = []
+        tx_contents_size = 0
+        for short_id in short_ids:
+            tx_hash, tx_contents, _ = tx_service.get_transaction(short_id)
+            if tx_contents is None:
+                transactions.append((short_id, tx_hash, -1, 0))
+            else:
+                transactions.append((short_id, tx_hash, tx_contents_size, len(tx_contents)))
+                tx_contents_pieces.append(tx_contents)
+                tx_contents_size += len(tx_contents)
+
+        with _SharedBuffer(bx_block) as bx_block_buffer, \
+                _SharedBuffer(*tx_contents_pieces) as tx_contents_buffer:
+            block_bytes, block_info, unknown_short_ids, unknown_tx_hashes = await self._run(
+                _bx_block_to_block,
+                bx_block_buffer.name,
+                len(bx_block),
+                tx_contents_buffer.name,
+                tx_contents_size,
+                transactions
+            )
+
+        block_msg = None
+        if block_bytes is not None:
+            block_msg = self.message_converter.block_message_from_bytes(bytearray(block_bytes))
+        return BlockDecompressionResult(block_msg, block_info, unknown_short_ids, unknown_tx_hashes)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        return await asyncio.get_event_loop().run_in_executor(self._executor, func, *args)
+
+
+class _SharedBuffer:
+    """
+    Shared memory segment holding concatenated pieces, unlinked on exit. No segment is created for empty contents.
+    """
+
+    def __init__(self, *pieces: Union[bytes, bytearray, memoryview]) -> None:
+        self._pieces = pieces
+        self._shared_memory: Optional[SharedMemory] = None
+        self.name: Optional[str] = None
+
+    def __enter__(self) -> "_SharedBuffer":
+        size = sum(len(piece) for piece in self._pieces)
+        if size == 0:
+            return self
+
+        shared_memory = SharedMemory(create=True, size=size)
+        offset = 0
+        for piece in self._pieces:
+            next_offset = offset + len(piece)
+            shared_memory.buf[offset:next_offset] = piece
+            offset = next_offset
+        self._shared_memory = shared_memory
+        self.name = shared_memory.name
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        shared_memory = self._shared_memory
+        if shared_memory is not None:
+            shared_memory.close()
+            shared_memory.unlink()
+            self._shared_memory = None
+
+
+_worker_message_converter: Optional[AbstractMessageConverter] = None
+
+
+def _init_worker(message_converter_bytes: bytes) -> None:
+    global _worker_message_converter
+    _worker_message_converter = pickle.loads(message_converter_bytes)
+
+
+def _get_worker_message_converter() -> AbstractMessageConverter:
+    message_converter = _worker_message_converter
+    assert message_converter is not None
+    return message_converter
+
+
+def _read_shared_buffer(name: Optional[str], size: int) -> bytearray:
+    """
+    Copies contents of a shared memory segment, so the segment can be closed before the contents are used
+    """
+    if name is None:
+        return bytearray(0)
+    shared_memory = SharedMemory(name)
+    try:
+        return bytearray(shared_memory.buf[:size])
+    finally:
+        shared_memory.close()
+
+
+def _get_block_transaction_hashes(block_buffer_name: str, block_size: int) -> List[Sha256Hash]:
+    message_converter = _get_worker_message_converter()
+    block_msg = message_converter.block_message_from_bytes(_read_shared_buffer(block_buffer_name, block_size))
+    return message_converter.get_block_transaction_hashes(block_msg)
+
+
+def _block_to_bx_block(
+    block_buffer_name: str,
+    block_size: int,
+    tx_service_snapshot: TransactionServiceSnapshot,
+    enable_block_compression: bool,
+    min_tx_age_seconds: float
+) -> Tuple[bytes, BlockInfo]:
+    message_converter = _get_worker_message_converter()
+    block_msg = message_converter.block_message_from_bytes(_read_shared_buffer(block_buffer_name, block_size))
+    bx_block, block_info = message_converter.block_to_bx_block(
+        block_msg,
+        tx_service_snapshot,
+        enable_block_compression,
+        min_tx_age_seconds
+    )
+    return bytes(bx_block), block_info
+
+
+def _bx_block_to_block(
+    bx_block_buffer_name: str,
+    bx_block_size: int,
+    tx_contents_buffer_name: Optional[str],
+    tx_contents_size: int,
+    transactions: List[Tuple[int, Optional[Sha256Hash], int, int]]
+) -> Tuple[Optional[bytes], BlockInfo, List[int], List[Sha256Hash]]:
+    """
+    :param transactions: list of (short id, transaction hash, contents offset, contents length) of the block
+        transactions, contents offset is -1 if contents are unknown
+    """
+    message_converter = _get_worker_message_converter()
+    bx_block = memoryview(_read_shared_buffer(bx_block_buffer_name, bx_block_size))
+    tx_contents = memoryview(_read_shared_buffer(tx_contents_buffer_name, tx_contents_size))
+
+    snapshot_transactions = {}
+    for short_id, tx_hash, offset, length in transactions:
+        if tx_hash is None:
+            continue
+        contents = None if offset < 0 else tx_contents[offset:offset + length]
+        snapshot_transactions[short_id] = SnapshotTransactionInfo(tx_hash, contents, short_id)
+
+    block_msg, block_info, unknown_short_ids, unknown_tx_hashes = message_converter.bx_block_to_block(
+        bx_block, TransactionServiceSnapshot(transactions=snapshot_transactions)
+    )
+    block_bytes = None if block_msg is None else bytes(block_msg.rawbytes())
+    return block_bytes, block_info, unknown_short_ids, unknown_tx_hashes
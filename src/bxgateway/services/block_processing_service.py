@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import time
 from typing import Iterable, Optional, TYPE_CHECKING, Union
@@ -23,10 +24,13 @@ from bxcommon.utils.stats.transaction_stat_event_type import TransactionStatEven
 from bxcommon.utils.stats.transaction_statistics_service import tx_stats
 from bxgateway import gateway_constants
 from bxgateway import log_messages
+from bxgateway.abstract_message_converter import BlockDecompressionState, BlockDecompressionResult
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
 from bxgateway.connections.abstract_relay_connection import AbstractRelayConnection
 from bxgateway.messages.gateway.block_received_message import BlockReceivedMessage
+from bxgateway.services.block_conversion_pool import BlockConversionPool
 from bxgateway.services.block_recovery_service import BlockRecoveryInfo, RecoveredTxsSource
+from bxgateway.utils.block_info import BlockInfo
 from bxgateway.utils.errors.message_conversion_error import MessageConversionError
 from bxgateway.utils.stats.gateway_bdn_performance_stats_service import gateway_bdn_performance_stats_service
 from bxutils import logging
@@ -319,8 +323,14 @@ class BlockProcessingService:
 
     def retry_broadcast_recovered_blocks(self, connection) -> None:
         if self._node.block_recovery_service.recovered_blocks and self._node.opts.has_fully_updated_tx_service:
-            for msg, recovery_source in self._node.block_recovery_service.recovered_blocks:
-                self._handle_decrypted_block(msg, connection, recovered=True, recovered_txs_source=recovery_source)
+            for msg, recovery_source, decompression_state in self._node.block_recovery_service.recovered_blocks:
+                self._handle_decrypted_block(
+                    msg,
+                    connection,
+                    recovered=True,
+                    recovered_txs_source=recovery_source,
+                    decompression_state=decompression_state
+                )
 
             self._node.block_recovery_service.clean_up_recovered_blocks()
 
@@ -376,7 +386,13 @@ class BlockProcessingService:
         :param block_message: block message to propagate
         :param connection: receiving connection (AbstractBlockchainConnection)
         """
-        block_hash = block_message.block_hash()
+        block_conversion_pool = self._node.block_conversion_pool
+        if block_conversion_pool is not None:
+            asyncio.create_task(
+                self._process_and_broadcast_block_in_pool(block_conversion_pool, block_message, connection)
+            )
+            return
+
         message_converter = self._node.message_converter
         assert message_converter is not None
         try:
@@ -387,15 +403,54 @@ class BlockProcessingService:
                 self._node.network.min_tx_age_seconds
             )
         except MessageConversionError as e:
-            block_stats.add_block_event_by_block_hash(
-                e.msg_hash,
-                BlockStatEventType.BLOCK_CONVERSION_FAILED,
-                network_num=connection.network_num,
-                conversion_type=e.conversion_type.value
+            self._on_block_compression_failed(e, connection)
+            return
+
+        self._broadcast_compressed_block(block_message, connection, bx_block, block_info)
+
+    async def _process_and_broadcast_block_in_pool(
+        self,
+        block_conversion_pool: BlockConversionPool,
+        block_message,
+        connection: AbstractGatewayBlockchainConnection
+    ) -> None:
+        try:
+            bx_block, block_info = await block_conversion_pool.block_to_bx_block(
+                block_message,
+                self._node.get_tx_service(),
+                self._node.opts.enable_block_compression,
+                self._node.network.min_tx_age_seconds
             )
-            connection.log_error(log_messages.BLOCK_COMPRESSION_FAIL, e.msg_hash, e)
+        except MessageConversionError as e:
+            self._on_block_compression_failed(e, connection)
             return
+        except Exception as e:
+            logger.error(log_messages.BLOCK_CONVERSION_POOL_FAIL, block_message.block_hash(), e, exc_info=True)
+            self._node.close_block_conversion_pool()
+            self._process_and_broadcast_block(block_message, connection)
+            return
+
+        self._broadcast_compressed_block(block_message, connection, bx_block, block_info)
+
+    def _on_block_compression_failed(
+        self, error: MessageConversionError, connection: AbstractGatewayBlockchainConnection
+    ) -> None:
+        block_stats.add_block_event_by_block_hash(
+            error.msg_hash,
+            BlockStatEventType.BLOCK_CONVERSION_FAILED,
+            network_num=connection.network_num,
+            conversion_type=error.conversion_type.value
+        )
+        connection.log_error(log_messages.BLOCK_COMPRESSION_FAIL, error.msg_hash, error)
 
+    def _broadcast_compressed_block(
+        self,
+        block_message,
+        connection: AbstractGatewayBlockchainConnection,
+        bx_block: memoryview,
+        block_info: BlockInfo
+    ) -> None:
+        block_hash = block_message.block_hash()
         if block_info.ignored_short_ids:
             assert block_info.ignored_short_ids is not None
             logger.debug(
@@ -463,7 +518,8 @@ class BlockProcessingService:
         connection: AbstractRelayConnection,
         encrypted_block_hash_hex: Optional[str] = None,
         recovered: bool = False,
-        recovered_txs_source: Optional[RecoveredTxsSource] = None
+        recovered_txs_source: Optional[RecoveredTxsSource] = None,
+        decompression_state: Optional[BlockDecompressionState] = None
     ) -> None:
         transaction_service = self._node.get_tx_service()
         message_converter = self._node.message_converter
@@ -482,26 +538,107 @@ class BlockProcessingService:
             return
 
         # TODO: determine if a real block or test block. Discard if test block.
-        if self._node.remote_node_conn or self._node.has_active_blockchain_peer():
-            try:
-                (
-                    block_message, block_info, unknown_sids, unknown_hashes
-                ) = message_converter.bx_block_to_block(bx_block, transaction_service)
-                block_content_debug_utils.log_compressed_block_debug_info(transaction_service, bx_block)
-            except MessageConversionError as e:
-                block_stats.add_block_event_by_block_hash(
-                    e.msg_hash,
-                    BlockStatEventType.BLOCK_CONVERSION_FAILED,
-                    network_num=connection.network_num,
-                    conversion_type=e.conversion_type.value
-                )
-                transaction_service.on_block_cleaned_up(e.msg_hash)
-                connection.log_warning(log_messages.FAILED_TO_DECOMPRESS_BLOCK, e.msg_hash, e)
-                return
-        else:
+        if not self._node.remote_node_conn and not self._node.has_active_blockchain_peer():
             connection.log_warning(log_messages.LACK_BLOCKCHAIN_CONNECTION)
             return
 
+        block_conversion_pool = self._node.block_conversion_pool
+        if block_conversion_pool is not None and decompression_state is None:
+            asyncio.create_task(
+                self._handle_decrypted_block_in_pool(
+                    block_conversion_pool,
+                    valid_block.block_hash,
+                    bx_block,
+                    connection,
+                    encrypted_block_hash_hex,
+                    recovered,
+                    recovered_txs_source
+                )
+            )
+            return
+
+        try:
+            if decompression_state is None:
+                decompression_result, decompression_state = message_converter.bx_block_to_block_resumable(
+                    bx_block, transaction_service
+                )
+            else:
+                # only transactions that were missing are looked up when resuming recovered block
+                decompression_result, decompression_state = message_converter.resume_bx_block_to_block(
+                    decompression_state, transaction_service
+                )
+            block_content_debug_utils.log_compressed_block_debug_info(transaction_service, bx_block)
+        except MessageConversionError as e:
+            self._on_block_decompression_failed(e, connection)
+            return
+
+        self._process_decompressed_block(
+            bx_block,
+            connection,
+            decompression_result,
+            decompression_state,
+            encrypted_block_hash_hex,
+            recovered,
+            recovered_txs_source
+        )
+
+    async def _handle_decrypted_block_in_pool(
+        self,
+        block_conversion_pool: BlockConversionPool,
+        block_hash: Optional[Sha256Hash],
+        bx_block: memoryview,
+        connection: AbstractRelayConnection,
+        encrypted_block_hash_hex: Optional[str],
+        recovered: bool,
+        recovered_txs_source: Optional[RecoveredTxsSource]
+    ) -> None:
+        transaction_service = self._node.get_tx_service()
+        try:
+            decompression_result = await block_conversion_pool.bx_block_to_block(bx_block, transaction_service)
+            block_content_debug_utils.log_compressed_block_debug_info(transaction_service, bx_block)
+        except MessageConversionError as e:
+            self._on_block_decompression_failed(e, connection)
+            return
+        except Exception as e:
+            logger.error(log_messages.BLOCK_CONVERSION_POOL_FAIL, block_hash, e, exc_info=True)
+            self._node.close_block_conversion_pool()
+            self._handle_decrypted_block(
+                bx_block, connection, encrypted_block_hash_hex, recovered, recovered_txs_source
+            )
+            return
+
+        self._process_decompressed_block(
+            bx_block,
+            connection,
+            decompression_result,
+            None,
+            encrypted_block_hash_hex,
+            recovered,
+            recovered_txs_source
+        )
+
+    def _on_block_decompression_failed(self, error: MessageConversionError, connection: AbstractRelayConnection) -> None:
+        block_stats.add_block_event_by_block_hash(
+            error.msg_hash,
+            BlockStatEventType.BLOCK_CONVERSION_FAILED,
+            network_num=connection.network_num,
+            conversion_type=error.conversion_type.value
+        )
+        self._node.get_tx_service().on_block_cleaned_up(error.msg_hash)
+        connection.log_warning(log_messages.FAILED_TO_DECOMPRESS_BLOCK, error.msg_hash, error)
+
+    def _process_decompressed_block(
+        self,
+        bx_block: memoryview,
+        connection: AbstractRelayConnection,
+        decompression_result: BlockDecompressionResult,
+        decompression_state: Optional[BlockDecompressionState],
+        encrypted_block_hash_hex: Optional[str],
+        recovered: bool,
+        recovered_txs_source: Optional[RecoveredTxsSource]
+    ) -> None:
+        transaction_service = self._node.get_tx_service()
+        block_message, block_info, unknown_sids, unknown_hashes = decompression_result
         block_hash = block_info.block_hash
         all_sids = block_info.short_ids
 
@@ -601,7 +738,9 @@ class BlockProcessingService:
                 connection.log_trace("Handling already queued block again. Ignoring.")
                 return
 
-            self._node.block_recovery_service.add_block(bx_block, block_hash, unknown_sids, unknown_hashes)
+            self._node.block_recovery_service.add_block(
+                bx_block, block_hash, unknown_sids, unknown_hashes, decompression_state
+            )
             block_stats.add_block_event_by_block_hash(
                 block_hash,
                 BlockStatEventType.BLOCK_DECOMPRESSED_WITH_UNKNOWN_TXS,
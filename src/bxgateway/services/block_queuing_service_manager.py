@@ -50,6 +50,18 @@ class BlockQueuingServiceManager:
         else:
             return True
 
+    def is_seen_by_all_blockchain_nodes(self, block_hash: Sha256Hash) -> bool:
+        """
+        :param block_hash:
+        :return: if all connected blockchain nodes have seen the block, False if no blockchain node is connected
+        """
+        if not self.blockchain_peer_to_block_queuing_service:
+            return False
+        for queuing_service in self:
+            if not queuing_service.is_block_seen_by_blockchain_node(block_hash):
+                return False
+        return True
+
     def add_block_queuing_service(
         self,
         connection: AbstractGatewayBlockchainConnection,
@@ -119,6 +131,8 @@ class BlockQueuingServiceManager:
                 queuing_service.remove(block_hash)
         if block_hash in self.block_storage:
             del self.block_storage[block_hash]
+        for queuing_service in self:
+            queuing_service.on_block_removed_from_storage(block_hash)
 
     def update_recovered_block(
         self,
@@ -1,13 +1,14 @@
 import time
 from collections import defaultdict
 from enum import Enum
-from typing import Dict, Set, List, NamedTuple
+from typing import Dict, Set, List, NamedTuple, Optional, Tuple
 
 from bxcommon.utils import crypto
 from bxcommon.utils.alarm_queue import AlarmQueue
 from bxcommon.utils.expiration_queue import ExpirationQueue
 from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway import gateway_constants
+from bxgateway.abstract_message_converter import BlockDecompressionState
 from bxutils import logging
 
 logger = logging.get_logger(__name__)
@@ -37,13 +38,14 @@ class BlockRecoveryService:
 
     Attributes
     ----------
-    recovered blocks: queue to which recovered blocks are pushed to
+    recovered blocks: queue to which recovered blocks are pushed to, with their partial decompression state
     _alarm_queue: reference to alarm queue to schedule cleanup on
 
     _bx_block_hash_to_sids: map of compressed block hash to its set of unknown short ids
     _bx_block_hash_to_tx_hashes: map of compressed block hash to its set of unknown transaction hashes
     _bx_block_hash_to_block_hash: map of compressed block hash to its original block hash
     _bx_block_hash_to_block: map of compressed block hash to its compressed byte representation
+    _bx_block_hash_to_decompression_state: map of compressed block hash to its partial decompression state
     _block_hash_to_bx_block_hashes: map of original block hash to compressed block hashes waiting for recovery
     _sid_to_bx_block_hashes: map of short id to compressed block hashes waiting for recovery
     _tx_hash_to_bx_block_hashes: map of transaction hash to block hashes waiting for recovery
@@ -57,6 +59,7 @@ class BlockRecoveryService:
     _bx_block_hash_to_tx_hashes: Dict[Sha256Hash, Set[Sha256Hash]]
     _bx_block_hash_to_block_hash: Dict[Sha256Hash, Sha256Hash]
     _bx_block_hash_to_block: Dict[Sha256Hash, memoryview]
+    _bx_block_hash_to_decompression_state: Dict[Sha256Hash, BlockDecompressionState]
     _block_hash_to_bx_block_hashes: Dict[Sha256Hash, Set[Sha256Hash]]
     _sid_to_bx_block_hashes: Dict[int, Set[Sha256Hash]]
     _tx_hash_to_bx_block_hashes: Dict[Sha256Hash, Set[Sha256Hash]]
@@ -64,6 +67,7 @@ class BlockRecoveryService:
     _cleanup_scheduled: bool = False
 
     recovery_attempts_by_block: Dict[Sha256Hash, int]
+    recovered_blocks: List[Tuple[memoryview, "RecoveredTxsSource", Optional[BlockDecompressionState]]]
 
     def __init__(self, alarm_queue: AlarmQueue):
         self.recovered_blocks = []
@@ -74,6 +78,7 @@ class BlockRecoveryService:
         self._bx_block_hash_to_tx_hashes = {}
         self._bx_block_hash_to_block_hash = {}
         self._bx_block_hash_to_block = {}
+        self._bx_block_hash_to_decompression_state = {}
         self.recovery_attempts_by_block = defaultdict(int)
         self._block_hash_to_bx_block_hashes = defaultdict(set)
         self._sid_to_bx_block_hashes = defaultdict(set)
@@ -81,19 +86,23 @@ class BlockRecoveryService:
         self._blocks_expiration_queue = ExpirationQueue(gateway_constants.BLOCK_RECOVERY_MAX_QUEUE_TIME)
 
     def add_block(self, bx_block: memoryview, block_hash: Sha256Hash, unknown_tx_sids: List[int],
-                  unknown_tx_hashes: List[Sha256Hash]):
+                  unknown_tx_hashes: List[Sha256Hash],
+                  decompression_state: Optional[BlockDecompressionState] = None):
         """
         Adds a block that needs to recovery. Tracks unknown short ids and contents as they come in.
         :param bx_block: bytearray representation of compressed block
         :param block_hash: original ObjectHash of block
         :param unknown_tx_sids: list of unknown short ids
         :param unknown_tx_hashes: list of unknown tx ObjectHashes
+        :param decompression_state: partial decompression state to resume from once block is recovered
         """
         logger.trace("Recovering block with {} unknown short ids and {} contents: {}", len(unknown_tx_sids),
                      len(unknown_tx_hashes), block_hash)
         bx_block_hash = Sha256Hash(crypto.double_sha256(bx_block))
 
         self._bx_block_hash_to_block[bx_block_hash] = bx_block
+        if decompression_state is not None:
+            self._bx_block_hash_to_decompression_state[bx_block_hash] = decompression_state
         self._bx_block_hash_to_block_hash[bx_block_hash] = block_hash
         self._bx_block_hash_to_sids[bx_block_hash] = set(unknown_tx_sids)
         self._bx_block_hash_to_tx_hashes[bx_block_hash] = set(unknown_tx_hashes)
@@ -199,6 +208,29 @@ class BlockRecoveryService:
         self._cleanup_scheduled = False
         return 0
 
+    def get_blocks_size(self) -> int:
+        return sum(len(bx_block) for bx_block in self._bx_block_hash_to_block.values())
+
+    def evict_oldest_blocks(self, max_bytes: int) -> Tuple[int, int]:
+        """
+        Gives up recovery of the oldest compressed blocks until at least `max_bytes` are removed.
+        :param max_bytes: size of compressed blocks to remove
+        :return: number of removed compressed blocks and their size
+        """
+        evicted_count = 0
+        evicted_size = 0
+        for bx_block_hash in list(self._blocks_expiration_queue.queue):
+            if evicted_size >= max_bytes:
+                break
+            bx_block = self._bx_block_hash_to_block.get(bx_block_hash)
+            if bx_block is None:
+                continue
+            self._remove_not_recovered_block(bx_block_hash)
+            evicted_count += 1
+            evicted_size += len(bx_block)
+        logger.debug("Gave up recovery of {} blocks to free memory.", evicted_count)
+        return evicted_count, evicted_size
+
     def clean_up_recovered_blocks(self):
         """
         Cleans up blocks that have finished recovery.
@@ -216,6 +248,7 @@ class BlockRecoveryService:
         """
         if self._is_block_recovered(bx_block_hash):
             bx_block = self._bx_block_hash_to_block[bx_block_hash]
+            decompression_state = self._bx_block_hash_to_decompression_state.get(bx_block_hash)
             block_hash = self._bx_block_hash_to_block_hash[bx_block_hash]
             logger.debug(
                 "Recovery status for block {}, compress block hash {}: "
@@ -223,7 +256,7 @@ class BlockRecoveryService:
                 block_hash, bx_block_hash, recovered_txs_source
             )
             self._remove_recovered_block_hash(block_hash)
-            self.recovered_blocks.append((bx_block, recovered_txs_source))
+            self.recovered_blocks.append((bx_block, recovered_txs_source, decompression_state))
 
     def _is_block_recovered(self, bx_block_hash: Sha256Hash):
         """
@@ -245,6 +278,7 @@ class BlockRecoveryService:
                 if bx_block_hash in self._bx_block_hash_to_block:
                     self._remove_sid_and_tx_mapping_for_bx_block_hash(bx_block_hash)
                     del self._bx_block_hash_to_block[bx_block_hash]
+                    self._bx_block_hash_to_decompression_state.pop(bx_block_hash, None)
                     del self._bx_block_hash_to_block_hash[bx_block_hash]
             del self._block_hash_to_bx_block_hashes[block_hash]
 
@@ -281,6 +315,7 @@ class BlockRecoveryService:
 
             self._remove_sid_and_tx_mapping_for_bx_block_hash(bx_block_hash)
             del self._bx_block_hash_to_block[bx_block_hash]
+            self._bx_block_hash_to_decompression_state.pop(bx_block_hash, None)
 
             block_hash = self._bx_block_hash_to_block_hash.pop(bx_block_hash)
             self._block_hash_to_bx_block_hashes[block_hash].discard(bx_block_hash)
@@ -9,6 +9,7 @@ from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
 from bxgateway.services.eth.eth_block_queuing_service import EthBlockQueuingService
+from bxgateway.utils.eth.block_transaction_hashes_memo import block_transaction_hashes_memo
 
 from bxutils import logging
 from bxutils.logging.log_record_type import LogRecordType
@@ -40,10 +41,12 @@ class AbstractEthBlockCleanupService(AbstractBlockCleanupService):
         transaction_service: TransactionService
     ) -> None:
         block_hash = block_msg.block_hash()
-        transactions_list = block_msg.txns()
+        transactions_hashes = block_transaction_hashes_memo.get(block_hash)
+        if transactions_hashes is None:
+            transactions_hashes = [tx.hash() for tx in block_msg.txns()]
         self.clean_block_transactions_by_block_components(
             block_hash=block_hash,
-            transactions_list=(tx.hash() for tx in transactions_list),
+            transactions_list=transactions_hashes,
             transaction_service=transaction_service
         )
 
@@ -55,7 +58,9 @@ class AbstractEthBlockCleanupService(AbstractBlockCleanupService):
         try:
             block_body = block_queuing_service.get_block_body_from_message(block_hash)
             assert block_body is not None
-            transactions_hashes = block_body.get_block_transaction_hashes(0)
+            transactions_hashes = block_transaction_hashes_memo.get_or_hash(
+                block_hash, block_body.get_block_transaction_bytes(0)
+            )
             self.clean_block_transactions_by_block_components(
                 transaction_service=self.node.get_tx_service(),
                 block_hash=block_hash,
@@ -0,0 +1,210 @@
+import time
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from prometheus_client import Counter, Gauge
+
+from bxcommon import constants
+from bxcommon.utils.alarm_queue import AlarmId
+from bxcommon.utils.blockchain_utils.eth import eth_common_constants
+from bxcommon.utils.expiring_dict import ExpiringDict
+from bxcommon.utils.expiring_set import ExpiringSet
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import gateway_constants
+from bxutils import logging
+
+if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
+    from bxgateway.connections.eth.eth_node_connection import EthNodeConnection
+
+logger = logging.get_logger(__name__)
+
+LATENCY_SMOOTHING_FACTOR = 0.3
+
+block_fetch_latency = Gauge(
+    "eth_block_fetch_latency_ms",
+    "Smoothed time to fetch an announced block header and body from the blockchain node",
+    ["ip_endpoint"]
+)
+block_fetch_hedged_requests = Counter(
+    "eth_block_fetch_hedged_requests",
+    "Number of announced blocks requested from the blockchain node after another node was slow to respond",
+    ["ip_endpoint"]
+)
+block_fetch_duplicate_bodies = Counter(
+    "eth_block_fetch_duplicate_bodies",
+    "Number of block bodies from the blockchain node dropped because the block was already fetched",
+    ["ip_endpoint"]
+)
+
+
+def _format_endpoint(connection: "EthNodeConnection") -> str:
+    return f"{connection.endpoint.ip_address}:{connection.endpoint.port}"
+
+
+class _PendingBlockFetch:
+    block_number: int
+    requested_connections: Dict["EthNodeConnection", float]
+    announcing_connections: List["EthNodeConnection"]
+    request_time: float
+    hedge_alarm_id: Optional[AlarmId]
+
+    def __init__(self, block_number: int, connection: "EthNodeConnection") -> None:
+        self.block_number = block_number
+        self.request_time = time.time()
+        self.requested_connections = {connection: self.request_time}
+        self.announcing_connections = [connection]
+        self.hedge_alarm_id = None
+
+
+class EthBlockFetchCoordinator:
+    """
+    Coordinates fetching blocks announced with NewBlockHashes by multiple Ethereum nodes.
+
+    Only the first node that announces a block is asked for its header and body. If the block is not
+    fetched within `hedge_delay_s`, it is also requested from the fastest other node that announced it.
+    Whichever body arrives first is processed; bodies of already fetched blocks are dropped before
+    they are parsed.
+    """
+
+    node: "EthGatewayNode"
+    hedge_delay_s: float
+
+    _pending_fetches: ExpiringDict[Sha256Hash, _PendingBlockFetch]
+    _fetched_blocks: ExpiringSet[Sha256Hash]
+    _fetch_latencies: Dict[str, float]
+
+    def __init__(self, node: "EthGatewayNode", hedge_delay_s: float) -> None:
+        self.node = node
+        self.hedge_delay_s = hedge_delay_s
+
+        self._pending_fetches = ExpiringDict(
+            node.alarm_queue,
+            eth_common_constants.NEW_BLOCK_PARTS_MAX_WAIT_S,
+            "eth_block_fetch_pending"
+        )
+        self._fetched_blocks = ExpiringSet(
+            node.alarm_queue,
+            gateway_constants.MAX_BLOCK_CACHE_TIME_S,
+            "eth_block_fetch_fetched"
+        )
+        self._fetch_latencies = {}
+
+    def on_block_announced(
+        self, block_hash: Sha256Hash, block_number: int, connection: "EthNodeConnection"
+    ) -> bool:
+        """
+        Records a block announcement from a blockchain node.
+
+        :return: if the announcing connection should request the block header and body
+        """
+        if block_hash in self._fetched_blocks:
+            return False
+
+        pending_fetch = self._pending_fetches.contents.get(block_hash)
+        if pending_fetch is None:
+            pending_fetch = _PendingBlockFetch(block_number, connection)
+            self._pending_fetches.add(block_hash, pending_fetch)
+            if self.hedge_delay_s > 0:
+                pending_fetch.hedge_alarm_id = self.node.alarm_queue.register_alarm(
+                    self.hedge_delay_s, self._hedge, block_hash
+                )
+            return True
+
+        if connection in pending_fetch.announcing_connections:
+            return False
+        pending_fetch.announcing_connections.append(connection)
+
+        if (
+            self.hedge_delay_s > 0
+            and pending_fetch.hedge_alarm_id is None
+            and len(pending_fetch.requested_connections) == 1
+        ):
+            # hedge delay has already elapsed without another node to request the block from
+            self._request_block(block_hash, pending_fetch, connection)
+        return False
+
+    def has_fetched(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._fetched_blocks
+
+    def is_fetched(self, block_hash: Sha256Hash, connection: "EthNodeConnection") -> bool:
+        """
+        Checks if a block body received from a blockchain node for an announced block is a late duplicate,
+        counting it if so.
+        """
+        if self.has_fetched(block_hash):
+            block_fetch_duplicate_bodies.labels(_format_endpoint(connection)).inc()
+            return True
+        return False
+
+    def on_block_fetched(self, block_hash: Sha256Hash, connection: "EthNodeConnection") -> bool:
+        """
+        Records a block header and body fetched from a blockchain node.
+
+        :return: False if the block was already fetched from another node and should be dropped
+        """
+        if self.is_fetched(block_hash, connection):
+            return False
+
+        self._fetched_blocks.add(block_hash)
+        pending_fetch = self._pending_fetches.contents.get(block_hash)
+        if pending_fetch is None:
+            return True
+        self._pending_fetches.remove_item(block_hash)
+
+        if pending_fetch.hedge_alarm_id is not None:
+            self.node.alarm_queue.unregister_alarm(pending_fetch.hedge_alarm_id)
+            pending_fetch.hedge_alarm_id = None
+
+        request_time = pending_fetch.requested_connections.get(connection)
+        if request_time is not None:
+            self._record_latency(connection, time.time() - request_time)
+        return True
+
+    def get_fetch_latency_ms(self, connection: "EthNodeConnection") -> Optional[float]:
+        latency = self._fetch_latencies.get(_format_endpoint(connection))
+        if latency is None:
+            return None
+        return latency * 1000
+
+    def _hedge(self, block_hash: Sha256Hash) -> int:
+        pending_fetch = self._pending_fetches.contents.get(block_hash)
+        if pending_fetch is None:
+            return constants.CANCEL_ALARMS
+        pending_fetch.hedge_alarm_id = None
+
+        candidates = [
+            connection for connection in pending_fetch.announcing_connections
+            if connection not in pending_fetch.requested_connections and connection.is_alive()
+        ]
+        if not candidates:
+            return constants.CANCEL_ALARMS
+
+        # nodes without measured latency are preferred, so that latency of each node gets measured
+        connection = min(
+            candidates,
+            key=lambda conn: self._fetch_latencies.get(_format_endpoint(conn), 0)
+        )
+        self._request_block(block_hash, pending_fetch, connection)
+        return constants.CANCEL_ALARMS
+
+    def _request_block(
+        self, block_hash: Sha256Hash, pending_fetch: _PendingBlockFetch, connection: "EthNodeConnection"
+    ) -> None:
+        logger.debug(
+            "Block {} was not fetched within {:.0f}ms. Requesting it from {}.",
+            block_hash, (time.time() - pending_fetch.request_time) * 1000, connection
+        )
+        pending_fetch.requested_connections[connection] = time.time()
+        block_fetch_hedged_requests.labels(_format_endpoint(connection)).inc()
+        connection.connection_protocol.request_new_block(block_hash, pending_fetch.block_number)
+
+    def _record_latency(self, connection: "EthNodeConnection", latency_s: float) -> None:
+        endpoint = _format_endpoint(connection)
+        previous_latency = self._fetch_latencies.get(endpoint)
+        if previous_latency is None:
+            latency = latency_s
+        else:
+            latency = LATENCY_SMOOTHING_FACTOR * latency_s + (1 - LATENCY_SMOOTHING_FACTOR) * previous_latency
+        self._fetch_latencies[endpoint] = latency
+        block_fetch_latency.labels(endpoint).set(latency * 1000)
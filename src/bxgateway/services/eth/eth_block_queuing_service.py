@@ -35,6 +35,7 @@ from bxgateway.messages.eth.protocol.new_block_hashes_eth_protocol_message impor
 )
 from bxgateway.services.abstract_block_queuing_service import AbstractBlockQueuingService, \
     BlockQueueEntry
+from bxgateway.services.eth.eth_header_chain_index import EthHeaderChainIndex
 from bxutils import logging
 
 if TYPE_CHECKING:
@@ -85,9 +86,6 @@ class EthBlockQueuingService(
     # best block accepted by Ethereum node
     best_accepted_block: EthBlockInfo
 
-    _block_hashes_by_height: ExpiringDict[int, Set[Sha256Hash]]
-    _height_by_block_hash: ExpiringDict[Sha256Hash, int]
-    _highest_block_number: int = 0
     _recovery_alarms_by_block_hash: Dict[Sha256Hash, AlarmId]
     _next_push_alarm_id: Optional[AlarmId] = None
     _partial_chainstate: Deque[EthBlockInfo]
@@ -117,16 +115,8 @@ class EthBlockQueuingService(
         self.best_sent_block = SentEthBlockInfo(INITIAL_BLOCK_HEIGHT, NULL_SHA256_HASH, 0)
         self.best_accepted_block = EthBlockInfo(INITIAL_BLOCK_HEIGHT, NULL_SHA256_HASH)
 
-        self._block_hashes_by_height = ExpiringDict(
-            node.alarm_queue,
-            gateway_constants.MAX_BLOCK_CACHE_TIME_S,
-            f"eth_block_queue_hashes_by_heights_{self.connection.endpoint}",
-        )
-        self._height_by_block_hash = ExpiringDict(
-            node.alarm_queue,
-            gateway_constants.MAX_BLOCK_CACHE_TIME_S,
-            f"eth_block_queue_height_by_hash_{self.connection.endpoint}"
-        )
+        # block heights and forks are tracked once for all blockchain peers
+        self.header_chain_index: EthHeaderChainIndex = self.node.header_chain_index
         self._recovery_alarms_by_block_hash = {}
         self._partial_chainstate = deque()
 
@@ -262,13 +252,14 @@ class EthBlockQueuingService(
         if block_message is not None:
             self.store_block_data(block_hash, block_message)
             block_number = block_message.block_number()
-        if block_number is None and block_hash in self._height_by_block_hash:
-            block_number = self._height_by_block_hash[block_hash]
+        if block_number is None:
+            block_number = self.header_chain_index.get_height(block_hash)
 
         assert block_number is not None
 
         super().mark_block_seen_by_blockchain_node(block_hash, block_message)
         self.accepted_block_hash_at_height[block_number] = block_hash
+        self.header_chain_index.set_canonical_block(block_hash, block_number)
         best_height, _ = self.best_accepted_block
         if block_number >= best_height:
             self.best_accepted_block = EthBlockInfo(block_number, block_hash)
@@ -287,19 +278,15 @@ class EthBlockQueuingService(
         self.remove_from_queue(block_hash)
         self._schedule_alarm_for_next_item()
 
-    def remove(self, block_hash: Sha256Hash) -> int:
-        index = super().remove(block_hash)
-        if block_hash in self._height_by_block_hash:
-            height = self._height_by_block_hash.contents.pop(block_hash, None)
+    def on_block_removed_from_storage(self, block_hash: Sha256Hash) -> None:
+        # the header chain index is shared with other queuing services and the feeds, so the height of the block
+        # is only dropped once no queuing service can send the block anymore
+        if block_hash in self.header_chain_index:
             self.connection.log_trace(
-                "Removing block {} at height {} in queuing service",
-                block_hash, height
+                "Removing block {} at height {} from header chain index",
+                block_hash, self.header_chain_index.get_height(block_hash)
             )
-            if height:
-                self._block_hashes_by_height.contents.get(
-                    height, set()
-                ).discard(block_hash)
-        return index
+            self.header_chain_index.remove(block_hash)
 
     def remove_from_queue(self, block_hash: Sha256Hash) -> int:
         index = super().remove_from_queue(block_hash)
@@ -395,7 +382,7 @@ class EthBlockQueuingService(
                     break
 
             # append to partial chain state
-            if head_hash == chain_head_height:
+            if height == chain_head_height and head_hash == chain_head_hash:
                 self._partial_chainstate.extend(missing_entries)
             # reorganization is required, rebuild to expected length
             else:
@@ -452,7 +439,7 @@ class EthBlockQueuingService(
             assert len(block_bodies) == 1
             bodies.append(block_bodies[0])
 
-            height = self._height_by_block_hash.contents.get(block_hash, None)
+            height = self.header_chain_index.get_height(block_hash)
             self.connection.log_debug(
                 "Appending {} body ({}) for sending to blockchain node.",
                 block_hash,
@@ -496,7 +483,7 @@ class EthBlockQueuingService(
             assert len(block_headers) == 1
             headers.append(block_headers[0])
 
-            height = self._height_by_block_hash.contents.get(block_hash, None)
+            height = self.header_chain_index.get_height(block_hash)
             self.connection.log_debug(
                 "Appending {} header ({}) for sending to blockchain node.",
                 block_hash,
@@ -517,7 +504,8 @@ class EthBlockQueuingService(
 
         Returns (success, [found_hashes])
         """
-        if block_hash not in self._blocks or block_hash not in self._height_by_block_hash:
+        starting_height = self.header_chain_index.get_height(block_hash)
+        if block_hash not in self._blocks or starting_height is None:
             return False, []
 
         if block_hash in self._blocks_waiting_for_recovery and self._blocks_waiting_for_recovery[block_hash]:
@@ -527,7 +515,6 @@ class EthBlockQueuingService(
             return False, []
 
         best_height, _, _ = self.best_sent_block
-        starting_height = self._height_by_block_hash[block_hash]
         look_back_length = best_height - starting_height + 1
         partial_chainstate = self.partial_chainstate(look_back_length)
 
@@ -580,9 +567,9 @@ class EthBlockQueuingService(
 
         while (
             len(block_hashes) < max_count
-            and height in self._block_hashes_by_height
+            and self.header_chain_index.has_height(height)
         ):
-            matching_hashes = self._block_hashes_by_height[height]
+            matching_hashes = self.header_chain_index.get_block_hashes_at_height(height)
 
             # A fork has occurred: give up, and fallback to
             # remote blockchain sync
@@ -613,16 +600,14 @@ class EthBlockQueuingService(
                     )
                     return False, []
             else:
-                block_hashes.append(
-                    next(iter(matching_hashes))
-                )
+                block_hashes.append(matching_hashes[0])
             height += (1 + skip) * multiplier
 
         # If a block is requested too far in the past, abort and fallback
         # to remote blockchain sync
         if (
-            height < self._highest_block_number
-            and height not in self._block_hashes_by_height
+            height < self.header_chain_index.highest_block_number
+            and not self.header_chain_index.has_height(height)
             and max_count != len(block_hashes)
         ):
             return False, []
@@ -664,10 +649,11 @@ class EthBlockQueuingService(
         :param max_count:
         :return: Iterator[Sha256Hash] in descending order (last -> first)
         """
-        if self._highest_block_number not in self._block_hashes_by_height:
+        highest_block_number = self.header_chain_index.highest_block_number
+        if not self.header_chain_index.has_height(highest_block_number):
             return iter([])
-        block_hashes = self._block_hashes_by_height[self._highest_block_number]
-        block_hash = next(iter(block_hashes))
+        block_hashes = self.header_chain_index.get_block_hashes_at_height(highest_block_number)
+        block_hash = block_hashes[0]
         if len(block_hashes) > 1:
             logger.debug(f"iterating over queued blocks starting for a possible fork {block_hash}")
 
@@ -688,6 +674,16 @@ class EthBlockQueuingService(
             return None
         return BlockBodiesEthProtocolMessage.from_body_bytes(block_parts.block_body_bytes)
 
+    def get_estimated_memory_size(self) -> int:
+        return super().get_estimated_memory_size() + (crypto.SHA256_HASH_LEN + constants.UL_INT_SIZE_IN_BYTES) * (
+            len(self.ordered_block_queue)
+            + len(self.block_checking_alarms)
+            + len(self.block_check_repeat_count)
+            + len(self.accepted_block_hash_at_height.contents)
+            + len(self.sent_block_at_height.contents)
+            + len(self._recovery_alarms_by_block_hash)
+        )
+
     def log_memory_stats(self) -> None:
         hooks.add_obj_mem_stats(
             self.__class__.__name__,
@@ -732,13 +728,9 @@ class EthBlockQueuingService(
                 block_hash,
                 block_number
             )
-            if block_number in self._block_hashes_by_height:
-                self._block_hashes_by_height[block_number].add(block_hash)
-            else:
-                self._block_hashes_by_height.add(block_number, {block_hash})
-            self._height_by_block_hash[block_hash] = block_number
-            if block_number > self._highest_block_number:
-                self._highest_block_number = block_number
+            self.header_chain_index.add_header(
+                block_hash, block_number, block_message.prev_block_hash(), block_message.difficulty()
+            )
         else:
             logger.trace(
                 "No block height could be parsed for block: {}", block_hash
@@ -877,9 +869,9 @@ class EthBlockQueuingService(
         for queued_block_hash, timestamp in self._block_queue:
             if (
                 not self._blocks_waiting_for_recovery[queued_block_hash]
-                and queued_block_hash in self._height_by_block_hash
+                and queued_block_hash in self.header_chain_index
             ):
-                if block_number == self._height_by_block_hash[queued_block_hash]:
+                if block_number == self.header_chain_index.get_height(queued_block_hash):
                     self.connection.log_info(
                         "In queuing service, fork detected at height {}. Setting aside block {} in favor of {}.",
                         block_number,
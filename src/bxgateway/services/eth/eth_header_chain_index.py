@@ -0,0 +1,169 @@
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional
+
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import gateway_constants
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+
+class EthHeaderChainEntry(NamedTuple):
+    block_number: int
+    block_hash: Sha256Hash
+    parent_hash: Optional[Sha256Hash]
+    difficulty: Optional[int]
+
+
+class EthHeaderChainIndex:
+    """
+    Node-wide index of recent Ethereum block headers, shared by block queuing services of all blockchain peers
+    and by the block feeds.
+
+    Headers are stored in a window of at most `max_length` consecutive heights, backed by deques indexed
+    by the offset from the lowest tracked height, so lookups by height are O(1). Each height keeps all known
+    block hashes (including forks) and the canonical block hash, i.e. the hash of the block accepted by
+    the blockchain nodes. The window moves forward as new heights are added, dropping the lowest heights.
+    """
+
+    max_length: int
+    highest_block_number: int
+
+    _base_height: int
+    _block_hashes: Deque[List[Sha256Hash]]
+    _canonical_hashes: Deque[Optional[Sha256Hash]]
+    _entries: Dict[Sha256Hash, EthHeaderChainEntry]
+
+    def __init__(self, max_length: int = gateway_constants.ETH_HEADER_CHAIN_INDEX_LENGTH) -> None:
+        self.max_length = max_length
+        self.highest_block_number = 0
+
+        self._base_height = 0
+        self._block_hashes = deque()
+        self._canonical_hashes = deque()
+        self._entries = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._entries
+
+    def add_header(
+        self,
+        block_hash: Sha256Hash,
+        block_number: int,
+        parent_hash: Optional[Sha256Hash] = None,
+        difficulty: Optional[int] = None
+    ) -> None:
+        if block_hash in self._entries:
+            return
+
+        index = self._get_or_create_index(block_number)
+        if index is None:
+            logger.trace("Block {} at height {} is too old for the header chain index.", block_hash, block_number)
+            return
+
+        self._block_hashes[index].append(block_hash)
+        self._entries[block_hash] = EthHeaderChainEntry(block_number, block_hash, parent_hash, difficulty)
+        if block_number > self.highest_block_number:
+            self.highest_block_number = block_number
+
+    def remove(self, block_hash: Sha256Hash) -> None:
+        entry = self._entries.pop(block_hash, None)
+        if entry is None:
+            return
+
+        index = self._get_index(entry.block_number)
+        if index is not None:
+            block_hashes = self._block_hashes[index]
+            if block_hash in block_hashes:
+                block_hashes.remove(block_hash)
+
+    def get_entry(self, block_hash: Sha256Hash) -> Optional[EthHeaderChainEntry]:
+        return self._entries.get(block_hash)
+
+    def get_height(self, block_hash: Sha256Hash) -> Optional[int]:
+        entry = self._entries.get(block_hash)
+        if entry is None:
+            return None
+        return entry.block_number
+
+    def has_height(self, block_number: int) -> bool:
+        index = self._get_index(block_number)
+        return index is not None and len(self._block_hashes[index]) > 0
+
+    def get_block_hashes_at_height(self, block_number: int) -> List[Sha256Hash]:
+        """
+        :return: hashes of all known blocks at the height, more than one if there is a fork
+        """
+        index = self._get_index(block_number)
+        if index is None:
+            return []
+        return self._block_hashes[index]
+
+    def get_canonical_block_hash(self, block_number: int) -> Optional[Sha256Hash]:
+        index = self._get_index(block_number)
+        if index is None:
+            return None
+        return self._canonical_hashes[index]
+
+    def set_canonical_block(self, block_hash: Sha256Hash, block_number: int) -> None:
+        """
+        Marks the block as accepted by a blockchain node at the height. Ancestors of the block that are
+        not canonical at their heights (after a chain reorganization) are marked canonical as well.
+        """
+        index = self._get_or_create_index(block_number)
+        if index is None:
+            return
+        self._canonical_hashes[index] = block_hash
+
+        entry = self._entries.get(block_hash)
+        while entry is not None and entry.parent_hash is not None and index > 0:
+            index -= 1
+            parent_hash = entry.parent_hash
+            if self._canonical_hashes[index] == parent_hash:
+                break
+            entry = self._entries.get(parent_hash)
+            if entry is None:
+                break
+            self._canonical_hashes[index] = parent_hash
+
+    def _get_index(self, block_number: int) -> Optional[int]:
+        index = block_number - self._base_height
+        if index < 0 or index >= len(self._block_hashes):
+            return None
+        return index
+
+    def _get_or_create_index(self, block_number: int) -> Optional[int]:
+        if not self._block_hashes or block_number >= self._base_height + self.max_length * 2:
+            # empty index or the chain moved far ahead, start a new window
+            self._reset(block_number)
+            return 0
+
+        if block_number < self._base_height:
+            if self._base_height + len(self._block_hashes) - block_number > self.max_length:
+                return None
+            while self._base_height > block_number:
+                self._block_hashes.appendleft([])
+                self._canonical_hashes.appendleft(None)
+                self._base_height -= 1
+            return 0
+
+        while block_number >= self._base_height + len(self._block_hashes):
+            self._block_hashes.append([])
+            self._canonical_hashes.append(None)
+
+        while len(self._block_hashes) > self.max_length:
+            for evicted_block_hash in self._block_hashes.popleft():
+                self._entries.pop(evicted_block_hash, None)
+            self._canonical_hashes.popleft()
+            self._base_height += 1
+
+        return block_number - self._base_height
+
+    def _reset(self, block_number: int) -> None:
+        self._entries.clear()
+        self._block_hashes = deque([[]])
+        self._canonical_hashes = deque([None])
+        self._base_height = block_number
@@ -0,0 +1,84 @@
+import time
+from typing import List, Optional, TYPE_CHECKING
+
+from bxcommon import constants
+from bxcommon.connections.connection_type import ConnectionType
+from bxcommon.utils.alarm_queue import AlarmId
+from bxgateway.utils.eth import eth_utils
+from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
+from bxutils import logging
+
+if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
+
+logger = logging.get_logger(__name__)
+
+
+class EthTransactionBatchingService:
+    """
+    Coalesces transactions sent to Ethereum nodes into multi-transaction messages.
+
+    Transactions are held for at most `batch_interval_s` after the first transaction of the batch
+    was added, or until `max_batch_size` transactions are collected, and then sent to each
+    blockchain node as a single Transactions message, paying RLPx framing and encryption once per batch.
+    """
+
+    node: "EthGatewayNode"
+    batch_interval_s: float
+    max_batch_size: int
+
+    _pending_txs: List[memoryview]
+    _batch_start_time: float
+    _flush_alarm_id: Optional[AlarmId]
+
+    def __init__(self, node: "EthGatewayNode", batch_interval_s: float, max_batch_size: int) -> None:
+        self.node = node
+        self.batch_interval_s = batch_interval_s
+        self.max_batch_size = max_batch_size
+
+        self._pending_txs = []
+        self._batch_start_time = 0
+        self._flush_alarm_id = None
+
+    def __len__(self) -> int:
+        return len(self._pending_txs)
+
+    def add_transactions(self, txs: List[memoryview]) -> None:
+        if not txs:
+            return
+
+        if not self._pending_txs:
+            self._batch_start_time = time.time()
+            self._flush_alarm_id = self.node.alarm_queue.register_alarm(
+                self.batch_interval_s, self._flush_on_timeout
+            )
+
+        self._pending_txs.extend(txs)
+
+        if len(self._pending_txs) >= self.max_batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        flush_alarm_id = self._flush_alarm_id
+        if flush_alarm_id is not None:
+            self.node.alarm_queue.unregister_alarm(flush_alarm_id)
+            self._flush_alarm_id = None
+
+        if not self._pending_txs:
+            return
+
+        txs = self._pending_txs
+        self._pending_txs = []
+
+        for batch_start in range(0, len(txs), self.max_batch_size):
+            batch = txs[batch_start:batch_start + self.max_batch_size]
+            msg = eth_utils.build_transactions_message(batch)
+            self.node.broadcast(msg, connection_types=(ConnectionType.BLOCKCHAIN_NODE,))
+            eth_gateway_stats_service.log_tx_batch(len(batch), time.time() - self._batch_start_time)
+            logger.trace("Sent batch of {} transactions to blockchain nodes.", len(batch))
+
+    def _flush_on_timeout(self) -> int:
+        self._flush_alarm_id = None
+        self.flush()
+        return constants.CANCEL_ALARMS
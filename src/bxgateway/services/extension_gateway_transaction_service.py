@@ -1,21 +1,25 @@
 import struct
-from typing import List, Set, Union
+from typing import List, Set, Union, Sequence, Tuple
 
 import task_pool_executor as tpe
 
 from bxcommon import constants
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.messages.bloxroute.txs_message import TxsMessage
+from bxcommon.models.blockchain_protocol import BlockchainProtocol
+from bxcommon.models.transaction_key import TransactionKey
 from bxcommon.models.tx_validation_status import TxValidationStatus
 from bxcommon.services.extension_transaction_service import ExtensionTransactionService
 from bxcommon.services.transaction_service import TransactionFromBdnGatewayProcessingResult
 from bxcommon.utils import crypto
 from bxcommon.utils.object_hash import Sha256Hash
-from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
-from bxgateway.connections.ont.ont_gateway_node import OntGatewayNode
+from bxgateway.services import gateway_transaction_service
 from bxgateway.services.gateway_transaction_service import GatewayTransactionService, \
     ProcessTransactionMessageFromNodeResult, MissingTransactions
 
+# blockchain protocols with transactions from blockchain node processed in extensions
+EXTENSION_NODE_TXS_PROTOCOLS = {BlockchainProtocol.ETHEREUM.value, BlockchainProtocol.ONTOLOGY.value}
+
 
 class ExtensionGatewayTransactionService(ExtensionTransactionService, GatewayTransactionService):
 
@@ -76,8 +80,7 @@ class ExtensionGatewayTransactionService(ExtensionTransactionService, GatewayTra
         opts = self.node.opts
         msg_bytes = msg.rawbytes()
 
-        if (isinstance(self.node, OntGatewayNode) or isinstance(self.node, EthGatewayNode)) and \
-                opts.process_node_txs_in_extension:
+        if opts.blockchain_protocol in EXTENSION_NODE_TXS_PROTOCOLS and opts.process_node_txs_in_extension:
             ext_processing_results = memoryview(self.proxy.process_gateway_transaction_from_node(
                 tpe.InputBytes(msg_bytes),
                 min_tx_network_fee,
@@ -174,3 +177,19 @@ class ExtensionGatewayTransactionService(ExtensionTransactionService, GatewayTra
             missing_transactions.add(MissingTransactions(short_id, transaction_hash))
 
         return missing_transactions
+
+    def get_short_ids_and_assign_times(
+        self, transaction_hashes: Sequence[Sha256Hash]
+    ) -> Tuple[List[int], List[float]]:
+        # transaction maps are kept in the extension, so they can only be queried one transaction at a time
+        return gateway_transaction_service.look_up_short_ids_and_assign_times(self, transaction_hashes)
+
+    def remove_transaction_contents_by_key(self, transaction_key: TransactionKey) -> int:
+        if not self.has_transaction_contents_by_key(transaction_key):
+            return 0
+        # contents are read before they are removed from the extension, which owns their buffer
+        contents_size = len(self.get_transaction_by_key(transaction_key))
+        del self._tx_cache_key_to_contents[transaction_key.transaction_cache_key]
+        # contents removed in the extension are accounted for the same way as after block cleanup tasks
+        self.update_removed_transactions(contents_size, [])
+        return contents_size
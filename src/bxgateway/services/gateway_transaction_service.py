@@ -1,4 +1,4 @@
-from typing import Union, cast, List, NamedTuple, Set, Optional, TYPE_CHECKING
+from typing import Union, cast, List, NamedTuple, Set, Optional, TYPE_CHECKING, Sequence, Tuple
 
 from bxcommon.messages.bloxroute.tx_message import TxMessage
 from bxcommon.messages.bloxroute.txs_message import TxsMessage
@@ -11,12 +11,13 @@ from bxcommon.utils.blockchain_utils import transaction_validation
 from bxcommon.utils.object_hash import Sha256Hash
 from bxcommon import constants
 from bxgateway.abstract_message_converter import AbstractMessageConverter
-from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
-from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
 from bxgateway.services.block_recovery_service import RecoveredTxsSource
 
 if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports,cyclic-import
     from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+    from bxgateway.messages.btc.tx_btc_message import TxBtcMessage
+    from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
 
 
 class ProcessTransactionMessageFromNodeResult(NamedTuple):
@@ -36,6 +37,45 @@ class MissingTransactions(NamedTuple):
     transaction_hash: Sha256Hash
 
 
+def get_short_ids_and_assign_times(
+    transaction_service: TransactionService, transaction_hashes: Sequence[Sha256Hash]
+) -> Tuple[List[int], List[float]]:
+    """
+    Looks up short ids of all transactions of a block.
+
+    Works with any transaction service, so it can be used by message converters that are not
+    bound to a gateway transaction service. Gateway transaction services look up all transactions
+    in a single pass over their maps.
+
+    :param transaction_service: transaction service
+    :param transaction_hashes: transaction hashes in block order
+    :return: short id of each transaction (NULL_TX_SID if unknown) and the time each short id was assigned
+    (0 if unknown), in block order
+    """
+    if isinstance(transaction_service, GatewayTransactionService):
+        return transaction_service.get_short_ids_and_assign_times(transaction_hashes)
+    return look_up_short_ids_and_assign_times(transaction_service, transaction_hashes)
+
+
+def look_up_short_ids_and_assign_times(
+    transaction_service: TransactionService, transaction_hashes: Sequence[Sha256Hash]
+) -> Tuple[List[int], List[float]]:
+    """
+    Looks up short ids of all transactions of a block through the public transaction service methods,
+    one transaction at a time.
+    """
+    get_transaction_key = transaction_service.get_transaction_key
+    get_short_id_by_key = transaction_service.get_short_id_by_key
+    get_short_id_assign_time = transaction_service.get_short_id_assign_time
+    null_tx_sid = constants.NULL_TX_SID
+
+    short_ids = [get_short_id_by_key(get_transaction_key(tx_hash)) for tx_hash in transaction_hashes]
+    assign_times = [
+        0 if short_id == null_tx_sid else get_short_id_assign_time(short_id) for short_id in short_ids
+    ]
+    return short_ids, assign_times
+
+
 class GatewayTransactionService(TransactionService):
 
     node: "AbstractGatewayNode"
@@ -84,7 +124,7 @@ class GatewayTransactionService(TransactionService):
 
     def process_transactions_message_from_node(
         self,
-        msg: Union[TxBtcMessage, TransactionsEthProtocolMessage, OntTxMessage],
+        msg: Union["TxBtcMessage", "TransactionsEthProtocolMessage", OntTxMessage],
         min_tx_network_fee: int,
         enable_transaction_validation: bool
     ) -> List[ProcessTransactionMessageFromNodeResult]:
@@ -155,6 +195,80 @@ class GatewayTransactionService(TransactionService):
 
         return missing_transactions
 
+    def get_short_ids_and_assign_times(
+        self, transaction_hashes: Sequence[Sha256Hash]
+    ) -> Tuple[List[int], List[float]]:
+        """
+        Looks up short ids and short id assign times of all transactions of a block in a single pass over
+        the transaction service maps, instead of calling `get_transaction_key`, `get_short_id_by_key` and
+        `get_short_id_assign_time` for each transaction. As `get_short_id_by_key`, returns the first short id
+        of transactions with multiple short ids.
+        """
+        tx_hash_to_cache_key = self._tx_hash_to_cache_key
+        tx_cache_key_to_short_ids = self._tx_cache_key_to_short_ids
+        short_id_assign_times = self._tx_assignment_expire_queue.queue
+        null_tx_sid = constants.NULL_TX_SID
+
+        short_ids = []
+        assign_times = []
+        for tx_hash in transaction_hashes:
+            tx_short_ids = tx_cache_key_to_short_ids.get(tx_hash_to_cache_key(tx_hash))
+            if tx_short_ids:
+                short_id = next(iter(tx_short_ids))
+                short_ids.append(short_id)
+                assign_times.append(short_id_assign_times.get(short_id, 0))
+            else:
+                short_ids.append(null_tx_sid)
+                assign_times.append(0)
+        return short_ids, assign_times
+
+    def get_transaction_contents_size(self) -> int:
+        return self._total_tx_contents_size
+
+    def evict_transactions_without_short_ids(self, max_bytes: int) -> Tuple[int, int]:
+        """
+        Drops contents of transactions without short ids, in the order they were added, until at least `max_bytes`
+        of contents are dropped. Blocks from the BDN reference transactions by short id, so these transactions
+        are the least needed ones.
+
+        Evicted transactions are still pending, so unlike transactions cleaned up after blocks they are not
+        tracked as removed: they are processed as new transactions if they are received or assigned a short id
+        again.
+
+        :param max_bytes: size of transaction contents to drop
+        :return: number of evicted transactions and size of their contents
+        """
+        evicted_transaction_keys = []
+        evicted_size = 0
+        for tx_hash in self.iter_transaction_hashes():
+            transaction_key = self.get_transaction_key(tx_hash)
+            if (
+                self.has_transaction_short_id_by_key(transaction_key)
+                or not self.has_transaction_contents_by_key(transaction_key)
+            ):
+                continue
+            evicted_transaction_keys.append(transaction_key)
+            evicted_size += len(self.get_transaction_by_key(transaction_key))
+            if evicted_size >= max_bytes:
+                break
+
+        for transaction_key in evicted_transaction_keys:
+            self.remove_transaction_contents_by_key(transaction_key)
+        return len(evicted_transaction_keys), evicted_size
+
+    def remove_transaction_contents_by_key(self, transaction_key: TransactionKey) -> int:
+        """
+        Drops transaction contents without tracking the transaction as removed.
+
+        :return: size of the dropped contents
+        """
+        if not self.has_transaction_contents_by_key(transaction_key):
+            return 0
+        contents_size = len(self.get_transaction_by_key(transaction_key))
+        del self._tx_cache_key_to_contents[transaction_key.transaction_cache_key]
+        self._total_tx_contents_size -= contents_size
+        return contents_size
+
     def set_transaction_contents_base_by_key(
         self,
         transaction_key: TransactionKey,
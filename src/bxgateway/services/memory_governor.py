@@ -0,0 +1,219 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+from prometheus_client import Counter
+
+from bxcommon.utils import memory_utils
+from bxcommon.utils.object_hash import Sha256Hash
+from bxcommon.utils.stats import stats_format
+from bxgateway import gateway_constants, log_messages
+from bxutils import logging
+
+if TYPE_CHECKING:
+    # pylint: disable=ungrouped-imports,cyclic-import
+    from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
+
+logger = logging.get_logger(__name__)
+
+TX_CONTENTS = "tx_contents"
+BLOCK_STORAGE = "block_storage"
+BLOCK_PARTS_STORAGE = "block_parts_storage"
+IN_PROGRESS_BLOCKS = "in_progress_blocks"
+BLOCK_RECOVERY = "block_recovery"
+BLOCK_QUEUING_SERVICES = "block_queuing_services"
+
+evicted_items = Counter(
+    "memory_governor_evicted_items",
+    "Number of items evicted by the memory governor to stay within the memory budget",
+    ["structure"]
+)
+evicted_bytes = Counter(
+    "memory_governor_evicted_bytes",
+    "Size of items evicted by the memory governor to stay within the memory budget",
+    ["structure"]
+)
+
+
+class MemoryGovernor:
+    """
+    Keeps the size of data cached by the gateway within a budget instead of restarting the gateway once memory
+    usage is too high.
+
+    When the tracked size of cached data approaches the budget, data the gateway can do without is evicted in
+    priority order: contents of the oldest transactions without short ids, block bodies all blockchain nodes
+    already have, and blocks awaiting recovery. With `--should-restart-on-high-memory`, the gateway is restarted
+    once its memory usage is above `CHECK_MEMORY_THRESHOLD_LIMIT`, with a budget only after
+    `MEMORY_MAX_OVER_LIMIT_CHECKS` consecutive checks despite evictions.
+    """
+
+    node: "AbstractGatewayNode"
+    budget_bytes: int
+    check_interval_s: int
+    over_limit_checks: int
+    evicted_items: Dict[str, int]
+    evicted_bytes: Dict[str, int]
+
+    _eviction_steps: List[Tuple[str, Callable[[int], Tuple[int, int]]]]
+
+    def __init__(self, node: "AbstractGatewayNode", budget_bytes: int) -> None:
+        self.node = node
+        self.budget_bytes = budget_bytes
+        if budget_bytes:
+            self.check_interval_s = gateway_constants.MEMORY_BUDGET_CHECK_INTERVAL_S
+        else:
+            self.check_interval_s = gateway_constants.CHECK_MEMORY_THRESHOLD_INTERVAL_S
+        self.over_limit_checks = 0
+        self.evicted_items = defaultdict(int)
+        self.evicted_bytes = defaultdict(int)
+
+        self._eviction_steps = [
+            (TX_CONTENTS, self._evict_tx_contents),
+            (BLOCK_STORAGE, self._evict_stale_blocks),
+            (BLOCK_PARTS_STORAGE, self._evict_stale_block_parts),
+            (BLOCK_RECOVERY, self._evict_recovering_blocks),
+        ]
+
+    def check_memory(self) -> int:
+        if self.budget_bytes:
+            self._check_budget()
+        if self.node.opts.should_restart_on_high_memory:
+            self._check_restart()
+        return self.check_interval_s
+
+    def evict(self, bytes_to_evict: int) -> Dict[str, Tuple[int, int]]:
+        """
+        Evicts data in priority order until at least `bytes_to_evict` are evicted or nothing is left to evict.
+
+        :return: number of evicted items and their size by evicted structure
+        """
+        evicted = {}
+        for structure, evict_func in self._eviction_steps:
+            if bytes_to_evict <= 0:
+                break
+            items, size = evict_func(bytes_to_evict)
+            if items:
+                evicted[structure] = (items, size)
+                self.evicted_items[structure] += items
+                self.evicted_bytes[structure] += size
+                evicted_items.labels(structure).inc(items)
+                evicted_bytes.labels(structure).inc(size)
+                bytes_to_evict -= size
+        return evicted
+
+    def get_tracked_sizes(self) -> Dict[str, int]:
+        node = self.node
+        return {
+            TX_CONTENTS: node.get_tx_service().get_transaction_contents_size(),
+            BLOCK_STORAGE: sum(
+                len(block.rawbytes()) for block in node.block_storage.contents.values() if block is not None
+            ),
+            BLOCK_PARTS_STORAGE: sum(
+                _get_block_parts_size(block_parts) for block_parts in self._get_block_parts_storage().values()
+            ),
+            IN_PROGRESS_BLOCKS: sum(
+                len(item.ciphertext or b"") + len(item.payload or b"")
+                for item in node.in_progress_blocks.contents.values()
+            ),
+            BLOCK_RECOVERY: node.block_recovery_service.get_blocks_size(),
+            BLOCK_QUEUING_SERVICES: sum(
+                queuing_service.get_estimated_memory_size()
+                for queuing_service in node.block_queuing_service_manager
+            ),
+        }
+
+    def get_info(self) -> Dict[str, Any]:
+        return {
+            "budget": stats_format.byte_count(self.budget_bytes),
+            "tracked_sizes": {
+                structure: stats_format.byte_count(size) for structure, size in self.get_tracked_sizes().items()
+            },
+            "evicted_items": dict(self.evicted_items),
+            "evicted_bytes": {
+                structure: stats_format.byte_count(size) for structure, size in self.evicted_bytes.items()
+            },
+            "over_limit_checks": self.over_limit_checks,
+        }
+
+    def _evict_tx_contents(self, max_bytes: int) -> Tuple[int, int]:
+        return self.node.get_tx_service().evict_transactions_without_short_ids(max_bytes)
+
+    def _check_budget(self) -> None:
+        tracked_size = sum(self.get_tracked_sizes().values())
+        if tracked_size < self.budget_bytes * gateway_constants.MEMORY_EVICTION_THRESHOLD:
+            return
+
+        evicted = self.evict(int(tracked_size - self.budget_bytes * gateway_constants.MEMORY_EVICTION_TARGET))
+        logger.warning(
+            log_messages.MEMORY_BUDGET_EVICTION,
+            stats_format.byte_count(tracked_size),
+            stats_format.byte_count(self.budget_bytes),
+            ", ".join(
+                f"{structure}: {items} ({stats_format.byte_count(size)})"
+                for structure, (items, size) in evicted.items()
+            ) or "nothing"
+        )
+
+    def _check_restart(self) -> None:
+        if memory_utils.get_app_memory_usage() <= gateway_constants.CHECK_MEMORY_THRESHOLD_LIMIT:
+            self.over_limit_checks = 0
+            return
+
+        self.over_limit_checks += 1
+        # evictions of the following checks may still bring memory usage down
+        if self.budget_bytes and self.over_limit_checks < gateway_constants.MEMORY_MAX_OVER_LIMIT_CHECKS:
+            return
+        logger.warning(log_messages.NODE_EXCEEDS_MEMORY)
+        self.node.should_force_exit = True
+        self.node.should_restart_on_high_memory = True
+
+    def _evict_tx_contents(self, max_bytes: int) -> Tuple[int, int]:
+        return self.node.get_tx_service().evict_transactions_without_short_ids(max_bytes)
+
+    def _evict_stale_blocks(self, max_bytes: int) -> Tuple[int, int]:
+        block_queuing_service_manager = self.node.block_queuing_service_manager
+
+        stale_block_hashes: List[Sha256Hash] = []
+        evicted_size = 0
+        for block_hash, block in self.node.block_storage.contents.items():
+            if block is None or not block_queuing_service_manager.is_seen_by_all_blockchain_nodes(block_hash):
+                continue
+            stale_block_hashes.append(block_hash)
+            evicted_size += len(block.rawbytes())
+            if evicted_size >= max_bytes:
+                break
+
+        for block_hash in stale_block_hashes:
+            block_queuing_service_manager.remove(block_hash)
+        return len(stale_block_hashes), evicted_size
+
+    def _evict_stale_block_parts(self, max_bytes: int) -> Tuple[int, int]:
+        block_parts_storage = self._get_block_parts_storage()
+        block_queuing_service_manager = self.node.block_queuing_service_manager
+
+        stale_block_hashes: List[Sha256Hash] = []
+        evicted_size = 0
+        for block_hash, block_parts in block_parts_storage.items():
+            if not block_queuing_service_manager.is_seen_by_all_blockchain_nodes(block_hash):
+                continue
+            stale_block_hashes.append(block_hash)
+            evicted_size += _get_block_parts_size(block_parts)
+            if evicted_size >= max_bytes:
+                break
+
+        for block_hash in stale_block_hashes:
+            self.node.block_parts_storage.remove_item(block_hash)
+        return len(stale_block_hashes), evicted_size
+
+    def _evict_recovering_blocks(self, max_bytes: int) -> Tuple[int, int]:
+        return self.node.block_recovery_service.evict_oldest_blocks(max_bytes)
+
+    def _get_block_parts_storage(self) -> Dict[Sha256Hash, Any]:
+        # only Ethereum gateways store blocks as separate header and body parts
+        block_parts_storage = getattr(self.node, "block_parts_storage", None)
+        if block_parts_storage is None:
+            return {}
+        return block_parts_storage.contents
+
+
+def _get_block_parts_size(block_parts) -> int:
+    return len(block_parts.block_header_bytes or b"") + len(block_parts.block_body_bytes or b"")
@@ -7,6 +7,7 @@ from bxcommon.utils.stats.block_stat_event_type import BlockStatEventType
 from bxcommon.utils.stats.block_statistics_service import block_stats
 from bxcommon.utils.stats.stat_block_type import StatBlockType
 from bxgateway import log_messages
+from bxgateway.abstract_message_converter import BlockDecompressionState
 from bxgateway.connections.abstract_relay_connection import AbstractRelayConnection
 from bxgateway.services.block_processing_service import BlockProcessingService
 from bxgateway.services.block_recovery_service import RecoveredTxsSource
@@ -30,7 +31,7 @@ class OntBlockProcessingService(BlockProcessingService):
 
     def retry_broadcast_recovered_blocks(self, connection):
         if self._node.block_recovery_service.recovered_blocks and self._node.opts.has_fully_updated_tx_service:
-            for msg, recovered_txs_source in self._node.block_recovery_service.recovered_blocks:
+            for msg, recovered_txs_source, decompression_state in self._node.block_recovery_service.recovered_blocks:
                 is_consensus_msg, = struct.unpack_from("?", msg[8:9])
                 if is_consensus_msg and self._node.opts.is_consensus:
                     self._handle_decrypted_consensus_block(
@@ -44,7 +45,8 @@ class OntBlockProcessingService(BlockProcessingService):
                         msg,
                         connection,
                         recovered=True,
-                        recovered_txs_source=recovered_txs_source
+                        recovered_txs_source=recovered_txs_source,
+                        decompression_state=decompression_state
                     )
 
             self._node.block_recovery_service.clean_up_recovered_blocks()
@@ -55,7 +57,8 @@ class OntBlockProcessingService(BlockProcessingService):
         connection: AbstractRelayConnection,
         encrypted_block_hash_hex: Optional[str] = None,
         recovered: bool = False,
-        recovered_txs_source: Optional[RecoveredTxsSource] = None
+        recovered_txs_source: Optional[RecoveredTxsSource] = None,
+        decompression_state: Optional[BlockDecompressionState] = None
     ):
         is_consensus_msg, = struct.unpack_from("?", bx_block[8:9])
         if is_consensus_msg and self._node.opts.is_consensus:
@@ -72,7 +75,8 @@ class OntBlockProcessingService(BlockProcessingService):
                 connection,
                 encrypted_block_hash_hex,
                 recovered,
-                recovered_txs_source
+                recovered_txs_source,
+                decompression_state
             )
 
     def _handle_decrypted_consensus_block(
@@ -0,0 +1,149 @@
+"""
+Snapshot of the gateway transaction service, written to disk periodically and on shutdown so that a restarted
+gateway starts with the transactions and short ids it had before instead of an empty transaction service.
+
+File layout (little endian):
+    header: magic, format version, network number, snapshot time, transactions count
+    entry per transaction: transaction hash, short ids count, contents length (CONTENTS_UNKNOWN if the gateway
+        did not have the contents), short ids, short id assign times, contents
+
+The file is memory mapped when loaded, and transaction contents are passed to the transaction service as views
+of the mapped file instead of being read into separately allocated buffers.
+"""
+import mmap
+import os
+import struct
+import time
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.utils import crypto
+from bxcommon.utils.object_hash import Sha256Hash
+
+SNAPSHOT_MAGIC = b"BXTS"
+SNAPSHOT_FORMAT_VERSION = 1
+CONTENTS_UNKNOWN = 0xffffffff
+
+_HEADER = struct.Struct("<4sHLdL")
+_ENTRY_HEADER = struct.Struct(f"<{crypto.SHA256_HASH_LEN}sHL")
+_SHORT_ID = struct.Struct("<L")
+_ASSIGN_TIME = struct.Struct("<d")
+
+
+class SnapshotLoadResult(NamedTuple):
+    snapshot_time: float
+    transactions_count: int
+    short_ids_count: int
+    expired_short_ids_count: int
+
+
+def serialize_tx_service(
+    tx_service: TransactionService, network_num: int
+) -> List[Union[bytes, bytearray, memoryview]]:
+    """
+    Serializes the transaction service into snapshot pieces that are written to the file one by one.
+    Pieces reference transaction contents instead of copying them into a single buffer.
+    """
+    pieces: List[Union[bytes, bytearray, memoryview]] = []
+    transactions_count = 0
+    for tx_hash in tx_service.iter_transaction_hashes():
+        transaction_key = tx_service.get_transaction_key(tx_hash)
+        short_ids = list(tx_service.get_short_ids_by_key(transaction_key))
+        contents = None
+        if tx_service.has_transaction_contents_by_key(transaction_key):
+            contents = tx_service.get_transaction_by_key(transaction_key)
+        if contents is None and not short_ids:
+            continue
+
+        pieces.append(
+            _ENTRY_HEADER.pack(
+                bytes(tx_hash.binary), len(short_ids), CONTENTS_UNKNOWN if contents is None else len(contents)
+            )
+        )
+        if short_ids:
+            pieces.append(struct.pack(f"<{len(short_ids)}L", *short_ids))
+            pieces.append(
+                struct.pack(
+                    f"<{len(short_ids)}d", *(tx_service.get_short_id_assign_time(short_id) for short_id in short_ids)
+                )
+            )
+        if contents is not None:
+            pieces.append(contents)
+        transactions_count += 1
+
+    pieces.insert(
+        0, _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, network_num, time.time(), transactions_count)
+    )
+    return pieces
+
+
+def write_snapshot_file(path: str, pieces: Iterable[Union[bytes, bytearray, memoryview]]) -> None:
+    """
+    Writes snapshot pieces to the file one by one and replaces the snapshot file atomically, so a gateway
+    stopped while writing keeps the previous snapshot
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        for piece in pieces:
+            f.write(piece)
+    os.replace(temp_path, path)
+
+
+def load_snapshot_file(
+    tx_service: TransactionService, path: str, network_num: int, max_age_s: float, sid_expire_time: float
+) -> Optional[SnapshotLoadResult]:
+    """
+    Loads transactions of a snapshot file into the transaction service.
+
+    Short ids assigned more than `sid_expire_time` seconds ago are skipped, since they were expired by the BDN.
+    Remaining short ids are assigned anew, so they expire up to `max_age_s` later than on the BDN.
+
+    :return: load result, None if the file does not exist, is older than `max_age_s` or belongs to another network
+    :raise ValueError: if the file is corrupted
+    """
+    if not os.path.exists(path) or os.path.getsize(path) < _HEADER.size:
+        return None
+
+    with open(path, "rb") as f:
+        # copy on write mapping, since transaction contents are expected to be writable buffers
+        snapshot_buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    snapshot = memoryview(snapshot_buffer)
+
+    magic, version, snapshot_network_num, snapshot_time, transactions_count = _HEADER.unpack_from(snapshot, 0)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported transaction service snapshot format: {magic!r}, version {version}.")
+    now = time.time()
+    if snapshot_network_num != network_num or now - snapshot_time > max_age_s:
+        return None
+
+    short_ids_count = 0
+    expired_short_ids_count = 0
+    min_assign_time = now - sid_expire_time
+    off = _HEADER.size
+    try:
+        for _ in range(transactions_count):
+            tx_hash_bytes, tx_short_ids_count, contents_length = _ENTRY_HEADER.unpack_from(snapshot, off)
+            off += _ENTRY_HEADER.size
+            short_ids_off = off
+            assign_times_off = short_ids_off + tx_short_ids_count * _SHORT_ID.size
+            off = assign_times_off + tx_short_ids_count * _ASSIGN_TIME.size
+
+            transaction_key = tx_service.get_transaction_key(Sha256Hash(bytearray(tx_hash_bytes)))
+            for i in range(tx_short_ids_count):
+                short_id, = _SHORT_ID.unpack_from(snapshot, short_ids_off + i * _SHORT_ID.size)
+                assign_time, = _ASSIGN_TIME.unpack_from(snapshot, assign_times_off + i * _ASSIGN_TIME.size)
+                if assign_time < min_assign_time:
+                    expired_short_ids_count += 1
+                    continue
+                tx_service.assign_short_id_by_key(transaction_key, short_id)
+                short_ids_count += 1
+
+            if contents_length != CONTENTS_UNKNOWN:
+                if off + contents_length > len(snapshot):
+                    raise ValueError("Transaction service snapshot is truncated.")
+                tx_service.set_transaction_contents_by_key(transaction_key, snapshot[off:off + contents_length])
+                off += contents_length
+    except struct.error as e:
+        raise ValueError(f"Transaction service snapshot is truncated: {e}") from e
+
+    return SnapshotLoadResult(snapshot_time, transactions_count, short_ids_count, expired_short_ids_count)
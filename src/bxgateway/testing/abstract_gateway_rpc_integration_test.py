@@ -1,4 +1,5 @@
 import datetime
+import json
 import time
 import unittest
 from abc import abstractmethod
@@ -20,6 +21,7 @@ from bxgateway.connections.eth.eth_node_connection import EthNodeConnection
 from bxgateway.messages.eth.eth_normal_message_converter import EthNormalMessageConverter
 from bxgateway.testing.mocks.mock_blockchain_connection import MockMessageConverter
 from bxutils import constants as utils_constants
+from bxutils.encoding.json_encoder import Case
 from bxcommon.models.bdn_account_model_base import BdnAccountModelBase
 from bxcommon.models.bdn_service_model_base import BdnServiceModelBase, FeedServiceModelBase
 from bxcommon.models.bdn_service_model_config_base import BdnServiceModelConfigBase, BdnFeedServiceModelConfigBase
@@ -34,6 +36,7 @@ from bxcommon.test_utils.helpers import async_test, AsyncMock
 from bxcommon.utils import convert
 from bxcommon.utils.object_hash import Sha256Hash
 from bxgateway.gateway_opts import GatewayOpts
+from bxgateway.rpc import rpc_request_types
 from bxgateway.rpc.gateway_status_details_level import GatewayStatusDetailsLevel
 from bxgateway.rpc.requests import gateway_memory_rpc_request
 from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
@@ -56,6 +59,15 @@ TRANSACTION_HASH = "74daac93cf5ff756e6fd5d10926a466533b4c901f64883e7f8b6b4a37cca
 ACCOUNT_ID = "bx_premium"
 
 
+class GatewayMethodRequest(BxJsonRpcRequest):
+    """
+    Request of an RPC method implemented only by the gateway, serialized with the method name
+    """
+
+    def to_jsons(self, case: Case = Case.SNAKE) -> str:
+        return json.dumps({"jsonrpc": "2.0", "id": self.id, "method": self.method, "params": self.params})
+
+
 class AbstractGatewayRpcIntegrationTest(AbstractTestCase):
     def __init__(self, *args, **kwargs):
         # hack to avoid unit test discovery of this class
@@ -185,6 +197,42 @@ class AbstractGatewayRpcIntegrationTest(AbstractTestCase):
             self.gateway_node.broadcast_messages[1][0].tx_hash()
         )
 
+    @async_test
+    async def test_blxr_batch_tx(self):
+        self.gateway_node.message_converter = EthNormalMessageConverter()
+        self.gateway_node.network_num = 5
+
+        result = await self.request(GatewayMethodRequest(
+            "1",
+            rpc_request_types.BLXR_BATCH_TX,
+            {
+                "transactions": [
+                    convert.bytes_to_hex(eth_fixtures.LEGACY_TRANSACTION),
+                    "zz",
+                    convert.bytes_to_hex(eth_fixtures.ACL_TRANSACTION),
+                    convert.bytes_to_hex(eth_fixtures.LEGACY_TRANSACTION),
+                ]
+            }
+        ))
+        self.assertEqual("1", result.id)
+        self.assertIsNone(result.error)
+        transaction_results = result.result["transactions"]
+        self.assertEqual(4, len(transaction_results))
+        self.assertEqual(eth_fixtures.LEGACY_TRANSACTION_HASH, transaction_results[0]["tx_hash"])
+        self.assertIn("error", transaction_results[1])
+        self.assertEqual(eth_fixtures.ACL_TRANSACTION_HASH, transaction_results[2]["tx_hash"])
+        self.assertEqual(eth_fixtures.LEGACY_TRANSACTION_HASH, transaction_results[3]["tx_hash"])
+
+        self.assertEqual(2, len(self.gateway_node.broadcast_messages))
+        self.assertEqual(
+            Sha256Hash(convert.hex_to_bytes(eth_fixtures.LEGACY_TRANSACTION_HASH)),
+            self.gateway_node.broadcast_messages[0][0].tx_hash()
+        )
+        self.assertEqual(
+            Sha256Hash(convert.hex_to_bytes(eth_fixtures.ACL_TRANSACTION_HASH)),
+            self.gateway_node.broadcast_messages[1][0].tx_hash()
+        )
+
     @async_test
     async def test_blxr_tx_expired(self):
         self.gateway_node.account_model.is_account_valid = MagicMock(return_value=False)
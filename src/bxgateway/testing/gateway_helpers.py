@@ -9,7 +9,7 @@ from bxcommon.test_utils.helpers import COOKIE_FILE_PATH, get_common_opts, \
     BTC_COMPACT_BLOCK_DECOMPRESS_MIN_TX_COUNT
 from bxgateway.connections.abstract_gateway_blockchain_connection import AbstractGatewayBlockchainConnection
 from bxgateway.connections.abstract_gateway_node import AbstractGatewayNode
-from bxgateway import argument_parsers
+from bxgateway import argument_parsers, gateway_constants
 from bxgateway.gateway_opts import GatewayOpts
 
 
@@ -60,9 +60,13 @@ def get_gateway_opts(
     ws=False,
     ws_host=constants.LOCALHOST,
     ws_port=28333,
+    ws_max_in_flight_requests: int = gateway_constants.WS_MAX_IN_FLIGHT_REQUESTS,
     request_remote_transaction_streaming: bool = False,
     enable_block_compression: bool = True,
     filter_txs_factor: float = 0,
+    eth_tx_batch_interval_ms: float = 0,
+    eth_tx_batch_max_size: int = gateway_constants.ETH_TX_BATCH_MAX_SIZE,
+    eth_block_fetch_hedge_delay_ms: float = gateway_constants.ETH_BLOCK_FETCH_HEDGE_DELAY_MS,
     blockchain_protocol: str = "Ethereum",
     should_restart_on_high_memory: bool = False,
     account_id: str = constants.DECODED_EMPTY_ACCOUNT_ID,
@@ -152,6 +156,7 @@ def get_gateway_opts(
             "ws": ws,
             "ws_host": constants.LOCALHOST,
             "ws_port": 28333,
+            "ws_max_in_flight_requests": ws_max_in_flight_requests,
             "account_id": account_id,
             "ipc": False,
             "ipc_file": "bxgateway.ipc",
@@ -161,6 +166,13 @@ def get_gateway_opts(
             "request_recovery": True,
             "enable_block_compression": enable_block_compression,
             "filter_txs_factor": filter_txs_factor,
+            "eth_tx_batch_interval_ms": eth_tx_batch_interval_ms,
+            "eth_tx_batch_max_size": eth_tx_batch_max_size,
+            "eth_block_fetch_hedge_delay_ms": eth_block_fetch_hedge_delay_ms,
+            "import_profile": False,
+            "block_conversion_processes": 0,
+            "tx_service_snapshot_interval_s": 0,
+            "memory_budget_mb": 0,
             "min_peer_relays_count": None,
             "should_restart_on_high_memory": should_restart_on_high_memory,
         }
@@ -1,6 +1,6 @@
 # pyre-ignore-all-errors
 import datetime
-from typing import Tuple, Optional, Union
+from typing import Tuple, Optional, Union, List
 
 from bxcommon.messages.bloxroute.block_hash_message import BlockHashMessage
 from bxcommon.messages.bloxroute.tx_message import TxMessage
@@ -47,6 +47,12 @@ class MockMessageConverter(AbstractMessageConverter):
         block_message = MockBlockMessage(buf=bx_block_msg)
         return BlockDecompressionResult(block_message, block_message.block_hash(), [], [])
 
+    def block_message_from_bytes(self, block_bytes: Union[bytearray, memoryview]) -> MockBlockMessage:
+        return MockBlockMessage(buf=bytearray(block_bytes))
+
+    def get_block_transaction_hashes(self, block_msg) -> List[Sha256Hash]:
+        return []
+
     def bdn_tx_to_bx_tx(
         self,
         raw_tx: Union[bytes, bytearray, memoryview],
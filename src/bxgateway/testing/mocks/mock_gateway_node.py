@@ -23,6 +23,7 @@ from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
 from bxgateway.services.abstract_block_cleanup_service import AbstractBlockCleanupService
 from bxgateway.services.btc.abstract_btc_block_cleanup_service import AbstractBtcBlockCleanupService
 from bxgateway.services.btc.btc_block_queuing_service import BtcBlockQueuingService
+from bxgateway.services.eth.eth_header_chain_index import EthHeaderChainIndex
 from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxgateway.services.push_block_queuing_service import PushBlockQueuingService
 from bxgateway.testing.mocks.mock_blockchain_connection import MockMessageConverter
@@ -69,6 +70,7 @@ class MockGatewayNode(AbstractGatewayNode):
         self.requester = MagicMock()
         self.has_active_blockchain_peer = MagicMock(return_value=True)
         self.min_tx_from_node_gas_price = MagicMock()
+        self.header_chain_index = EthHeaderChainIndex()
 
     def broadcast(self, msg, broadcasting_conn=None, prepend_to_queue=False, connection_types=None):
         if connection_types is None:
@@ -29,8 +29,15 @@ class MessageConversionError(Exception):
 
         self.msg_hash = msg_hash
         self.conversion_type = conversion_type
+        self._args = (msg_hash, src_msg_type, target_msg_type, error, conversion_type)
         super(MessageConversionError, self).__init__(self.error_msg)
 
+    def __reduce__(self):
+        # errors raised in block conversion worker processes are pickled to be re-raised in the main process,
+        # and the wrapped error may not be picklable
+        msg_hash, src_msg_type, target_msg_type, error, conversion_type = self._args
+        return self.__class__, (msg_hash, src_msg_type, target_msg_type, str(error), conversion_type)
+
 
 def btc_block_decompression_error(msg_hash: Sha256Hash, error: Union[Exception, str]) -> "MessageConversionError":
     return MessageConversionError(
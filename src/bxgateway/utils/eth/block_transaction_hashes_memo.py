@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from typing import List, Tuple, Optional, Iterable, Union
+
+from bxcommon.utils.blockchain_utils.eth import eth_common_utils
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import eth_constants
+from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
+
+
+def hash_transactions(txs_bytes: Iterable[Union[bytes, bytearray, memoryview]]) -> List[Sha256Hash]:
+    return [Sha256Hash(eth_common_utils.keccak_hash(tx_bytes)) for tx_bytes in txs_bytes]
+
+
+class BlockTransactionHashesMemo:
+    """
+    Keeps Keccak hashes of transactions of the most recent blocks, so transactions of a block are hashed
+    once and the hashes are reused by block compression, block cleanup and feeds.
+
+    Hashes are keyed by block hash and kept in transaction index order. Time spent on hashing
+    transactions of each block is kept as well to report the hashing time saved by each reuse.
+    """
+
+    _tx_hashes: "OrderedDict[Sha256Hash, Tuple[List[Sha256Hash], float]]"
+
+    def __init__(self, max_size: int = eth_constants.ETH_BLOCK_TX_HASHES_MEMO_SIZE) -> None:
+        self.max_size = max_size
+        self._tx_hashes = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tx_hashes)
+
+    def __contains__(self, block_hash: Sha256Hash) -> bool:
+        return block_hash in self._tx_hashes
+
+    def get(self, block_hash: Sha256Hash) -> Optional[List[Sha256Hash]]:
+        entry = self._tx_hashes.get(block_hash)
+        if entry is None:
+            return None
+        self._tx_hashes.move_to_end(block_hash)
+        tx_hashes, hashing_time = entry
+        eth_gateway_stats_service.log_tx_hash_memo_hit(len(tx_hashes), hashing_time)
+        return tx_hashes
+
+    def add(self, block_hash: Sha256Hash, tx_hashes: List[Sha256Hash], hashing_time: float) -> None:
+        eth_gateway_stats_service.log_tx_hash_memo_miss(hashing_time)
+        self._tx_hashes[block_hash] = (tx_hashes, hashing_time)
+        self._tx_hashes.move_to_end(block_hash)
+        while len(self._tx_hashes) > self.max_size:
+            self._tx_hashes.popitem(last=False)
+
+    def get_or_hash(
+        self, block_hash: Sha256Hash, txs_bytes: Iterable[Union[bytes, bytearray, memoryview]]
+    ) -> List[Sha256Hash]:
+        """
+        Returns hashes of the block transactions, hashing raw transactions if the block is not in the memo.
+
+        :param block_hash: block hash
+        :param txs_bytes: RLP encoded transactions of the block in transaction index order
+        :return: transaction hashes in transaction index order
+        """
+        tx_hashes = self.get(block_hash)
+        if tx_hashes is not None:
+            return tx_hashes
+
+        start_time = time.time()
+        tx_hashes = hash_transactions(txs_bytes)
+        self.add(block_hash, tx_hashes, time.time() - start_time)
+        return tx_hashes
+
+    def clear(self) -> None:
+        self._tx_hashes.clear()
+
+
+block_transaction_hashes_memo = BlockTransactionHashesMemo()
@@ -1,3 +1,5 @@
+from typing import List, Union, Iterator
+
 from bxcommon.utils.blockchain_utils.eth import rlp_utils
 
 # pylint: disable=invalid-name
@@ -15,3 +17,69 @@ def parse_transaction_bytes(tx_bytes: memoryview) -> TransactionsEthProtocolMess
     buf[0:len(txs_prefix)] = txs_prefix
     buf[len(txs_prefix):] = tx_bytes
     return TransactionsEthProtocolMessage(buf)
+
+
+def get_transactions_bytes(msg: TransactionsEthProtocolMessage) -> List[memoryview]:
+    """
+    Splits Ethereum transactions message into RLP encoded transactions without deserializing them
+    """
+    msg_bytes = memoryview(msg.rawbytes())
+    _, txs_length, txs_start = rlp_utils.consume_length_prefix(msg_bytes, 0)
+    txs_bytes = msg_bytes[txs_start:txs_start + txs_length]
+
+    txs = []
+    tx_start = 0
+    while tx_start < len(txs_bytes):
+        _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(txs_bytes, tx_start)
+        txs.append(txs_bytes[tx_start:tx_item_start + tx_item_length])
+        tx_start = tx_item_start + tx_item_length
+    return txs
+
+
+def iter_transactions_bytes_slices(
+    msg: TransactionsEthProtocolMessage, max_slice_size: int
+) -> Iterator[List[memoryview]]:
+    """
+    Lazily splits Ethereum transactions message into slices of RLP encoded transactions without deserializing them.
+
+    Each slice holds transactions of at most `max_slice_size` bytes in total, except for a single
+    transaction larger than that, which is returned as a slice of its own.
+    """
+    msg_bytes = memoryview(msg.rawbytes())
+    _, txs_length, txs_start = rlp_utils.consume_length_prefix(msg_bytes, 0)
+    txs_bytes = msg_bytes[txs_start:txs_start + txs_length]
+
+    txs = []
+    slice_size = 0
+    tx_start = 0
+    while tx_start < len(txs_bytes):
+        _, tx_item_length, tx_item_start = rlp_utils.consume_length_prefix(txs_bytes, tx_start)
+        tx_end = tx_item_start + tx_item_length
+        if txs and slice_size + tx_end - tx_start > max_slice_size:
+            yield txs
+            txs = []
+            slice_size = 0
+        txs.append(txs_bytes[tx_start:tx_end])
+        slice_size += tx_end - tx_start
+        tx_start = tx_end
+
+    if txs:
+        yield txs
+
+
+def build_transactions_message(
+    txs: List[Union[bytes, bytearray, memoryview]]
+) -> TransactionsEthProtocolMessage:
+    """
+    Builds Ethereum transactions message from RLP encoded transactions, copying each of them once
+    """
+    txs_size = sum(len(tx) for tx in txs)
+    txs_prefix = rlp_utils.get_length_prefix_list(txs_size)
+
+    buf = bytearray(len(txs_prefix) + txs_size)
+    buf[0:len(txs_prefix)] = txs_prefix
+    offset = len(txs_prefix)
+    for tx in txs:
+        buf[offset:offset + len(tx)] = tx
+        offset += len(tx)
+    return TransactionsEthProtocolMessage(buf)
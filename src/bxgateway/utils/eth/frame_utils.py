@@ -6,6 +6,9 @@ from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxcommon.utils.blockchain_utils.eth.crypto_utils import get_padded_len_16
 from bxgateway.utils.eth.frame import Frame
 
+# rlp encoded message type of up to 8 bytes
+MAX_ENCODED_MSG_TYPE_LEN = 9
+
 
 def get_frames(msg_type, payload_bytes, protocol_id=eth_common_constants.DEFAULT_FRAME_PROTOCOL_ID,
                window_size=eth_common_constants.DEFAULT_FRAME_SIZE):
@@ -116,7 +119,8 @@ def parse_frame_body(body_bytes, has_msg_type):
     msg_type = None
 
     if has_msg_type:
-        item, end = rlp.codec.consume_item(body_bytes, 0)
+        # only bytes of the message type are copied, body may be a memoryview of a large frame
+        item, end = rlp.codec.consume_item(bytes(body_bytes[:MAX_ENCODED_MSG_TYPE_LEN]), 0)
         msg_type = rlp.sedes.big_endian_int.deserialize(item)
         payload = body_bytes[end:]
     else:
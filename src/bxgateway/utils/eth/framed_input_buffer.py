@@ -1,7 +1,7 @@
 from bxcommon.exceptions import ParseError
 from bxcommon.utils.buffers.input_buffer import InputBuffer
 from bxgateway.utils.eth import frame_utils
-from bxcommon.utils.blockchain_utils.eth import rlp_utils, eth_common_constants
+from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxgateway.utils.eth.rlpx_cipher import RLPxCipher
 
 
@@ -67,7 +67,10 @@ class FramedInputBuffer(object):
         if self._receiving_frame and input_buffer.length >= self._current_frame_enc_body_size:
             frame_enc_body_bytes = input_buffer.remove_bytes(self._current_frame_enc_body_size)
 
-            body = self._rlpx_cipher.decrypt_frame_body(frame_enc_body_bytes, self._current_frame_body_size)
+            # frame body is decrypted in place, in the bytes removed from the input buffer
+            body = self._rlpx_cipher.decrypt_frame_body_into(
+                frame_enc_body_bytes, self._current_frame_body_size, memoryview(frame_enc_body_bytes)
+            )
 
             msg_type_is_expected = not self._chunked_frames_in_progress or self._current_frame_sequence_id == 0
             payload, msg_type = frame_utils.parse_frame_body(body, msg_type_is_expected)
@@ -75,7 +78,7 @@ class FramedInputBuffer(object):
             if msg_type_is_expected:
                 self._current_msg_type = msg_type
 
-            self._payload_buffer.add_bytes(bytearray(rlp_utils.str_to_bytes(payload)))
+            self._payload_buffer.add_bytes(bytearray(payload))
 
             if not self._chunked_frames_in_progress:
                 self._full_message_received = True
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from typing import List, Tuple, NamedTuple, Optional
+
+from bxcommon.utils.blockchain_utils.eth import eth_common_constants
+from bxgateway import eth_constants
+from bxgateway.messages.eth.protocol.eth_protocol_message import EthProtocolMessage
+from bxgateway.utils.eth import frame_utils
+
+
+class FramedMessage(NamedTuple):
+    """
+    Unencrypted RLPx frames of a message: (header, padded body) bytes of each frame.
+    """
+    frames: List[Tuple[bytes, bytes]]
+
+
+def frame_message(
+    msg: EthProtocolMessage,
+    protocol_id: int = eth_common_constants.DEFAULT_FRAME_PROTOCOL_ID,
+    window_size: int = eth_common_constants.DEFAULT_FRAME_SIZE
+) -> FramedMessage:
+    frames = frame_utils.get_frames(msg.msg_type, msg.rawbytes(), protocol_id, window_size)
+    assert frames
+    return FramedMessage([(frame.get_header(), frame.get_body()) for frame in frames])
+
+
+class FramedMessageCache:
+    """
+    Keeps unencrypted frames of the most recently sent messages, so a message that is sent to several
+    Ethereum peers is split into frames and RLP encoded only once. Only encryption is done per connection.
+
+    Messages are keyed by identity. Cache entries hold a reference to the message,
+    so the identity of a cached message cannot be reused by another object.
+    """
+
+    _framed_messages: "OrderedDict[int, Tuple[EthProtocolMessage, FramedMessage]]"
+
+    def __init__(self, max_size: int = eth_constants.ETH_FRAMED_MESSAGE_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._framed_messages = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._framed_messages)
+
+    def get(self, msg: EthProtocolMessage) -> Optional[FramedMessage]:
+        entry = self._framed_messages.get(id(msg))
+        if entry is None or entry[0] is not msg:
+            return None
+        self._framed_messages.move_to_end(id(msg))
+        return entry[1]
+
+    def get_or_frame(self, msg: EthProtocolMessage) -> Tuple[FramedMessage, bool]:
+        """
+        Returns frames of the message, splitting the message into frames if it is not in the cache.
+
+        :param msg: message to send
+        :return: tuple (frames of the message, flag indicating if frames were found in the cache)
+        """
+        framed_message = self.get(msg)
+        if framed_message is not None:
+            return framed_message, True
+
+        framed_message = frame_message(msg)
+        self._framed_messages[id(msg)] = (msg, framed_message)
+        while len(self._framed_messages) > self.max_size:
+            self._framed_messages.popitem(last=False)
+        return framed_message, False
+
+    def clear(self) -> None:
+        self._framed_messages.clear()
+
+
+framed_message_cache = FramedMessageCache()
@@ -2,7 +2,6 @@ import os
 import random
 import struct
 import sys
-import pyelliptic
 from Crypto.Cipher import AES
 import blxr_rlp as rlp
 from blxr_rlp import sedes
@@ -342,11 +341,11 @@ class RLPxCipher(object):
         else:
             self._egress_mac, self._ingress_mac = mac2, mac1
 
-        iv = "\x00" * eth_common_constants.IV_LEN
-        self._aes_enc = pyelliptic.Cipher(self._aes_secret, iv, eth_common_constants.CIPHER_ENCRYPT_DO,
-                                          ciphername=eth_common_constants.RLPX_CIPHER_NAME)
-        self._aes_dec = pyelliptic.Cipher(self._aes_secret, iv, eth_common_constants.CIPHER_DECRYPT_DO,
-                                          ciphername=eth_common_constants.RLPX_CIPHER_NAME)
+        # aes-256-ctr with zero iv; unlike pyelliptic, pycryptodome ciphers accept any buffer
+        # and can write to a preallocated output buffer, so frames are not copied to bytes first
+        iv = bytes(eth_common_constants.IV_LEN)
+        self._aes_enc = AES.new(self._aes_secret, AES.MODE_CTR, nonce=b"", initial_value=iv)
+        self._aes_dec = AES.new(self._aes_secret, AES.MODE_CTR, nonce=b"", initial_value=iv)
         self._mac_enc = AES.new(self.mac_secret, AES.MODE_ECB).encrypt
 
         self._is_ready = True
@@ -364,28 +363,74 @@ class RLPxCipher(object):
         if not self._is_ready:
             raise CipherNotInitializedError(f"failed to encrypt frame {frame}, the cipher was never initialized!")
 
-        header = frame.get_header()
-        body = frame.get_body()
+        return self.encrypt_frame_bytes(frame.get_header(), frame.get_body())
+
+    def encrypt_frame_bytes(self, header, body):
+        """
+        Encrypts frame from already encoded frame header and padded frame body
+        :param header: frame header bytes
+        :param body: frame body bytes, padded to 16-byte boundary
+        :return: encrypted frame
+        """
+
+        if not self._is_ready:
+            raise CipherNotInitializedError("failed to encrypt frame, the cipher was never initialized!")
+
+        output = bytearray(self.get_encrypted_frame_size(len(body)))
+        self.encrypt_frame_bytes_into(header, body, memoryview(output))
+        return output
+
+    def encrypt_frame_bytes_into(self, header, body, output):
+        """
+        Encrypts frame from already encoded frame header and padded frame body, writing encrypted frame
+        directly to the output buffer
+        :param header: frame header bytes
+        :param body: frame body bytes, padded to 16-byte boundary
+        :param output: writable memoryview of at least get_encrypted_frame_size(len(body)) bytes
+        :return: number of bytes written
+        """
+
+        if not self._is_ready:
+            raise CipherNotInitializedError("failed to encrypt frame, the cipher was never initialized!")
+
+        hdr_len = eth_common_constants.FRAME_HDR_DATA_LEN
+        mac_len = eth_common_constants.FRAME_MAC_LEN
+        body_len = len(body)
+        assert len(header) == hdr_len
+        assert len(output) >= self.get_encrypted_frame_size(body_len)
 
         # header
-        header_ciphertext = self.aes_encode(header)
+        header_ciphertext = output[:hdr_len]
+        self._aes_enc.encrypt(header, output=header_ciphertext)
 
         # egress-mac.update(aes(mac-secret,egress-mac) ^ header-ciphertext).digest
-        header_mac = self.mac_egress(
-            crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:eth_common_constants.FRAME_MAC_LEN]),
-                                    header_ciphertext))[:eth_common_constants.FRAME_MAC_LEN]
+        output[hdr_len:hdr_len + mac_len] = self.mac_egress(
+            crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:mac_len]),
+                                    bytes(header_ciphertext)))[:mac_len]
 
         # frame
-        frame_ciphertext = self.aes_encode(body)
-        assert len(frame_ciphertext) == len(body)
+        body_offset = hdr_len + mac_len
+        frame_ciphertext = output[body_offset:body_offset + body_len]
+        self._aes_enc.encrypt(body, output=frame_ciphertext)
         # egress-mac.update(aes(mac-secret,egress-mac) ^
         # left128(egress-mac.update(frame-ciphertext).digest))
-        fmac_seed = self.mac_egress(frame_ciphertext)
-        frame_mac = self.mac_egress(
-            crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:eth_common_constants.FRAME_MAC_LEN]),
-                                    fmac_seed[:eth_common_constants.FRAME_MAC_LEN]))[:eth_common_constants.FRAME_MAC_LEN]
+        self._egress_mac.update(frame_ciphertext)
+        fmac_seed = self._egress_mac.digest()
+        frame_mac_offset = body_offset + body_len
+        output[frame_mac_offset:frame_mac_offset + mac_len] = self.mac_egress(
+            crypto_utils.string_xor(self._mac_enc(self.mac_egress()[:mac_len]),
+                                    fmac_seed[:mac_len]))[:mac_len]
 
-        return bytearray(header_ciphertext + header_mac + frame_ciphertext + frame_mac)
+        return frame_mac_offset + mac_len
+
+    def get_encrypted_frame_size(self, body_len):
+        """
+        Returns size of encrypted frame
+        :param body_len: length of padded frame body
+        :return: encrypted frame size
+        """
+
+        return eth_common_constants.FRAME_HDR_TOTAL_LEN + body_len + eth_common_constants.FRAME_MAC_LEN
 
     def decrypt_frame_header(self, data):
         """
@@ -425,6 +470,20 @@ class RLPxCipher(object):
         :return: decrypted frame body
         """
 
+        output = bytearray(crypto_utils.get_padded_len_16(body_size))
+        self.decrypt_frame_body_into(data, body_size, memoryview(output))
+        return output[:body_size]
+
+    def decrypt_frame_body_into(self, data, body_size, output):
+        """
+        Decrypts frame body directly to the output buffer. Output may be the frame data itself
+        to decrypt the frame in place.
+        :param data: frame data
+        :param body_size: body size
+        :param output: writable memoryview of at least padded body size bytes
+        :return: memoryview of decrypted frame body in the output buffer
+        """
+
         if not self._is_ready:
             raise CipherNotInitializedError("failed to decrypt frame body, the cipher was never initialized!")
 
@@ -437,12 +496,14 @@ class RLPxCipher(object):
         if not len(data) >= read_size + eth_common_constants.FRAME_MAC_LEN:
             raise ParseError("Insufficient body length")
 
+        data = memoryview(data)
         frame_cipher_text = data[:read_size]
         frame_mac = data[read_size:read_size + eth_common_constants.FRAME_MAC_LEN]
 
         # ingres-mac.update(aes(mac-secret,ingres-mac) ^
         # left128(ingres-mac.update(frame-ciphertext).digest))
-        frame_mac_seed = self.mac_ingress(frame_cipher_text)
+        self._ingress_mac.update(frame_cipher_text)
+        frame_mac_seed = self._ingress_mac.digest()
         expected_frame_mac = self.mac_ingress(
             crypto_utils.string_xor(self._mac_enc(self.mac_ingress()[:eth_common_constants.FRAME_MAC_LEN]),
                                     frame_mac_seed[:eth_common_constants.FRAME_MAC_LEN]))[:eth_common_constants.FRAME_MAC_LEN]
@@ -450,27 +511,15 @@ class RLPxCipher(object):
         if not frame_mac == expected_frame_mac:
             raise AuthenticationError("Invalid frame mac")
 
-        return self.aes_decode(frame_cipher_text)[:body_size]
-
-    def aes_encode(self, data=""):
-        if isinstance(data, bytearray):
-            bytes_to_encode = bytes(data)
-        elif isinstance(data, memoryview):
-            bytes_to_encode = data.tobytes()
-        else:
-            bytes_to_encode = data
-
-        return self._aes_enc.update(bytes_to_encode)
+        frame_plain_text = output[:read_size]
+        self._aes_dec.decrypt(frame_cipher_text, output=frame_plain_text)
+        return frame_plain_text[:body_size]
 
-    def aes_decode(self, data=""):
-        if isinstance(data, bytearray):
-            bytes_to_decode = bytes(data)
-        elif isinstance(data, memoryview):
-            bytes_to_decode = data.tobytes()
-        else:
-            bytes_to_decode = data
+    def aes_encode(self, data=b""):
+        return self._aes_enc.encrypt(data)
 
-        return self._aes_dec.update(bytes_to_decode)
+    def aes_decode(self, data=b""):
+        return self._aes_dec.decrypt(data)
 
     def mac_egress(self, data=b""):
         data = rlp_utils.str_to_bytes(data)
@@ -0,0 +1,261 @@
+import asyncio
+import functools
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from prometheus_client import Histogram
+
+from bxcommon.utils.alarm_queue import AlarmQueue
+from bxgateway import gateway_constants
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+message_handler_duration = Histogram(
+    "message_handler_duration_seconds",
+    "Time spent in message handlers on the event loop",
+    ("connection", "message_type", "handler"),
+    buckets=gateway_constants.EVENT_LOOP_PROFILER_BUCKETS_S
+)
+alarm_callback_duration = Histogram(
+    "alarm_callback_duration_seconds",
+    "Time spent in alarm callbacks on the event loop",
+    ("alarm",),
+    buckets=gateway_constants.EVENT_LOOP_PROFILER_BUCKETS_S
+)
+event_loop_lag = Histogram(
+    "event_loop_lag_seconds",
+    "Delay of event loop wake ups past their scheduled time",
+    buckets=gateway_constants.EVENT_LOOP_PROFILER_BUCKETS_S
+)
+
+
+class DurationStats:
+    """
+    Call count, total and maximum duration of a profiled callback since the last reset.
+    Durations are observed in the Prometheus histogram of the callback as well, which is never reset.
+    """
+
+    __slots__ = ("labels", "count", "total_s", "max_s", "_histogram")
+
+    labels: Dict[str, str]
+    count: int
+    total_s: float
+    max_s: float
+
+    def __init__(self, labels: Dict[str, str], histogram) -> None:
+        self.labels = labels
+        self._histogram = histogram
+        self.count = 0
+        self.total_s = 0
+        self.max_s = 0
+
+    def record(self, duration_s: float) -> None:
+        self.count += 1
+        self.total_s += duration_s
+        if duration_s > self.max_s:
+            self.max_s = duration_s
+        self._histogram.observe(duration_s)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total_s = 0
+        self.max_s = 0
+
+    def to_json(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = dict(self.labels)
+        stats.update({
+            "count": self.count,
+            "total_ms": self.total_s * 1000,
+            "average_ms": self.total_s * 1000 / self.count if self.count else 0,
+            "max_ms": self.max_s * 1000,
+        })
+        return stats
+
+
+class ProfiledCallback:
+    """
+    Wraps a message handler or an alarm callback to record the duration of each call.
+
+    Compares and hashes equal to the wrapped callback, so scheduled alarms can still be looked up by function.
+    """
+
+    __slots__ = ("fn", "stats")
+
+    fn: Callable
+    stats: DurationStats
+
+    def __init__(self, fn: Callable, stats: DurationStats) -> None:
+        self.fn = fn
+        self.stats = stats
+
+    def __call__(self, *args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            self.stats.record(time.perf_counter() - start_time)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ProfiledCallback):
+            other = other.fn
+        return self.fn == other
+
+    def __hash__(self) -> int:
+        return hash(self.fn)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.fn, name)
+
+    def __repr__(self) -> str:
+        return f"ProfiledCallback<{self.fn!r}>"
+
+
+class ProfiledMessageHandlers(dict):
+    """
+    Message handlers map of a connection, wrapping handlers in `ProfiledCallback` as they are added.
+    """
+
+    def __init__(
+        self, profiler: "EventLoopProfiler", connection_name: str, message_handlers: Dict[Any, Callable]
+    ) -> None:
+        super().__init__()
+        self._profiler = profiler
+        self._connection_name = connection_name
+        self.update(message_handlers)
+
+    def __setitem__(self, message_type, handler: Callable) -> None:
+        super().__setitem__(
+            message_type, self._profiler.profile_message_handler(self._connection_name, message_type, handler)
+        )
+
+    def update(self, *args, **kwargs) -> None:
+        for message_type, handler in dict(*args, **kwargs).items():
+            self[message_type] = handler
+
+
+class EventLoopProfiler:
+    """
+    Always-on profiler of the work done on the event loop: durations of connection message handlers and alarm
+    callbacks, and event loop lag, i.e. how late the loop wakes up compared to the scheduled time.
+
+    Results are exported as Prometheus histograms and returned by the `profile` RPC command.
+    """
+
+    message_handler_stats: Dict[Tuple[str, str, str], DurationStats]
+    alarm_stats: Dict[str, DurationStats]
+    event_loop_lag_stats: DurationStats
+    start_time: float
+
+    def __init__(self) -> None:
+        self.message_handler_stats = {}
+        self.alarm_stats = {}
+        self.event_loop_lag_stats = DurationStats({}, event_loop_lag)
+        self.start_time = time.time()
+
+    def profile_message_handlers(
+        self, connection, message_handlers: Dict[Any, Callable]
+    ) -> ProfiledMessageHandlers:
+        return ProfiledMessageHandlers(self, type(connection).__name__, message_handlers)
+
+    def profile_message_handler(self, connection_name: str, message_type, handler: Callable) -> ProfiledCallback:
+        if isinstance(handler, ProfiledCallback):
+            handler = handler.fn
+        message_type_name = _get_message_type_name(message_type)
+        handler_name = get_callback_name(handler)
+        key = (connection_name, message_type_name, handler_name)
+        stats = self.message_handler_stats.get(key)
+        if stats is None:
+            stats = DurationStats(
+                {"connection": connection_name, "message_type": message_type_name, "handler": handler_name},
+                message_handler_duration.labels(connection_name, message_type_name, handler_name)
+            )
+            self.message_handler_stats[key] = stats
+        return ProfiledCallback(handler, stats)
+
+    def profile_alarm_queue(self, alarm_queue: AlarmQueue) -> None:
+        """
+        Wraps `register_alarm` and `register_approx_alarm` of the alarm queue, so callbacks of alarms registered
+        from then on are timed with `profile_alarm`.
+
+        Alarms already in the queue, e.g. registered by the base node during its construction, are not timed.
+        """
+        register_alarm = alarm_queue.register_alarm
+        register_approx_alarm = alarm_queue.register_approx_alarm
+
+        def profiled_register_alarm(fire_delay, fn: Callable, *args, alarm_name: Optional[str] = None, **kwargs):
+            return register_alarm(
+                fire_delay, self.profile_alarm(fn, alarm_name), *args, alarm_name=alarm_name, **kwargs
+            )
+
+        def profiled_register_approx_alarm(
+            fire_delay, slop, fn: Callable, *args, alarm_name: Optional[str] = None, **kwargs
+        ):
+            return register_approx_alarm(
+                fire_delay, slop, self.profile_alarm(fn, alarm_name), *args, alarm_name=alarm_name, **kwargs
+            )
+
+        alarm_queue.register_alarm = profiled_register_alarm
+        alarm_queue.register_approx_alarm = profiled_register_approx_alarm
+
+    def profile_alarm(self, fn: Callable, alarm_name: Optional[str] = None) -> ProfiledCallback:
+        if isinstance(fn, ProfiledCallback):
+            fn = fn.fn
+        if alarm_name is None:
+            alarm_name = get_callback_name(fn)
+        stats = self.alarm_stats.get(alarm_name)
+        if stats is None:
+            stats = DurationStats({"alarm": alarm_name}, alarm_callback_duration.labels(alarm_name))
+            self.alarm_stats[alarm_name] = stats
+        return ProfiledCallback(fn, stats)
+
+    async def sample_event_loop_lag(self, interval_s: float) -> None:
+        """
+        Sleeps for `interval_s` in a loop, recording how late the event loop resumes the coroutine each time
+        """
+        loop = asyncio.get_event_loop()
+        while True:
+            scheduled_time = loop.time() + interval_s
+            await asyncio.sleep(interval_s)
+            self.event_loop_lag_stats.record(max(0.0, loop.time() - scheduled_time))
+
+    def reset(self) -> None:
+        for stats in self.message_handler_stats.values():
+            stats.reset()
+        for stats in self.alarm_stats.values():
+            stats.reset()
+        self.event_loop_lag_stats.reset()
+        self.start_time = time.time()
+
+    def get_report(self, top: int = gateway_constants.PROFILE_RPC_DEFAULT_TOP) -> Dict[str, Any]:
+        """
+        :param top: number of message handlers and alarms with the most total time to include
+        :return: profile since the last reset
+        """
+        return {
+            "interval_s": time.time() - self.start_time,
+            "event_loop_lag": self.event_loop_lag_stats.to_json(),
+            "message_handlers": _get_top_stats(self.message_handler_stats.values(), top),
+            "alarms": _get_top_stats(self.alarm_stats.values(), top),
+        }
+
+
+def get_callback_name(fn: Callable) -> str:
+    if isinstance(fn, functools.partial):
+        fn = fn.func
+    return getattr(fn, "__qualname__", type(fn).__name__)
+
+
+def _get_message_type_name(message_type: Union[bytes, int, Any]) -> str:
+    if isinstance(message_type, (bytes, bytearray)):
+        return message_type.rstrip(b"\x00").decode("utf-8", errors="replace")
+    return str(message_type)
+
+
+def _get_top_stats(stats: Iterable[DurationStats], top: int) -> List[Dict[str, Any]]:
+    called_stats = [entry for entry in stats if entry.count]
+    called_stats.sort(key=lambda entry: entry.total_s, reverse=True)
+    return [entry.to_json() for entry in called_stats[:top]]
+
+
+event_loop_profiler = EventLoopProfiler()
@@ -0,0 +1,99 @@
+import builtins
+import sys
+import time
+from typing import List, NamedTuple, Optional, Callable, Any
+
+from bxcommon import constants
+from bxcommon.utils import memory_utils
+from bxutils import logging
+
+logger = logging.get_logger(__name__)
+
+REPORT_MODULES_COUNT = 30
+
+
+class ImportProfileEntry(NamedTuple):
+    module_name: str
+    # including nested imports
+    duration_ms: float
+    self_duration_ms: float
+    memory_delta: int
+
+
+class ImportProfiler:
+    """
+    Measures time and memory spent on importing each module, while active as a context manager.
+
+    Only modules imported for the first time are measured. Durations and memory deltas of a module include
+    nested imports made while the module was loading, similar to `python -X importtime`.
+    """
+
+    entries: List[ImportProfileEntry]
+
+    _original_import: Optional[Callable[..., Any]]
+    _nested_durations: List[float]
+    _start_time: float
+    _start_memory: int
+    _duration: float
+    _memory_delta: int
+
+    def __init__(self) -> None:
+        self.entries = []
+        self._original_import = None
+        self._nested_durations = []
+        self._start_time = 0
+        self._start_memory = 0
+        self._duration = 0
+        self._memory_delta = 0
+
+    def __enter__(self) -> "ImportProfiler":
+        self._start_time = time.time()
+        self._start_memory = memory_utils.get_app_memory_usage()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        builtins.__import__ = self._original_import
+        self._original_import = None
+        self._duration = time.time() - self._start_time
+        self._memory_delta = memory_utils.get_app_memory_usage() - self._start_memory
+
+    def log_report(self, modules_count: int = REPORT_MODULES_COUNT) -> None:
+        logger.info(
+            "Imported {} modules in {:.2f}ms, memory usage increased by {:.2f}MB. Slowest modules:",
+            len(self.entries), self._duration * 1000, self._memory_delta / constants.BYTE_TO_MB
+        )
+        for entry in sorted(self.entries, key=lambda e: e.duration_ms, reverse=True)[:modules_count]:
+            logger.info(
+                "{}: {:.2f}ms (self {:.2f}ms), memory +{:.2f}MB",
+                entry.module_name, entry.duration_ms, entry.self_duration_ms,
+                entry.memory_delta / constants.BYTE_TO_MB
+            )
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original_import = self._original_import
+        assert original_import is not None
+        if level != 0 or name in sys.modules:
+            return original_import(name, globals, locals, fromlist, level)
+
+        start_time = time.time()
+        start_memory = memory_utils.get_app_memory_usage()
+        self._nested_durations.append(0)
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            duration = time.time() - start_time
+            nested_duration = self._nested_durations.pop()
+            if self._nested_durations:
+                self._nested_durations[-1] += duration
+            # failed optional imports are not reported
+            if name in sys.modules:
+                self.entries.append(
+                    ImportProfileEntry(
+                        name,
+                        duration * 1000,
+                        (duration - nested_duration) * 1000,
+                        memory_utils.get_app_memory_usage() - start_memory
+                    )
+                )
@@ -24,6 +24,21 @@ class EthGatewayStatInterval(StatsIntervalData):
     total_serialization_time: float = 0
     total_serialized_msgs_count: int = 0
     max_serialization_time: float = 0
+    total_framed_message_cache_hits: int = 0
+    total_tx_batches_count: int = 0
+    total_batched_txs_count: int = 0
+    max_tx_batch_size: int = 0
+    total_tx_batch_delay: float = 0
+    max_tx_batch_delay: float = 0
+    total_receipts_fetch_blocks_count: int = 0
+    total_fetched_receipts_count: int = 0
+    total_receipts_fetch_time: float = 0
+    max_receipts_fetch_time: float = 0
+    total_tx_hash_memo_hits: int = 0
+    total_tx_hash_memo_misses: int = 0
+    total_tx_hashes_reused: int = 0
+    total_tx_hashing_time: float = 0
+    total_tx_hashing_time_saved: float = 0
 
 
 class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "AbstractGatewayNode"]):
@@ -61,6 +76,31 @@ class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "Abstrac
             self.interval_data.max_serialization_time, time
         )
 
+    def log_framed_message_cache_hit(self) -> None:
+        self.interval_data.total_framed_message_cache_hits += 1
+
+    def log_tx_batch(self, batch_size: int, delay: float) -> None:
+        self.interval_data.total_tx_batches_count += 1
+        self.interval_data.total_batched_txs_count += batch_size
+        self.interval_data.max_tx_batch_size = max(self.interval_data.max_tx_batch_size, batch_size)
+        self.interval_data.total_tx_batch_delay += delay
+        self.interval_data.max_tx_batch_delay = max(self.interval_data.max_tx_batch_delay, delay)
+
+    def log_receipts_fetch(self, receipts_count: int, time: float) -> None:
+        self.interval_data.total_receipts_fetch_blocks_count += 1
+        self.interval_data.total_fetched_receipts_count += receipts_count
+        self.interval_data.total_receipts_fetch_time += time
+        self.interval_data.max_receipts_fetch_time = max(self.interval_data.max_receipts_fetch_time, time)
+
+    def log_tx_hash_memo_hit(self, tx_hashes_count: int, saved_time: float) -> None:
+        self.interval_data.total_tx_hash_memo_hits += 1
+        self.interval_data.total_tx_hashes_reused += tx_hashes_count
+        self.interval_data.total_tx_hashing_time_saved += saved_time
+
+    def log_tx_hash_memo_miss(self, time: float) -> None:
+        self.interval_data.total_tx_hash_memo_misses += 1
+        self.interval_data.total_tx_hashing_time += time
+
     def get_info(self) -> Dict[str, Any]:
         if self.interval_data.total_encryption_time > 0:
             average_encryption_time = (
@@ -86,6 +126,27 @@ class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "Abstrac
         else:
             average_serialization_time = 0
 
+        if self.interval_data.total_tx_batches_count > 0:
+            average_tx_batch_size = (
+                self.interval_data.total_batched_txs_count
+                / self.interval_data.total_tx_batches_count
+            )
+            average_tx_batch_delay = (
+                self.interval_data.total_tx_batch_delay
+                / self.interval_data.total_tx_batches_count
+            )
+        else:
+            average_tx_batch_size = 0
+            average_tx_batch_delay = 0
+
+        if self.interval_data.total_receipts_fetch_blocks_count > 0:
+            average_receipts_fetch_time = (
+                self.interval_data.total_receipts_fetch_time
+                / self.interval_data.total_receipts_fetch_blocks_count
+            )
+        else:
+            average_receipts_fetch_time = 0
+
         return {
             "total_encrypted_msgs_count": self.interval_data.total_encrypted_msgs_count,
             "average_encryption_time": stats_format.duration(average_encryption_time * 1000),
@@ -102,6 +163,28 @@ class _EthGatewayStatsService(StatisticsService[EthGatewayStatInterval, "Abstrac
             "max_serialization_time": stats_format.duration(
                 self.interval_data.max_serialization_time * 1000
             ),
+            "total_framed_message_cache_hits": self.interval_data.total_framed_message_cache_hits,
+            "total_tx_batches_count": self.interval_data.total_tx_batches_count,
+            "total_batched_txs_count": self.interval_data.total_batched_txs_count,
+            "average_tx_batch_size": average_tx_batch_size,
+            "max_tx_batch_size": self.interval_data.max_tx_batch_size,
+            "average_tx_batch_delay": stats_format.duration(average_tx_batch_delay * 1000),
+            "max_tx_batch_delay": stats_format.duration(
+                self.interval_data.max_tx_batch_delay * 1000
+            ),
+            "total_receipts_fetch_blocks_count": self.interval_data.total_receipts_fetch_blocks_count,
+            "total_fetched_receipts_count": self.interval_data.total_fetched_receipts_count,
+            "average_receipts_fetch_time": stats_format.duration(average_receipts_fetch_time * 1000),
+            "max_receipts_fetch_time": stats_format.duration(
+                self.interval_data.max_receipts_fetch_time * 1000
+            ),
+            "total_tx_hash_memo_hits": self.interval_data.total_tx_hash_memo_hits,
+            "total_tx_hash_memo_misses": self.interval_data.total_tx_hash_memo_misses,
+            "total_tx_hashes_reused": self.interval_data.total_tx_hashes_reused,
+            "total_tx_hashing_time": stats_format.duration(self.interval_data.total_tx_hashing_time * 1000),
+            "total_tx_hashing_time_saved": stats_format.duration(
+                self.interval_data.total_tx_hashing_time_saved * 1000
+            ),
         }
 
 
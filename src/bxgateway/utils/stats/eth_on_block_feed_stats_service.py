@@ -17,11 +17,17 @@ if TYPE_CHECKING:
 class EthOnBlockFeedStatInterval(StatsIntervalData):
     subscriber_task_count: List[int]
     subscriber_task_duration: List[float]
+    block_calls_count: int
+    block_unique_calls_count: int
+    block_duration: List[float]
 
     def __init__(self):
         super().__init__()
         self.subscriber_task_count = [0]
         self.subscriber_task_duration = [0]
+        self.block_calls_count = 0
+        self.block_unique_calls_count = 0
+        self.block_duration = []
 
 
 class EthOnBlockFeedStatsService(
@@ -60,6 +66,14 @@ class EthOnBlockFeedStatsService(
             "total_calls": sum(interval_data.subscriber_task_count),
             "max_calls_per_subscriber": max(interval_data.subscriber_task_count, default=None),
             "max_duration": max(interval_data.subscriber_task_duration, default=None),
+            "unique_calls": interval_data.block_unique_calls_count,
+            "deduplicated_calls": interval_data.block_calls_count - interval_data.block_unique_calls_count,
+            "blocks": len(interval_data.block_duration),
+            "avg_block_duration": (
+                sum(interval_data.block_duration) / len(interval_data.block_duration)
+                if interval_data.block_duration else None
+            ),
+            "max_block_duration": max(interval_data.block_duration, default=None),
         }
 
     def log_subscriber_tasks(self, tasks_count: int, duration_s: float) -> None:
@@ -67,5 +81,14 @@ class EthOnBlockFeedStatsService(
         interval_data.subscriber_task_count.append(tasks_count)
         interval_data.subscriber_task_duration.append(duration_s)
 
+    def log_block_calls(self, calls_count: int, unique_calls_count: int, duration_s: float) -> None:
+        """
+        Logs calls executed for a block, from the block notification until all subscribers were notified.
+        """
+        interval_data = self.interval_data
+        interval_data.block_calls_count += calls_count
+        interval_data.block_unique_calls_count += unique_calls_count
+        interval_data.block_duration.append(duration_s)
+
 
 eth_on_block_feed_stats_service = EthOnBlockFeedStatsService()
@@ -48,6 +48,17 @@ class GatewayTransactionStatInterval(StatsIntervalData):
     dropped_transactions_from_relay: int = 0
 
     transactions_bytes_skipped: int = 0
+    transactions_messages_sliced: int = 0
+    transactions_bytes_sliced: int = 0
+    transactions_slices_processed: int = 0
+
+    node_transactions_messages_forwarded: int = 0
+    node_transactions_bytes_forwarded: int = 0
+    node_transactions_bytes_saved: int = 0
+
+    inv_transactions_requested: int = 0
+    inv_transactions_skipped: int = 0
+    inv_transaction_bytes_saved: int = 0
 
 
 class _GatewayTransactionStatsService(
@@ -150,6 +161,27 @@ class _GatewayTransactionStatsService(
     def log_skipped_transaction_bytes(self, skipped_bytes: int) -> None:
         self.interval_data.transactions_bytes_skipped += skipped_bytes
 
+    def log_sliced_transactions_message(self, sliced_bytes: int, slices_count: int) -> None:
+        self.interval_data.transactions_messages_sliced += 1
+        self.interval_data.transactions_bytes_sliced += sliced_bytes
+        self.interval_data.transactions_slices_processed += slices_count
+
+    def log_transactions_forwarded_to_nodes(self, forwarded_bytes: int, saved_bytes: int) -> None:
+        self.interval_data.node_transactions_messages_forwarded += 1
+        self.interval_data.node_transactions_bytes_forwarded += forwarded_bytes
+        self.interval_data.node_transactions_bytes_saved += saved_bytes
+
+    def log_inv_transactions(self, requested_count: int, skipped_count: int, saved_bytes: int) -> None:
+        """
+        Logs transactions announced by a blockchain node that were requested or skipped since the gateway
+        already had them. Saved bytes include contents of skipped transactions that are still in the
+        transaction service only.
+        """
+        interval_data = self.interval_data
+        interval_data.inv_transactions_requested += requested_count
+        interval_data.inv_transactions_skipped += skipped_count
+        interval_data.inv_transaction_bytes_saved += saved_bytes
+
     def get_info(self) -> Dict[str, Any]:
         node = self.node
         assert node is not None
@@ -225,6 +257,15 @@ class _GatewayTransactionStatsService(
             "rejected_structure": interval_data.tx_validation_failed_structure,
             "rejected_gas_price": interval_data.tx_validation_failed_gas_price,
             "transaction_bytes_skipped": interval_data.transactions_bytes_skipped,
+            "transactions_messages_sliced": interval_data.transactions_messages_sliced,
+            "transactions_bytes_sliced": interval_data.transactions_bytes_sliced,
+            "transactions_slices_processed": interval_data.transactions_slices_processed,
+            "node_transactions_messages_forwarded": interval_data.node_transactions_messages_forwarded,
+            "node_transactions_bytes_forwarded": interval_data.node_transactions_bytes_forwarded,
+            "node_transactions_bytes_saved": interval_data.node_transactions_bytes_saved,
+            "inv_transactions_requested": interval_data.inv_transactions_requested,
+            "inv_transactions_skipped": interval_data.inv_transactions_skipped,
+            "inv_transaction_bytes_saved": interval_data.inv_transaction_bytes_saved,
             **node._tx_service.get_aggregate_stats(),
         }
 
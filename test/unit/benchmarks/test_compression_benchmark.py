@@ -0,0 +1,47 @@
+import os
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.benchmarks import benchmark_utils, block_samples, compression_benchmark
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "samples")
+
+
+class CompressionBenchmarkTest(AbstractTestCase):
+
+    def test_build_synthetic_blocks(self):
+        for build_block in [block_samples.build_eth_block, block_samples.build_btc_block, block_samples.build_ont_block]:
+            block = build_block(SAMPLES_DIR, tx_count=300)
+            self.assertEqual(300, len(block.tx_hashes))
+            self.assertEqual(300, len(set(block.tx_hashes)))
+            self.assertEqual(block.size, len(block.block_msg.rawbytes()))
+
+    def test_run_benchmark(self):
+        opts = compression_benchmark.parse_arguments(
+            ["--samples-dir", SAMPLES_DIR, "--tx-count", "50", "--iterations", "2", "--short-id-hit-ratio", "0", "1"]
+        )
+        report = compression_benchmark.run_benchmark(opts)
+
+        self.assertEqual(set(compression_benchmark.PROTOCOLS), set(report["protocols"]))
+        for protocol_report in report["protocols"].values():
+            self.assertEqual(50, protocol_report["tx_count"])
+            no_hits = protocol_report["results"]["hit_ratio_0"]
+            all_hits = protocol_report["results"]["hit_ratio_1"]
+            self.assertEqual(0, no_hits["short_ids"])
+            self.assertEqual(50, all_hits["short_ids"])
+            self.assertLess(all_hits["bx_block_size"], no_hits["bx_block_size"])
+            for stage in ["compression", "decompression"]:
+                self.assertIn("p50_ms", all_hits[stage]["latency"])
+                self.assertIn("p99_ms", all_hits[stage]["latency"])
+                self.assertGreater(all_hits[stage]["bytes_per_second"], 0)
+                self.assertGreater(all_hits[stage]["allocations"]["allocated_bytes"], 0)
+
+        comparison = benchmark_utils.compare_metrics(report["protocols"], report["protocols"])
+        self.assertEqual(0, comparison["eth.results.hit_ratio_1.compression.latency.p50_ms"]["change_percent"])
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(50, benchmark_utils.percentile(values, 50))
+        self.assertEqual(99, benchmark_utils.percentile(values, 99))
+        self.assertEqual(100, benchmark_utils.percentile(values, 100))
+        self.assertEqual(0, benchmark_utils.percentile([], 50))
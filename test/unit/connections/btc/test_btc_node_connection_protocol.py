@@ -69,6 +69,36 @@ class BtcNodeConnectionProtocolTest(AbstractTestCase):
         self.assertIn((InventoryType.MSG_TX, seen_block_hash), get_data_msg)
         self.assertIn((InventoryType.MSG_BLOCK, not_seen_block_hash), get_data_msg)
 
+    def test_get_data_skips_known_transactions(self):
+        known_tx_hash = BtcObjectHash(buf=helpers.generate_bytearray(BTC_SHA_HASH_LEN), length=BTC_SHA_HASH_LEN)
+        removed_tx_hash = BtcObjectHash(buf=helpers.generate_bytearray(BTC_SHA_HASH_LEN), length=BTC_SHA_HASH_LEN)
+        new_tx_hash = BtcObjectHash(buf=helpers.generate_bytearray(BTC_SHA_HASH_LEN), length=BTC_SHA_HASH_LEN)
+        tx_service = self.node.get_tx_service()
+        tx_service.set_transaction_contents(known_tx_hash, helpers.generate_bytearray(250))
+        tx_service.set_transaction_contents(removed_tx_hash, helpers.generate_bytearray(250))
+        tx_service.remove_transaction_by_tx_hash(removed_tx_hash)
+
+        inv_message = InvBtcMessage(magic=123, inv_vects=[
+            (InventoryType.MSG_TX, known_tx_hash),
+            (InventoryType.MSG_TX, removed_tx_hash),
+            (InventoryType.MSG_TX, new_tx_hash),
+        ])
+        self.sut.msg_inv(inv_message)
+
+        get_data_msg_bytes = self.sut.connection.get_bytes_to_send()
+        get_data_msg = GetDataBtcMessage(buf=get_data_msg_bytes)
+        self.assertEqual(1, get_data_msg.count())
+        self.assertIn((InventoryType.MSG_TX, new_tx_hash), get_data_msg)
+
+    def test_get_data_all_transactions_known(self):
+        tx_service = self.node.get_tx_service()
+        tx_service.set_transaction_contents(self.tx_hash, helpers.generate_bytearray(250))
+
+        inv_message = InvBtcMessage(magic=123, inv_vects=[(InventoryType.MSG_TX, self.tx_hash)])
+        self.sut.msg_inv(inv_message)
+
+        self.assertEqual(0, self.sut.connection.outputbuf.length)
+
     def test_get_data_segwit(self):
         self._test_get_data(True)
 
@@ -1,6 +1,6 @@
 import struct
 
-from mock import MagicMock, call
+from mock import MagicMock, call, patch
 
 from bxcommon import constants
 from bxcommon.connections.connection_type import ConnectionType
@@ -9,6 +9,7 @@ from bxcommon.models.blockchain_protocol import BlockchainProtocol
 from bxcommon.models.tx_validation_status import TxValidationStatus
 from bxcommon.test_utils.mocks.mock_node_ssl_service import MockNodeSSLService
 from bxcommon.utils.blockchain_utils import transaction_validation
+from bxgateway import gateway_constants
 from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
 from bxgateway.connections.eth.eth_node_connection import EthNodeConnection
 from bxcommon.feed.eth.eth_new_transaction_feed import EthNewTransactionFeed
@@ -22,6 +23,7 @@ from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import \
 from bxgateway.messages.eth.serializers.transient_block_body import TransientBlockBody
 from bxgateway.testing import gateway_helpers
 from bxcommon.test_utils import helpers
+from bxcommon.test_utils.helpers import async_test
 from bxcommon.test_utils.abstract_test_case import AbstractTestCase
 from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
 from bxgateway.messages.eth.protocol.block_bodies_eth_protocol_message import (
@@ -94,6 +96,25 @@ class EthNodeConnectionProtocolTest(AbstractTestCase):
         self.node.opts.ws = True
         self.node.publish_block = MagicMock()
 
+    def test_block_body_of_fetched_block_marked_for_cleanup(self):
+        self.cleanup_service.clean_block_transactions_by_block_components = MagicMock()
+        block_hash = helpers.generate_object_hash()
+        self.node.block_fetch_coordinator.on_block_fetched(block_hash, self.connection)
+        self.node.block_cleanup_service._block_hash_marked_for_cleanup.add(block_hash)
+
+        self.sut.request_block_body([block_hash])
+        block_bodies_message = BlockBodiesEthProtocolMessage(
+            None, [mock_eth_messages.get_dummy_transient_block_body(1)]
+        )
+        block_bodies_message.serialize()
+        self.sut.msg_block_bodies(block_bodies_message)
+
+        self.cleanup_service.clean_block_transactions_by_block_components.assert_called_once()
+        self.assertEqual(
+            block_hash,
+            self.cleanup_service.clean_block_transactions_by_block_components.call_args[1]["block_hash"]
+        )
+
     def test_request_block_bodies(self):
         self.cleanup_service.clean_block_transactions_by_block_components = (
             MagicMock()
@@ -485,6 +506,48 @@ class EthNodeConnectionProtocolTest(AbstractTestCase):
         self.assertEqual(1, len(self.broadcast_messages))
         self.assertEqual(1, len(self.broadcast_to_node_messages))
 
+    @async_test
+    async def test_msg_tx_large_message_processed_in_slices(self):
+        self.node.opts.ws = False
+        self.node.opts.transaction_validation = False
+
+        transactions = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 21)]
+        message = TransactionsEthProtocolMessage(None, transactions)
+        tx_size = len(transactions[0].contents())
+
+        with patch.object(gateway_constants, "ETH_TRANSACTIONS_SLICE_SIZE", 5 * tx_size):
+            await self.sut.process_transactions_message_in_slices(message)
+
+        self.assertEqual(20, len(self.broadcast_messages))
+        self.assertGreaterEqual(len(self.broadcast_to_node_messages), 3)
+
+    def test_msg_tx_forwards_only_new_transactions_to_nodes_once(self):
+        self.node.opts.ws = False
+        self.node.opts.transaction_validation = False
+
+        seen_transaction = mock_eth_messages.get_dummy_transaction(1)
+        self.sut.msg_tx(TransactionsEthProtocolMessage(None, [seen_transaction]))
+        self.assertEqual(1, len(self.broadcast_to_node_messages))
+        self.broadcast_to_node_messages.clear()
+        self.broadcast_messages.clear()
+
+        new_transactions = [mock_eth_messages.get_dummy_transaction(i) for i in range(2, 5)]
+        self.sut.msg_tx(
+            TransactionsEthProtocolMessage(None, [new_transactions[0], seen_transaction, *new_transactions[1:]])
+        )
+
+        self.assertEqual(3, len(self.broadcast_messages))
+        self.assertEqual(1, len(self.broadcast_to_node_messages))
+        forwarded_msg = self.broadcast_to_node_messages[0]
+        self.assertEqual(
+            [transaction.hash() for transaction in new_transactions],
+            [transaction.hash() for transaction in forwarded_msg.get_transactions()]
+        )
+
+        # nothing is forwarded if all transactions were seen
+        self.sut.msg_tx(TransactionsEthProtocolMessage(None, [seen_transaction]))
+        self.assertEqual(1, len(self.broadcast_to_node_messages))
+
     def test_handle_tx_with_an_invalid_signature(self):
         tx_bytes = \
             b"\xf8k" \
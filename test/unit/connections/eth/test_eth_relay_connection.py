@@ -1,3 +1,5 @@
+import time
+
 from asynctest import MagicMock
 
 from bxcommon.connections.connection_type import ConnectionType
@@ -18,6 +20,7 @@ from bxcommon.feed.new_transaction_feed import NewTransactionFeed, FeedSource
 from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import (
     TransactionsEthProtocolMessage,
 )
+from bxgateway.services.eth.eth_transaction_batching_service import EthTransactionBatchingService
 from bxgateway.testing import gateway_helpers
 from bxgateway.testing.fixture import eth_fixtures
 from bxgateway.testing.mocks import mock_eth_messages
@@ -105,6 +108,51 @@ class EthRelayConnectionTest(AbstractTestCase):
         self.relay_connection_1.msg_tx(expensive_tx)
         self._assert_tx_sent()
 
+    def test_transactions_batched_until_interval_expires(self):
+        self.node.transaction_batching_service = EthTransactionBatchingService(self.node, 0.005, 3)
+        self._set_bc_connection()
+
+        for nonce in range(2):
+            self.relay_connection_1.msg_tx(
+                self._convert_to_bx_message(
+                    TransactionsEthProtocolMessage(None, [mock_eth_messages.get_dummy_transaction(nonce, 10)])
+                )
+            )
+        self.node.broadcast.assert_not_called()
+        self.assertEqual(2, len(self.node.transaction_batching_service))
+
+        time.time = MagicMock(return_value=time.time() + 0.01)
+        self.node.alarm_queue.fire_alarms()
+
+        self._assert_tx_sent()
+        ((sent_tx_msg,), _) = self.node.broadcast.call_args
+        self.assertEqual(
+            [0, 1], [transaction.nonce for transaction in sent_tx_msg.get_transactions()]
+        )
+        self.assertEqual(0, len(self.node.transaction_batching_service))
+
+    def test_transactions_batch_sent_when_full(self):
+        self.node.opts.filter_txs_factor = 1
+        self.node.transaction_batching_service = EthTransactionBatchingService(self.node, 0.005, 2)
+        self._set_bc_connection()
+
+        transactions = [mock_eth_messages.get_dummy_transaction(i, 10) for i in range(100)]
+        self.node.on_transactions_in_block(transactions)
+
+        for nonce, gas_price in [(1, 15), (2, 5), (3, 20)]:
+            self.relay_connection_1.msg_tx(
+                self._convert_to_bx_message(
+                    TransactionsEthProtocolMessage(None, [mock_eth_messages.get_dummy_transaction(nonce, gas_price)])
+                )
+            )
+
+        self._assert_tx_sent()
+        ((sent_tx_msg,), _) = self.node.broadcast.call_args
+        self.assertEqual(
+            [1, 3], [transaction.nonce for transaction in sent_tx_msg.get_transactions()]
+        )
+        self.assertEqual(0, len(self.node.transaction_batching_service))
+
     def _convert_to_bx_message(
         self, transactions_eth_msg: TransactionsEthProtocolMessage
     ) -> TxMessage:
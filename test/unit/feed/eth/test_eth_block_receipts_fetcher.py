@@ -0,0 +1,125 @@
+from bxcommon.rpc import rpc_constants
+from bxcommon.rpc.json_rpc_response import JsonRpcResponse
+from bxcommon.rpc.rpc_errors import RpcError, RpcErrorCode
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.helpers import async_test, AsyncMock
+
+from bxgateway.feed.eth.eth_block_receipts_fetcher import EthBlockReceiptsFetcher, \
+    ETH_GET_BLOCK_RECEIPTS_RPC_METHOD
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_eth_ws_proxy_publisher import MockEthWsProxyPublisher
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+
+BLOCK_HASH = "0x01"
+
+
+class EthBlockReceiptsFetcherTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        opts = gateway_helpers.get_gateway_opts(8000, blockchain_protocol="Ethereum")
+        self.node = MockGatewayNode(opts)
+        self.node.eth_ws_proxy_publisher = MockEthWsProxyPublisher(None, None, None, self.node)
+        self.tx_hashes = [f"0x{i:02x}" for i in range(5)]
+        self.receipts = [{"transactionHash": tx_hash, "blockHash": BLOCK_HASH} for tx_hash in self.tx_hashes]
+        self.fetcher = EthBlockReceiptsFetcher(self.node, chunk_size=2, max_retries=2)
+
+    @async_test
+    async def test_fetch_receipts__single_request_per_block(self):
+        self.node.eth_ws_proxy_publisher.call_rpc = AsyncMock(
+            return_value=JsonRpcResponse(request_id=1, result=self.receipts)
+        )
+
+        receipts = await self.fetcher.fetch_receipts(BLOCK_HASH, self.tx_hashes)
+
+        self.assertEqual(self.receipts, receipts)
+        self.node.eth_ws_proxy_publisher.call_rpc.assert_called_once_with(
+            ETH_GET_BLOCK_RECEIPTS_RPC_METHOD, [BLOCK_HASH]
+        )
+
+    @async_test
+    async def test_fetch_receipts__retries_only_missing_receipts(self):
+        receipts_by_hash = {receipt["transactionHash"]: receipt for receipt in self.receipts}
+        requested_hashes = []
+
+        async def call_rpc(method, params, request_id=None):
+            if method == ETH_GET_BLOCK_RECEIPTS_RPC_METHOD:
+                # unexpected response, receipts are fetched for each transaction instead
+                return JsonRpcResponse(request_id=request_id, result={})
+
+            self.assertEqual(rpc_constants.ETH_GET_TRANSACTION_RECEIPT_RPC_METHOD, method)
+            tx_hash = params[0]
+            requested_hashes.append(tx_hash)
+            if tx_hash == self.tx_hashes[3] and requested_hashes.count(tx_hash) == 1:
+                return JsonRpcResponse(request_id=request_id, result=None)
+            return JsonRpcResponse(request_id=request_id, result=receipts_by_hash[tx_hash])
+
+        self.node.eth_ws_proxy_publisher.call_rpc = call_rpc
+
+        receipts = await self.fetcher.fetch_receipts(BLOCK_HASH, self.tx_hashes)
+
+        self.assertEqual(self.receipts, receipts)
+        self.assertTrue(self.fetcher.block_receipts_supported)
+        self.assertEqual(self.tx_hashes + [self.tx_hashes[3]], requested_hashes)
+
+    @async_test
+    async def test_fetch_receipts__method_not_found_disables_block_receipts(self):
+        receipts_by_hash = {receipt["transactionHash"]: receipt for receipt in self.receipts}
+
+        async def call_rpc(method, params, request_id=None):
+            if method == ETH_GET_BLOCK_RECEIPTS_RPC_METHOD:
+                raise RpcError(RpcErrorCode.METHOD_NOT_FOUND, request_id, None, "method not found")
+            return JsonRpcResponse(request_id=request_id, result=receipts_by_hash[params[0]])
+
+        self.node.eth_ws_proxy_publisher.call_rpc = call_rpc
+
+        receipts = await self.fetcher.fetch_receipts(BLOCK_HASH, self.tx_hashes)
+
+        self.assertEqual(self.receipts, receipts)
+        self.assertFalse(self.fetcher.block_receipts_supported)
+
+    @async_test
+    async def test_fetch_receipts__transient_error_keeps_block_receipts(self):
+        receipts_by_hash = {receipt["transactionHash"]: receipt for receipt in self.receipts}
+
+        async def call_rpc(method, params, request_id=None):
+            if method == ETH_GET_BLOCK_RECEIPTS_RPC_METHOD:
+                raise RpcError(RpcErrorCode.SERVER_ERROR, request_id, None, "block not found")
+            return JsonRpcResponse(request_id=request_id, result=receipts_by_hash[params[0]])
+
+        self.node.eth_ws_proxy_publisher.call_rpc = call_rpc
+
+        receipts = await self.fetcher.fetch_receipts(BLOCK_HASH, self.tx_hashes)
+
+        self.assertEqual(self.receipts, receipts)
+        self.assertTrue(self.fetcher.block_receipts_supported)
+
+    @async_test
+    async def test_fetch_receipts__reports_fetched_receipts(self):
+        self.fetcher.block_receipts_supported = False
+        self.node.eth_ws_proxy_publisher.call_rpc = AsyncMock(
+            side_effect=[JsonRpcResponse(request_id=1, result=receipt) for receipt in self.receipts]
+        )
+        fetched_counts = []
+
+        receipts = await self.fetcher.fetch_receipts(
+            BLOCK_HASH,
+            self.tx_hashes,
+            lambda fetched: fetched_counts.append(len([receipt for receipt in fetched if receipt is not None]))
+        )
+
+        self.assertEqual(self.receipts, receipts)
+        # receipts are reported after each chunk
+        self.assertEqual([2, 4, 5], fetched_counts)
+
+    @async_test
+    async def test_fetch_receipts__gives_up_after_max_retries(self):
+        self.fetcher.block_receipts_supported = False
+        self.node.eth_ws_proxy_publisher.call_rpc = AsyncMock(
+            return_value=JsonRpcResponse(request_id=1, result=None)
+        )
+
+        receipts = await self.fetcher.fetch_receipts(BLOCK_HASH, self.tx_hashes)
+
+        self.assertEqual([None] * len(self.tx_hashes), receipts)
+        self.assertEqual(3 * len(self.tx_hashes), self.node.eth_ws_proxy_publisher.call_rpc.call_count)
@@ -8,6 +8,7 @@ from bxcommon.test_utils.mocks.mock_node_ssl_service import MockNodeSSLService
 from bxcommon.feed.feed_source import FeedSource
 from bxcommon.utils.blockchain_utils.eth import crypto_utils
 from bxgateway.connections.eth.eth_gateway_node import EthGatewayNode
+from bxgateway.feed.eth.eth_block_feed_entry import EthBlockFeedEntry
 from bxgateway.feed.eth.eth_new_block_feed import EthNewBlockFeed
 from bxgateway.feed.eth.eth_raw_block import EthRawBlock
 from bxgateway.messages.eth.eth_normal_message_converter import EthNormalMessageConverter
@@ -152,6 +153,41 @@ class EthNewBlockFeedTest(AbstractTestCase):
 
         self.sut.serialize.assert_not_called()
 
+    def test_serialize_included_fields_only(self):
+        self.sut.subscribe({"include": ["hash", "header.number"]})
+        self.sut.subscribe({"include": ["uncles"]})
+
+        block_message = self.generate_new_eth_block()
+        internal_block_message = InternalEthBlockInfo.from_new_block_msg(block_message)
+        entry = self.sut.serialize(
+            EthRawBlock(
+                block_message.number(),
+                block_message.block_hash(),
+                FeedSource.BLOCKCHAIN_SOCKET,
+                iter([internal_block_message])
+            )
+        )
+
+        self.assertEqual({"hash", "header", "uncles"}, set(entry.__dict__))
+        self.assertIn("number", entry.header)
+
+        self.sut.subscribe({})
+        self.assertEqual(set(EthNewBlockFeed.FIELDS), self.sut.get_included_fields())
+
+    def test_block_feed_entry_from_rlp_matches_block(self):
+        block_message = self.generate_new_eth_block()
+        internal_block_message = InternalEthBlockInfo.from_new_block_msg(block_message)
+        block_hash = internal_block_message.block_hash()
+
+        self.assertEqual(
+            EthBlockFeedEntry(block_hash, block_message.get_block()),
+            EthBlockFeedEntry(block_hash, internal_block_message)
+        )
+        self.assertEqual(
+            EthBlockFeedEntry(block_hash, block_message.get_block(), ["header"]),
+            EthBlockFeedEntry(block_hash, internal_block_message.rawbytes(), ["header"])
+        )
+
     def _verify_block(self, block_hash_str, received_block):
         self.assertEqual(block_hash_str, received_block["hash"])
         block_items = [
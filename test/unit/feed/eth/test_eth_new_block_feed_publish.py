@@ -188,13 +188,13 @@ class EthNewBlockFeedPublishTest(AbstractTestCase):
         self.sut.publish_blocks_from_queue(10, 20)
         # no blocks in queueing service
         self.sut.publish.assert_not_called()
-        self.block_queuing_service.accepted_block_hash_at_height[11] = "11"
+        self.node.header_chain_index.set_canonical_block("11", 11)
         self.sut.publish_blocks_from_queue(10, 20)
         # only one block in queueing service
         self.sut.publish.assert_called_once()
         self.sut.publish = MagicMock()
         for i in range(10, 20):
-            self.block_queuing_service.accepted_block_hash_at_height[i] = str(i)
+            self.node.header_chain_index.set_canonical_block(str(i), i)
         self.sut.publish_blocks_from_queue(10, 20)
         # only one block in queueing service
         call_args = self.sut.publish.call_args_list
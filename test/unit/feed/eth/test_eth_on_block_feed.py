@@ -120,6 +120,52 @@ class EthOnBlockFeedTest(AbstractTestCase):
         self.assertEqual(len(calls), calls_number)
         self.assertEqual(subscriber.messages.qsize(), calls_number + 1)
 
+    @async_test
+    async def test_publish_identical_calls_executed_once(self):
+        data = "0x6d4ce63c"
+        subscribers = [
+            self.sut.subscribe({"call_params": [{"data": data, "name": f"call_{i}"}]})
+            for i in range(5)
+        ]
+        other_tag_subscriber = self.sut.subscribe({"call_params": [{"data": data, "name": "1", "tag": -1}]})
+
+        await self._publish_to_feed(10)
+
+        calls = self.node.eth_ws_proxy_publisher.call_rpc.mock.call_args_list
+        self.assertEqual(2, len(calls))
+        for i, subscriber in enumerate(subscribers):
+            self.assertEqual(subscriber.messages.qsize(), 2)
+            msg = subscriber.messages.get_nowait()
+            self.assertEqual(f"call_{i}", msg["name"])
+            self.assertEqual(10, msg["tag"])
+        msg = other_tag_subscriber.messages.get_nowait()
+        self.assertEqual(9, msg["tag"])
+
+    @async_test
+    async def test_publish_calls_with_max_concurrent_calls(self):
+        self.sut = EthOnBlockFeed(self.node, max_concurrent_calls=4)
+        in_flight_calls = []
+        max_in_flight_calls = []
+
+        async def call_rpc(method, params, request_id=None):
+            in_flight_calls.append(params)
+            max_in_flight_calls.append(len(in_flight_calls))
+            await asyncio.sleep(0)
+            in_flight_calls.remove(params)
+            return JsonRpcResponse(request_id=request_id, result={})
+
+        self.node.eth_ws_proxy_publisher.call_rpc = call_rpc
+        calls_number = 9
+        subscriber = self.sut.subscribe(
+            {"call_params": [{"data": hex(i), "name": hex(i)} for i in range(calls_number)]}
+        )
+
+        await self._publish_to_feed()
+
+        self.assertEqual(len(max_in_flight_calls), calls_number)
+        self.assertEqual(4, max(max_in_flight_calls))
+        self.assertEqual(subscriber.messages.qsize(), calls_number + 1)
+
     @async_test
     async def test_subscribe_update(self):
         subscriber = self.sut.subscribe(
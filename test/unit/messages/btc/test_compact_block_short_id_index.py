@@ -0,0 +1,55 @@
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.messages.btc.compact_block_short_id_index import CompactBlockShortIdIndex, \
+    CompactBlockShortIdIndexCache, compute_short_id, get_short_id_key
+
+
+class CompactBlockShortIdIndexTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.key = get_short_id_key(helpers.generate_bytearray(80), helpers.generate_bytearray(8))
+        self.tx_hashes = [helpers.generate_object_hash() for _ in range(100)]
+
+    def test_update_indexes_short_ids(self):
+        index = CompactBlockShortIdIndex(self.key)
+        self.assertEqual(100, index.update(self.tx_hashes))
+        self.assertEqual(100, len(index))
+
+        for tx_hash in self.tx_hashes:
+            short_id = compute_short_id(self.key, tx_hash.binary[::-1])
+            self.assertEqual(tx_hash, index.get_tx_hash(short_id))
+
+        self.assertIsNone(index.get_tx_hash(bytes(6)))
+
+    def test_update_only_indexes_new_transactions(self):
+        index = CompactBlockShortIdIndex(self.key)
+        index.update(self.tx_hashes[:60])
+
+        self.assertEqual(40, index.update(self.tx_hashes))
+        self.assertEqual(0, index.update(self.tx_hashes))
+        self.assertEqual(100, len(index))
+
+    def test_update_drops_removed_transactions(self):
+        index = CompactBlockShortIdIndex(self.key)
+        index.update(self.tx_hashes[:60])
+
+        new_tx_hash = helpers.generate_object_hash()
+        self.assertEqual(1, index.update(self.tx_hashes[10:60] + [new_tx_hash]))
+        self.assertEqual(51, len(index))
+
+        for tx_hash in self.tx_hashes[:10]:
+            self.assertIsNone(index.get_tx_hash(compute_short_id(self.key, tx_hash.binary[::-1])))
+        for tx_hash in self.tx_hashes[10:60] + [new_tx_hash]:
+            self.assertEqual(tx_hash, index.get_tx_hash(compute_short_id(self.key, tx_hash.binary[::-1])))
+
+    def test_cache_evicts_least_recently_used_key(self):
+        cache = CompactBlockShortIdIndexCache(max_size=2)
+        index_1 = cache.get_index(b"1")
+        cache.get_index(b"2")
+        self.assertIs(index_1, cache.get_index(b"1"))
+
+        cache.get_index(b"3")
+        self.assertEqual(2, len(cache))
+        self.assertIs(index_1, cache.get_index(b"1"))
+        self.assertEqual(2, len(cache))
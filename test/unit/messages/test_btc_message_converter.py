@@ -240,6 +240,41 @@ class BtcMessageConverterTests(AbstractTestCase):
             parsed_block.rawbytes().tobytes(), ref_block.rawbytes().tobytes()
         )
 
+    def test_resume_decompression_of_recovered_block(self):
+        self.tx_service, self.btc_message_converter = self.init(False)
+        parsed_block = get_sample_block()
+        transactions = parsed_block.txns()[:]
+        missing_transactions = {}
+        for short_id, txn in enumerate(transactions, 1):
+            bx_tx_hash = btc_common_utils.get_txid(txn)
+            self.tx_service.assign_short_id(bx_tx_hash, short_id)
+            if short_id % 3 == 0:
+                missing_transactions[bx_tx_hash] = txn
+            else:
+                self.tx_service.set_transaction_contents(bx_tx_hash, txn)
+        bx_block, block_info = self.btc_message_converter.block_to_bx_block(parsed_block, self.tx_service, True, 0)
+
+        decompression_result, decompression_state = self.btc_message_converter.bx_block_to_block_resumable(
+            bx_block, self.tx_service
+        )
+        self.assertIsNone(decompression_result.block_msg)
+        self.assertEqual(0, len(decompression_result.unknown_short_ids))
+        self.assertEqual(set(missing_transactions), set(decompression_result.unknown_tx_hashes))
+        self.assertEqual(len(missing_transactions), len(decompression_state.missing_tx_short_ids))
+
+        for bx_tx_hash, txn in missing_transactions.items():
+            self.tx_service.set_transaction_contents(bx_tx_hash, txn)
+
+        decompression_result, decompression_state = self.btc_message_converter.resume_bx_block_to_block(
+            decompression_state, self.tx_service
+        )
+        self.assertIsNone(decompression_state)
+        self.assertEqual(0, len(decompression_result.unknown_tx_hashes))
+        self.assertEqual(block_info.txn_count, decompression_result.block_info.txn_count)
+        self.assertEqual(
+            parsed_block.rawbytes().tobytes(), decompression_result.block_msg.rawbytes().tobytes()
+        )
+
     @multi_setup()
     def test_segwit_partial_compression(self):
         parsed_block = get_segwit_block()
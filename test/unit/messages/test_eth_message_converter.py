@@ -154,6 +154,23 @@ class EthMessageConverterTests(AbstractTestCase):
         tx_obj = tx_message.get_transactions()[0]
         self.assertEqual(tx, tx_obj)
 
+    def test_bx_txs_to_tx_msgs__single_message(self):
+        txs = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 4)]
+        bx_tx_messages = []
+        for tx in txs:
+            tx_bytes = rlp.encode(tx, Transaction)
+            tx_hash = Sha256Hash(hashlib.sha256(tx_bytes).digest())
+            bx_tx_messages.append(
+                TxMessage(message_hash=tx_hash, network_num=self.test_network_num, tx_val=tx_bytes)
+            )
+
+        tx_messages = self.eth_message_converter.bx_txs_to_tx_msgs(bx_tx_messages)
+
+        self.assertEqual(1, len(tx_messages))
+        self.assertIsInstance(tx_messages[0], TransactionsEthProtocolMessage)
+        self.assertEqual(txs, tx_messages[0].get_transactions())
+        self.assertEqual([], self.eth_message_converter.bx_txs_to_tx_msgs([]))
+
     @multi_setup()
     def test_block_to_bx_block__success(self):
         txs = []
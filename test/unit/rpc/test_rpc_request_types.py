@@ -0,0 +1,68 @@
+import json
+
+from bxcommon.feed.feed_manager import FeedManager
+from bxcommon.rpc.json_rpc_response import JsonRpcResponse
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.helpers import async_test
+from bxgateway.rpc import rpc_request_types
+from bxgateway.rpc.subscription_rpc_handler import SubscriptionRpcHandler
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+from bxutils.encoding.json_encoder import Case
+
+
+def create_request(method: str, params) -> str:
+    return json.dumps({"jsonrpc": "2.0", "id": "1", "method": method, "params": params})
+
+
+class RpcRequestTypesTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.gateway = MockGatewayNode(gateway_helpers.get_gateway_opts(8000))
+        self.rpc = SubscriptionRpcHandler(self.gateway, FeedManager(self.gateway), Case.SNAKE)
+
+    @async_test
+    async def test_handle_gateway_request(self):
+        response = JsonRpcResponse.from_jsons(
+            await self.rpc.handle_request(
+                create_request(rpc_request_types.BLXR_BATCH_TX, {"transactions": []})
+            )
+        )
+
+        self.assertEqual("1", response.id)
+        self.assertIsNotNone(response.error)
+        self.assertIsNone(response.result)
+
+    @async_test
+    async def test_handle_profile_request(self):
+        response = JsonRpcResponse.from_jsons(
+            await self.rpc.handle_request(create_request(rpc_request_types.PROFILE, {"top": 1}))
+        )
+
+        self.assertEqual("1", response.id)
+        self.assertIsNone(response.error)
+        self.assertIn("event_loop_lag", response.result)
+        self.assertIn("message_handlers", response.result)
+        self.assertIn("alarms", response.result)
+
+        response = JsonRpcResponse.from_jsons(
+            await self.rpc.handle_request(create_request(rpc_request_types.PROFILE, {"top": 0}))
+        )
+        self.assertIsNotNone(response.error)
+        self.assertIsNone(response.result)
+
+    @async_test
+    async def test_handle_gateway_request_other_method(self):
+        self.assertIsNone(
+            await rpc_request_types.handle_gateway_request(
+                self.rpc, self.rpc.gateway_request_handlers, create_request("blxr_tx", {})
+            )
+        )
+        # method names in params don't make a request a gateway method request
+        self.assertIsNone(
+            await rpc_request_types.handle_gateway_request(
+                self.rpc,
+                self.rpc.gateway_request_handlers,
+                create_request("blxr_tx", {"transaction": rpc_request_types.BLXR_BATCH_TX})
+            )
+        )
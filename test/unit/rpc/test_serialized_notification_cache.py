@@ -0,0 +1,86 @@
+import json
+
+from mock import patch
+
+from bxcommon.feed.feed import FeedKey
+from bxcommon.rpc.bx_json_rpc_request import BxJsonRpcRequest
+from bxcommon.rpc.rpc_request_type import RpcRequestType
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.rpc.serialized_notification_cache import SerializedNotificationCache
+from bxutils.encoding.json_encoder import Case
+
+FEED_KEY = FeedKey("newTxs")
+
+
+def create_notification(subscription_id: str, result) -> BxJsonRpcRequest:
+    return BxJsonRpcRequest(None, RpcRequestType.SUBSCRIBE, {"subscription": subscription_id, "result": result})
+
+
+class SerializedNotificationCacheTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.cache = SerializedNotificationCache(max_size=2)
+        self.result = {"tx_hash": "0x1234", "tx_contents": {"gas_price": "0x1", "input": "0xabcdef"}}
+
+    def test_serialize_spliced_notification_identical(self):
+        for case in [Case.SNAKE, Case.CAMEL]:
+            for subscription_id in ["subscription-1", "subscription-2"]:
+                notification = create_notification(subscription_id, self.result)
+                self.assertEqual(
+                    notification.to_jsons(case).encode(),
+                    self.cache.serialize(notification, FEED_KEY, (), case)
+                )
+
+    def test_serialize_result_once(self):
+        with patch.object(BxJsonRpcRequest, "to_jsons", autospec=True, side_effect=BxJsonRpcRequest.to_jsons) \
+                as to_jsons:
+            self.cache.serialize(create_notification("subscription-1", self.result), FEED_KEY, (), Case.SNAKE)
+            calls = to_jsons.call_count
+            serialized = self.cache.serialize(
+                create_notification("subscription-2", self.result), FEED_KEY, (), Case.SNAKE
+            )
+            self.assertEqual(calls, to_jsons.call_count)
+
+        message = json.loads(serialized)
+        self.assertEqual("subscription-2", message["params"]["subscription"])
+        self.assertEqual(self.result, message["params"]["result"])
+
+    def test_serialize_filtered_results_once(self):
+        include = ("tx_hash",)
+        self.cache.serialize(
+            create_notification("subscription-1", {"tx_hash": "0x1234"}), FEED_KEY, include, Case.SNAKE
+        )
+
+        with patch.object(BxJsonRpcRequest, "to_jsons", autospec=True, side_effect=BxJsonRpcRequest.to_jsons) \
+                as to_jsons:
+            self.cache.serialize(
+                create_notification("subscription-2", {"tx_hash": "0x1234"}), FEED_KEY, include, Case.SNAKE
+            )
+            to_jsons.assert_not_called()
+
+            # different include fields and evicted results are serialized again
+            self.cache.serialize(create_notification("subscription-3", {"tx_hash": "0x1234"}), FEED_KEY, (), Case.SNAKE)
+            self.assertEqual(1, to_jsons.call_count)
+            for tx_hash in ["0x5678", "0x9abc"]:
+                self.cache.serialize(
+                    create_notification("subscription-1", {"tx_hash": tx_hash}), FEED_KEY, include, Case.SNAKE
+                )
+            self.cache.serialize(
+                create_notification("subscription-2", {"tx_hash": "0x1234"}), FEED_KEY, include, Case.SNAKE
+            )
+            self.assertEqual(4, to_jsons.call_count)
+
+    def test_serialize_filtered_results_type_strict(self):
+        include = ("value", "flag")
+        self.cache = SerializedNotificationCache(max_size=10)
+        self.cache.serialize(
+            create_notification("subscription-1", {"value": 1, "flag": True}), FEED_KEY, include, Case.SNAKE
+        )
+
+        # equal by ==, but serialized differently
+        for result in [{"value": 1.0, "flag": True}, {"value": 1, "flag": 1}, {"flag": True, "value": 1}]:
+            notification = create_notification("subscription-2", result)
+            self.assertEqual(
+                notification.to_jsons(Case.SNAKE).encode(),
+                self.cache.serialize(notification, FEED_KEY, include, Case.SNAKE)
+            )
@@ -0,0 +1,89 @@
+import asyncio
+from typing import List, Dict
+
+from mock import MagicMock
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.helpers import async_test
+from bxgateway.rpc.ws.ws_connection import WsConnection
+
+
+class MockWebSocket:
+    def __init__(self, messages: List[str]) -> None:
+        self.messages = messages
+        self.sent_messages = []
+
+    def __aiter__(self):
+        return self._iter_messages()
+
+    async def _iter_messages(self):
+        for message in self.messages:
+            yield message
+
+    async def send(self, message: str) -> None:
+        self.sent_messages.append(message)
+
+
+class WsConnectionTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.request_events: Dict[str, asyncio.Event] = {}
+        self.started_requests = []
+        self.rpc_handler = MagicMock()
+        self.rpc_handler.handle_request = self._handle_request
+
+    async def _handle_request(self, message: str) -> str:
+        self.started_requests.append(message)
+        event = self.request_events.get(message)
+        if event is not None:
+            await event.wait()
+        return message
+
+    @async_test
+    async def test_handle_request_serialized(self):
+        websocket = MockWebSocket(["1", "2"])
+        connection = WsConnection(websocket, "", self.rpc_handler, 1)
+
+        await connection.handle_request(websocket, "")
+
+        self.assertEqual(["1", "2"], websocket.sent_messages)
+
+    @async_test
+    async def test_handle_request_pipelined_responds_as_requests_complete(self):
+        self.request_events["1"] = asyncio.Event()
+        websocket = MockWebSocket(["1", "2"])
+        connection = WsConnection(websocket, "", self.rpc_handler, 2)
+
+        await connection.handle_request(websocket, "")
+        await asyncio.sleep(0)
+        self.assertEqual(["2"], websocket.sent_messages)
+
+        self.request_events["1"].set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertEqual(["2", "1"], websocket.sent_messages)
+        self.assertEqual(0, len(connection._in_flight_requests))
+
+    @async_test
+    async def test_handle_request_pipelined_limits_in_flight_requests(self):
+        self.request_events["1"] = asyncio.Event()
+        self.request_events["2"] = asyncio.Event()
+        websocket = MockWebSocket(["1", "2", "3"])
+        connection = WsConnection(websocket, "", self.rpc_handler, 2)
+
+        request_handler = asyncio.ensure_future(connection.handle_request(websocket, ""))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertEqual(["1", "2"], self.started_requests)
+        self.assertFalse(request_handler.done())
+
+        self.request_events["2"].set()
+        await request_handler
+        await asyncio.sleep(0)
+        self.assertEqual(["1", "2", "3"], self.started_requests)
+        self.assertEqual(["2", "3"], websocket.sent_messages)
+
+        self.request_events["1"].set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertEqual(["2", "3", "1"], websocket.sent_messages)
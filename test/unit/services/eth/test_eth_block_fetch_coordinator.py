@@ -0,0 +1,82 @@
+import time
+
+from mock import MagicMock
+
+from bxcommon.network.ip_endpoint import IpEndpoint
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.services.eth.eth_block_fetch_coordinator import EthBlockFetchCoordinator
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+
+BLOCK_NUMBER = 10
+HEDGE_DELAY_S = 0.25
+
+
+class EthBlockFetchCoordinatorTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        opts = gateway_helpers.get_gateway_opts(8000, blockchain_protocol="Ethereum")
+        self.node = MockGatewayNode(opts)
+        self.coordinator = EthBlockFetchCoordinator(self.node, HEDGE_DELAY_S)
+        self.block_hash = helpers.generate_object_hash()
+        self.connection_1 = self._create_connection(8001)
+        self.connection_2 = self._create_connection(8002)
+        self.connection_3 = self._create_connection(8003)
+
+    def _create_connection(self, port: int) -> MagicMock:
+        connection = MagicMock()
+        connection.endpoint = IpEndpoint("127.0.0.1", port)
+        connection.is_alive = MagicMock(return_value=True)
+        return connection
+
+    def _advance_time(self, delay_s: float) -> None:
+        time.time = MagicMock(return_value=time.time() + delay_s)
+        self.node.alarm_queue.fire_alarms()
+
+    def test_only_first_announcement_is_requested(self):
+        self.assertTrue(self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_1))
+        self.assertFalse(self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_2))
+        self.assertFalse(self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_1))
+
+        self.assertTrue(self.coordinator.on_block_fetched(self.block_hash, self.connection_1))
+        self.assertFalse(self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_3))
+
+        self._advance_time(HEDGE_DELAY_S)
+        self.connection_2.connection_protocol.request_new_block.assert_not_called()
+        self.assertIsNotNone(self.coordinator.get_fetch_latency_ms(self.connection_1))
+
+    def test_slow_fetch_is_hedged_to_fastest_announcer(self):
+        self.coordinator._fetch_latencies = {"127.0.0.1:8002": 0.5, "127.0.0.1:8003": 0.1}
+        self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_1)
+        self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_2)
+        self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_3)
+
+        self._advance_time(HEDGE_DELAY_S)
+
+        self.connection_2.connection_protocol.request_new_block.assert_not_called()
+        self.connection_3.connection_protocol.request_new_block.assert_called_once_with(
+            self.block_hash, BLOCK_NUMBER
+        )
+
+        self.assertTrue(self.coordinator.on_block_fetched(self.block_hash, self.connection_3))
+        self.assertTrue(self.coordinator.is_fetched(self.block_hash, self.connection_1))
+        self.assertFalse(self.coordinator.on_block_fetched(self.block_hash, self.connection_1))
+
+    def test_late_announcement_is_requested_after_hedge_delay(self):
+        self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_1)
+        self._advance_time(HEDGE_DELAY_S)
+
+        self.assertFalse(self.coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_2))
+        self.connection_2.connection_protocol.request_new_block.assert_called_once_with(
+            self.block_hash, BLOCK_NUMBER
+        )
+
+    def test_hedging_disabled(self):
+        coordinator = EthBlockFetchCoordinator(self.node, 0)
+        coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_1)
+        coordinator.on_block_announced(self.block_hash, BLOCK_NUMBER, self.connection_2)
+
+        self._advance_time(HEDGE_DELAY_S)
+
+        self.connection_2.connection_protocol.request_new_block.assert_not_called()
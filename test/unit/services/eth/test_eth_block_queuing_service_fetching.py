@@ -188,13 +188,13 @@ class EthBlockQueuingServiceFetchingTest(AbstractTestCase):
     def test_iterate_recent_block_hashes(self):
         top_blocks = list(self.block_queuing_service.iterate_recent_block_hashes(max_count=10))
         block_hash = top_blocks[0]
-        self.assertEqual(self.block_queuing_service._height_by_block_hash[block_hash],
-                         self.block_queuing_service._highest_block_number)
+        self.assertEqual(self.node.header_chain_index.get_height(block_hash),
+                         self.node.header_chain_index.highest_block_number)
         self.assertEqual(10, len(top_blocks))
 
     def test_get_transactions_hashes_from_message(self):
-        last_block_hash = list(self.block_queuing_service._block_hashes_by_height[
-            self.block_queuing_service._highest_block_number])[0]
+        last_block_hash = self.node.header_chain_index.get_block_hashes_at_height(
+            self.node.header_chain_index.highest_block_number)[0]
         self.assertIsNotNone(self.block_queuing_service.get_block_body_from_message(last_block_hash))
         self.assertIsNone(self.block_queuing_service.get_block_body_from_message(bytes(64)))
 
@@ -252,3 +252,12 @@ class EthBlockQueuingServiceFetchingTest(AbstractTestCase):
         self.assertFalse(result)
         self.node_conn.enqueue_msg.assert_not_called()
 
+
+    def test_remove_keeps_height_of_block_in_storage(self):
+        block_hash = self.block_hashes[10]
+
+        self.block_queuing_service.remove(block_hash)
+        self.assertEqual(1010, self.node.header_chain_index.get_height(block_hash))
+
+        self.node.block_queuing_service_manager.remove(block_hash)
+        self.assertNotIn(block_hash, self.node.header_chain_index)
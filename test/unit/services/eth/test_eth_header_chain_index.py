@@ -0,0 +1,89 @@
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.services.eth.eth_header_chain_index import EthHeaderChainIndex
+
+MAX_LENGTH = 10
+
+
+class EthHeaderChainIndexTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.index = EthHeaderChainIndex(MAX_LENGTH)
+
+    def _add_chain(self, start_height: int, length: int, parent_hash=None):
+        block_hashes = []
+        for height in range(start_height, start_height + length):
+            block_hash = helpers.generate_object_hash()
+            self.index.add_header(block_hash, height, parent_hash)
+            block_hashes.append(block_hash)
+            parent_hash = block_hash
+        return block_hashes
+
+    def test_add_header(self):
+        block_hashes = self._add_chain(100, 5)
+
+        self.assertEqual(5, len(self.index))
+        self.assertEqual(104, self.index.highest_block_number)
+        for height, block_hash in enumerate(block_hashes, 100):
+            self.assertIn(block_hash, self.index)
+            self.assertEqual(height, self.index.get_height(block_hash))
+            self.assertEqual([block_hash], self.index.get_block_hashes_at_height(height))
+        self.assertEqual(block_hashes[1], self.index.get_entry(block_hashes[2]).parent_hash)
+
+        self.assertFalse(self.index.has_height(99))
+        self.assertFalse(self.index.has_height(105))
+        self.assertIsNone(self.index.get_height(helpers.generate_object_hash()))
+
+    def test_add_older_header(self):
+        self._add_chain(100, 5)
+        older_block_hash = helpers.generate_object_hash()
+
+        self.index.add_header(older_block_hash, 97)
+
+        self.assertEqual(97, self.index.get_height(older_block_hash))
+        self.assertFalse(self.index.has_height(98))
+        self.assertEqual(104, self.index.highest_block_number)
+
+        too_old_block_hash = helpers.generate_object_hash()
+        self.index.add_header(too_old_block_hash, 90)
+        self.assertNotIn(too_old_block_hash, self.index)
+
+    def test_fork_and_remove(self):
+        block_hashes = self._add_chain(100, 3)
+        fork_block_hash = helpers.generate_object_hash()
+        self.index.add_header(fork_block_hash, 101, block_hashes[0])
+
+        self.assertEqual([block_hashes[1], fork_block_hash], self.index.get_block_hashes_at_height(101))
+
+        self.index.remove(block_hashes[1])
+        self.assertNotIn(block_hashes[1], self.index)
+        self.assertEqual([fork_block_hash], self.index.get_block_hashes_at_height(101))
+
+    def test_window_moves_forward(self):
+        block_hashes = self._add_chain(100, MAX_LENGTH + 5)
+
+        self.assertEqual(MAX_LENGTH, len(self.index))
+        self.assertFalse(self.index.has_height(104))
+        self.assertNotIn(block_hashes[4], self.index)
+        self.assertTrue(self.index.has_height(105))
+
+        far_block_hash = helpers.generate_object_hash()
+        self.index.add_header(far_block_hash, 200)
+        self.assertEqual(1, len(self.index))
+        self.assertEqual(200, self.index.highest_block_number)
+        self.assertEqual(200, self.index.get_height(far_block_hash))
+
+    def test_canonical_chain_reorganization(self):
+        block_hashes = self._add_chain(100, 4)
+        for height, block_hash in enumerate(block_hashes, 100):
+            self.index.set_canonical_block(block_hash, height)
+        fork_block_hashes = self._add_chain(102, 3, block_hashes[1])
+
+        self.index.set_canonical_block(fork_block_hashes[2], 104)
+
+        self.assertEqual(block_hashes[0], self.index.get_canonical_block_hash(100))
+        self.assertEqual(block_hashes[1], self.index.get_canonical_block_hash(101))
+        self.assertEqual(fork_block_hashes[0], self.index.get_canonical_block_hash(102))
+        self.assertEqual(fork_block_hashes[1], self.index.get_canonical_block_hash(103))
+        self.assertEqual(fork_block_hashes[2], self.index.get_canonical_block_hash(104))
+        self.assertIsNone(self.index.get_canonical_block_hash(105))
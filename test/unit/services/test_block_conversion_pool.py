@@ -0,0 +1,143 @@
+import os
+import pickle
+
+import blxr_rlp as rlp
+
+from bxcommon import constants
+from bxcommon.messages.eth.serializers.block import Block
+from bxcommon.messages.eth.serializers.transaction import Transaction
+from bxcommon.services.transaction_service import TransactionService
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.test_utils.helpers import async_test
+from bxcommon.test_utils.mocks.mock_node import MockNode
+from bxcommon.utils import convert
+from bxcommon.utils.blockchain_utils.btc import btc_common_utils
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway.messages.btc.block_btc_message import BlockBtcMessage
+from bxgateway.messages.btc.btc_normal_message_converter import BtcNormalMessageConverter
+from bxgateway.messages.eth.eth_normal_message_converter import EthNormalMessageConverter
+from bxgateway.messages.eth.internal_eth_block_info import InternalEthBlockInfo
+from bxgateway.messages.eth.protocol.new_block_eth_protocol_message import NewBlockEthProtocolMessage
+from bxgateway.services.block_conversion_pool import BlockConversionPool, TransactionServiceSnapshot, \
+    SnapshotTransactionInfo
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks import mock_eth_messages
+from bxgateway.utils.errors import message_conversion_error
+from bxgateway.utils.errors.message_conversion_error import MessageConversionError, MessageConversionType
+
+
+class TransactionServiceSnapshotTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.tx_hash_1 = Sha256Hash(helpers.generate_bytearray(32))
+        self.tx_hash_2 = Sha256Hash(helpers.generate_bytearray(32))
+        self.tx_contents = helpers.generate_bytearray(250)
+
+    def test_short_id_lookups(self):
+        snapshot = TransactionServiceSnapshot({self.tx_hash_1: 10}, {10: 1234.5})
+
+        self.assertEqual(10, snapshot.get_short_id_by_key(snapshot.get_transaction_key(self.tx_hash_1)))
+        self.assertEqual(1234.5, snapshot.get_short_id_assign_time(10))
+        self.assertEqual(
+            constants.NULL_TX_SID, snapshot.get_short_id_by_key(snapshot.get_transaction_key(self.tx_hash_2))
+        )
+        self.assertEqual(0, snapshot.get_short_id_assign_time(20))
+
+    def test_get_missing_transactions(self):
+        snapshot = TransactionServiceSnapshot(transactions={
+            1: SnapshotTransactionInfo(self.tx_hash_1, self.tx_contents, 1),
+            2: SnapshotTransactionInfo(self.tx_hash_2, None, 2),
+        })
+
+        self.assertEqual(self.tx_contents, snapshot.get_transaction(1).contents)
+        self.assertEqual(SnapshotTransactionInfo(None, None, 3), snapshot.get_transaction(3))
+
+        has_missing, unknown_short_ids, unknown_tx_hashes = snapshot.get_missing_transactions([1, 2, 3])
+        self.assertTrue(has_missing)
+        self.assertEqual([3], unknown_short_ids)
+        self.assertEqual([self.tx_hash_2], unknown_tx_hashes)
+
+        has_missing, unknown_short_ids, unknown_tx_hashes = snapshot.get_missing_transactions([1])
+        self.assertFalse(has_missing)
+        self.assertEqual([], unknown_short_ids)
+        self.assertEqual([], unknown_tx_hashes)
+
+    def test_pickle_message_conversion_error(self):
+        error = message_conversion_error.btc_block_compression_error(self.tx_hash_1, "invalid block")
+
+        unpickled_error = pickle.loads(pickle.dumps(error))
+        self.assertIsInstance(unpickled_error, MessageConversionError)
+        self.assertEqual(self.tx_hash_1, unpickled_error.msg_hash)
+        self.assertEqual(MessageConversionType.BLOCK_COMPRESSION, unpickled_error.conversion_type)
+        self.assertEqual(error.error_msg, unpickled_error.error_msg)
+
+    def test_pickle_message_conversion_error_with_exception(self):
+        # wrapped errors are only kept in their string form, they may not be picklable
+        error = MessageConversionError(
+            self.tx_hash_1,
+            b"block",
+            b"broadcast",
+            ValueError(memoryview(b"invalid block")),
+            MessageConversionType.BLOCK_COMPRESSION
+        )
+
+        unpickled_error = pickle.loads(pickle.dumps(error))
+        self.assertEqual(error.error_msg, unpickled_error.error_msg)
+
+
+class BlockConversionPoolTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.tx_service = TransactionService(MockNode(gateway_helpers.get_gateway_opts(8000)), 0)
+        self.pools = []
+
+    def tearDown(self) -> None:
+        for pool in self.pools:
+            pool.close()
+        super().tearDown()
+
+    @async_test
+    async def test_btc_conversion_matches_converter(self):
+        root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with open(os.path.join(root_dir, "samples/btc_sample_block.txt")) as sample_file:
+            block_msg = BlockBtcMessage(buf=bytearray(convert.hex_to_bytes(sample_file.read().strip("\n"))))
+        # some transactions are left without short ids, so they are sent in full
+        for short_id, tx in enumerate(block_msg.txns()[::2]):
+            tx_hash = btc_common_utils.get_txid(tx)
+            self.tx_service.assign_short_id(tx_hash, short_id + 1)
+            self.tx_service.set_transaction_contents(tx_hash, tx)
+
+        await self._assert_conversion_matches_converter(BtcNormalMessageConverter(block_msg.magic()), block_msg)
+
+    @async_test
+    async def test_eth_conversion_matches_converter(self):
+        txs = []
+        for i in range(1, 100):
+            tx = mock_eth_messages.get_dummy_transaction(i)
+            txs.append(tx)
+            if i % 2 == 0:
+                self.tx_service.assign_short_id(tx.hash(), i)
+                self.tx_service.set_transaction_contents(tx.hash(), rlp.encode(tx, Transaction))
+        block = Block(mock_eth_messages.get_dummy_block_header(100), txs, [])
+        block_msg = InternalEthBlockInfo.from_new_block_msg(NewBlockEthProtocolMessage(None, block, 40000000))
+
+        await self._assert_conversion_matches_converter(EthNormalMessageConverter(), block_msg)
+
+    async def _assert_conversion_matches_converter(self, message_converter, block_msg) -> None:
+        pool = BlockConversionPool(message_converter, 1)
+        self.pools.append(pool)
+
+        bx_block, block_info = message_converter.block_to_bx_block(block_msg, self.tx_service, True, 0)
+        pool_bx_block, pool_block_info = await pool.block_to_bx_block(block_msg, self.tx_service, True, 0)
+        self.assertEqual(bytes(bx_block), bytes(pool_bx_block))
+        self.assertEqual(block_info.short_ids, pool_block_info.short_ids)
+
+        decompression_result = message_converter.bx_block_to_block(bx_block, self.tx_service)
+        pool_decompression_result = await pool.bx_block_to_block(bx_block, self.tx_service)
+        self.assertEqual(
+            bytes(decompression_result.block_msg.rawbytes()), bytes(pool_decompression_result.block_msg.rawbytes())
+        )
+        self.assertEqual([], pool_decompression_result.unknown_short_ids)
+        self.assertEqual([], pool_decompression_result.unknown_tx_hashes)
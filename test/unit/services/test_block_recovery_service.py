@@ -93,6 +93,20 @@ class BlockRecoveryManagerTest(AbstractTestCase):
         self.assertEqual(self.block_recovery_service.recovered_blocks[0][0], self.blocks[0])
         self.assertEqual(self.block_recovery_service.recovered_blocks[0][1], RecoveredTxsSource.TXS_RECEIVED_FROM_BDN)
 
+    def test_recovered_blocks__with_decompression_state(self):
+        bx_block = _create_block()
+        block_hash = Sha256Hash(os.urandom(32))
+        decompression_state = MagicMock()
+        self.block_recovery_service.add_block(bx_block, block_hash, [1], [], decompression_state)
+
+        self.block_recovery_service.check_missing_sid(1, RecoveredTxsSource.TXS_RECEIVED_FROM_BDN)
+
+        self._assert_no_blocks_awaiting_recovery()
+        self.assertEqual(
+            [(bx_block, RecoveredTxsSource.TXS_RECEIVED_FROM_BDN, decompression_state)],
+            self.block_recovery_service.recovered_blocks
+        )
+
     def test_clean_up_old_blocks__single_block(self):
         self.assertFalse(self.block_recovery_service._cleanup_scheduled)
         self.assertEqual(len(self.alarm_queue.alarms), 0)
@@ -265,6 +279,7 @@ class BlockRecoveryManagerTest(AbstractTestCase):
         self.assertEqual(0, len(self.block_recovery_service._bx_block_hash_to_sids))
         self.assertEqual(0, len(self.block_recovery_service._bx_block_hash_to_tx_hashes))
         self.assertEqual(0, len(self.block_recovery_service._bx_block_hash_to_block_hash))
+        self.assertEqual(0, len(self.block_recovery_service._bx_block_hash_to_decompression_state))
 
         self.assertEqual(0, len(self.block_recovery_service._sid_to_bx_block_hashes))
         self.assertEqual(0, len(self.block_recovery_service._tx_hash_to_bx_block_hashes))
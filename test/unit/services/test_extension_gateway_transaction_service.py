@@ -107,5 +107,29 @@ class ExtensionGatewayTransactionServiceTest(AbstractTransactionServiceTestCase)
     def test_get_transactions(self):
         self._test_get_transactions()
 
+    def test_evict_transactions_without_short_ids(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(3)]
+        for tx_hash in tx_hashes:
+            self.transaction_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(100))
+        self.transaction_service.assign_short_id(tx_hashes[0], 10)
+
+        self.assertEqual((1, 100), self.transaction_service.evict_transactions_without_short_ids(50))
+
+        self.assertTrue(self.transaction_service.has_transaction_contents(tx_hashes[0]))
+        self.assertFalse(self.transaction_service.has_transaction_contents(tx_hashes[1]))
+        self.assertTrue(self.transaction_service.has_transaction_contents(tx_hashes[2]))
+        self.assertEqual(200, self.transaction_service.get_transaction_contents_size())
+        self.assertFalse(
+            self.transaction_service.removed_transaction_by_key(
+                self.transaction_service.get_transaction_key(tx_hashes[1])
+            )
+        )
+        self.assertEqual(
+            0,
+            self.transaction_service.remove_transaction_contents_by_key(
+                self.transaction_service.get_transaction_key(tx_hashes[1])
+            )
+        )
+
     def _get_transaction_service(self) -> ExtensionGatewayTransactionService:
         return ExtensionGatewayTransactionService(self.mock_node, 0)
\ No newline at end of file
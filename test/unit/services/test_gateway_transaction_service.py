@@ -1,5 +1,8 @@
 from mock import MagicMock
 
+from bxcommon import constants
+from bxcommon.test_utils import helpers
+from bxgateway.services import gateway_transaction_service
 from bxgateway.services.gateway_transaction_service import GatewayTransactionService
 from bxcommon.test_utils.abstract_transaction_service_test_case import AbstractTransactionServiceTestCase
 
@@ -65,5 +68,64 @@ class GatewayTransactionServiceTest(AbstractTransactionServiceTestCase):
     def test_get_transactions(self):
         self._test_get_transactions()
 
+    def test_get_short_ids_and_assign_times(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(3)]
+        self.transaction_service.assign_short_id(tx_hashes[0], 10)
+        self.transaction_service.assign_short_id(tx_hashes[2], 12)
+
+        short_ids, assign_times = self.transaction_service.get_short_ids_and_assign_times(tx_hashes)
+
+        self.assertEqual([10, constants.NULL_TX_SID, 12], short_ids)
+        self.assertEqual(
+            [
+                self.transaction_service.get_short_id_assign_time(10),
+                0,
+                self.transaction_service.get_short_id_assign_time(12)
+            ],
+            assign_times
+        )
+
+    def test_get_short_ids_and_assign_times_single_pass(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(4)]
+        self.transaction_service.assign_short_id(tx_hashes[0], 10)
+        self.transaction_service.assign_short_id(tx_hashes[1], 11)
+        self.transaction_service.assign_short_id(tx_hashes[1], 12)
+        self.transaction_service.assign_short_id(tx_hashes[3], 13)
+        expected = gateway_transaction_service.look_up_short_ids_and_assign_times(
+            self.transaction_service, tx_hashes
+        )
+
+        self.transaction_service.get_short_id_by_key = MagicMock()
+        self.transaction_service.get_short_id_assign_time = MagicMock()
+        self.assertEqual(
+            expected, gateway_transaction_service.get_short_ids_and_assign_times(self.transaction_service, tx_hashes)
+        )
+        self.transaction_service.get_short_id_by_key.assert_not_called()
+        self.transaction_service.get_short_id_assign_time.assert_not_called()
+
+    def test_evict_transactions_without_short_ids(self):
+        tx_hashes = [helpers.generate_object_hash() for _ in range(3)]
+        for tx_hash in tx_hashes:
+            self.transaction_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(100))
+        self.transaction_service.assign_short_id(tx_hashes[0], 10)
+
+        self.assertEqual((1, 100), self.transaction_service.evict_transactions_without_short_ids(50))
+
+        self.assertTrue(self.transaction_service.has_transaction_contents(tx_hashes[0]))
+        self.assertFalse(self.transaction_service.has_transaction_contents(tx_hashes[1]))
+        self.assertTrue(self.transaction_service.has_transaction_contents(tx_hashes[2]))
+        self.assertEqual(200, self.transaction_service.get_transaction_contents_size())
+        self.assertFalse(
+            self.transaction_service.removed_transaction_by_key(
+                self.transaction_service.get_transaction_key(tx_hashes[1])
+            )
+        )
+        self.assertEqual(
+            0,
+            self.transaction_service.remove_transaction_contents_by_key(
+                self.transaction_service.get_transaction_key(tx_hashes[1])
+            )
+        )
+
     def _get_transaction_service(self) -> GatewayTransactionService:
         return GatewayTransactionService(self.mock_node, 0)
@@ -0,0 +1,133 @@
+from mock import MagicMock, patch
+
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.expiring_dict import ExpiringDict
+from bxcommon.utils.object_hash import Sha256Hash
+from bxgateway import gateway_constants
+from bxgateway.messages.eth.new_block_parts import NewBlockParts
+from bxgateway.services import memory_governor
+from bxgateway.services.memory_governor import MemoryGovernor
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+
+
+class MemoryGovernorTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.node = MockGatewayNode(gateway_helpers.get_gateway_opts(8000, should_restart_on_high_memory=True))
+        self.node.block_recovery_service = MagicMock()
+        self.node.block_recovery_service.evict_oldest_blocks = MagicMock(return_value=(1, 500))
+        self.node.block_recovery_service.get_blocks_size = MagicMock(return_value=0)
+        self.node.block_queuing_service_manager.is_seen_by_all_blockchain_nodes = MagicMock(return_value=True)
+        self.memory_governor = MemoryGovernor(self.node, 1000)
+
+        self.tx_service = self.node.get_tx_service()
+        self.tx_hash_with_short_id = Sha256Hash(helpers.generate_bytearray(32))
+        self.tx_service.set_transaction_contents(self.tx_hash_with_short_id, helpers.generate_bytearray(100))
+        self.tx_service.assign_short_id(self.tx_hash_with_short_id, 1)
+        self.tx_hashes = []
+        for _ in range(2):
+            tx_hash = Sha256Hash(helpers.generate_bytearray(32))
+            self.tx_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(100))
+            self.tx_hashes.append(tx_hash)
+
+        self.block_hash = Sha256Hash(helpers.generate_bytearray(32))
+        block = MagicMock()
+        block.rawbytes = MagicMock(return_value=helpers.generate_bytearray(300))
+        self.node.block_storage[self.block_hash] = block
+        self.node.block_queuing_service_manager.remove = MagicMock(
+            wraps=self.node.block_queuing_service_manager.remove
+        )
+
+    def test_evict_in_priority_order(self):
+        evicted = self.memory_governor.evict(150)
+
+        self.assertEqual({memory_governor.TX_CONTENTS: (2, 200)}, evicted)
+        for tx_hash in self.tx_hashes:
+            self.assertFalse(self.tx_service.has_transaction_contents(tx_hash))
+            # evicted transactions are still pending, so they are not tracked as removed
+            self.assertFalse(self.tx_service.removed_transaction_by_key(self.tx_service.get_transaction_key(tx_hash)))
+        self.assertTrue(self.tx_service.has_transaction_contents(self.tx_hash_with_short_id))
+        self.assertEqual(100, self.tx_service.get_transaction_contents_size())
+        self.assertIn(self.block_hash, self.node.block_storage)
+
+        evicted = self.memory_governor.evict(1000)
+
+        self.assertEqual(
+            {memory_governor.BLOCK_STORAGE: (1, 300), memory_governor.BLOCK_RECOVERY: (1, 500)},
+            evicted
+        )
+        self.assertNotIn(self.block_hash, self.node.block_storage)
+        # removed through the block queuing services, so they can drop their own references to the block
+        self.node.block_queuing_service_manager.remove.assert_called_once_with(self.block_hash)
+        self.node.block_recovery_service.evict_oldest_blocks.assert_called_once_with(700)
+        self.assertEqual(2, self.memory_governor.evicted_items[memory_governor.TX_CONTENTS])
+        self.assertEqual(300, self.memory_governor.evicted_bytes[memory_governor.BLOCK_STORAGE])
+
+    def test_evict_keeps_blocks_not_seen_by_blockchain_nodes(self):
+        self.node.block_queuing_service_manager.is_seen_by_all_blockchain_nodes = MagicMock(return_value=False)
+
+        evicted = self.memory_governor.evict(1000)
+
+        self.assertNotIn(memory_governor.BLOCK_STORAGE, evicted)
+        self.assertIn(self.block_hash, self.node.block_storage)
+
+    def test_evict_block_parts(self):
+        block_parts_hash = Sha256Hash(helpers.generate_bytearray(32))
+        self.node.block_parts_storage = ExpiringDict(self.node.alarm_queue, 60, "test_block_parts")
+        self.node.block_parts_storage[block_parts_hash] = NewBlockParts(
+            memoryview(helpers.generate_bytearray(100)), memoryview(helpers.generate_bytearray(200)), 1
+        )
+        self.assertEqual(300, self.memory_governor.get_tracked_sizes()[memory_governor.BLOCK_PARTS_STORAGE])
+
+        evicted = self.memory_governor.evict(700)
+
+        self.assertEqual((1, 300), evicted[memory_governor.BLOCK_PARTS_STORAGE])
+        self.assertNotIn(block_parts_hash, self.node.block_parts_storage)
+
+    @patch("bxcommon.utils.memory_utils.get_app_memory_usage")
+    def test_check_memory_evicts_by_tracked_size(self, get_app_memory_usage):
+        # memory usage of the process does not trigger evictions
+        get_app_memory_usage.return_value = gateway_constants.CHECK_MEMORY_THRESHOLD_LIMIT * 2
+        self.node.opts.should_restart_on_high_memory = False
+        self.memory_governor.budget_bytes = 700
+
+        self.memory_governor.check_memory()
+        self.assertTrue(self.tx_service.has_transaction_contents(self.tx_hashes[0]))
+
+        tx_hash = Sha256Hash(helpers.generate_bytearray(32))
+        self.tx_service.set_transaction_contents(tx_hash, helpers.generate_bytearray(100))
+        self.memory_governor.check_memory()
+
+        self.assertFalse(self.tx_service.has_transaction_contents(self.tx_hashes[0]))
+        self.assertFalse(self.tx_service.has_transaction_contents(self.tx_hashes[1]))
+        self.assertTrue(self.tx_service.has_transaction_contents(tx_hash))
+        self.assertIn(self.block_hash, self.node.block_storage)
+        self.assertFalse(self.node.should_force_exit)
+
+    @patch("bxcommon.utils.memory_utils.get_app_memory_usage")
+    def test_check_memory_restarts_as_last_resort(self, get_app_memory_usage):
+        get_app_memory_usage.return_value = gateway_constants.CHECK_MEMORY_THRESHOLD_LIMIT
+        self.memory_governor.check_memory()
+        self.assertEqual(0, self.memory_governor.over_limit_checks)
+
+        get_app_memory_usage.return_value = gateway_constants.CHECK_MEMORY_THRESHOLD_LIMIT + 1
+        for _ in range(gateway_constants.MEMORY_MAX_OVER_LIMIT_CHECKS - 1):
+            self.memory_governor.check_memory()
+        self.assertFalse(self.node.should_force_exit)
+
+        self.memory_governor.check_memory()
+        self.assertTrue(self.node.should_force_exit)
+
+    @patch("bxcommon.utils.memory_utils.get_app_memory_usage")
+    def test_check_memory_without_budget(self, get_app_memory_usage):
+        memory_governor_without_budget = MemoryGovernor(self.node, 0)
+        get_app_memory_usage.return_value = gateway_constants.CHECK_MEMORY_THRESHOLD_LIMIT + 1
+
+        self.assertEqual(
+            gateway_constants.CHECK_MEMORY_THRESHOLD_INTERVAL_S, memory_governor_without_budget.check_memory()
+        )
+
+        self.assertTrue(self.tx_service.has_transaction_contents(self.tx_hashes[0]))
+        self.assertTrue(self.node.should_force_exit)
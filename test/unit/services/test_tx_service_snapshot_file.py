@@ -0,0 +1,82 @@
+import os
+import tempfile
+
+from mock import MagicMock
+
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxcommon.utils.object_hash import Sha256Hash
+
+from bxgateway.services import tx_service_snapshot_file
+from bxgateway.services.gateway_transaction_service import GatewayTransactionService
+from bxgateway.testing import gateway_helpers
+from bxgateway.testing.mocks.mock_gateway_node import MockGatewayNode
+
+NETWORK_NUM = 5
+
+
+class TxServiceSnapshotFileTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.node = MockGatewayNode(gateway_helpers.get_gateway_opts(8000))
+        self.node.block_recovery_service = MagicMock()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tx_service_snapshot.bin")
+
+        tx_service = GatewayTransactionService(self.node, NETWORK_NUM)
+        self.tx_hash_1 = Sha256Hash(helpers.generate_bytearray(32))
+        self.tx_hash_2 = Sha256Hash(helpers.generate_bytearray(32))
+        self.tx_contents = helpers.generate_bytearray(250)
+        tx_service.set_transaction_contents(self.tx_hash_1, self.tx_contents)
+        tx_service.assign_short_id(self.tx_hash_1, 10)
+        tx_service.assign_short_id(self.tx_hash_1, 11)
+        tx_service.assign_short_id(self.tx_hash_2, 20)
+        tx_service_snapshot_file.write_snapshot_file(
+            self.path, tx_service_snapshot_file.serialize_tx_service(tx_service, NETWORK_NUM)
+        )
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_load_snapshot(self):
+        tx_service = GatewayTransactionService(self.node, NETWORK_NUM)
+        result = tx_service_snapshot_file.load_snapshot_file(tx_service, self.path, NETWORK_NUM, 60, 60)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(2, result.transactions_count)
+        self.assertEqual(3, result.short_ids_count)
+        self.assertEqual(0, result.expired_short_ids_count)
+        self.assertEqual(self.tx_contents, tx_service.get_transaction_by_hash(self.tx_hash_1))
+        self.assertEqual(
+            {10, 11}, set(tx_service.get_short_ids_by_key(tx_service.get_transaction_key(self.tx_hash_1)))
+        )
+        self.assertFalse(tx_service.has_transaction_contents(self.tx_hash_2))
+        self.assertEqual(self.tx_hash_2, tx_service.get_transaction(20).hash)
+
+    def test_load_snapshot_skips_expired_short_ids(self):
+        tx_service = GatewayTransactionService(self.node, NETWORK_NUM)
+        result = tx_service_snapshot_file.load_snapshot_file(tx_service, self.path, NETWORK_NUM, 60, 0)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(0, result.short_ids_count)
+        self.assertEqual(3, result.expired_short_ids_count)
+        self.assertEqual(self.tx_contents, tx_service.get_transaction_by_hash(self.tx_hash_1))
+        self.assertFalse(tx_service.has_short_id(10))
+
+    def test_load_snapshot_ignored(self):
+        tx_service = GatewayTransactionService(self.node, NETWORK_NUM)
+
+        self.assertIsNone(tx_service_snapshot_file.load_snapshot_file(tx_service, self.path, NETWORK_NUM + 1, 60, 60))
+        self.assertIsNone(tx_service_snapshot_file.load_snapshot_file(tx_service, self.path, NETWORK_NUM, -1, 60))
+        self.assertIsNone(
+            tx_service_snapshot_file.load_snapshot_file(tx_service, f"{self.path}.missing", NETWORK_NUM, 60, 60)
+        )
+        self.assertFalse(tx_service.has_transaction_contents(self.tx_hash_1))
+
+    def test_load_truncated_snapshot(self):
+        with open(self.path, "rb+") as f:
+            f.truncate(os.path.getsize(self.path) - 10)
+
+        tx_service = GatewayTransactionService(self.node, NETWORK_NUM)
+        with self.assertRaises(ValueError):
+            tx_service_snapshot_file.load_snapshot_file(tx_service, self.path, NETWORK_NUM, 60, 60)
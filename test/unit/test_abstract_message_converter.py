@@ -0,0 +1,41 @@
+from collections import deque
+
+from bxcommon.messages.bloxroute import compact_block_short_ids_serializer
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+
+from bxgateway.abstract_message_converter import BxBlockWriter, finalize_block_bytes
+
+
+class BxBlockWriterTest(AbstractTestCase):
+
+    def test_write_block(self):
+        short_ids = [1, 5, 100]
+        header = bytearray(b"header")
+        tx = memoryview(bytearray(range(100)))
+
+        writer = BxBlockWriter(len(header) + 1 + 4 + len(tx), short_ids)
+        writer.write(header)
+        writer.write_byte(0xff)
+        writer.write_struct("<L", 12345)
+        writer.write(tx)
+        bx_block = writer.finalize()
+
+        expected_bx_block = finalize_block_bytes(
+            deque([header, bytearray([0xff]), (12345).to_bytes(4, "little"), tx]),
+            len(header) + 1 + 4 + len(tx),
+            short_ids
+        )
+        self.assertEqual(bytes(expected_bx_block), bytes(bx_block))
+
+        block_offsets = compact_block_short_ids_serializer.get_bx_block_offsets(bx_block)
+        parsed_short_ids, _ = compact_block_short_ids_serializer.deserialize_short_ids_from_buffer(
+            bx_block, block_offsets.short_id_offset
+        )
+        self.assertEqual(short_ids, parsed_short_ids)
+
+    def test_finalize_incomplete_block(self):
+        writer = BxBlockWriter(10, [])
+        writer.write(bytearray(9))
+
+        with self.assertRaises(ValueError):
+            writer.finalize()
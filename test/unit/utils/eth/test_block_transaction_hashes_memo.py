@@ -0,0 +1,38 @@
+from bxcommon.test_utils import helpers
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.testing.mocks import mock_eth_messages
+from bxgateway.utils.eth.block_transaction_hashes_memo import BlockTransactionHashesMemo
+from bxgateway.utils.stats.eth.eth_gateway_stats_service import eth_gateway_stats_service
+
+
+class BlockTransactionHashesMemoTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.memo = BlockTransactionHashesMemo(max_size=2)
+        self.transactions = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 6)]
+        self.txs_bytes = [tx.contents() for tx in self.transactions]
+
+    def test_get_or_hash_hashes_block_transactions_once(self):
+        block_hash = helpers.generate_object_hash()
+        memo_hits = eth_gateway_stats_service.interval_data.total_tx_hash_memo_hits
+
+        tx_hashes = self.memo.get_or_hash(block_hash, self.txs_bytes)
+        self.assertEqual([tx.hash() for tx in self.transactions], tx_hashes)
+
+        self.assertIs(tx_hashes, self.memo.get_or_hash(block_hash, []))
+        self.assertEqual(memo_hits + 1, eth_gateway_stats_service.interval_data.total_tx_hash_memo_hits)
+
+    def test_memo_evicts_least_recently_used_block(self):
+        block_hash_1 = helpers.generate_object_hash()
+        block_hash_2 = helpers.generate_object_hash()
+        block_hash_3 = helpers.generate_object_hash()
+
+        self.memo.get_or_hash(block_hash_1, self.txs_bytes)
+        self.memo.get_or_hash(block_hash_2, self.txs_bytes)
+        self.memo.get(block_hash_1)
+        self.memo.get_or_hash(block_hash_3, self.txs_bytes)
+
+        self.assertEqual(2, len(self.memo))
+        self.assertIn(block_hash_1, self.memo)
+        self.assertNotIn(block_hash_2, self.memo)
+        self.assertIn(block_hash_3, self.memo)
@@ -0,0 +1,31 @@
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
+from bxgateway.testing.mocks import mock_eth_messages
+from bxgateway.utils.eth import eth_utils
+
+
+class EthUtilsTest(AbstractTestCase):
+
+    def test_iter_transactions_bytes_slices(self):
+        transactions = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 11)]
+        message = TransactionsEthProtocolMessage(None, transactions)
+        max_slice_size = 3 * len(transactions[0].contents())
+
+        slices = list(eth_utils.iter_transactions_bytes_slices(message, max_slice_size))
+
+        self.assertGreater(len(slices), 1)
+        for txs in slices[:-1]:
+            self.assertLessEqual(sum(len(tx) for tx in txs), max_slice_size)
+        self.assertEqual(
+            [bytes(tx.contents()) for tx in transactions],
+            [bytes(tx) for txs in slices for tx in txs]
+        )
+
+    def test_iter_transactions_bytes_slices_transaction_larger_than_slice(self):
+        transactions = [mock_eth_messages.get_dummy_transaction(i) for i in range(1, 4)]
+        message = TransactionsEthProtocolMessage(None, transactions)
+
+        slices = list(eth_utils.iter_transactions_bytes_slices(message, 1))
+
+        self.assertEqual(3, len(slices))
+        self.assertEqual([1, 1, 1], [len(txs) for txs in slices])
@@ -0,0 +1,63 @@
+from bxcommon.utils.buffers.input_buffer import InputBuffer
+from bxgateway.messages.eth.protocol.transactions_eth_protocol_message import TransactionsEthProtocolMessage
+from bxgateway.testing.abstract_rlpx_cipher_test import AbstractRLPxCipherTest
+from bxgateway.testing.mocks import mock_eth_messages
+from bxgateway.utils.eth.framed_input_buffer import FramedInputBuffer
+from bxgateway.utils.eth.framed_message_cache import FramedMessageCache
+
+
+class FramedMessageCacheTest(AbstractRLPxCipherTest):
+
+    def setUp(self) -> None:
+        self.cache = FramedMessageCache(max_size=2)
+
+    def _create_message(self, tx_count: int) -> TransactionsEthProtocolMessage:
+        return TransactionsEthProtocolMessage(
+            None, [mock_eth_messages.get_dummy_transaction(i + 1) for i in range(tx_count)]
+        )
+
+    def test_frames_are_reused_by_all_peers(self):
+        msg = self._create_message(200)
+
+        for _ in range(3):
+            sender_cipher, receiver_cipher = self.setup_ciphers()
+            framed_message, _ = self.cache.get_or_frame(msg)
+            self.assertGreater(len(framed_message.frames), 1)
+
+            input_buffer = InputBuffer()
+            for frame_header, frame_body in framed_message.frames:
+                input_buffer.add_bytes(sender_cipher.encrypt_frame_bytes(frame_header, frame_body))
+
+            framed_input_buffer = FramedInputBuffer(receiver_cipher)
+            is_full, msg_type = framed_input_buffer.peek_message(input_buffer)
+            self.assertTrue(is_full)
+            payload, msg_type = framed_input_buffer.get_full_message()
+            self.assertEqual(msg.msg_type, msg_type)
+            self.assertEqual(msg.rawbytes(), payload)
+
+        self.assertEqual(1, len(self.cache))
+
+    def test_get_or_frame_returns_cached_frames(self):
+        msg = self._create_message(2)
+
+        framed_message, is_cached = self.cache.get_or_frame(msg)
+        self.assertFalse(is_cached)
+
+        cached_framed_message, is_cached = self.cache.get_or_frame(msg)
+        self.assertTrue(is_cached)
+        self.assertIs(framed_message, cached_framed_message)
+
+    def test_cache_evicts_least_recently_used_message(self):
+        msg_1 = self._create_message(1)
+        msg_2 = self._create_message(1)
+        msg_3 = self._create_message(1)
+
+        self.cache.get_or_frame(msg_1)
+        self.cache.get_or_frame(msg_2)
+        self.cache.get_or_frame(msg_1)
+        self.cache.get_or_frame(msg_3)
+
+        self.assertEqual(2, len(self.cache))
+        self.assertIsNotNone(self.cache.get(msg_1))
+        self.assertIsNone(self.cache.get(msg_2))
+        self.assertIsNotNone(self.cache.get(msg_3))
@@ -1,4 +1,7 @@
+from bxcommon.test_utils import helpers
+from bxcommon.utils.blockchain_utils.eth import eth_common_constants
 from bxgateway.testing.abstract_rlpx_cipher_test import AbstractRLPxCipherTest
+from bxgateway.utils.eth import frame_utils
 
 
 class RLPxCipherTests(AbstractRLPxCipherTest):
@@ -34,3 +37,31 @@ class RLPxCipherTests(AbstractRLPxCipherTest):
         mac_ingress2 = cipher2.mac_ingress()
 
         self.assertEqual(mac_egress1, mac_ingress2)
+
+    def test_encrypt_frame_into_and_decrypt_in_place(self):
+        cipher1, cipher2 = self.setup_ciphers()
+
+        payload = helpers.generate_bytearray(1000)
+        frame = frame_utils.get_frames(1, payload)[0]
+        body = frame.get_body()
+
+        output = bytearray(cipher1.get_encrypted_frame_size(len(body)) + 10)
+        written = cipher1.encrypt_frame_bytes_into(frame.get_header(), body, memoryview(output))
+        self.assertEqual(cipher1.get_encrypted_frame_size(len(body)), written)
+
+        header = cipher2.decrypt_frame_header(bytes(output[:eth_common_constants.FRAME_HDR_TOTAL_LEN]))
+        body_size, _, _, _ = frame_utils.parse_frame_header(header)
+        self.assertEqual(frame.get_body_size(), body_size)
+
+        enc_body = memoryview(output)[eth_common_constants.FRAME_HDR_TOTAL_LEN:written]
+        decrypted_body = cipher2.decrypt_frame_body_into(enc_body, body_size, enc_body)
+        self.assertEqual(body[:body_size], decrypted_body)
+
+        # ciphers stay in sync with frames encrypted by allocating methods
+        encrypted_frame = cipher1.encrypt_frame(frame)
+        header = cipher2.decrypt_frame_header(bytes(encrypted_frame[:eth_common_constants.FRAME_HDR_TOTAL_LEN]))
+        body_size, _, _, _ = frame_utils.parse_frame_header(header)
+        self.assertEqual(
+            body[:body_size],
+            cipher2.decrypt_frame_body(encrypted_frame[eth_common_constants.FRAME_HDR_TOTAL_LEN:], body_size)
+        )
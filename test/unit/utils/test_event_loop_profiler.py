@@ -0,0 +1,97 @@
+from mock import MagicMock
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.utils.event_loop_profiler import EventLoopProfiler, ProfiledCallback
+
+
+class MockConnection:
+
+    def __init__(self) -> None:
+        self.received = []
+
+    def msg_ping(self, msg):
+        self.received.append(msg)
+
+    def msg_pong(self, msg):
+        self.received.append(msg)
+
+
+class EventLoopProfilerTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        self.profiler = EventLoopProfiler()
+        self.connection = MockConnection()
+
+    def test_profile_message_handlers(self):
+        message_handlers = self.profiler.profile_message_handlers(
+            self.connection, {b"ping\x00\x00": self.connection.msg_ping}
+        )
+        message_handlers.update({b"pong\x00\x00": self.connection.msg_pong})
+
+        self.assertIsInstance(message_handlers[b"pong\x00\x00"], ProfiledCallback)
+        self.assertEqual(self.connection.msg_ping, message_handlers[b"ping\x00\x00"])
+
+        message_handlers[b"ping\x00\x00"]("msg1")
+        message_handlers[b"ping\x00\x00"]("msg2")
+        message_handlers[b"pong\x00\x00"]("msg3")
+        self.assertEqual(["msg1", "msg2", "msg3"], self.connection.received)
+
+        report = self.profiler.get_report()
+        handler_counts = {
+            (stats["connection"], stats["message_type"], stats["handler"]): stats["count"]
+            for stats in report["message_handlers"]
+        }
+        self.assertEqual(
+            {
+                ("MockConnection", "ping", "MockConnection.msg_ping"): 2,
+                ("MockConnection", "pong", "MockConnection.msg_pong"): 1,
+            },
+            handler_counts
+        )
+
+    def test_profile_alarm_queue(self):
+        alarm_queue = MagicMock()
+        register_alarm = alarm_queue.register_alarm
+        register_approx_alarm = alarm_queue.register_approx_alarm
+        callback = MagicMock(return_value=5)
+        approx_callback = MagicMock(return_value=0)
+        self.profiler.profile_alarm_queue(alarm_queue)
+
+        alarm_queue.register_alarm(1, callback, "arg", alarm_name="test_alarm")
+        alarm_queue.register_approx_alarm(2, 1, approx_callback)
+
+        register_alarm.assert_called_once()
+        profiled_callback = register_alarm.call_args[0][1]
+        self.assertIsInstance(profiled_callback, ProfiledCallback)
+        self.assertEqual(callback, profiled_callback)
+        self.assertEqual("arg", register_alarm.call_args[0][2])
+        self.assertEqual("test_alarm", register_alarm.call_args[1]["alarm_name"])
+        self.assertEqual(5, profiled_callback("arg"))
+        callback.assert_called_once_with("arg")
+
+        register_approx_alarm.assert_called_once()
+        profiled_approx_callback = register_approx_alarm.call_args[0][2]
+        self.assertIsInstance(profiled_approx_callback, ProfiledCallback)
+        self.assertEqual(approx_callback, profiled_approx_callback)
+
+        alarms = self.profiler.get_report()["alarms"]
+        self.assertEqual(1, len(alarms))
+        self.assertEqual("test_alarm", alarms[0]["alarm"])
+        self.assertEqual(1, alarms[0]["count"])
+
+    def test_report_top_and_reset(self):
+        message_handlers = self.profiler.profile_message_handlers(
+            self.connection, {b"ping": self.connection.msg_ping, b"pong": self.connection.msg_pong}
+        )
+        message_handlers[b"ping"]("msg")
+        self.profiler.event_loop_lag_stats.record(0.25)
+
+        report = self.profiler.get_report(top=1)
+        self.assertEqual(1, len(report["message_handlers"]))
+        self.assertEqual("ping", report["message_handlers"][0]["message_type"])
+        self.assertEqual(250, report["event_loop_lag"]["max_ms"])
+
+        self.profiler.reset()
+        report = self.profiler.get_report()
+        self.assertEqual([], report["message_handlers"])
+        self.assertEqual(0, report["event_loop_lag"]["count"])
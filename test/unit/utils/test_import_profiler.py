@@ -0,0 +1,29 @@
+import sys
+
+from bxcommon.test_utils.abstract_test_case import AbstractTestCase
+from bxgateway.utils.import_profiler import ImportProfiler
+
+
+class ImportProfilerTest(AbstractTestCase):
+
+    def setUp(self) -> None:
+        sys.modules.pop("colorsys", None)
+
+    def test_profile_new_imports(self):
+        with ImportProfiler() as profiler:
+            # pylint: disable=import-outside-toplevel,unused-import
+            import colorsys
+            import time
+
+        self.assertEqual(["colorsys"], [entry.module_name for entry in profiler.entries])
+        entry = profiler.entries[0]
+        self.assertGreaterEqual(entry.duration_ms, entry.self_duration_ms)
+        self.assertGreaterEqual(entry.self_duration_ms, 0)
+
+    def test_import_restored_on_exit(self):
+        with ImportProfiler() as profiler:
+            pass
+
+        # pylint: disable=import-outside-toplevel,unused-import
+        import colorsys
+        self.assertEqual([], profiler.entries)